@@ -1,8 +1,7 @@
 import requests
 from typing import List, Dict, Any, Optional
 import os
-from dotenv import load_dotenv
-from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger
+from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger, DEFAULT_TIMEOUT
 
 class BingSearch(BaseAPISearch):
     """Bing Search API kullanarak arama yapan sınıf."""
@@ -22,9 +21,6 @@ class BingSearch(BaseAPISearch):
             api_key=api_key
         )
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
-        
         # Rate limit ve fiyatlandırma bilgilerini set et
         self.rate_limit_info = "3 çağrı/saniye, 1000 çağrı/ay (ücretsiz)"
         self.pricing_info = "$7 / 1000 sorgu (ilk 1000 sorgu/ay ücretsiz)"
@@ -64,7 +60,7 @@ class BingSearch(BaseAPISearch):
         
         try:
             # İsteği yap
-            response = requests.get(search_url, headers=headers, params=params)
+            response = requests.get(search_url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -2,7 +2,7 @@ import requests
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 import json
-from search_interface import SearchEngine, SearchResult
+from search_interface import SearchEngine, SearchResult, DEFAULT_TIMEOUT
 
 class DuckDuckGoSearch(SearchEngine):
     """DuckDuckGo arama API'si ile arama yapan sınıf."""
@@ -41,7 +41,7 @@ class DuckDuckGoSearch(SearchEngine):
         results = []
         
         try:
-            response = requests.post(url, headers=headers, data=data)
+            response = requests.post(url, headers=headers, data=data, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "html.parser")
@@ -10,9 +10,8 @@ bir SearchEngine implementasyonunu içerir.
 
 import requests
 from typing import List, Dict, Any
-import os
-from dotenv import load_dotenv
-from search_interface import SearchEngine, SearchResult
+from search_interface import SearchEngine, SearchResult, DEFAULT_TIMEOUT
+from src.credentials import get_credentials
 
 class FirecrawlSearch(SearchEngine):
     """Firecrawl.dev API kullanarak arama yapan sınıf."""
@@ -30,10 +29,7 @@ class FirecrawlSearch(SearchEngine):
             license_type="Kapalı, Ücretli"
         )
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
-        
-        self.api_key = api_key or os.getenv("FIRECRAWL_API_KEY")
+        self.api_key = api_key or get_credentials().get("FIRECRAWL_API_KEY")
         self.base_url = "https://api.firecrawl.dev"
         self.rate_limit_info = "Plan'a bağlı olarak değişen kısıtlamalar"
         self.pricing_info = "Ücretsiz: 500 kredi, Hobby: $16/ay, Standard: $83/ay"
@@ -66,7 +62,7 @@ class FirecrawlSearch(SearchEngine):
         results = []
         
         try:
-            response = requests.post(endpoint, headers=headers, json=payload)
+            response = requests.post(endpoint, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
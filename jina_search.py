@@ -10,9 +10,8 @@ bir SearchEngine implementasyonunu içerir.
 
 import requests
 from typing import List, Dict, Any
-import os
-from dotenv import load_dotenv
-from search_interface import SearchEngine, SearchResult
+from search_interface import SearchEngine, SearchResult, DEFAULT_TIMEOUT
+from src.credentials import get_credentials
 
 class JinaSearch(SearchEngine):
     """Jina AI Reader API kullanarak arama yapan sınıf."""
@@ -30,10 +29,7 @@ class JinaSearch(SearchEngine):
             license_type="Kapalı, Ücretli (Freemium)"
         )
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
-        
-        self.api_key = api_key or os.getenv("JINA_API_KEY")
+        self.api_key = api_key or get_credentials().get("JINA_API_KEY")
         self.search_url = "https://s.jina.ai"
         self.rate_limit_info = "Ücretsiz: 0 RPM, Başlangıç: 40 RPM, Pro: 400 RPM"
         self.pricing_info = "Ücretsiz: Yok, Başlangıç: $5/ay 1M token, Pro: $49/ay 10M token"
@@ -62,7 +58,7 @@ class JinaSearch(SearchEngine):
         results = []
         
         try:
-            response = requests.get(url, headers=headers)
+            response = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
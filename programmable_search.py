@@ -1,8 +1,8 @@
 import requests
 from typing import List, Dict, Any, Optional
-import os
-from dotenv import load_dotenv
 from search_interface import BaseAPISearch, SearchResult
+from src.engines.google import GoogleSearch as CustomSearchAPI
+from src.credentials import get_credentials
 
 class ProgrammableGoogleSearch(BaseAPISearch):
     """Google Programlanabilir Arama Motoru (PSE) kullanarak arama yapan sınıf."""
@@ -23,11 +23,8 @@ class ProgrammableGoogleSearch(BaseAPISearch):
             api_key=api_key
         )
         
-        # .env dosyasını yükle
-        load_dotenv()
-        
         # Custom Search Engine ID
-        self.cx = cx or os.getenv("GOOGLE_CX")
+        self.cx = cx or self.credentials.get("GOOGLE_CX")
         
         # Rate limit ve fiyatlandırma bilgilerini set et
         self.rate_limit_info = "100 sorgu/gün (ücretsiz), 10,000 sorgu/gün (ücretli)"
@@ -36,78 +33,38 @@ class ProgrammableGoogleSearch(BaseAPISearch):
         # Gerekli parametreleri kontrol et
         if not self.api_key or not self.cx:
             raise ValueError("Google API Key ve Custom Search Engine ID gereklidir. Lütfen .env dosyasını kontrol edin.")
+        
+        # İstekler src paketindeki Custom Search implementasyonu üzerinden gönderilir
+        self._api = CustomSearchAPI(api_key=self.api_key, cx=self.cx)
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def search(self, query: str, num_results: int = 10, timeout: Optional[float] = None) -> List[SearchResult]:
         """
         Google Programlanabilir Arama Motoru API ile arama yapar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
+            timeout: Tüm sayfaların (bağlantı ve okuma dahil) süre bütçesi (saniye)
             
         Returns:
             SearchResult nesnelerinin listesi
-        """
-        url = "https://www.googleapis.com/customsearch/v1"
-        results = []
-        total_results = 0
-        
-        # Google API her seferinde en fazla 10 sonuç döndürür, bu yüzden
-        # birden fazla istek gerekebilir
-        while total_results < num_results:
-            # İstek parametrelerini hazırla
-            params = {
-                "key": self.api_key,
-                "cx": self.cx,
-                "q": query,
-                "num": min(10, num_results - total_results)
-            }
             
-            # Sayfalama için başlangıç indeksi ekle (1-tabanlı)
-            if total_results > 0:
-                params["start"] = total_results + 1
-                
-            try:
-                # İsteği yap
-                response = requests.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Sonuç yoksa döngüden çık
-                if "items" not in data:
-                    break
-                
-                # Sonuçları işle
-                items = data["items"]
-                for item in items:
-                    if total_results >= num_results:
-                        break
-                        
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        link=item.get("link", ""),
-                        snippet=item.get("snippet", "")
-                    ))
-                    
-                    total_results += 1
-                
-                # Daha fazla sonuç yoksa veya sayfa dolmamışsa çık
-                if len(items) < 10:
-                    break
-                    
-            except Exception as e:
-                self._handle_request_error(e)
-                break
-        return results
+        Raises:
+            TimeoutError: Süre bütçesi veya istek zaman aşımı dolarsa
+        """
+        # Google API her seferinde en fazla 10 sonuç döndürür (toplamda en fazla 100); sayfalar
+        # src.engines.base.BaseAPISearch._iter_pages ile eşzamanlı istenir
+        return [
+            SearchResult(title=result.title, link=result.link, snippet=result.snippet)
+            for result in self._api.search(query, num_results, timeout=timeout)
+        ]
 
 
 if __name__ == "__main__":
-    # .env dosyasını yükle
-    load_dotenv()
-    
     # API anahtarları
-    api_key = os.getenv("GOOGLE_API_KEY")
-    cx = os.getenv("GOOGLE_CX")
+    credentials = get_credentials()
+    api_key = credentials.get("GOOGLE_API_KEY")
+    cx = credentials.get("GOOGLE_CX")
     
     if not api_key or not cx:
         print("Hata: GOOGLE_API_KEY ve GOOGLE_CX .env dosyasında bulunmalıdır.")
@@ -1,11 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple, Union
 import time
-import os
 import json
 import logging
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from src.credentials import get_credentials
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -14,6 +13,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("search_engine")
 
+# Tek bir HTTP isteğinin varsayılan zaman aşımı (saniye)
+DEFAULT_TIMEOUT = 10
+
 @dataclass
 class SearchResult:
     """
@@ -117,12 +119,12 @@ class BaseAPISearch(SearchEngine):
         """
         super().__init__(name, source_url, license_type)
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
+        # Kimlik bilgileri src paketinin paylaşılan sağlayıcısından okunur (.env süreç başına bir kez yüklenir)
+        self.credentials = get_credentials()
         
         # API anahtarını doğrudan set et veya env'den yükle
         if api_key_env_name and not api_key:
-            self.api_key = os.getenv(api_key_env_name)
+            self.api_key = self.credentials.get(api_key_env_name)
             if not self.api_key:
                 logger.warning(f"{api_key_env_name} çevre değişkeni bulunamadı")
         else:
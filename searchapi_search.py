@@ -12,7 +12,7 @@ import requests
 from typing import List, Dict, Any, Optional
 import os
 from dotenv import load_dotenv
-from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger
+from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger, DEFAULT_TIMEOUT
 
 class SearchApiSearch(BaseAPISearch):
     """SearchAPI.io API kullanarak arama yapan sınıf."""
@@ -68,7 +68,7 @@ class SearchApiSearch(BaseAPISearch):
         
         try:
             # İsteği yap
-            response = requests.get(self.base_url, params=params)
+            response = requests.get(self.base_url, params=params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -12,7 +12,7 @@ import requests
 import json
 import os
 from typing import Dict, List, Any
-from search_interface import SearchEngine, SearchResult
+from search_interface import SearchEngine, SearchResult, DEFAULT_TIMEOUT
 
 def serper_search(query: str, num_results: int = 10) -> List[Dict[str, str]]:
     """
@@ -47,7 +47,7 @@ def serper_search(query: str, num_results: int = 10) -> List[Dict[str, str]]:
     search_results = []
     
     try:
-        response = requests.post(url, headers=headers, data=payload)
+        response = requests.post(url, headers=headers, data=payload, timeout=DEFAULT_TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
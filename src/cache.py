@@ -0,0 +1,615 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Arama sonuçları için önbellek modülü.
+
+Bu modül, herhangi bir SearchEngine örneğini saran, boyutu sınırlı (LRU)
+ve motor bazında süre sınırlı (TTL) bir bellek içi önbellek sağlar.
+Önbellekten dönen sonuçlar ağ isteği yapılmadan döndürülür; zaman ölçümü
+yapılırken önbellek atlanarak canlı istek zorlanabilir.
+
+Ayrıca birden fazla sürecin paylaşabildiği, SQLite tabanlı kalıcı bir yanıt
+önbelleği (ResponseCache) içerir. Bu önbellek ham API yanıtını, ayrıştırılmış
+sonuçları ve canlı isteğin süresini saklar; böylece gece çalışan regresyon
+testleri ve rapor yeniden üretimi API'ye gitmeden yapılabilir.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Tuple, TYPE_CHECKING
+
+from src.core import SearchEngine, SearchResult, logger
+from src.config.settings import RESPONSE_CACHE_PATH
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Varsayılan önbellek ayarları
+DEFAULT_CACHE_SIZE = 1024  # en fazla kayıt sayısı
+DEFAULT_CACHE_TTL = 3600  # saniye
+
+CacheKey = Tuple[str, str, int]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Sorguyu önbellek anahtarı için normalleştirir (küçük harf, tek boşluk).
+    
+    Args:
+        query: Arama sorgusu
+    
+    Returns:
+        Normalleştirilmiş sorgu
+    """
+    return " ".join(query.lower().split())
+
+
+class ResultCache:
+    """İş parçacığı güvenli, TTL destekli LRU önbellek."""
+    
+    def __init__(self,
+                 max_size: int = DEFAULT_CACHE_SIZE,
+                 default_ttl: float = DEFAULT_CACHE_TTL,
+                 engine_ttls: Optional[Dict[str, float]] = None):
+        """
+        ResultCache sınıfını başlatır.
+        
+        Args:
+            max_size: Önbellekte tutulacak en fazla kayıt sayısı
+            default_ttl: Kayıtların varsayılan geçerlilik süresi (saniye)
+            engine_ttls: Motor adı -> geçerlilik süresi (saniye) eşlemesi
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.engine_ttls = engine_ttls or {}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Sayaçlar
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def make_key(self, engine_name: str, query: str, num_results: int) -> CacheKey:
+        """
+        Önbellek anahtarını oluşturur.
+        
+        Args:
+            engine_name: Motor adı
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            (motor, normalleştirilmiş sorgu, sonuç sayısı) biçiminde anahtar
+        """
+        return (engine_name, normalize_query(query), num_results)
+    
+    def get_ttl(self, engine_name: str) -> float:
+        """
+        Motorun kayıt geçerlilik süresini döndürür.
+        
+        Args:
+            engine_name: Motor adı
+        
+        Returns:
+            Geçerlilik süresi (saniye)
+        """
+        return self.engine_ttls.get(engine_name, self.default_ttl)
+    
+    def get(self, key: CacheKey) -> Optional[List[SearchResult]]:
+        """
+        Anahtara ait geçerli kaydı döndürür.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Sonuç listesi veya kayıt yoksa/süresi dolmuşsa None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, results = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(results)
+    
+    def put(self, key: CacheKey, results: List[SearchResult]) -> None:
+        """
+        Sonuçları önbelleğe yazar; kapasite aşılırsa en eski kayıt çıkarılır.
+        
+        Args:
+            key: Önbellek anahtarı
+            results: Saklanacak sonuç listesi
+        """
+        expires_at = time.monotonic() + self.get_ttl(key[0])
+        with self._lock:
+            self._entries[key] = (expires_at, list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Tüm kayıtları siler."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Önbellek sayaçlarını döndürür.
+        
+        Returns:
+            İstatistikleri içeren sözlük
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Önbelleği geçerli bağlamda atlanan nesneler (CachedSearch ve ResponseCache). Bayrak
+# iş parçacığına değil bağlama bağlıdır: aynı olay döngüsündeki eşyordamlar birbirini
+# etkilemez ve copy_context ile başka iş parçacığına taşınabilir.
+_bypassed = ContextVar("cache_bypass", default=frozenset())
+
+
+@contextmanager
+def _bypass(owner: Any):
+    """Blok süresince owner'ın önbelleğini geçerli bağlamda atlar."""
+    token = _bypassed.set(_bypassed.get() | {owner})
+    try:
+        yield
+    finally:
+        _bypassed.reset(token)
+
+
+class CachedSearch(SearchEngine):
+    """Herhangi bir SearchEngine örneğinin önüne önbellek koyan sarmalayıcı."""
+    
+    def __init__(self, engine: SearchEngine, cache: Optional[ResultCache] = None, bypass: bool = False):
+        """
+        CachedSearch sınıfını başlatır.
+        
+        Args:
+            engine: Sarmalanacak arama motoru
+            cache: Kullanılacak önbellek (None ise yeni bir ResultCache oluşturulur;
+                birden fazla motor aynı önbelleği paylaşabilir)
+            bypass: True ise önbellek okunmaz, her arama canlı yapılır
+        """
+        super().__init__(engine.name, engine.source_url, engine.license_type)
+        self.engine = engine
+        self.cache = cache if cache is not None else ResultCache()
+        self.bypass = bypass
+        self.rate_limit_info = engine.rate_limit_info
+        self.pricing_info = engine.pricing_info
+    
+    def __getattr__(self, name: str) -> Any:
+        # Tanımlı olmayan öznitelikleri (reset_session, base_url vb.) sarılan motora yönlendir
+        if name == "engine":
+            raise AttributeError(name)
+        return getattr(self.engine, name)
+    
+    @property
+    def settings_key(self) -> str:
+        """Hız sınırı ve devre kesici tanımları sarılan motorun sınıf adıyla aranır."""
+        return self.engine.settings_key
+    
+    @property
+    def is_bypassed(self) -> bool:
+        """Önbelleğin geçerli bağlamda atlanıp atlanmayacağı."""
+        return self.bypass or self in _bypassed.get()
+    
+    @contextmanager
+    def bypass_cache(self):
+        """
+        Blok içindeki aramaların (yalnızca geçerli bağlamda: iş parçacığı veya
+        eşyordam) canlı yapılmasını sağlar. Zaman ölçümleri için kullanılır;
+        canlı sonuçlar yine önbelleğe yazılır.
+        """
+        # Sarılan motorun kendi önbelleği (ör. ResponseCache) varsa o da atlanır
+        inner = getattr(self.engine, "bypass_cache", None)
+        with _bypass(self), (inner() if inner else nullcontext()):
+            yield
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Önbellekte geçerli kayıt varsa onu, yoksa sarılan motorun sonuçlarını döndürür.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        key = self.cache.make_key(self.name, query, num_results)
+        
+        if not self.is_bypassed:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug(f"{self.name} önbellekten döndü: '{query}'")
+                return cached
+        
+        results = self.engine.search(query, num_results)
+        # Boş sonuçlar genellikle hata anlamına gelir, önbelleğe alınmaz
+        if results:
+            self.cache.put(key, results)
+        return results
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """
+        search metodunun asenkron karşılığı.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        key = self.cache.make_key(self.name, query, num_results)
+        
+        if not self.is_bypassed:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        results = await self.engine.async_search(query, num_results, session=session)
+        if results:
+            self.cache.put(key, results)
+        return results
+    
+    def search_iter(self, query: str, num_results: int = 10) -> Iterator[SearchResult]:
+        """
+        Önbellekteki sonuçları veya sarılan motorun search_iter ile ürettiği
+        sonuçları üretir. Tüketici erken durursa eksik sonuçlar önbelleğe yazılmaz.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Yields:
+            SearchResult nesneleri
+        """
+        key = self.cache.make_key(self.name, query, num_results)
+        
+        if not self.is_bypassed:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield from cached
+                return
+        
+        results = []
+        for result in self.engine.search_iter(query, num_results):
+            results.append(result)
+            yield result
+        if results:
+            self.cache.put(key, results)
+    
+    async def async_search_iter(self,
+                                query: str,
+                                num_results: int = 10,
+                                session: Optional[Any] = None) -> AsyncIterator[SearchResult]:
+        """
+        search_iter metodunun asenkron karşılığı.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+        
+        Yields:
+            SearchResult nesneleri
+        """
+        key = self.cache.make_key(self.name, query, num_results)
+        
+        if not self.is_bypassed:
+            cached = self.cache.get(key)
+            if cached is not None:
+                for result in cached:
+                    yield result
+                return
+        
+        results = []
+        async for result in self.engine.async_search_iter(query, num_results, session=session):
+            results.append(result)
+            yield result
+        if results:
+            self.cache.put(key, results)
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Sarılan motorun bilgilerini önbellek istatistikleriyle birlikte döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        info = self.engine.get_engine_info()
+        info["cache"] = self.cache.get_stats()
+        return info
+
+
+class CacheTrace:
+    """Bir ölçüm sırasında kalıcı önbellekten dönen yanıtları kaydeder."""
+    
+    def __init__(self):
+        self.hits = 0
+        self.recorded_time = None  # Önbellekteki yanıtın canlı istek süresi
+    
+    def record_hit(self, elapsed_time: Optional[float]) -> None:
+        """
+        Önbellekten dönen bir yanıtı kaydeder.
+        
+        Args:
+            elapsed_time: Yanıt ilk alındığında ölçülen süre (saniye)
+        """
+        self.hits += 1
+        if elapsed_time is not None:
+            self.recorded_time = (self.recorded_time or 0.0) + elapsed_time
+
+
+_current_trace = ContextVar("response_cache_trace", default=None)
+
+
+@contextmanager
+def trace_cache_hits():
+    """
+    Blok içinde (aynı iş parçacığı veya asyncio görevi) kalıcı önbellekten
+    dönen yanıtları izler. Değerlendirici, önbellekten dönen çalıştırmalarda
+    ölçülen süre yerine yanıtın ilk alındığı andaki süreyi kullanır.
+    
+    Örnek:
+        with trace_cache_hits() as trace:
+            results, elapsed_time = engine.measure_search_time(query)
+        if trace.hits:
+            elapsed_time = trace.recorded_time
+    
+    Yields:
+        CacheTrace nesnesi
+    """
+    trace = CacheTrace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+class ResponseCache:
+    """
+    SQLite tabanlı, süreçler arasında paylaşılabilen kalıcı yanıt önbelleği.
+    
+    Veritabanı WAL modunda açılır; birden fazla değerlendirici süreci aynı
+    dosyayı aynı anda okuyup yazabilir. Her iş parçacığı kendi bağlantısını
+    kullanır.
+    """
+    
+    def __init__(self, path: str = RESPONSE_CACHE_PATH, ttl: Optional[float] = None):
+        """
+        ResponseCache sınıfını başlatır.
+        
+        Args:
+            path: SQLite veritabanı dosyasının yolu
+            ttl: Kayıtların geçerlilik süresi (saniye, None ise süresiz)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.bypass = False
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        connection = self._connection()
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                engine TEXT NOT NULL,
+                query TEXT NOT NULL,
+                num_results INTEGER NOT NULL,
+                params TEXT NOT NULL,
+                raw_response TEXT NOT NULL,
+                results TEXT NOT NULL,
+                elapsed_time REAL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (engine, query, num_results, params)
+            )
+        """)
+        connection.commit()
+    
+    def _connection(self) -> "sqlite3.Connection":
+        """İş parçacığına ait veritabanı bağlantısını döndürür."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # sqlite3 yalnızca yanıt önbelleği kullanıldığında yüklenir
+            import sqlite3
+            
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+    
+    def make_key(self,
+                 engine_name: str,
+                 query: str,
+                 num_results: int,
+                 params: Optional[Dict[str, Any]] = None) -> Tuple[str, str, int, str]:
+        """
+        Önbellek anahtarını oluşturur.
+        
+        Args:
+            engine_name: Motor adı
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            params: Sonuçları etkileyen yerel ayar parametreleri (ör. Serper gl/hl)
+        
+        Returns:
+            (motor, normalleştirilmiş sorgu, sonuç sayısı, parametreler) biçiminde anahtar
+        """
+        return (engine_name, normalize_query(query), num_results, json.dumps(params or {}, sort_keys=True))
+    
+    @contextmanager
+    def bypass_cache(self):
+        """Blok içindeki aramaların (yalnızca geçerli bağlamda) önbelleği okumamasını sağlar."""
+        with _bypass(self):
+            yield
+    
+    @property
+    def is_bypassed(self) -> bool:
+        """Önbelleğin geçerli bağlamda atlanıp atlanmayacağı."""
+        return self.bypass or self in _bypassed.get()
+    
+    def get(self, key: Tuple[str, str, int, str]) -> Optional[List[SearchResult]]:
+        """
+        Anahtara ait geçerli kaydın ayrıştırılmış sonuçlarını döndürür.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Sonuç listesi veya kayıt yoksa/süresi dolmuşsa/önbellek atlanıyorsa None
+        """
+        if self.is_bypassed:
+            return None
+        
+        row = self._connection().execute(
+            "SELECT results, elapsed_time, created_at FROM responses "
+            "WHERE engine = ? AND query = ? AND num_results = ? AND params = ?",
+            key
+        ).fetchone()
+        
+        if row is None or (self.ttl is not None and row[2] + self.ttl <= time.time()):
+            with self._stats_lock:
+                self.misses += 1
+            return None
+        
+        with self._stats_lock:
+            self.hits += 1
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.record_hit(row[1])
+        
+        return [SearchResult(**item) for item in json.loads(row[0])]
+    
+    def get_raw(self, key: Tuple[str, str, int, str]) -> Optional[Any]:
+        """
+        Anahtara ait ham API yanıtını döndürür.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            JSON yanıtı (sözlük) veya metin; kayıt yoksa None
+        """
+        row = self._connection().execute(
+            "SELECT raw_response FROM responses "
+            "WHERE engine = ? AND query = ? AND num_results = ? AND params = ?",
+            key
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put(self,
+            key: Tuple[str, str, int, str],
+            raw_response: Any,
+            results: List[SearchResult],
+            elapsed_time: Optional[float] = None) -> None:
+        """
+        Ham yanıtı ve ayrıştırılmış sonuçları önbelleğe yazar.
+        
+        Args:
+            key: Önbellek anahtarı
+            raw_response: Ham API yanıtı (JSON sözlüğü veya metin)
+            results: Ayrıştırılmış sonuç listesi
+            elapsed_time: Canlı isteğin süresi (saniye)
+        """
+        import sqlite3
+        
+        connection = self._connection()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                key + (
+                    json.dumps(raw_response, ensure_ascii=False),
+                    json.dumps([result.to_dict() for result in results], ensure_ascii=False),
+                    elapsed_time,
+                    time.time()
+                )
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            # Önbelleğe yazılamaması aramayı başarısız saymaz
+            logger.warning(f"Yanıt önbelleğe yazılamadı: {e}")
+    
+    def clear(self, engine_name: Optional[str] = None) -> None:
+        """
+        Kayıtları siler.
+        
+        Args:
+            engine_name: Yalnızca bu motorun kayıtlarını sil (None ise tümü)
+        """
+        connection = self._connection()
+        if engine_name is None:
+            connection.execute("DELETE FROM responses")
+        else:
+            connection.execute("DELETE FROM responses WHERE engine = ?", (engine_name,))
+        connection.commit()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Önbellek sayaçlarını döndürür.
+        
+        Returns:
+            İstatistikleri içeren sözlük
+        """
+        size = self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "size": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+    
+    def close(self) -> None:
+        """Bu iş parçacığının veritabanı bağlantısını kapatır."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
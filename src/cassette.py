@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+HTTP kayıt/oynatma (kaset) modülü.
+
+Bu modül, arama motorlarının gerçek HTTP alışverişlerini (istek, yanıt
+gövdesi, başlıklar ve ölçülen süre) sıkıştırılmış bir kaset dosyasına
+kaydeder ve daha sonra ağa çıkmadan aynı yanıtları geri oynatır.
+Yakalama requests'in HTTPAdapter katmanında yapıldığından motorların
+istek oluşturma ve ayrıştırma kodu üretimdeki ile aynı şekilde çalışır;
+requests kullanan her SearchEngine alt sınıfı kasetle test edilebilir.
+
+Örnek:
+    cassette = Cassette("cassettes/serper.jsonl.gz", mode="record")
+    with cassette.use():
+        evaluator.run_test("python programming")
+    
+    cassette = Cassette("cassettes/serper.jsonl.gz", mode="replay", replay_latency=True)
+    with cassette.use():
+        evaluator.run_test("python programming")
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.core import logger
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Kasete yazılmayan ve eşleştirmede kullanılmayan gizli alan adları (küçük harf)
+SECRET_FIELDS = {
+    "key", "api_key", "apikey", "api-key", "access_key", "token", "cx",
+    "authorization", "x-api-key", "x-subscription-token", "ocp-apim-subscription-key", "cookie"
+}
+
+# Gövde çözülmüş olarak saklandığından oynatmada anlamsız olan yanıt başlıkları
+_DROPPED_RESPONSE_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "set-cookie"}
+
+
+class CassetteMissError(LookupError):
+    """Oynatma modunda kasette karşılığı olmayan istek yapıldığında oluşur."""
+
+
+def _strip_secrets(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Sözlükten gizli alanları çıkarır."""
+    return {name: value for name, value in values.items() if name.lower() not in SECRET_FIELDS}
+
+
+def _normalize_url(url: str) -> str:
+    """URL'deki gizli sorgu parametrelerini çıkarır ve parametreleri sıralar."""
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name.lower() not in SECRET_FIELDS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def _normalize_body(body: Any) -> Optional[str]:
+    """İstek gövdesini eşleştirme için normalleştirir (JSON ise sıralı, gizli alanlar çıkarılmış)."""
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    try:
+        data = json.loads(body)
+    except ValueError:
+        # Form verisi
+        if "=" in body:
+            return urlencode(sorted(_strip_secrets(dict(parse_qsl(body, keep_blank_values=True))).items()))
+        return body
+    if isinstance(data, dict):
+        data = _strip_secrets(data)
+    return json.dumps(data, sort_keys=True, ensure_ascii=False)
+
+
+class Cassette:
+    """HTTP alışverişlerini kaydeden ve geri oynatan kaset."""
+    
+    def __init__(self,
+                 path: str,
+                 mode: str = REPLAY,
+                 replay_latency: bool = False,
+                 latency_scale: float = 1.0):
+        """
+        Cassette sınıfını başlatır.
+        
+        Args:
+            path: Kaset dosyasının yolu (.gz ile bitiyorsa gzip ile sıkıştırılır)
+            mode: "record" (canlı istek yapıp kaydet) veya "replay" (ağa çıkmadan oynat)
+            replay_latency: True ise oynatmada kaydedilen süre kadar beklenir
+            latency_scale: Oynatılan sürelerin çarpanı (ör. 0.5 ile yarı sürede oynatılır)
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Geçersiz kaset modu: {mode} (record veya replay olmalı)")
+        
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.entries = []
+        self._index = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        
+        if mode == REPLAY:
+            self.load()
+    
+    def _open(self, mode: str):
+        """Kaset dosyasını (gerekirse gzip ile) açar."""
+        if self.path.endswith(".gz"):
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+    
+    @staticmethod
+    def _match_key(method: str, url: str, body: Any) -> Tuple[str, str, Optional[str]]:
+        """İsteğin eşleştirme anahtarını oluşturur."""
+        return (method.upper(), _normalize_url(url), _normalize_body(body))
+    
+    def load(self) -> None:
+        """
+        Kaset dosyasını okur.
+        
+        Raises:
+            FileNotFoundError: Dosya bulunamazsa
+        """
+        with self._open("r") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        
+        with self._lock:
+            self.entries = entries
+            self._index = {}
+            self._positions = {}
+            for entry in entries:
+                request = entry["request"]
+                key = (request["method"], request["url"], request["body"])
+                self._index.setdefault(key, []).append(entry)
+        logger.info(f"Kaset yüklendi: {self.path} ({len(entries)} kayıt)")
+    
+    def save(self) -> None:
+        """Kaydedilen alışverişleri kaset dosyasına yazar."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        with self._lock:
+            entries = list(self.entries)
+        with self._open("w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        logger.info(f"Kaset kaydedildi: {self.path} ({len(entries)} kayıt)")
+    
+    def record(self, request: requests.PreparedRequest, response: requests.Response, elapsed_time: float) -> None:
+        """
+        Bir HTTP alışverişini kasete ekler.
+        
+        Args:
+            request: Gönderilen istek
+            response: Alınan yanıt (gövdesi okunmuş)
+            elapsed_time: İsteğin gönderilmesinden gövdenin okunmasına kadar geçen süre (saniye)
+        """
+        method, url, body = self._match_key(request.method, request.url, request.body)
+        entry = {
+            "request": {
+                "method": method,
+                "url": url,
+                "body": body,
+                "headers": _strip_secrets(dict(request.headers))
+            },
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    name: value for name, value in response.headers.items()
+                    if name.lower() not in _DROPPED_RESPONSE_HEADERS
+                },
+                "encoding": response.encoding,
+                "body": response.text
+            },
+            "elapsed_time": elapsed_time
+        }
+        with self._lock:
+            self.entries.append(entry)
+            self._index.setdefault((method, url, body), []).append(entry)
+    
+    def find(self, request: requests.PreparedRequest) -> Dict[str, Any]:
+        """
+        İsteğe karşılık gelen kaydı döndürür. Aynı istek birden fazla kez
+        kaydedildiyse kayıtlar sırayla (sonuna gelince baştan) döndürülür.
+        
+        Args:
+            request: Gönderilecek istek
+        
+        Returns:
+            Kasetteki kayıt
+        
+        Raises:
+            CassetteMissError: Kasette eşleşen kayıt yoksa
+        """
+        key = self._match_key(request.method, request.url, request.body)
+        with self._lock:
+            matches = self._index.get(key)
+            if not matches:
+                raise CassetteMissError(f"Kasette kayıt bulunamadı: {key[0]} {key[1]}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return matches[position % len(matches)]
+    
+    def build_response(self,
+                       adapter: HTTPAdapter,
+                       request: requests.PreparedRequest,
+                       entry: Dict[str, Any]) -> requests.Response:
+        """
+        Kasetteki kayıttan requests.Response nesnesi oluşturur.
+        
+        Args:
+            adapter: İsteği gönderen HTTPAdapter
+            request: Gönderilen istek
+            entry: Kasetteki kayıt
+        
+        Returns:
+            Response nesnesi
+        """
+        recorded = entry["response"]
+        encoding = recorded.get("encoding") or "utf-8"
+        
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded.get("reason")
+        response.headers = CaseInsensitiveDict(recorded.get("headers", {}))
+        response.encoding = encoding
+        response._content = recorded["body"].encode(encoding)
+        response.url = request.url
+        response.request = request
+        response.connection = adapter
+        response.elapsed = timedelta(seconds=entry.get("elapsed_time") or 0.0)
+        return response
+    
+    def _send(self, original_send, adapter: HTTPAdapter, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """HTTPAdapter.send yerine çağrılan kayıt/oynatma fonksiyonu."""
+        if self.mode == REPLAY:
+            entry = self.find(request)
+            if self.replay_latency and entry.get("elapsed_time"):
+                time.sleep(entry["elapsed_time"] * self.latency_scale)
+            return self.build_response(adapter, request, entry)
+        
+        start_time = time.perf_counter()
+        response = original_send(adapter, request, **kwargs)
+        # Gövde okunana kadar geçen süre de ölçüme dahil edilir
+        response.content
+        elapsed_time = time.perf_counter() - start_time
+        self.record(request, response, elapsed_time)
+        return response
+    
+    @contextmanager
+    def use(self):
+        """
+        Blok içinde requests üzerinden yapılan tüm HTTP isteklerini kasete
+        yönlendirir. Kayıt modunda blok sonunda kaset dosyaya yazılır.
+        
+        Not: aiohttp tabanlı async_search yolu kasetten geçmez; kasetle
+        yapılan ölçümler senkron arama yolunu kullanmalıdır.
+        """
+        original_send = HTTPAdapter.send
+        cassette = self
+        
+        def send(adapter, request, **kwargs):
+            return cassette._send(original_send, adapter, request, **kwargs)
+        
+        HTTPAdapter.send = send
+        try:
+            yield self
+        finally:
+            HTTPAdapter.send = original_send
+            if self.mode == RECORD:
+                self.save()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.entries)
@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Motor bazında devre kesici (circuit breaker) ve negatif önbellek modülü.
+
+Hatalı bir motor (geçersiz anahtar, tükenmiş kota, 5xx yanıtlar) her
+çalıştırmada hata gecikmesini yeniden öder. Devre kesici, motorun son
+çağrılarındaki hata ve yavaş çağrı oranını izler; eşik aşılınca devre
+açılır ve istekler ağa gitmeden reddedilir. Bekleme süresi dolunca devre
+yarı açık duruma geçer ve az sayıda deneme isteğine izin verilir; deneme
+başarılıysa devre kapanır, değilse yeniden açılır.
+
+Negatif önbellek ise başarısız olan motor × sorgu çiftlerini kısa bir süre
+saklar; aynı çift bu süre içinde yeniden denenmez.
+
+Motorlar hataları boş sonuçla gizlediğinden hatalar, arama sırasında
+trace_errors() ile açılan bağlam üzerinden report_error() ile bildirilir.
+
+Örnek:
+    breakers = CircuitBreakerRegistry()
+    with breakers.guard(engine, query, num_results) as call:
+        results, call.elapsed_time = engine.measure_search_time(query, num_results)
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+from src.core import SearchEngine, logger
+from src.cache import normalize_query
+
+# Devre durumları
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Raporlarda kullanılan durum adları
+STATE_LABELS = {
+    CLOSED: "Kapalı",
+    OPEN: "Açık",
+    HALF_OPEN: "Yarı Açık",
+}
+
+DEFAULT_NEGATIVE_CACHE_TTL = 30.0  # saniye
+
+
+class CircuitOpenError(RuntimeError):
+    """İstek, açık devre veya negatif önbellek nedeniyle gönderilmeden reddedildiğinde oluşur."""
+
+
+@dataclass
+class CircuitBreakerSpec:
+    """Bir motorun devre kesici ayarları."""
+    failure_rate_threshold: float = 0.5  # devreyi açan hata oranı
+    slow_call_threshold: Optional[float] = None  # yavaş sayılan çağrı süresi (saniye, None ise izlenmez)
+    slow_call_rate_threshold: float = 1.0  # devreyi açan yavaş çağrı oranı
+    window_size: int = 20  # oranların hesaplandığı son çağrı sayısı
+    minimum_calls: int = 5  # oranlar değerlendirilmeden önce gereken çağrı sayısı
+    open_duration: float = 30.0  # devrenin açık kalacağı süre (saniye)
+    half_open_calls: int = 1  # yarı açık durumda izin verilen deneme isteği sayısı
+
+
+class CircuitBreaker:
+    """Tek bir motorun kapalı / açık / yarı açık durum makinesi."""
+    
+    def __init__(self, spec: Optional[CircuitBreakerSpec] = None):
+        """
+        CircuitBreaker sınıfını başlatır.
+        
+        Args:
+            spec: Devre kesici ayarları (None ise varsayılanlar)
+        """
+        self.spec = spec or CircuitBreakerSpec()
+        self.state = CLOSED
+        # Son çağrıların (hatalı, yavaş) bayrakları
+        self._calls = deque(maxlen=self.spec.window_size)
+        self._opened_at = None
+        self._probes = 0
+        self._lock = threading.Lock()
+        
+        # Sayaçlar
+        self.trips = 0
+        self.rejected = 0
+    
+    def _update_state(self) -> None:
+        """Açık devrenin bekleme süresi dolduysa yarı açık duruma geçer (kilit altında çağrılır)."""
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.spec.open_duration:
+            self.state = HALF_OPEN
+            self._probes = 0
+    
+    def _trip(self) -> None:
+        """Devreyi açar (kilit altında çağrılır)."""
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+        self.trips += 1
+    
+    def allow_request(self) -> bool:
+        """
+        İsteğin gönderilip gönderilemeyeceğini döndürür. Yarı açık durumda
+        izin verilen her istek bir deneme hakkı tüketir.
+        
+        Returns:
+            İstek gönderilebilirse True
+        """
+        with self._lock:
+            self._update_state()
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and self._probes < self.spec.half_open_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self, elapsed_time: Optional[float] = None) -> None:
+        """
+        Başarılı bir çağrıyı kaydeder; süre eşiği aşan çağrılar yavaş sayılır.
+        
+        Args:
+            elapsed_time: Çağrının süresi (saniye)
+        """
+        threshold = self.spec.slow_call_threshold
+        slow = threshold is not None and elapsed_time is not None and elapsed_time >= threshold
+        self._record(failed=False, slow=slow)
+    
+    def record_failure(self) -> None:
+        """Başarısız bir çağrıyı (hata veya zaman aşımı) kaydeder."""
+        self._record(failed=True, slow=False)
+    
+    def _record(self, failed: bool, slow: bool) -> None:
+        """Çağrı sonucunu pencereye ekler ve gerekirse durumu değiştirir."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                # Deneme isteği sağlıklıysa devre kapanır, değilse yeniden açılır
+                if failed or slow:
+                    self._trip()
+                else:
+                    self.state = CLOSED
+                    self._calls.clear()
+                return
+            if self.state == OPEN:
+                # Devre açılmadan önce gönderilmiş isteklerin sonuçları
+                return
+            
+            self._calls.append((failed, slow))
+            if len(self._calls) < self.spec.minimum_calls:
+                return
+            failure_rate = sum(1 for call in self._calls if call[0]) / len(self._calls)
+            slow_rate = sum(1 for call in self._calls if call[1]) / len(self._calls)
+            if failure_rate >= self.spec.failure_rate_threshold or (
+                    self.spec.slow_call_threshold is not None and slow_rate >= self.spec.slow_call_rate_threshold):
+                self._trip()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Devre durumunu ve sayaçları döndürür.
+        
+        Returns:
+            state, trips, rejected, failure_rate ve slow_call_rate içeren sözlük
+        """
+        with self._lock:
+            self._update_state()
+            calls = len(self._calls)
+            return {
+                "state": self.state,
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "failure_rate": sum(1 for call in self._calls if call[0]) / calls if calls else 0.0,
+                "slow_call_rate": sum(1 for call in self._calls if call[1]) / calls if calls else 0.0
+            }
+
+
+class NegativeCache:
+    """Başarısız motor × sorgu çiftlerini kısa süre saklayan iş parçacığı güvenli önbellek."""
+    
+    def __init__(self, ttl: float = DEFAULT_NEGATIVE_CACHE_TTL):
+        """
+        NegativeCache sınıfını başlatır.
+        
+        Args:
+            ttl: Hataların saklanacağı süre (saniye)
+        """
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+    
+    def make_key(self, engine_name: str, query: str, num_results: int) -> Tuple[str, str, int]:
+        """
+        Önbellek anahtarını oluşturur.
+        
+        Args:
+            engine_name: Motor adı
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            (motor, normalleştirilmiş sorgu, sonuç sayısı) biçiminde anahtar
+        """
+        return (engine_name, normalize_query(query), num_results)
+    
+    def get(self, key: Tuple[str, str, int]) -> Optional[str]:
+        """
+        Anahtara ait geçerli hata mesajını döndürür.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Hata mesajı veya kayıt yoksa/süresi dolmuşsa None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, message = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self.hits += 1
+            return message
+    
+    def put(self, key: Tuple[str, str, int], message: str) -> None:
+        """
+        Hatayı önbelleğe yazar.
+        
+        Args:
+            key: Önbellek anahtarı
+            message: Hata mesajı
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, message)
+    
+    def clear(self) -> None:
+        """Tüm kayıtları siler."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for expires_at, _ in self._entries.values() if expires_at > now)
+
+
+class ErrorTrace:
+    """Bir arama sırasında motorun boş sonuçla gizlediği hataları kaydeder."""
+    
+    def __init__(self):
+        self.errors = 0
+        self.last_error = None
+    
+    def record(self, error: Exception) -> None:
+        """
+        Bir hatayı kaydeder.
+        
+        Args:
+            error: Yakalanan istisna
+        """
+        self.errors += 1
+        self.last_error = error
+
+
+_current_errors = ContextVar("search_errors", default=None)
+
+
+@contextmanager
+def trace_errors():
+    """
+    Blok içindeki (aynı iş parçacığı veya asyncio görevi) aramaların
+    bildirdiği hataları izler.
+    
+    Yields:
+        ErrorTrace nesnesi
+    """
+    trace = ErrorTrace()
+    token = _current_errors.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_errors.reset(token)
+
+
+def report_error(error: Exception) -> None:
+    """
+    Motorun yakalayıp boş sonuçla gizlediği hatayı etkin izlemeye bildirir;
+    etkin izleme yoksa hiçbir şey yapmaz.
+    
+    Args:
+        error: Yakalanan istisna
+    """
+    trace = _current_errors.get()
+    if trace is not None:
+        trace.record(error)
+
+
+class CircuitCall:
+    """guard() bloğundaki çağrının süresini taşır."""
+    
+    def __init__(self):
+        self.elapsed_time = None
+
+
+class CircuitBreakerRegistry:
+    """Her motor için ayrı devre kesici ve ortak negatif önbellek tutar."""
+    
+    def __init__(self,
+                 specs: Optional[Dict[str, CircuitBreakerSpec]] = None,
+                 default_spec: Optional[CircuitBreakerSpec] = None,
+                 negative_cache_ttl: float = DEFAULT_NEGATIVE_CACHE_TTL):
+        """
+        CircuitBreakerRegistry sınıfını başlatır.
+        
+        Args:
+            specs: Motor sınıf adı (veya motor adı) -> devre kesici ayarları
+            default_spec: Tanımı olmayan motorlar için kullanılacak ayarlar
+            negative_cache_ttl: Başarısız motor × sorgu çiftlerinin saklanacağı süre
+                (saniye, 0 ise negatif önbellek kullanılmaz)
+        """
+        self.specs = specs or {}
+        self.default_spec = default_spec or CircuitBreakerSpec()
+        self.negative_cache = NegativeCache(negative_cache_ttl)
+        self._breakers = {}
+        self._lock = threading.Lock()
+    
+    def breaker_for(self, engine: SearchEngine) -> CircuitBreaker:
+        """
+        Motorun devre kesicisini döndürür.
+        
+        Args:
+            engine: Arama motoru
+        
+        Returns:
+            CircuitBreaker nesnesi
+        """
+        with self._lock:
+            if engine.name not in self._breakers:
+                spec = self.specs.get(engine.settings_key, self.specs.get(engine.name, self.default_spec))
+                self._breakers[engine.name] = CircuitBreaker(spec)
+            return self._breakers[engine.name]
+    
+    @contextmanager
+    def guard(self, engine: SearchEngine, query: str, num_results: int):
+        """
+        Aramayı devre kesici ve negatif önbellek üzerinden çalıştırır. Blok
+        içinde fırlatılan veya report_error ile bildirilen hatalar başarısız
+        çağrı sayılır; bloğun sonunda call.elapsed_time atanmışsa yavaş çağrı
+        eşiği ile karşılaştırılır.
+        
+        Args:
+            engine: Arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Yields:
+            CircuitCall nesnesi
+        
+        Raises:
+            CircuitOpenError: Devre açıksa veya çift negatif önbellekteyse
+        """
+        key = self.negative_cache.make_key(engine.name, query, num_results)
+        cached_error = self.negative_cache.get(key)
+        if cached_error is not None:
+            raise CircuitOpenError(f"{engine.name} - '{query}' yakın zamanda başarısız oldu: {cached_error}")
+        
+        breaker = self.breaker_for(engine)
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{engine.name} devresi açık, istek gönderilmedi")
+        
+        trips = breaker.trips
+        call = CircuitCall()
+        with trace_errors() as errors:
+            try:
+                yield call
+            except Exception as e:
+                breaker.record_failure()
+                self.negative_cache.put(key, str(e))
+                raise
+        
+        if errors.errors:
+            breaker.record_failure()
+            self.negative_cache.put(key, str(errors.last_error))
+        else:
+            breaker.record_success(call.elapsed_time)
+        
+        if breaker.trips > trips:
+            logger.warning(f"{engine.name} devresi açıldı ({breaker.trips}. kez)")
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Tüm motorların devre kesici istatistiklerini döndürür.
+        
+        Returns:
+            Motor adı -> istatistik sözlüğü
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {engine_name: breaker.get_stats() for engine_name, breaker in breakers.items()}
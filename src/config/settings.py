@@ -10,26 +10,40 @@ yapılandırma ayarlarını sağlar.
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import Dict, Any, List, Type
+from typing import Dict, Any, List, Optional, Type
 
-# .env dosyasını yükle
-load_dotenv()
+from src.credentials import get_credentials
 
 # Proje kök dizini
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
-# API anahtarları
-API_KEYS = {
+# API anahtarlarının kimlik bilgisi sağlayıcısındaki adları
+# (Key: api_key_name, Value: motor sınıfı parametresi -> değişken adı)
+API_KEY_NAMES = {
     "google": {
-        "api_key": os.getenv("GOOGLE_API_KEY"),
-        "cx": os.getenv("GOOGLE_CX"),
+        "api_key": "GOOGLE_API_KEY",
+        "cx": "GOOGLE_CX",
     },
     "bing": {
-        "api_key": os.getenv("BING_API_KEY"),
+        "api_key": "BING_API_KEY",
     },
     "brave": {
-        "api_key": os.getenv("BRAVE_API_KEY"),
+        "api_key": "BRAVE_API_KEY",
+    },
+    "serper": {
+        "api_key": "SERPER_API_KEY",
+    },
+    "tavily": {
+        "api_key": "TAVILY_API_KEY",
+    },
+    "jina": {
+        "api_key": "JINA_API_KEY",
+    },
+    "firecrawl": {
+        "api_key": "FIRECRAWL_API_KEY",
+    },
+    "searchapi": {
+        "api_key": "SEARCHAPI_KEY",
     }
 }
 
@@ -41,6 +55,9 @@ DEFAULT_TEST_RUNS = 3
 # Raporlama ayarları
 REPORT_DIR = os.path.join(BASE_DIR, "reports")
 REPORT_FILENAME_TEMPLATE = "search_evaluation_report_{timestamp}.md"
+
+# Kalıcı yanıt önbelleği (src/cache.py - ResponseCache)
+RESPONSE_CACHE_PATH = get_credentials().get("RESPONSE_CACHE_PATH", os.path.join(BASE_DIR, "cache", "responses.sqlite3"))
 # Arama motoru özellikleri
 ENGINE_SETTINGS = {
     # Google arama motoru ayarları:
@@ -50,13 +67,18 @@ ENGINE_SETTINGS = {
     # - module_path: Motorun Python modül yolu
     # - class_name: Kullanılacak sınıf adı
     # - api_key_name: API anahtarının .env dosyasındaki adı
+    # - rate_limit: Hız sınırı (src/rate_limiter.py tarafından uygulanır)
+    #     requests_per_second: Saniyedeki istek sayısı, burst: Patlama kapasitesi,
+    #     max_concurrency: Aynı anda yürütülen arama sayısı (yoksa concurrent_requests'e göre belirlenir);
+    #     bir aramanın sayfaları aynı yuvayı kullanır ve her biri kovadan token alır
     "GoogleSearch": {
         "max_results_per_page": 10,
         "requires_api_key": True,
         "concurrent_requests": False,
         "module_path": "src.engines.google",
         "class_name": "GoogleSearch", 
-        "api_key_name": "google"
+        "api_key_name": "google",
+        "rate_limit": {"requests_per_second": 1, "burst": 5, "max_concurrency": 1}
     },
     "BingSearch": {
         "max_results_per_page": 50,
@@ -64,21 +86,24 @@ ENGINE_SETTINGS = {
         "concurrent_requests": False,
         "module_path": "src.engines.bing",
         "class_name": "BingSearch",
-        "api_key_name": "bing"
+        "api_key_name": "bing",
+        "rate_limit": {"requests_per_second": 3, "burst": 3, "max_concurrency": 1}
     },
     "DuckDuckGoSearch": {
         "max_results_per_page": 25,
         "requires_api_key": False,
         "concurrent_requests": False,
         "module_path": "src.engines.duck",
-        "class_name": "DuckDuckGoSearch"
+        "class_name": "DuckDuckGoSearch",
+        "rate_limit": {"requests_per_second": 1, "burst": 2, "max_concurrency": 1}
     },
     "QuickSearch": {
         "max_results_per_page": 10,
         "requires_api_key": False,
         "concurrent_requests": False,
         "module_path": "src.utils.quick_search",
-        "class_name": "QuickSearch"
+        "class_name": "QuickSearch",
+        "rate_limit": {"requests_per_second": 1, "burst": 2, "max_concurrency": 1}
     },
     "BraveSearch": {
         "max_results_per_page": 10,
@@ -86,7 +111,53 @@ ENGINE_SETTINGS = {
         "concurrent_requests": False,
         "module_path": "src.engines.brave",
         "class_name": "BraveSearch",
-        "api_key_name": "brave"
+        "api_key_name": "brave",
+        "rate_limit": {"requests_per_second": 1, "burst": 1, "max_concurrency": 1}
+    },
+    "SerperSearch": {
+        "max_results_per_page": 40,
+        "requires_api_key": True,
+        "concurrent_requests": True,
+        "module_path": "src.engines.serper",
+        "class_name": "SerperSearch",
+        "api_key_name": "serper",
+        "rate_limit": {"requests_per_second": 5, "burst": 10, "max_concurrency": 5}
+    },
+    "TavilySearch": {
+        "max_results_per_page": 20,
+        "requires_api_key": True,
+        "concurrent_requests": True,
+        "module_path": "src.engines.tavily",
+        "class_name": "TavilySearch",
+        "api_key_name": "tavily",
+        "rate_limit": {"requests_per_second": 2, "burst": 4, "max_concurrency": 4}
+    },
+    "JinaSearch": {
+        "max_results_per_page": 50,
+        "requires_api_key": True,
+        "concurrent_requests": True,
+        "module_path": "src.engines.jina",
+        "class_name": "JinaSearch",
+        "api_key_name": "jina",
+        "rate_limit": {"requests_per_second": 1, "burst": 2, "max_concurrency": 2}
+    },
+    "FirecrawlSearch": {
+        "max_results_per_page": 20,
+        "requires_api_key": True,
+        "concurrent_requests": True,
+        "module_path": "src.engines.firecrawl",
+        "class_name": "FirecrawlSearch",
+        "api_key_name": "firecrawl",
+        "rate_limit": {"requests_per_second": 1, "burst": 2, "max_concurrency": 2}
+    },
+    "SearchApiSearch": {
+        "max_results_per_page": 100,
+        "requires_api_key": True,
+        "concurrent_requests": True,
+        "module_path": "src.engines.searchapi",
+        "class_name": "SearchApiSearch",
+        "api_key_name": "searchapi",
+        "rate_limit": {"requests_per_second": 5, "burst": 5, "max_concurrency": 5}
     }
 }
 
@@ -103,6 +174,21 @@ PYTHON_FILE_HEADER = """#!/usr/bin/env python
 
 """
 
+def get_api_keys(api_key_name: str) -> Dict[str, Optional[str]]:
+    """
+    Bir motorun API anahtarlarını paylaşılan kimlik bilgisi sağlayıcısından
+    okur. Değerler her çağrıda sağlayıcıdan alındığından .env dosyasındaki
+    değişiklikler ve set_credentials ile verilen sağlayıcı hemen geçerli olur.
+    
+    Args:
+        api_key_name: ENGINE_SETTINGS'teki api_key_name değeri (ör. "google")
+        
+    Returns:
+        Motor sınıfı parametresi -> değer sözlüğü (tanımlı değilse boş sözlük)
+    """
+    credentials = get_credentials()
+    return {param: credentials.get(env_name) for param, env_name in API_KEY_NAMES.get(api_key_name, {}).items()}
+
 def get_engine_settings(engine_name: str) -> Dict[str, Any]:
     """
     Belirli bir arama motoru için ayarları döndürür.
@@ -0,0 +1,226 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Tuple, Union
+import asyncio
+import contextvars
+import logging
+import time
+
+from src.histogram import monotonic_ns, NS_PER_SECOND
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger("search_evaluator")
+
+@dataclass
+class SearchResult:
+    """Arama sonucunu temsil eden veri sınıfı."""
+    title: str
+    link: str
+    snippet: str
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Sonucu sözlük formatına dönüştürür."""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "snippet": self.snippet
+        }
+
+
+class SearchEngine(ABC):
+    """Tüm arama motorları için temel arayüz."""
+    
+    def __init__(self, name: str, source_url: str, license_type: str):
+        """
+        SearchEngine temel sınıfını başlatır.
+        
+        Args:
+            name: Arama motoru adı
+            source_url: Arama motorunun kaynak URL'si
+            license_type: Lisans türü
+        """
+        self.name = name
+        self.source_url = source_url
+        self.license_type = license_type
+        self.rate_limit_info = "Belirtilmemiş"
+        self.pricing_info = "Belirtilmemiş"
+    
+    @property
+    def settings_key(self) -> str:
+        """
+        ENGINE_SETTINGS gibi sınıf adıyla tutulan tanımlarda (hız sınırı, devre
+        kesici) motorun anahtarı; başka motoru temsil eden vekiller ezer.
+        """
+        return self.__class__.__name__
+        
+    @abstractmethod
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Verilen sorgu ile arama yapar ve sonuçları döndürür.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            
+        Returns:
+            Liste olarak SearchResult nesneleri
+        """
+        pass
+    
+    async def async_search(self, 
+                           query: str, 
+                           num_results: int = 10, 
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """
+        search metodunun asenkron karşılığı.
+        
+        Yerel asenkron implementasyonu olmayan motorlar için bloklayan search
+        çağrısını olay döngüsünün varsayılan iş parçacığı havuzunda çalıştırır;
+        bağlam değişkenleri (önbellek atlama, süre sınırı, aşama ölçümü) iş
+        parçacığına taşınır.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession (yerel implementasyonlar kullanır)
+            
+        Returns:
+            Liste olarak SearchResult nesneleri
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, contextvars.copy_context().run, self.search, query, num_results)
+    
+    def search_iter(self, query: str, num_results: int = 10) -> Iterator[SearchResult]:
+        """
+        Sonuçları hazır oldukça üreten arama. Yanıtları parça parça
+        ayrıştırabilen motorlar bu metodu ezer; varsayılan implementasyon
+        search sonucunu tek seferde üretir.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            
+        Yields:
+            SearchResult nesneleri
+        """
+        yield from self.search(query, num_results)
+    
+    async def async_search_iter(self,
+                                query: str,
+                                num_results: int = 10,
+                                session: Optional[Any] = None) -> AsyncIterator[SearchResult]:
+        """
+        search_iter metodunun asenkron karşılığı; varsayılan implementasyon
+        async_search sonucunu tek seferde üretir.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+            
+        Yields:
+            SearchResult nesneleri
+        """
+        for result in await self.async_search(query, num_results, session=session):
+            yield result
+    
+    def measure_search_time(self, query: str, num_results: int = 10) -> Tuple[List[SearchResult], float]:
+        """
+        Arama süresi ölçümü ile search metodu çağrısı yapar.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye) biçiminde tuple
+        """
+        # Monoton nanosaniye saati; sistem saati değişikliklerinden etkilenmez
+        start_ns = monotonic_ns()
+        results = self.search(query, num_results)
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        return results, elapsed_time
+    
+    async def async_measure_search_time(self, 
+                                        query: str, 
+                                        num_results: int = 10, 
+                                        session: Optional[Any] = None) -> Tuple[List[SearchResult], float]:
+        """
+        Arama süresi ölçümü ile async_search metodu çağrısı yapar.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+            
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye) biçiminde tuple
+        """
+        start_ns = monotonic_ns()
+        results = await self.async_search(query, num_results, session=session)
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        return results, elapsed_time
+    
+    def measure_search_iter(self, query: str, num_results: int = 10) -> Tuple[List[SearchResult], float, List[float]]:
+        """
+        search_iter üzerinden arama yapar; toplam sürenin yanında her sonucun
+        hazır olduğu anı da ölçer (ilk sonuca kadar geçen süre için).
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye, sonuç_başına_varış_süreleri) biçiminde tuple
+        """
+        start_ns = monotonic_ns()
+        results = []
+        arrival_times = []
+        for result in self.search_iter(query, num_results):
+            arrival_times.append((monotonic_ns() - start_ns) / NS_PER_SECOND)
+            results.append(result)
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        return results, elapsed_time, arrival_times
+    
+    async def async_measure_search_iter(self,
+                                        query: str,
+                                        num_results: int = 10,
+                                        session: Optional[Any] = None) -> Tuple[List[SearchResult], float, List[float]]:
+        """
+        measure_search_iter metodunun asenkron karşılığı.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+            
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye, sonuç_başına_varış_süreleri) biçiminde tuple
+        """
+        start_ns = monotonic_ns()
+        results = []
+        arrival_times = []
+        async for result in self.async_search_iter(query, num_results, session=session):
+            arrival_times.append((monotonic_ns() - start_ns) / NS_PER_SECOND)
+            results.append(result)
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        return results, elapsed_time, arrival_times
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Arama motoru hakkında bilgileri döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        return {
+            "name": self.name,
+            "source_url": self.source_url,
+            "license_type": self.license_type,
+            "rate_limit": self.rate_limit_info,
+            "pricing": self.pricing_info
+        } 
\ No newline at end of file
@@ -9,6 +9,9 @@ import statistics
 from src.core.search_interface import SearchEngine, SearchResult
 from src.config.settings import REPORT_FILENAME_TEMPLATE
 from src.utils.pdf_report import PdfReportGenerator
+from src.cache import trace_cache_hits
+from src.histogram import LatencyHistogram, DEFAULT_PERCENTILES, percentile_key, format_percentiles, format_latency
+from src.stats import time_to_k, rank_label, DEFAULT_RESULT_RANKS
 
 class SearchEngineEvaluator:
     """Farklı arama motorlarını değerlendirmeye yarayan sınıf."""
@@ -18,6 +21,8 @@ class SearchEngineEvaluator:
         self.engines = []
         self.results = {}
         self.metrics = {}
+        # Motor bazında tüm sorgular üzerindeki gecikme dağılımı
+        self.latency_histograms = {}
         
     def register_engine(self, engine: SearchEngine) -> None:
         """
@@ -59,13 +64,21 @@ class SearchEngineEvaluator:
             
             # Birden fazla ölçüm alınarak ortalama hesaplanacak
             times = []
+            arrival_runs = []
             found_results = None
             
             for i in range(runs):
                 try:
                     print(f"Çalıştırma {i+1}/{runs}...")
-                    results, elapsed_time = engine.measure_search_time(query, num_results)
+                    with trace_cache_hits() as trace:
+                        results, elapsed_time, arrival_times = engine.measure_search_iter(query, num_results)
+                    # Kalıcı önbellekten dönen yanıtlarda ilk canlı isteğin süresi kullanılır;
+                    # yanıt tek seferde alındığından tüm sonuçlar o anda hazırdı
+                    if trace.recorded_time is not None:
+                        elapsed_time = trace.recorded_time
+                        arrival_times = [elapsed_time] * len(results)
                     times.append(elapsed_time)
+                    arrival_runs.append(arrival_times)
                     
                     # İlk geçerli sonuçları sakla
                     if found_results is None and results:
@@ -79,6 +92,8 @@ class SearchEngineEvaluator:
             # Test sonuçlarını kaydet
             if times:
                 average_time = statistics.mean(times)
+                histogram = LatencyHistogram.from_seconds(times)
+                self.latency_histograms.setdefault(engine_name, LatencyHistogram()).merge(histogram)
                 test_results[engine_name] = {
                     "engine_info": engine.get_engine_info(),
                     "query": query,
@@ -86,6 +101,8 @@ class SearchEngineEvaluator:
                     "avg_response_time": average_time,
                     "min_response_time": min(times),
                     "max_response_time": max(times),
+                    "latency_percentiles": histogram.to_dict(),
+                    "time_to_k": time_to_k(arrival_runs, DEFAULT_RESULT_RANKS),
                     "results_count": len(found_results) if found_results else 0,
                     "results": [
                         {
@@ -106,6 +123,15 @@ class SearchEngineEvaluator:
         self.results[query] = test_results
         return test_results
     
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Motor bazında tüm ölçümler üzerindeki gecikme yüzdeliklerini döndürür.
+        
+        Returns:
+            Motor adı -> histogram özeti (count, min, max, mean, p50, p90, p95, p99, p99.9)
+        """
+        return {engine_name: histogram.to_dict() for engine_name, histogram in self.latency_histograms.items()}
+    
     def generate_report(self, output_dir: str = ".") -> str:
         """
         Test sonuçlarına dayalı karşılaştırmalı bir Markdown raporu oluşturur.
@@ -175,6 +201,15 @@ class SearchEngineEvaluator:
                 f.write(f"- **API/Kütüphane Adı:** {engine_name}\n")
                 f.write(f"- **Kullanılan endpoint:** {engine_info.get('source_url', 'Belirtilmemiş')}\n")
                 f.write(f"- **Ortalama yanıt süresi:** {data.get('avg_response_time', 'N/A'):.2f} saniye\n")
+                if data.get("latency_percentiles"):
+                    percentiles = ", ".join(
+                        f"{percentile_key(p)} {value}"
+                        for p, value in zip(DEFAULT_PERCENTILES, format_percentiles(data["latency_percentiles"]))
+                    )
+                    f.write(f"- **Gecikme yüzdelikleri:** {percentiles}\n")
+                if data.get("time_to_k"):
+                    ranks = ", ".join(f"{rank_label(k)} {format_latency(value)}" for k, value in data["time_to_k"].items())
+                    f.write(f"- **Sonuç hazır olma süreleri:** {ranks}\n")
                 f.write(f"- **Ücretsiz sorgu limiti ve fiyatlandırma:** {engine_info.get('pricing', 'Belirtilmemiş')}\n")
                 f.write(f"- **Rate limit:** {engine_info.get('rate_limit', 'Belirtilmemiş')}\n")
                 f.write(f"- **Sonuç kalitesi:** (1-5 arası puan ve kısa yorum) *Manuel değerlendirme gerekiyor*\n")
@@ -196,6 +231,32 @@ class SearchEngineEvaluator:
             f.write(tabulate(table_data, headers=headers, tablefmt="pipe"))
             f.write("\n\n")
             
+            # Tüm sorgular üzerindeki gecikme yüzdelikleri
+            latency_percentiles = self.get_latency_percentiles()
+            if latency_percentiles:
+                f.write("### Gecikme Yüzdelikleri\n\n")
+                percentile_rows = [
+                    [engine_name, summary["count"], format_latency(summary["mean"])] + format_percentiles(summary)
+                    for engine_name, summary in latency_percentiles.items()
+                ]
+                percentile_headers = ["API", "Ölçüm", "Ort."] + [percentile_key(p) for p in DEFAULT_PERCENTILES]
+                f.write(tabulate(percentile_rows, headers=percentile_headers, tablefmt="pipe"))
+                f.write("\n\n")
+            
+            # İlk sonuca ve ilk k sonuca kadar geçen süreler (toplam süreden önce hazır olabilir)
+            ranked_engines = {name: data for name, data in self.results[first_query].items() if data.get("time_to_k")}
+            if ranked_engines:
+                f.write("### Sonuç Hazır Olma Süreleri\n\n")
+                f.write("İlk sonuca ve ilk k sonuca kadar geçen ortalama süre; k sonuca ulaşmayan çalıştırmalar dahil değildir.\n\n")
+                rank_rows = [
+                    [engine_name, format_latency(data["avg_response_time"])]
+                    + [format_latency(data["time_to_k"].get(k)) for k in DEFAULT_RESULT_RANKS]
+                    for engine_name, data in ranked_engines.items()
+                ]
+                rank_headers = ["API", "Ort. Toplam"] + [rank_label(k) for k in DEFAULT_RESULT_RANKS]
+                f.write(tabulate(rank_rows, headers=rank_headers, tablefmt="pipe"))
+                f.write("\n\n")
+            
             # 5. Öneriler
             f.write("## 5. Öneriler\n")
             f.write("*Manuel değerlendirme gerekiyor. Aşağıdaki kullanım senaryolarına göre değerlendirilebilir:*\n\n")
@@ -246,7 +307,8 @@ class SearchEngineEvaluator:
         pdf_generator = PdfReportGenerator(
             search_results=self.results,
             engines=self.engines,
-            output_dir=output_dir
+            output_dir=output_dir,
+            latency_percentiles=self.get_latency_percentiles()
         )
         
         # PDF raporu oluştur
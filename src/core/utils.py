@@ -14,7 +14,7 @@ from typing import List, Dict, Any, Type, Optional
 from dotenv import load_dotenv
 
 from src.core.search_interface import SearchEngine
-from src.config.settings import ENGINE_SETTINGS, API_KEYS, SUPPORTED_ENGINES, get_engine_settings
+from src.config.settings import ENGINE_SETTINGS, SUPPORTED_ENGINES, get_api_keys, get_engine_settings
 
 def dynamic_import(module_path: str, class_name: str) -> Type:
     """
@@ -59,7 +59,7 @@ def load_engine(engine_name: str) -> Optional[SearchEngine]:
         # API Key gerekiyorsa
         if engine_settings.get("requires_api_key", False):
             api_key_name = engine_settings.get("api_key_name")
-            api_keys = API_KEYS.get(api_key_name, {})
+            api_keys = get_api_keys(api_key_name)
             
             if not api_keys:
                 print(f"{engine_name} için API anahtarı desteği tanımlanmamış.")
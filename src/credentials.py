@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+API anahtarları ve diğer gizli ayarlar için merkezi kimlik bilgisi modülü.
+
+.env dosyası her motor oluşturulduğunda yeniden okunup ayrıştırılmak yerine
+süreç başına bir kez yüklenir ve önbellekte tutulur; dosya sonradan
+değişirse (değiştirilme zamanı farklıysa) bir sonraki okumada yeniden
+yüklenir. Değerler şu öncelikle aranır: doğrudan verilen değerler, çevre
+değişkenleri, .env dosyası (load_dotenv'in override=False davranışı).
+
+Motorlara farklı bir sağlayıcı `credentials` parametresiyle verilebilir;
+verilmezse get_credentials() ile paylaşılan varsayılan sağlayıcı kullanılır.
+
+Örnek:
+    credentials = CredentialProvider(values={"SERPER_API_KEY": "..."})
+    engine = SerperSearch(credentials=credentials)
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+from dotenv import dotenv_values, find_dotenv
+
+from src.core import logger
+
+# .env dosyasının değişip değişmediğinin en sık kontrol edileceği aralık (saniye)
+DEFAULT_CHECK_INTERVAL = 1.0
+
+
+class CredentialProvider:
+    """
+    .env dosyasını bir kez yükleyip önbellekte tutan, dosya değiştiğinde
+    yeniden yükleyen, iş parçacığı güvenli kimlik bilgisi sağlayıcısı.
+    """
+    
+    def __init__(self,
+                 env_file: Optional[str] = None,
+                 values: Optional[Mapping[str, str]] = None,
+                 use_environ: bool = True,
+                 check_interval: Optional[float] = DEFAULT_CHECK_INTERVAL):
+        """
+        CredentialProvider sınıfını başlatır.
+        
+        Args:
+            env_file: .env dosyasının yolu (None ise proje dizinlerinde aranır, "" ise dosya kullanılmaz)
+            values: Diğer kaynaklardan önce gelen doğrudan değerler (testler ve işçi süreçleri için)
+            use_environ: Çevre değişkenlerine bakılıp bakılmayacağı
+            check_interval: Dosya değişikliğinin en sık kontrol edileceği aralık
+                (saniye, 0 ise her okumada, None ise hiç yeniden yüklenmez)
+        """
+        self.env_file = env_file
+        self.values = dict(values or {})
+        self.use_environ = use_environ
+        self.check_interval = check_interval
+        self.loads = 0
+        
+        self._file_values: Optional[Dict[str, str]] = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _resolve_path(self) -> str:
+        """.env dosyasının yolunu döndürür (bulunamazsa boş metin)."""
+        if self.env_file is None:
+            self.env_file = find_dotenv()
+        return self.env_file
+    
+    def _is_fresh(self, now: float) -> bool:
+        """Önbellekteki değerlerin dosya kontrol edilmeden kullanılıp kullanılamayacağı."""
+        if self._file_values is None:
+            return False
+        return self.check_interval is None or now - self._checked_at < self.check_interval
+    
+    def _load(self) -> Dict[str, str]:
+        """
+        .env değerlerini ilk okumada yükler, sonraki okumalarda dosya
+        değiştiyse yeniden yükler.
+        
+        Returns:
+            .env dosyasındaki değerler
+        """
+        now = time.monotonic()
+        if self._is_fresh(now):
+            return self._file_values
+        
+        with self._lock:
+            if self._is_fresh(now):
+                return self._file_values
+            self._checked_at = now
+            
+            path = self._resolve_path()
+            try:
+                mtime = os.stat(path).st_mtime_ns if path else None
+            except OSError:
+                mtime = None
+            
+            if self._file_values is None or mtime != self._mtime:
+                self._file_values = {key: value for key, value in dotenv_values(path).items()
+                                     if value is not None} if mtime is not None else {}
+                self._mtime = mtime
+                self.loads += 1
+                logger.debug(f".env dosyası yüklendi: {path or '(bulunamadı)'}")
+            return self._file_values
+    
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Kimlik bilgisini döndürür.
+        
+        Args:
+            name: Değişken adı (ör. SERPER_API_KEY)
+            default: Bulunamazsa döndürülecek değer
+        
+        Returns:
+            Değer veya default
+        """
+        if name in self.values:
+            return self.values[name]
+        if self.use_environ and name in os.environ:
+            return os.environ[name]
+        return self._load().get(name, default)
+    
+    def reload(self) -> None:
+        """.env dosyasını bir sonraki okumada yeniden yüklenmeye zorlar."""
+        with self._lock:
+            self._file_values = None
+            self._mtime = None
+
+
+_default_provider: Optional[CredentialProvider] = None
+_default_lock = threading.Lock()
+
+
+def get_credentials() -> CredentialProvider:
+    """
+    Paylaşılan varsayılan kimlik bilgisi sağlayıcısını döndürür (ilk çağrıda oluşturulur).
+    
+    Returns:
+        CredentialProvider nesnesi
+    """
+    global _default_provider
+    if _default_provider is None:
+        with _default_lock:
+            if _default_provider is None:
+                _default_provider = CredentialProvider()
+    return _default_provider
+
+
+def set_credentials(provider: Optional[CredentialProvider]) -> None:
+    """
+    Varsayılan kimlik bilgisi sağlayıcısını değiştirir.
+    
+    Args:
+        provider: Yeni sağlayıcı (None ise sonraki get_credentials çağrısında yeniden oluşturulur)
+    """
+    global _default_provider
+    with _default_lock:
+        _default_provider = provider
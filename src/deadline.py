@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Arama süre sınırı (deadline) modülü.
+
+Bir aramanın tamamı için verilen süre bütçesi bağlam değişkeni olarak
+taşınır; bağlantı kurma, yanıt okuma ve sayfalama döngüleri kalan süreyi
+buradan okur. Böylece motorların imzalarını değiştirmeden değerlendirici
+veya meta motorlar tarafından verilen süre sınırı en alttaki HTTP isteğine
+kadar iletilir. İç içe süre sınırlarında daha erken biten geçerlidir.
+
+Örnek:
+    with deadline(2.0):
+        results = engine.search("python")  # 2 saniyede bitmezse SearchTimeoutError
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+
+class SearchTimeoutError(TimeoutError):
+    """Arama süre sınırı içinde tamamlanamadığında oluşur."""
+
+
+class Deadline:
+    """Monoton saate göre belirlenmiş bir bitiş anı."""
+    
+    def __init__(self, timeout: float):
+        """
+        Deadline sınıfını başlatır.
+        
+        Args:
+            timeout: Şu andan itibaren verilen süre (saniye)
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+    
+    def remaining(self) -> float:
+        """Kalan süreyi döndürür (saniye, süre dolduysa 0)."""
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    @property
+    def expired(self) -> bool:
+        """Sürenin dolup dolmadığı."""
+        return time.monotonic() >= self.expires_at
+    
+    def check(self, what: str = "arama") -> None:
+        """
+        Süre dolduysa SearchTimeoutError fırlatır.
+        
+        Args:
+            what: Hata mesajında kullanılacak işlem adı
+        
+        Raises:
+            SearchTimeoutError: Süre dolduysa
+        """
+        if self.expired:
+            raise SearchTimeoutError(f"{what} {self.timeout:.2f} saniyelik süre sınırını aştı")
+
+
+_current_deadline = ContextVar("search_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: Optional[float]):
+    """
+    Blok içindeki aramalar için süre sınırı belirler. timeout None ise
+    mevcut süre sınırı (varsa) aynen geçerli kalır.
+    
+    Args:
+        timeout: Süre bütçesi (saniye)
+    
+    Yields:
+        Geçerli Deadline nesnesi veya None
+    """
+    current = _current_deadline.get()
+    if timeout is None or (current is not None and current.remaining() <= timeout):
+        yield current
+        return
+    
+    token = _current_deadline.set(Deadline(timeout))
+    try:
+        yield _current_deadline.get()
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Geçerli süre sınırını döndürür (yoksa None)."""
+    return _current_deadline.get()
+
+
+def check_deadline(what: str = "arama") -> None:
+    """
+    Geçerli süre sınırı dolduysa SearchTimeoutError fırlatır; sayfalama
+    döngülerinde her istekten önce çağrılır.
+    
+    Args:
+        what: Hata mesajında kullanılacak işlem adı
+    """
+    current = _current_deadline.get()
+    if current is not None:
+        current.check(what)
+
+
+def request_timeout(default: Optional[float]) -> Optional[float]:
+    """
+    Tek bir HTTP isteğine verilecek zaman aşımını döndürür: varsayılan süre
+    ile geçerli süre sınırında kalan sürenin küçüğü.
+    
+    Args:
+        default: Süre sınırı yokken kullanılacak zaman aşımı (saniye)
+    
+    Returns:
+        Zaman aşımı (saniye) veya None
+    
+    Raises:
+        SearchTimeoutError: Süre sınırı zaten dolduysa
+    """
+    current = _current_deadline.get()
+    if current is None:
+        return default
+    
+    current.check()
+    remaining = current.remaining()
+    return remaining if default is None else min(default, remaining)
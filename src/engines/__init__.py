@@ -4,21 +4,34 @@
 """
 Arama motorları paketini başlatan modül.
 Bu modul, tüm arama motoru sınıflarını dışarıya expose eder.
+
+Motor modülleri (ve onlarla birlikte requests, BeautifulSoup gibi bağımlılıklar)
+paket içe aktarılırken değil, sınıfa ilk erişildiğinde yüklenir; böylece
+`main.py -e serper` yalnızca Serper motorunun modülünü yükler. Paket dışındaki
+motorlar "search_evaluator.engines" entry point grubu ile eklenebilir:
+    
+    [project.entry-points."search_evaluator.engines"]
+    mymotor = "paketim.motor:MyMotorSearch"
 """
 
-from typing import Dict, Type, Any, List, Optional
+import importlib
+from importlib.metadata import entry_points
+from typing import Dict, Type, Any, List, Optional, TYPE_CHECKING
 
-# Arama motoru sınıflarını import et
-from .bing import BingSearch
-from .google import GoogleSearch
-from .duck import DuckDuckGoSearch
-from .brave import BraveSearch
-from .searchapi import SearchApiSearch
-from .serper import SerperSearch
-from .jina import JinaSearch
-from .firecrawl import FirecrawlSearch
-from .tavily import TavilySearch
-from src.core import SearchEngine
+if TYPE_CHECKING:
+    from .bing import BingSearch
+    from .google import GoogleSearch
+    from .duck import DuckDuckGoSearch
+    from .brave import BraveSearch
+    from .searchapi import SearchApiSearch
+    from .serper import SerperSearch
+    from .jina import JinaSearch
+    from .firecrawl import FirecrawlSearch
+    from .tavily import TavilySearch
+    from src.core import SearchEngine
+
+# Eklenti motorlarının tanımlandığı entry point grubu
+ENTRY_POINT_GROUP = "search_evaluator.engines"
 
 # Kullanılabilir tüm motorları bir sözlükte topla
 # Key: Motor ID, Value: Sınıf
@@ -34,17 +47,51 @@ AVAILABLE_ENGINES: Dict[str, str] = {
     "tavily": "TavilySearch"
 }
 
-def register_engine(key: str, class_name: str) -> None:
+# Paket dışındaki motorların modül yolları (Key: Motor ID, Value: Modül)
+_ENGINE_MODULES: Dict[str, str] = {}
+
+_plugins_loaded = False
+
+def register_engine(key: str, class_name: str, module_name: Optional[str] = None) -> None:
     """
     Yeni bir arama motorunu kayıt eder.
     
     Args:
         key: Arama motoru anahtar adı
         class_name: Arama motoru sınıfının adı
+        module_name: Sınıfın bulunduğu modül (None ise src.engines.<key>)
     """
     AVAILABLE_ENGINES[key] = class_name
+    if module_name:
+        _ENGINE_MODULES[key] = module_name
+    else:
+        _ENGINE_MODULES.pop(key, None)
+
+def load_plugins() -> None:
+    """
+    ENTRY_POINT_GROUP grubundaki eklenti motorlarını kayıt eder. Entry point
+    değeri "modül:Sınıf" biçiminde olmalıdır; modüller yine ilk kullanımda
+    yüklenir. Yerleşik motorlarla aynı anahtara sahip eklentiler yok sayılır.
+    """
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        module_name, _, class_name = entry_point.value.partition(":")
+        if not class_name:
+            print(f"Geçersiz motor eklentisi '{entry_point.name}': {entry_point.value}")
+            continue
+        if entry_point.name in AVAILABLE_ENGINES:
+            continue
+        register_engine(entry_point.name, class_name.strip(), module_name.strip())
+
+def _engine_module(key: str) -> str:
+    """Motorun sınıfını içeren modülün adını döndürür."""
+    return _ENGINE_MODULES.get(key, f"src.engines.{key}")
 
-def get_engine_class(key: str) -> Optional[Type[SearchEngine]]:
+def get_engine_class(key: str) -> Optional[Type["SearchEngine"]]:
     """
     Anahtar adına göre arama motoru sınıfını döndürür.
     
@@ -54,15 +101,16 @@ def get_engine_class(key: str) -> Optional[Type[SearchEngine]]:
     Returns:
         Arama motoru sınıfı veya None
     """
+    if key not in AVAILABLE_ENGINES:
+        load_plugins()
     if key not in AVAILABLE_ENGINES:
         return None
     
     class_name = AVAILABLE_ENGINES[key]
-    module_name = f"src.engines.{key}"
+    module_name = _engine_module(key)
     
     try:
         # Dinamik olarak modülü içe aktar
-        import importlib
         module = importlib.import_module(module_name)
         engine_class = getattr(module, class_name)
         return engine_class
@@ -72,11 +120,12 @@ def get_engine_class(key: str) -> Optional[Type[SearchEngine]]:
 
 def get_available_engines() -> List[str]:
     """
-    Mevcut tüm arama motorlarının listesini döndürür.
+    Mevcut tüm arama motorlarının (eklentiler dahil) listesini döndürür.
     
     Returns:
         Motor anahtarlarının listesi
     """
+    load_plugins()
     return list(AVAILABLE_ENGINES.keys())
 
 def get_all_engine_classes() -> Dict[str, Type[Any]]:
@@ -86,7 +135,24 @@ def get_all_engine_classes() -> Dict[str, Type[Any]]:
     Returns:
         ID ve sınıf eşleşmelerini içeren sözlük
     """
-    return {key: get_engine_class(key) for key in AVAILABLE_ENGINES}
+    return {key: get_engine_class(key) for key in get_available_engines()}
+
+def __getattr__(name: str) -> Any:
+    """
+    Motor sınıflarını ilk erişimde yükler (`from src.engines import SerperSearch`).
+    
+    Raises:
+        AttributeError: İsim kayıtlı bir motor sınıfı değilse
+    """
+    for key, class_name in list(AVAILABLE_ENGINES.items()):
+        if class_name == name:
+            engine_class = getattr(importlib.import_module(_engine_module(key)), class_name)
+            globals()[name] = engine_class
+            return engine_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(AVAILABLE_ENGINES.values()))
 
 __all__ = [
     'BingSearch',
@@ -102,5 +168,6 @@ __all__ = [
     'get_all_engine_classes',
     'AVAILABLE_ENGINES',
     'register_engine',
+    'load_plugins',
     'get_available_engines'
 ]
@@ -1,17 +1,47 @@
-from typing import Dict, List, Any, Optional
-import os
-from dotenv import load_dotenv
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional, Tuple, Union
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import requests
 from src.core import SearchEngine, SearchResult, logger
+from src.credentials import CredentialProvider, get_credentials
+from src.rate_limiter import pace_request, async_pace_request
+from src.utils import (create_async_session, create_http_session, compile_result_mapping, ResultMapping,
+                       DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT)
+from src.histogram import monotonic_ns, NS_PER_SECOND
+from src.phases import phase_timer
+from src.deadline import SearchTimeoutError, deadline, request_timeout
+from src.circuit_breaker import report_error
 
 class BaseAPISearch(SearchEngine):
     """API tabanlı arama motorları için temel sınıf."""
     
+    # Yanıt gövdesinin biçimi: "json" veya "text"
+    response_format = "json"
+    
+    # Sonuçları etkileyen ve kalıcı önbellek anahtarına eklenen istek parametreleri (ör. gl, hl)
+    cache_key_params = ()
+    
+    # Sayfalama: tek istekte dönebilecek en fazla sonuç (None ise sayfalama yapılmaz),
+    # API'nin izin verdiği toplam sonuç sınırı ve aynı anda gönderilecek sayfa isteği sayısı
+    # (hız sınırlama etkinse her sayfa motorun kovasından token alır; kovada token
+    # kaldıkça sayfalar eşzamanlı, sonrası saniyedeki istek sınırıyla gönderilir)
+    page_size = None
+    max_results = None
+    page_concurrency = 4
+    
+    # JSON yanıtındaki sonuç listesinin ve alanların yolları; tanımlıysa varsayılan
+    # _parse_response bunu kullanır (yollar motor başına bir kez derlenir)
+    result_mapping: Optional[ResultMapping] = None
+    
     def __init__(self, 
                  name: str, 
                  source_url: str, 
                  license_type: str,
                  api_key_env_name: Optional[str] = None,
-                 api_key: Optional[str] = None):
+                 api_key: Optional[str] = None,
+                 credentials: Optional[CredentialProvider] = None):
         """
         BaseAPISearch sınıfını başlatır.
         
@@ -21,25 +51,541 @@ class BaseAPISearch(SearchEngine):
             license_type: Lisans türü
             api_key_env_name: .env dosyasında API anahtarını içeren değişken adı
             api_key: Doğrudan belirtilen API anahtarı (None ise env'den yüklenir)
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(name, source_url, license_type)
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
+        # .env dosyası her motor için yeniden okunmaz; sağlayıcı bir kez yükleyip önbellekte tutar
+        self.credentials = credentials or get_credentials()
         
         # API anahtarını doğrudan set et veya env'den yükle
         if api_key:
             self.api_key = api_key
         elif api_key_env_name:
-            self.api_key = os.getenv(api_key_env_name)
+            self.api_key = self.credentials.get(api_key_env_name)
             if not self.api_key:
                 logger.warning(f"{api_key_env_name} çevre değişkeni bulunamadı")
         else:
             self.api_key = None
+        
+        # Çalıştırmalar arasında paylaşılan bağlantı havuzu (ilk istekte oluşturulur)
+        self.pool_size = DEFAULT_POOL_SIZE
+        self.keep_alive = True
+        self._session = None
+        
+        # Kalıcı yanıt önbelleği (src.cache.ResponseCache, None ise kullanılmaz)
+        self.response_cache = None
+        
+        # Tek bir HTTP isteğinin zaman aşımı (saniye); arama süre sınırı daha kısaysa o geçerlidir
+        self.timeout = DEFAULT_TIMEOUT
+        
+        # Sonuç eşlemesinden derlenmiş çıkarma fonksiyonu
+        self._extract_results = compile_result_mapping(self.result_mapping) if self.result_mapping else None
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Motorun bağlantı havuzlu HTTP oturumu.
+        
+        Returns:
+            requests.Session nesnesi
+        """
+        if self._session is None:
+            self._session = create_http_session(pool_size=self.pool_size, keep_alive=self.keep_alive)
+        return self._session
+    
+    def configure_session(self, pool_size: Optional[int] = None, keep_alive: Optional[bool] = None) -> None:
+        """
+        Bağlantı havuzu ayarlarını değiştirir; açık bağlantılar kapatılır ve
+        sonraki istekte yeni ayarlarla oturum oluşturulur.
+        
+        Args:
+            pool_size: Host başına havuzda tutulacak bağlantı sayısı
+            keep_alive: Bağlantıların istekler arasında açık tutulup tutulmayacağı
+        """
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+        self.reset_session()
+    
+    def reset_session(self) -> None:
+        """
+        Havuzdaki bağlantıları kapatır. Sonraki istek soğuk bağlantı ile
+        (DNS, TCP ve TLS dahil) başlar.
+        """
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def bypass_cache(self):
+        """
+        Blok içindeki aramalarda kalıcı önbelleğin okunmamasını sağlayan bağlam
+        yöneticisi döndürür; canlı yanıtlar yine önbelleğe yazılır.
+        
+        Returns:
+            Bağlam yöneticisi
+        """
+        if self.response_cache is None:
+            return nullcontext()
+        return self.response_cache.bypass_cache()
+    
+    def _cache_key(self, query: str, num_results: int, request: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        İstek için kalıcı önbellek anahtarını oluşturur.
+        
+        cache_key_params içinde listelenen parametreler isteğin params, json
+        veya data alanından okunur; böylece farklı yerel ayarlarla yapılan
+        aramalar ayrı saklanır.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            request: _build_request tarafından oluşturulan istek tanımı
+        
+        Returns:
+            Önbellek anahtarı veya önbellek kullanılmıyorsa None
+        """
+        if self.response_cache is None:
+            return None
+        
+        params = {}
+        for field in ("params", "json", "data"):
+            values = request.get(field)
+            if isinstance(values, dict):
+                params.update({name: values[name] for name in self.cache_key_params if name in values})
+        
+        return self.response_cache.make_key(self.name, query, num_results, params)
+    
+    def _store_response(self,
+                        cache_key: Optional[Tuple],
+                        data: Union[Dict[str, Any], str],
+                        results: List[SearchResult],
+                        elapsed_time: float) -> None:
+        """
+        Ham yanıtı ve ayrıştırılmış sonuçları kalıcı önbelleğe yazar.
+        
+        Args:
+            cache_key: _cache_key tarafından oluşturulan anahtar (None ise yazılmaz)
+            data: Ham yanıt gövdesi
+            results: Ayrıştırılmış sonuçlar
+            elapsed_time: İsteğin gönderilmesinden gövdenin okunmasına kadar geçen süre
+        """
+        # Boş sonuçlar genellikle hata anlamına gelir, önbelleğe alınmaz
+        if cache_key is not None and results:
+            self.response_cache.put(cache_key, data, results, elapsed_time)
+    
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
+        """
+        Motorun HTTP isteğini tanımlar.
+        
+        Dönen sözlük hem requests hem aiohttp tarafından kullanılabilecek
+        anahtarları içerir: method, url ve isteğe bağlı olarak headers,
+        params, json, data.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            İstek tanımını içeren sözlük
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} _build_request metodunu uygulamalıdır")
+    
+    def _parse_response(self, data: Union[Dict[str, Any], str], num_results: int) -> List[SearchResult]:
+        """
+        Ham yanıt gövdesinden SearchResult nesneleri oluşturur. Varsayılan
+        implementasyon result_mapping tanımlı motorlarda eşlemeyi kullanır.
+        
+        Args:
+            data: JSON yanıtı (sözlük) veya response_format "text" ise HTML metni
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        if self._extract_results is not None:
+            return self._extract_results(data, num_results)
+        raise NotImplementedError(f"{self.__class__.__name__} _parse_response metodunu uygulamalıdır")
+    
+    def _page_request(self, request: Dict[str, Any], offset: int, count: int) -> Dict[str, Any]:
+        """
+        İlk sayfanın istek tanımından belirtilen sayfanın isteğini oluşturur.
+        page_size tanımlayan motorlar bu metodu uygulamalıdır.
+        
+        Args:
+            request: _build_request tarafından oluşturulan (ilk sayfa) istek tanımı
+            offset: Sayfanın ilk sonucunun 0 tabanlı sırası
+            count: Sayfada istenen sonuç sayısı
+        
+        Returns:
+            Sayfanın istek tanımı
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} _page_request metodunu uygulamalıdır")
+    
+    def _page_offsets(self, num_results: int) -> List[Tuple[int, int]]:
+        """
+        İstenen sonuç sayısı için sayfaları döndürür.
+        
+        Args:
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            (başlangıç, sonuç sayısı) çiftlerinin listesi; sayfalama gerekmiyorsa tek sayfa
+        """
+        if self.max_results is not None:
+            num_results = min(num_results, self.max_results)
+        if not self.page_size or num_results <= self.page_size:
+            return [(0, num_results)]
+        return [(offset, min(self.page_size, num_results - offset)) for offset in range(0, num_results, self.page_size)]
+    
+    def _request_timeout(self) -> Optional[float]:
+        """
+        Gönderilecek istek için zaman aşımını döndürür: self.timeout ile geçerli
+        arama süre sınırında kalan sürenin küçüğü. Bağlantı kurma ve okuma
+        aşamalarının her biri bu süreyle sınırlanır.
+        
+        Returns:
+            Zaman aşımı (saniye) veya None
+        
+        Raises:
+            SearchTimeoutError: Süre sınırı zaten dolduysa
+        """
+        return request_timeout(self.timeout)
+    
+    def _send_request(self, request: Dict[str, Any]) -> requests.Response:
+        """
+        İstek tanımını motorun bağlantı havuzlu oturumu üzerinden gönderir.
+        
+        Args:
+            request: _build_request tarafından oluşturulan istek tanımı
+        
+        Returns:
+            Response nesnesi
+        """
+        response = self.session.request(**request, timeout=self._request_timeout())
+        response.raise_for_status()
+        return response
+    
+    async def _async_send_request(self, session: Any, request: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+        """
+        İstek tanımını aiohttp oturumu üzerinden gönderir ve gövdeyi okur.
+        
+        Args:
+            session: aiohttp.ClientSession nesnesi
+            request: _build_request tarafından oluşturulan istek tanımı
+        
+        Returns:
+            response_format'a göre JSON sözlüğü veya metin
+        """
+        import aiohttp  # yalnızca asenkron yolda yüklenir; oturum zaten aiohttp gerektirir
+        
+        timeout = self._request_timeout()
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        async with session.request(**request, timeout=client_timeout) as response:
+            response.raise_for_status()
+            with phase_timer("download"):
+                await response.read()
+            with phase_timer("parse"):
+                if self.response_format == "json":
+                    return await response.json(content_type=None)
+                return await response.text()
+    
+    def search(self, query: str, num_results: int = 10, timeout: Optional[float] = None) -> List[SearchResult]:
+        """
+        İsteği oluşturur, gönderir ve yanıtı ayrıştırır.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            timeout: Aramanın tamamı için süre bütçesi (saniye, None ise geçerli
+                süre sınırı veya yalnızca istek başına self.timeout)
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        
+        Raises:
+            SearchTimeoutError: Arama süre sınırı veya istek zaman aşımı içinde tamamlanamazsa
+        """
+        with deadline(timeout):
+            return self._search(query, num_results)
+    
+    def _search(self, query: str, num_results: int) -> List[SearchResult]:
+        """search metodunun süre sınırı uygulanmış gövdesi."""
+        return list(self.search_iter(query, num_results))
+    
+    def search_iter(self, query: str, num_results: int = 10) -> Iterator[SearchResult]:
+        """
+        Sonuçları her yanıt (sayfalı motorlarda her sayfa) ayrıştırılır
+        ayrıştırılmaz üreten arama. Tüketici ilk sonuçlarla hemen çalışmaya
+        başlayabilir; tüketici erken durursa kalan sayfa istekleri iptal edilir.
+        Süre sınırı için çağıran taraf deadline() bloğu kullanır.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Yields:
+            SearchResult nesneleri (sıralı)
+        
+        Raises:
+            SearchTimeoutError: Arama süre sınırı veya istek zaman aşımı içinde tamamlanamazsa
+        """
+        request = self._build_request(query, num_results)
+        cache_key = self._cache_key(query, num_results, request)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield from cached
+                return
+        
+        pages = self._page_offsets(num_results)
+        if len(pages) > 1:
+            yield from self._iter_pages(request, pages, cache_key)
+            return
+        
+        try:
+            start_ns = monotonic_ns()
+            with pace_request(self):
+                response = self._send_request(request)
+            with phase_timer("parse"):
+                data = response.json() if self.response_format == "json" else response.text
+            elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+            with phase_timer("parse"):
+                results = self._parse_response(data, num_results)
+            self._store_response(cache_key, data, results, elapsed_time)
+        except Exception as e:
+            self._raise_if_timeout(e)
+            self._handle_request_error(e)
+            return
+        yield from results
+    
+    def _fetch_page(self, request: Dict[str, Any], offset: int, count: int) -> Tuple[Any, List[SearchResult]]:
+        """
+        Tek bir sayfayı gönderir ve ayrıştırır.
+        
+        Args:
+            request: İlk sayfanın istek tanımı
+            offset: Sayfanın ilk sonucunun 0 tabanlı sırası
+            count: Sayfada istenen sonuç sayısı
+        
+        Returns:
+            (ham yanıt, sonuçlar) biçiminde tuple
+        """
+        with pace_request(self):
+            response = self._send_request(self._page_request(request, offset, count))
+        with phase_timer("parse"):
+            data = response.json() if self.response_format == "json" else response.text
+            return data, self._parse_response(data, count)
+    
+    def _iter_pages(self,
+                    request: Dict[str, Any],
+                    pages: List[Tuple[int, int]],
+                    cache_key: Optional[Tuple]) -> Iterator[SearchResult]:
+        """
+        Sayfaları en fazla page_concurrency eşzamanlı istekle gönderir ve
+        sonuçlarını sırayla üretir. Hız sınırlama etkinse her sayfa motorun
+        sınırlayıcısından token alır. Eksik dönen ilk sayfada durulur; sonraki
+        sayfaların henüz gönderilmemiş istekleri iptal edilir. Böylece derin
+        sonuçların gecikmesi sayfa sayısı × RTT yerine yaklaşık tek bir RTT olur.
+        
+        Args:
+            request: İlk sayfanın istek tanımı
+            pages: (başlangıç, sonuç sayısı) çiftleri
+            cache_key: Birleştirilmiş sonuçların yazılacağı önbellek anahtarı
+        
+        Yields:
+            SearchResult nesneleri (sayfa sırasıyla)
+        """
+        start_ns = monotonic_ns()
+        payloads = []
+        results = []
+        failed = False
+        executor = ThreadPoolExecutor(max_workers=min(self.page_concurrency, len(pages)))
+        try:
+            # Süre sınırı, hız sınırlama, aşama ölçümü ve hata izlemesi sayfa iş parçacıklarına kopyalanır
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._fetch_page, request, offset, count)
+                for offset, count in pages
+            ]
+            for future, (offset, count) in zip(futures, pages):
+                try:
+                    data, page_results = future.result()
+                except Exception as e:
+                    self._raise_if_timeout(e)
+                    self._handle_request_error(e)
+                    failed = True
+                    break
+                payloads.append(data)
+                results.extend(page_results)
+                yield from page_results
+                if len(page_results) < count:
+                    break
+        finally:
+            # Sonuç beklenmeden dönülür; sürmekte olan sayfa istekleri arka planda tamamlanır
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        # Bir sayfası hata veren aramanın eksik sonuçları önbelleğe yazılmaz
+        if not failed:
+            self._store_response(cache_key, payloads, results, elapsed_time)
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None,
+                           timeout: Optional[float] = None) -> List[SearchResult]:
+        """
+        search metodunun aiohttp tabanlı yerel asenkron implementasyonu.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession (None ise geçici oturum açılır)
+            timeout: Aramanın tamamı için süre bütçesi (saniye)
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        
+        Raises:
+            SearchTimeoutError: Arama süre sınırı veya istek zaman aşımı içinde tamamlanamazsa
+        """
+        with deadline(timeout):
+            return [result async for result in self.async_search_iter(query, num_results, session=session)]
+    
+    async def async_search_iter(self,
+                                query: str,
+                                num_results: int = 10,
+                                session: Optional[Any] = None) -> AsyncIterator[SearchResult]:
+        """
+        search_iter metodunun aiohttp tabanlı karşılığı.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession (None ise geçici oturum açılır)
+        
+        Yields:
+            SearchResult nesneleri (sıralı)
+        
+        Raises:
+            SearchTimeoutError: Arama süre sınırı veya istek zaman aşımı içinde tamamlanamazsa
+        """
+        request = self._build_request(query, num_results)
+        cache_key = self._cache_key(query, num_results, request)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                for result in cached:
+                    yield result
+                return
+        
+        pages = self._page_offsets(num_results)
+        if len(pages) > 1:
+            if session is None:
+                async with create_async_session() as own_session:
+                    async for result in self._async_iter_pages(own_session, request, pages, cache_key):
+                        yield result
+            else:
+                async for result in self._async_iter_pages(session, request, pages, cache_key):
+                    yield result
+            return
+        
+        try:
+            start_ns = monotonic_ns()
+            async with async_pace_request(self):
+                if session is None:
+                    async with create_async_session() as own_session:
+                        data = await self._async_send_request(own_session, request)
+                else:
+                    data = await self._async_send_request(session, request)
+            elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+            with phase_timer("parse"):
+                results = self._parse_response(data, num_results)
+            self._store_response(cache_key, data, results, elapsed_time)
+        except Exception as e:
+            self._raise_if_timeout(e)
+            self._handle_request_error(e)
+            return
+        for result in results:
+            yield result
+    
+    async def _async_iter_pages(self,
+                                session: Any,
+                                request: Dict[str, Any],
+                                pages: List[Tuple[int, int]],
+                                cache_key: Optional[Tuple]) -> AsyncIterator[SearchResult]:
+        """
+        _iter_pages metodunun aiohttp tabanlı karşılığı; eşzamanlılık bir
+        semafor ile page_concurrency ile sınırlanır.
+        
+        Args:
+            session: aiohttp.ClientSession nesnesi
+            request: İlk sayfanın istek tanımı
+            pages: (başlangıç, sonuç sayısı) çiftleri
+            cache_key: Birleştirilmiş sonuçların yazılacağı önbellek anahtarı
+        
+        Yields:
+            SearchResult nesneleri (sayfa sırasıyla)
+        """
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+        
+        async def fetch(offset: int, count: int) -> Tuple[Any, List[SearchResult]]:
+            async with semaphore, async_pace_request(self):
+                data = await self._async_send_request(session, self._page_request(request, offset, count))
+            with phase_timer("parse"):
+                return data, self._parse_response(data, count)
+        
+        start_ns = monotonic_ns()
+        payloads = []
+        results = []
+        failed = False
+        tasks = [asyncio.ensure_future(fetch(offset, count)) for offset, count in pages]
+        try:
+            for task, (offset, count) in zip(tasks, pages):
+                try:
+                    data, page_results = await task
+                except Exception as e:
+                    self._raise_if_timeout(e)
+                    self._handle_request_error(e)
+                    failed = True
+                    break
+                payloads.append(data)
+                results.extend(page_results)
+                for result in page_results:
+                    yield result
+                if len(page_results) < count:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        elapsed_time = (monotonic_ns() - start_ns) / NS_PER_SECOND
+        if not failed:
+            self._store_response(cache_key, payloads, results, elapsed_time)
+    
+    def _raise_if_timeout(self, e: Exception) -> None:
+        """
+        Zaman aşımı hatalarını SearchTimeoutError olarak yeniden fırlatır; diğer
+        hatalarda hiçbir şey yapmaz. Zaman aşımları boş sonuçla gizlenmez ki
+        değerlendirici onları ayrı bir sonuç türü olarak kaydedebilsin.
+        
+        Args:
+            e: Yakalanan istisna
+        
+        Raises:
+            SearchTimeoutError: e bir zaman aşımı hatasıysa
+        """
+        if isinstance(e, SearchTimeoutError):
+            raise e
+        if isinstance(e, (requests.exceptions.Timeout, asyncio.TimeoutError)):
+            raise SearchTimeoutError(f"{self.name} isteği zaman aşımına uğradı: {e}") from e
     
     def _handle_request_error(self, e: Exception, engine_name: Optional[str] = None) -> None:
         """
-        İstek hatalarının standart şekilde işlenmesi.
+        İstek hatalarının standart şekilde işlenmesi. Hata, devre kesicinin
+        görebilmesi için etkin hata izlemesine de bildirilir.
         
         Args:
             e: Yakalanan istisna
@@ -47,7 +593,8 @@ class BaseAPISearch(SearchEngine):
         """
         engine = engine_name or self.name
         logger.error(f"{engine} arama hatası: {str(e)}")
-        
+        report_error(e)
+    
     def _validate_api_key(self) -> bool:
         """
         API anahtarının varlığını kontrol eder.
@@ -60,4 +607,4 @@ class BaseAPISearch(SearchEngine):
         """
         if not self.api_key:
             raise ValueError(f"{self.name} için API anahtarı gerekli ancak bulunamadı")
-        return True 
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -8,31 +8,45 @@ Bu modül, Bing Web Search API kullanarak web aramaları yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import os
-from search_interface import SearchEngine, SearchResult
-from src.config.settings import API_KEYS, PYTHON_FILE_HEADER
+from src.core import SearchResult
+from src.engines.base import BaseAPISearch
+from src.utils import ResultMapping
+from src.credentials import CredentialProvider
+from src.config.settings import PYTHON_FILE_HEADER
 
-class BingSearch(SearchEngine):
+class BingSearch(BaseAPISearch):
     """Bing Search API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    # Kalıcı önbellek anahtarına eklenen yerel ayar parametreleri
+    cache_key_params = ("mkt",)
+    
+    # Bing tek seferde en fazla 50 sonuç döndürür; fazlası offset ile sayfalanır
+    page_size = 50
+    
+    # Sonuçlar "webPages.value" listesindedir; başlık "name", bağlantı "url" alanındadır
+    result_mapping = ResultMapping(items_path="webPages.value", title_field="name", link_field="url")
+    
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         BingSearch sınıfını başlatır.
         
         Args:
             api_key: Bing API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Bing Search",
             source_url="https://www.microsoft.com/en-us/bing/apis/bing-web-search-api",
-            license_type="Kapalı, Ücretli (Azure)"
+            license_type="Kapalı, Ücretli (Azure)",
+            api_key_env_name="BING_API_KEY",
+            api_key=api_key,
+            credentials=credentials
         )
         
-        # API anahtarlarını al
-        bing_api_keys = API_KEYS.get("bing", {})
-        self.api_key = api_key or bing_api_keys.get("api_key")
+        # API endpoint
+        self.base_url = "https://api.bing.microsoft.com/v7.0/search"
         
         self.rate_limit_info = "3 çağrı/saniye, 1000 çağrı/ay (ücretsiz)"
         self.pricing_info = "$7 / 1000 sorgu (ilk 1000 sorgu/ay ücretsiz)"
@@ -40,19 +54,17 @@ class BingSearch(SearchEngine):
         if not self.api_key:
             raise ValueError("Bing API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Bing Web Search API ile arama yapar.
+        Bing Web Search API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
-        search_url = "https://api.bing.microsoft.com/v7.0/search"
-        
         headers = {
             "Ocp-Apim-Subscription-Key": self.api_key
         }
@@ -65,22 +77,18 @@ class BingSearch(SearchEngine):
             "responseFilter": "Webpages"
         }
         
-        results = []
+        return {"method": "GET", "url": self.base_url, "headers": headers, "params": params}
+    
+    def _page_request(self, request: Dict[str, Any], offset: int, count: int) -> Dict[str, Any]:
+        """
+        Bing isteğinin offset ile kaydırılmış sayfasını oluşturur.
         
-        try:
-            response = requests.get(search_url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "webPages" in data and "value" in data["webPages"]:
-                for item in data["webPages"]["value"][:num_results]:
-                    results.append(SearchResult(
-                        title=item.get("name", ""),
-                        link=item.get("url", ""),
-                        snippet=item.get("snippet", "")
-                    ))
-                    
-        except Exception as e:
-            print(f"Bing arama hatası: {e}")
+        Args:
+            request: İlk sayfanın istek tanımı
+            offset: Sayfanın ilk sonucunun 0 tabanlı sırası
+            count: Sayfada istenen sonuç sayısı
             
-        return results 
\ No newline at end of file
+        Returns:
+            Sayfanın istek tanımı
+        """
+        return dict(request, params=dict(request["params"], offset=offset, count=count))
\ No newline at end of file
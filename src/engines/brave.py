@@ -8,27 +8,33 @@ Bu modül, Brave Search API'sini kullanarak web araması yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 
 class BraveSearch(BaseAPISearch):
     """Brave Search API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    # Kalıcı önbellek anahtarına eklenen yerel ayar parametreleri
+    cache_key_params = ("country", "search_lang", "safesearch")
+    
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         BraveSearch sınıfını başlatır.
         
         Args:
             api_key: Brave Search API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Brave Search",
             source_url="https://search.brave.com/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="BRAVE_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint
@@ -42,16 +48,16 @@ class BraveSearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("Brave Search API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Brave Search API ile arama yapar.
+        Brave Search API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek başlıklarını hazırla
         headers = {
@@ -69,51 +75,55 @@ class BraveSearch(BaseAPISearch):
             # "safesearch": "off"
         }
         
-        results = []
+        return {"method": "GET", "url": self.base_url, "headers": headers, "params": params}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        Brave Search yanıtından sonuçları çıkarır.
         
-        try:
-            # GET isteği yap
-            response = requests.get(self.base_url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Arama sonuçlarını işle
-            if "web" in data and "results" in data["web"]:
-                for item in data["web"]["results"][:num_results]:
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        link=item.get("url", ""),
-                        snippet=item.get("description", "")
-                    ))
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-            # İlgili bilgi kutuları ekle (Brave, bunları farklı bölümlerde döndürür)
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        results = []
+        
+        # Arama sonuçlarını işle
+        if "web" in data and "results" in data["web"]:
+            for item in data["web"]["results"][:num_results]:
+                results.append(SearchResult(
+                    title=item.get("title", ""),
+                    link=item.get("url", ""),
+                    snippet=item.get("description", "")
+                ))
+        
+        # İlgili bilgi kutuları ekle (Brave, bunları farklı bölümlerde döndürür)
+        
+        # Knowledge Graph
+        if len(results) < num_results and "infobox" in data:
+            infobox = data["infobox"]
+            title = infobox.get("title", "")
+            description = infobox.get("description", "")
             
-            # Knowledge Graph
-            if len(results) < num_results and "infobox" in data:
-                infobox = data["infobox"]
-                title = infobox.get("title", "")
-                description = infobox.get("description", "")
-                
-                if title or description:
+            if title or description:
+                results.append(SearchResult(
+                    title=title or "Brave Bilgi Kutusu",
+                    link=infobox.get("url", ""),
+                    snippet=description or ""
+                ))
+        
+        # Featured Snippet / Q&A
+        if len(results) < num_results and "mixed" in data:
+            for mixed_item in data["mixed"]:
+                if mixed_item.get("type") == "qa" and "qa" in mixed_item:
+                    qa_data = mixed_item["qa"]
                     results.append(SearchResult(
-                        title=title or "Brave Bilgi Kutusu",
-                        link=infobox.get("url", ""),
-                        snippet=description or ""
+                        title=qa_data.get("question", "Soru & Cevap"),
+                        link=qa_data.get("url", ""),
+                        snippet=qa_data.get("answer", "")
                     ))
-            
-            # Featured Snippet / Q&A
-            if len(results) < num_results and "mixed" in data:
-                for mixed_item in data["mixed"]:
-                    if mixed_item.get("type") == "qa" and "qa" in mixed_item:
-                        qa_data = mixed_item["qa"]
-                        results.append(SearchResult(
-                            title=qa_data.get("question", "Soru & Cevap"),
-                            link=qa_data.get("url", ""),
-                            snippet=qa_data.get("answer", "")
-                        ))
-                        break  # Sadece ilk Q&A'yı ekle
-            
-        except Exception as e:
-            self._handle_request_error(e)
+                    break  # Sadece ilk Q&A'yı ekle
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
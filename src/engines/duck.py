@@ -8,40 +8,50 @@ Bu modül, DuckDuckGo üzerinden arama yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
-from search_interface import SearchEngine, SearchResult
+from src.core import SearchResult
+from src.engines.base import BaseAPISearch
+from src.html_parsers import get_parser, parse_bs4
 import logging
 
 logger = logging.getLogger("search_engine")
 
-class DuckDuckGoSearch(SearchEngine):
+class DuckDuckGoSearch(BaseAPISearch):
     """DuckDuckGo arama API'si ile arama yapan sınıf."""
     
-    def __init__(self):
-        """DuckDuckGoSearch sınıfını başlatır."""
+    # DuckDuckGo JSON değil HTML döndürür
+    response_format = "text"
+    
+    def __init__(self, parser: Optional[str] = None):
+        """
+        DuckDuckGoSearch sınıfını başlatır.
+        
+        Args:
+            parser: HTML ayrıştırıcısı ("lxml", "stream" veya "bs4"; None ise
+                kullanılabilir olan en hızlısı)
+        """
         super().__init__(
             name="DuckDuckGo Search",
             source_url="https://duckduckgo.com",
             license_type="Açık Kaynak, Ücretsiz"
         )
+        self.base_url = "https://html.duckduckgo.com/html/"
         self.rate_limit_info = "Limitlenmemiş (ancak aşırı kullanım tespit edilirse IP kısıtlaması olabilir)"
         self.pricing_info = "Ücretsiz"
+        self.parser_name, self._html_parser = get_parser(parser)
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        DuckDuckGo ile arama yapar. DuckDuckGo'nun resmi API'si sınırlı olduğundan, 
-        HTML yanıtını işleyerek sonuçları çıkartır.
+        DuckDuckGo HTML arama isteğini hazırlar. DuckDuckGo'nun resmi API'si 
+        sınırlı olduğundan, HTML sayfası istenir.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
-        url = "https://html.duckduckgo.com/html/"
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
         }
@@ -50,52 +60,27 @@ class DuckDuckGoSearch(SearchEngine):
             "b": ""
         }
         
-        results = []
+        return {"method": "POST", "url": self.base_url, "headers": headers, "data": data}
+    
+    def _parse_response(self, data: str, num_results: int) -> List[SearchResult]:
+        """
+        DuckDuckGo HTML yanıtını seçilen ayrıştırıcıyla işleyerek sonuçları
+        çıkartır. Ayrıştırıcı hata verirse BeautifulSoup ile yeniden denenir.
         
-        try:
-            # POST isteği yap
-            response = requests.post(url, headers=headers, data=data)
-            response.raise_for_status()
-            
-            # HTML'i ayrıştır
-            soup = BeautifulSoup(response.text, "html.parser")
-            result_elements = soup.select(".result")
+        Args:
+            data: HTML yanıt metni
+            num_results: İstenen sonuç sayısı
             
-            # Sonuçları işle
-            for element in result_elements[:num_results]:
-                title_element = element.select_one(".result__title")
-                link_element = element.select_one(".result__url")
-                snippet_element = element.select_one(".result__snippet")
-                
-                # Link'i temizle
-                link = ""
-                if link_element:
-                    link = link_element.text.strip()
-                    
-                # Veya başlık öğesindeki linki al (daha güvenilir)
-                if title_element and title_element.find("a"):
-                    href = title_element.find("a").get("href", "")
-                    if href.startswith("/"):
-                        # Göreli bağlantıyı işle
-                        if "uddg=" in href:
-                            # URL'yi çıkart
-                            link = href.split("uddg=")[1].split("&")[0]
-                            try:
-                                link = requests.utils.unquote(link)
-                            except:
-                                pass
-                
-                # Sonucu ekle
-                results.append(SearchResult(
-                    title=title_element.text.strip() if title_element else "",
-                    link=link,
-                    snippet=snippet_element.text.strip() if snippet_element else ""
-                ))
-                
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        try:
+            return self._html_parser(data, num_results)
         except Exception as e:
-            logger.error(f"DuckDuckGo arama hatası: {e}")
-            
-        return results
+            if self.parser_name == "bs4":
+                raise
+            logger.warning(f"{self.parser_name} ayrıştırıcısı başarısız oldu, bs4 kullanılıyor: {str(e)}")
+            return parse_bs4(data, num_results)
 
 
 if __name__ == "__main__":
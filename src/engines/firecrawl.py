@@ -8,27 +8,30 @@ Bu modül, Firecrawl API'sini kullanarak web araması yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 
 class FirecrawlSearch(BaseAPISearch):
     """Firecrawl API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         FirecrawlSearch sınıfını başlatır.
         
         Args:
             api_key: Firecrawl API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Firecrawl Search",
             source_url="https://firecrawl.dev/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="FIRECRAWL_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint - güncel dokümantasyona göre doğru endpoint
@@ -42,16 +45,16 @@ class FirecrawlSearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("Firecrawl API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Firecrawl API ile arama yapar.
+        Firecrawl API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek başlıklarını hazırla 
         headers = {
@@ -65,24 +68,28 @@ class FirecrawlSearch(BaseAPISearch):
             "limit": min(20, num_results)  # Maksimum 20 sonuç
         }
         
-        results = []
+        return {"method": "POST", "url": self.base_url, "headers": headers, "json": payload}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        Firecrawl yanıtından sonuçları çıkarır.
         
-        try:
-            # POST isteği yap
-            response = requests.post(self.base_url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Arama sonuçlarını işle - çalışan örneğe göre düzenle
-            if "success" in data and data["success"] and "data" in data:
-                for item in data["data"]:
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        link=item.get("url", ""),
-                        snippet=item.get("description", "")
-                    ))
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-        except Exception as e:
-            self._handle_request_error(e)
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        results = []
+        
+        # Arama sonuçlarını işle - çalışan örneğe göre düzenle
+        if "success" in data and data["success"] and "data" in data:
+            for item in data["data"]:
+                results.append(SearchResult(
+                    title=item.get("title", ""),
+                    link=item.get("url", ""),
+                    snippet=item.get("description", "")
+                ))
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
@@ -13,35 +13,49 @@ from typing import List, Dict, Any, Optional
 import json
 import os
 from src.core.search_interface import SearchEngine, SearchResult
-from src.config.settings import API_KEYS, PYTHON_FILE_HEADER
+from src.config.settings import PYTHON_FILE_HEADER
 from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 from src.core import logger
-from src.utils import safe_request, extract_search_results
+from src.utils import safe_request, ResultMapping
 
 class GoogleSearch(BaseAPISearch):
     """Google Custom Search API kullanarak arama yapar."""
     
     BASE_URL = "https://www.googleapis.com/customsearch/v1"
     
-    def __init__(self, api_key: Optional[str] = None, cx: Optional[str] = None):
+    # Google tek seferde en fazla 10 sonuç döndürür ve start + num 100'ü geçemez
+    page_size = 10
+    max_results = 100
+    
+    # Sonuçlar "items" listesindedir; title, link ve snippet alanları varsayılan adlarıyla gelir
+    result_mapping = ResultMapping(items_path="items")
+    
+    def __init__(self, api_key: Optional[str] = None, cx: Optional[str] = None,
+                 credentials: Optional[CredentialProvider] = None):
         """
         GoogleSearch sınıfını başlatır.
         
         Args:
             api_key: Google API anahtarı (None ise çevre değişkeninden yüklenir)
             cx: Google Custom Search Engine ID (None ise çevre değişkeninden yüklenir)
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Google Search",
             source_url="https://developers.google.com/custom-search/v1/overview",
             license_type="Ticari",
             api_key_env_name="GOOGLE_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # Custom Search Engine ID'sini al
         self.cx = cx or self._get_cx_from_env()
         
+        # API endpoint (test sunucusuna yönlendirmek için değiştirilebilir)
+        self.base_url = self.BASE_URL
+        
         # Ücretlendirme ve limit bilgilerini ayarla
         self.pricing_info = "İlk 100 sorgu/gün ücretsiz, sonrası $5/1000 sorgu"
         self.rate_limit_info = "100 sorgu/gün (ücretsiz seviye)"
@@ -53,21 +67,21 @@ class GoogleSearch(BaseAPISearch):
         Returns:
             CX değeri veya None
         """
-        cx = os.getenv("GOOGLE_CX")
+        cx = self.credentials.get("GOOGLE_CX")
         if not cx:
             logger.warning("GOOGLE_CX çevre değişkeni bulunamadı")
         return cx
         
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Google Custom Search Engine API ile arama yapar.
+        Google Custom Search Engine API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
-            num_results: İstenen sonuç sayısı (max 10)
+            num_results: İstenen sonuç sayısı (ilk sayfa için en fazla 10)
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # API anahtarı ve CX değerinin varlığını kontrol et
         if not self.api_key or not self.cx:
@@ -76,29 +90,46 @@ class GoogleSearch(BaseAPISearch):
         # Google tek seferde maksimum 10 sonuç döndürür
         num_to_fetch = min(10, num_results)
         
-        try:
-            # API parametrelerini hazırla
-            params = {
-                "q": query,
-                "key": self.api_key,
-                "cx": self.cx,
-                "num": num_to_fetch
-            }
+        # API parametrelerini hazırla
+        params = {
+            "q": query,
+            "key": self.api_key,
+            "cx": self.cx,
+            "num": num_to_fetch
+        }
+        
+        return {"method": "GET", "url": self.base_url, "params": params}
+    
+    def _page_request(self, request: Dict[str, Any], offset: int, count: int) -> Dict[str, Any]:
+        """
+        Google isteğinin belirtilen sayfasını oluşturur (start 1 tabanlıdır: 1, 11, 21, ...).
+        
+        Args:
+            request: İlk sayfanın istek tanımı
+            offset: Sayfanın ilk sonucunun 0 tabanlı sırası
+            count: Sayfada istenen sonuç sayısı
             
-            # API isteği yap
-            response = safe_request(self.BASE_URL, params=params)
-            data = response.json()
+        Returns:
+            Sayfanın istek tanımı
+        """
+        return dict(request, params=dict(request["params"], start=offset + 1, num=count))
+    
+    def _send_request(self, request: Dict[str, Any]) -> requests.Response:
+        """
+        Google isteklerini safe_request üzerinden gönderir.
+        
+        Args:
+            request: _build_request tarafından oluşturulan istek tanımı
             
-            # Sonuçları çıkar ve döndür
-            return extract_search_results(
-                data=data,
-                items_path="items",
-                title_field="title",
-                link_field="link",
-                snippet_field="snippet",
-                max_results=num_results
-            )
-                
-        except Exception as e:
-            self._handle_request_error(e)
-            return [] 
\ No newline at end of file
+        Returns:
+            Response nesnesi
+        """
+        return safe_request(
+            request["url"],
+            method=request["method"],
+            headers=request.get("headers"),
+            params=request.get("params"),
+            json_data=request.get("json"),
+            timeout=self.timeout,
+            session=self.session
+        )
@@ -8,27 +8,33 @@ Bu modül, Jina AI API'sini kullanarak arama yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 
 class JinaSearch(BaseAPISearch):
     """Jina AI API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    # Kalıcı önbellek anahtarına eklenen yerel ayar parametreleri
+    cache_key_params = ("language",)
+    
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         JinaSearch sınıfını başlatır.
         
         Args:
             api_key: Jina AI API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Jina AI Search",
             source_url="https://jina.ai/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="JINA_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint
@@ -42,16 +48,16 @@ class JinaSearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("Jina AI API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Jina AI API ile arama yapar.
+        Jina AI API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek başlıklarını hazırla
         headers = {
@@ -68,57 +74,61 @@ class JinaSearch(BaseAPISearch):
             "include_metadata": True         # Metadata dahil etme
         }
         
-        results = []
+        return {"method": "POST", "url": self.base_url, "headers": headers, "json": payload}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        Jina AI yanıtından sonuçları çıkarır.
         
-        try:
-            # POST isteği yap
-            response = requests.post(self.base_url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Arama sonuçlarını işle
-            if "results" in data:
-                for item in data["results"][:num_results]:
-                    # Snippet/içerik için en iyi alanı seç
-                    content = ""
-                    metadata = item.get("metadata", {})
-                    
-                    # İçerik için öncelikli alanları kontrol et
-                    if "description" in metadata:
-                        content = metadata["description"]
-                    elif "snippet" in metadata:
-                        content = metadata["snippet"]
-                    elif "content" in metadata:
-                        content = metadata["content"]
-                    elif "text" in item:
-                        content = item["text"]
-                    
-                    # Başlık için en iyi alanı seç
-                    title = ""
-                    if "title" in metadata:
-                        title = metadata["title"]
-                    elif "name" in metadata:
-                        title = metadata["name"]
-                    else:
-                        # Başlık yoksa, içeriğin ilk 50 karakterini kullan
-                        title = content[:50] + "..." if len(content) > 50 else content
-                    
-                    # URL/Link için en iyi alanı seç
-                    link = ""
-                    if "url" in metadata:
-                        link = metadata["url"]
-                    elif "link" in metadata:
-                        link = metadata["link"]
-                    elif "source" in metadata:
-                        link = metadata["source"]
-                    
-                    results.append(SearchResult(
-                        title=title,
-                        link=link,
-                        snippet=content
-                    ))
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-        except Exception as e:
-            self._handle_request_error(e)
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        results = []
+        
+        # Arama sonuçlarını işle
+        if "results" in data:
+            for item in data["results"][:num_results]:
+                # Snippet/içerik için en iyi alanı seç
+                content = ""
+                metadata = item.get("metadata", {})
+                
+                # İçerik için öncelikli alanları kontrol et
+                if "description" in metadata:
+                    content = metadata["description"]
+                elif "snippet" in metadata:
+                    content = metadata["snippet"]
+                elif "content" in metadata:
+                    content = metadata["content"]
+                elif "text" in item:
+                    content = item["text"]
+                
+                # Başlık için en iyi alanı seç
+                title = ""
+                if "title" in metadata:
+                    title = metadata["title"]
+                elif "name" in metadata:
+                    title = metadata["name"]
+                else:
+                    # Başlık yoksa, içeriğin ilk 50 karakterini kullan
+                    title = content[:50] + "..." if len(content) > 50 else content
+                
+                # URL/Link için en iyi alanı seç
+                link = ""
+                if "url" in metadata:
+                    link = metadata["url"]
+                elif "link" in metadata:
+                    link = metadata["link"]
+                elif "source" in metadata:
+                    link = metadata["source"]
+                
+                results.append(SearchResult(
+                    title=title,
+                    link=link,
+                    snippet=content
+                ))
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
@@ -8,26 +8,36 @@ Bu modül, SearchAPI.io API'yi kullanarak Google SERP sonuçlarını çeken
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, extract_search_results, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
+from src.utils import ResultMapping
 
 class SearchApiSearch(BaseAPISearch):
     """SearchAPI.io API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    # Kalıcı önbellek anahtarına eklenen yerel ayar parametreleri
+    cache_key_params = ("gl", "hl")
+    
+    # Organik sonuçlar "organic_results" listesindedir
+    result_mapping = ResultMapping(items_path="organic_results")
+    
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         SearchApiSearch sınıfını başlatır.
         
         Args:
             api_key: SearchAPI.io API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="SearchAPI.io Search",
             source_url="https://www.searchapi.io/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="SEARCHAPI_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint
@@ -41,16 +51,16 @@ class SearchApiSearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("SearchAPI.io API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        SearchAPI.io API ile Google araması yapar.
+        SearchAPI.io API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek parametrelerini hazırla
         params = {
@@ -62,44 +72,37 @@ class SearchApiSearch(BaseAPISearch):
             "hl": "tr"   # Türkçe arayüz için
         }
         
-        results = []
+        return {"method": "GET", "url": self.base_url, "params": params}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        SearchAPI.io yanıtından Google sonuçlarını çıkarır.
         
-        try:
-            # İsteği yap
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Organic sonuçları al
-            if "organic_results" in data:
-                organic_results = extract_search_results(
-                    data=data,
-                    items_path="organic_results",
-                    title_field="title",
-                    link_field="link",
-                    snippet_field="snippet",
-                    max_results=num_results
-                )
-                results.extend(organic_results)
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-            # Eğer yeterli sonuç yoksa, featured_snippet ve knowledge_graph ekle
-            if len(results) < num_results and "featured_snippet" in data:
-                snippet = data["featured_snippet"]
-                results.append(SearchResult(
-                    title=snippet.get("title", "Öne Çıkan Sonuç"),
-                    link=snippet.get("link", ""),
-                    snippet=snippet.get("snippet", "")
-                ))
-                
-            if len(results) < num_results and "knowledge_graph" in data:
-                kg = data["knowledge_graph"]
-                results.append(SearchResult(
-                    title=kg.get("title", "Bilgi Grafiği"),
-                    link=kg.get("source", {}).get("link", ""),
-                    snippet=kg.get("description", "")
-                ))
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        # Organic sonuçları al
+        results = self._extract_results(data, num_results)
+        
+        # Eğer yeterli sonuç yoksa, featured_snippet ve knowledge_graph ekle
+        if len(results) < num_results and "featured_snippet" in data:
+            snippet = data["featured_snippet"]
+            results.append(SearchResult(
+                title=snippet.get("title", "Öne Çıkan Sonuç"),
+                link=snippet.get("link", ""),
+                snippet=snippet.get("snippet", "")
+            ))
             
-        except Exception as e:
-            self._handle_request_error(e)
+        if len(results) < num_results and "knowledge_graph" in data:
+            kg = data["knowledge_graph"]
+            results.append(SearchResult(
+                title=kg.get("title", "Bilgi Grafiği"),
+                link=kg.get("source", {}).get("link", ""),
+                snippet=kg.get("description", "")
+            ))
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
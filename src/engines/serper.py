@@ -8,27 +8,33 @@ Bu modül, Serper.dev API'yi kullanarak Google arama sonuçlarını çeken
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 
 class SerperSearch(BaseAPISearch):
     """Serper.dev API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    # Kalıcı önbellek anahtarına eklenen yerel ayar parametreleri
+    cache_key_params = ("gl", "hl")
+    
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         SerperSearch sınıfını başlatır.
         
         Args:
             api_key: Serper.dev API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Google Serper",
             source_url="https://serper.dev/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="SERPER_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint
@@ -42,16 +48,16 @@ class SerperSearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("Serper.dev API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Serper.dev API ile Google araması yapar.
+        Serper.dev API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek başlıklarını hazırla
         headers = {
@@ -67,54 +73,58 @@ class SerperSearch(BaseAPISearch):
             "num": min(40, num_results)  # Serper maksimum 40 sonuç destekliyor
         }
         
-        results = []
+        return {"method": "POST", "url": self.base_url, "headers": headers, "json": payload}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        Serper.dev yanıtından Google sonuçlarını çıkarır.
         
-        try:
-            # POST isteği yap
-            response = requests.post(self.base_url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Organik sonuçları işle
-            if "organic" in data:
-                for item in data["organic"][:num_results]:
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        link=item.get("link", ""),
-                        snippet=item.get("snippet", "")
-                    ))
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-            # Eğer yeterli sonuç yoksa, answersBox ve knowledgeGraph ekle
-            if len(results) < num_results and "answerBox" in data:
-                answer_box = data["answerBox"]
-                answer_title = answer_box.get("title", "")
-                answer_snippet = answer_box.get("snippet", "")
-                answer_link = answer_box.get("link", "")
-                
-                # AnswerBox'ta farklı veri formatları olabilir
-                if isinstance(answer_snippet, dict) and "list" in answer_snippet:
-                    answer_text = " ".join([f"{i+1}. {item}" for i, item in enumerate(answer_snippet["list"])])
-                else:
-                    answer_text = answer_snippet
-                
-                results.append(SearchResult(
-                    title=answer_title or "Öne Çıkan Cevap",
-                    link=answer_link or "",
-                    snippet=answer_text or ""
-                ))
-                
-            if len(results) < num_results and "knowledgeGraph" in data:
-                kg = data["knowledgeGraph"]
-                kg_title = kg.get("title", "")
-                kg_desc = kg.get("description", "")
-                
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        results = []
+        
+        # Organik sonuçları işle
+        if "organic" in data:
+            for item in data["organic"][:num_results]:
                 results.append(SearchResult(
-                    title=kg_title or "Bilgi Grafiği",
-                    link="",  # Knowledge Graph genellikle doğrudan bir link içermez
-                    snippet=kg_desc or ""
+                    title=item.get("title", ""),
+                    link=item.get("link", ""),
+                    snippet=item.get("snippet", "")
                 ))
+        
+        # Eğer yeterli sonuç yoksa, answersBox ve knowledgeGraph ekle
+        if len(results) < num_results and "answerBox" in data:
+            answer_box = data["answerBox"]
+            answer_title = answer_box.get("title", "")
+            answer_snippet = answer_box.get("snippet", "")
+            answer_link = answer_box.get("link", "")
+            
+            # AnswerBox'ta farklı veri formatları olabilir
+            if isinstance(answer_snippet, dict) and "list" in answer_snippet:
+                answer_text = " ".join([f"{i+1}. {item}" for i, item in enumerate(answer_snippet["list"])])
+            else:
+                answer_text = answer_snippet
+            
+            results.append(SearchResult(
+                title=answer_title or "Öne Çıkan Cevap",
+                link=answer_link or "",
+                snippet=answer_text or ""
+            ))
+            
+        if len(results) < num_results and "knowledgeGraph" in data:
+            kg = data["knowledgeGraph"]
+            kg_title = kg.get("title", "")
+            kg_desc = kg.get("description", "")
             
-        except Exception as e:
-            self._handle_request_error(e)
+            results.append(SearchResult(
+                title=kg_title or "Bilgi Grafiği",
+                link="",  # Knowledge Graph genellikle doğrudan bir link içermez
+                snippet=kg_desc or ""
+            ))
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
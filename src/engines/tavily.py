@@ -8,27 +8,30 @@ Bu modül, Tavily API'sini kullanarak web araması yapan
 bir SearchEngine implementasyonunu içerir.
 """
 
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from search_interface import BaseAPISearch, SearchResult, logger
+from src.core import SearchResult, logger
+from src.engines.base import BaseAPISearch
+from src.credentials import CredentialProvider
 
 class TavilySearch(BaseAPISearch):
     """Tavily API kullanarak arama yapan sınıf."""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, credentials: Optional[CredentialProvider] = None):
         """
         TavilySearch sınıfını başlatır.
         
         Args:
             api_key: Tavily API anahtarı. Belirtilmezse .env dosyasından aranır.
+            credentials: Kimlik bilgisi sağlayıcısı (None ise paylaşılan varsayılan sağlayıcı)
         """
         super().__init__(
             name="Tavily Search",
             source_url="https://tavily.com/",
             license_type="Kapalı, Ücretli (Freemium)",
             api_key_env_name="TAVILY_API_KEY",
-            api_key=api_key
+            api_key=api_key,
+            credentials=credentials
         )
         
         # API endpoint
@@ -42,16 +45,16 @@ class TavilySearch(BaseAPISearch):
         if not self.api_key:
             raise ValueError("Tavily API Key gereklidir. Lütfen .env dosyasını kontrol edin.")
     
-    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
         """
-        Tavily API ile arama yapar.
+        Tavily API isteğini hazırlar.
         
         Args:
             query: Arama sorgusu
             num_results: İstenen sonuç sayısı
             
         Returns:
-            SearchResult nesnelerinin listesi
+            İstek tanımını içeren sözlük
         """
         # İstek başlıklarını hazırla - Bearer formatı kullan
         headers = {
@@ -66,36 +69,41 @@ class TavilySearch(BaseAPISearch):
             "include_answer": False
         }
         
-        results = []
+        # POST isteği (API dokümantasyonuna göre POST kullanılmalı)
+        return {"method": "POST", "url": self.base_url, "headers": headers, "json": payload}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        """
+        Tavily yanıtından sonuçları çıkarır.
         
-        try:
-            # POST isteği yap (API dokümantasyonuna göre POST kullanılmalı)
-            response = requests.post(self.base_url, headers=headers, json=payload)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Arama sonuçlarını işle
-            if "results" in data:
-                for item in data["results"][:num_results]:
-                    # Tavily sonuçlarında title=title, url=link, content=snippet
-                    results.append(SearchResult(
-                        title=item.get("title", ""),
-                        link=item.get("url", ""),
-                        snippet=item.get("content", "")
-                    ))
-            
-            # Tavily bazen answer özelliği döndürür
-            if len(results) < num_results and "answer" in data and data["answer"]:
-                # Answer'ı ekleyebiliriz ama sadece include_answer=True ise vardır
-                answer_text = data.get("answer", "")
-                if answer_text:
-                    results.append(SearchResult(
-                        title="Tavily Özet Cevap",
-                        link="",  # Tavily answer için link sağlamaz
-                        snippet=answer_text
-                    ))
+        Args:
+            data: API yanıt verisi
+            num_results: İstenen sonuç sayısı
             
-        except Exception as e:
-            self._handle_request_error(e)
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        results = []
+        
+        # Arama sonuçlarını işle
+        if "results" in data:
+            for item in data["results"][:num_results]:
+                # Tavily sonuçlarında title=title, url=link, content=snippet
+                results.append(SearchResult(
+                    title=item.get("title", ""),
+                    link=item.get("url", ""),
+                    snippet=item.get("content", "")
+                ))
+        
+        # Tavily bazen answer özelliği döndürür
+        if len(results) < num_results and "answer" in data and data["answer"]:
+            # Answer'ı ekleyebiliriz ama sadece include_answer=True ise vardır
+            answer_text = data.get("answer", "")
+            if answer_text:
+                results.append(SearchResult(
+                    title="Tavily Özet Cevap",
+                    link="",  # Tavily answer için link sağlamaz
+                    snippet=answer_text
+                ))
         
-        return results 
\ No newline at end of file
+        return results
\ No newline at end of file
@@ -1,21 +1,91 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import time
 import os
 import json
 import statistics
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, asynccontextmanager, nullcontext
 from datetime import datetime
 from tabulate import tabulate
 
 from src.core import SearchEngine, SearchResult, logger
-from src.utils import format_timestamp
+from src.utils import format_timestamp, create_async_session
+from src.rate_limiter import RateLimitScheduler, pacing
+from src.cache import trace_cache_hits
+from src.histogram import LatencyHistogram, DEFAULT_PERCENTILES, percentile_key, format_percentiles, format_latency
+from src.phases import PhaseStats, PHASES, PHASE_LABELS, record_phases
+from src.deadline import SearchTimeoutError, deadline
+from src.circuit_breaker import CircuitBreakerRegistry, CircuitCall, CircuitOpenError, STATE_LABELS
+from src.stats import (robust_summary, intervals_overlap, time_to_k, rank_label, DEFAULT_OUTLIER_THRESHOLD, DEFAULT_CONFIDENCE,
+                       DEFAULT_BOOTSTRAP_RESAMPLES, DEFAULT_RESULT_RANKS)
 
 class SearchEngineEvaluator:
     """Farklı arama motorlarını değerlendirmeye yarayan sınıf."""
     
-    def __init__(self):
-        """SearchEngineEvaluator sınıfını başlatır."""
+    def __init__(self, 
+                 max_workers: Optional[int] = None, 
+                 rate_limiter: Optional[RateLimitScheduler] = None,
+                 force_live: bool = False,
+                 warmup_runs: int = 0,
+                 outlier_threshold: Optional[float] = DEFAULT_OUTLIER_THRESHOLD,
+                 confidence: float = DEFAULT_CONFIDENCE,
+                 bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+                 timeout: Optional[float] = None,
+                 engine_timeouts: Optional[Dict[str, float]] = None,
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 result_ranks: Sequence[int] = DEFAULT_RESULT_RANKS):
+        """
+        SearchEngineEvaluator sınıfını başlatır.
+        
+        Args:
+            max_workers: Paralel modda kullanılacak en fazla iş parçacığı sayısı
+                (None ise kayıtlı motor sayısı kadar)
+            rate_limiter: Motor bazında hız sınırlayıcı (None ise istekler kısıtlanmaz)
+            force_live: True ise önbellekli motorlarda (CachedSearch, ResponseCache)
+                önbellek atlanır ve tüm ölçümler canlı istekle yapılır
+            warmup_runs: Her motor için istatistiklere dahil edilmeyen ısınma
+                çalıştırması sayısı (DNS, bağlantı kurulumu vb. dışarıda kalır)
+            outlier_threshold: MAD tabanlı değiştirilmiş z-skoru aykırı değer eşiği
+                (None ise aykırı değer ayıklanmaz)
+            confidence: Medyan gecikmenin bootstrap güven aralığı düzeyi
+            bootstrap_resamples: Bootstrap yeniden örnekleme sayısı
+            timeout: Tek bir aramanın (bağlantı, okuma ve sayfalama dahil) süre
+                bütçesi (saniye, None ise sınırsız); aşan çalıştırmalar zaman aşımı
+                olarak ayrıca sayılır
+            engine_timeouts: Motor adı veya sınıf adı -> süre bütçesi (timeout'u ezer)
+            circuit_breakers: Motor bazında devre kesici ve negatif önbellek (None ise
+                hatalı motorlar her çalıştırmada yeniden denenir); reddedilen
+                çalıştırmalar atlanan olarak ayrıca sayılır
+            result_ranks: Hazır olma süresi raporlanan sonuç sıraları (time-to-k);
+                ilk sonuca kadar geçen süre her zaman ayrıca raporlanır
+        
+        Raises:
+            ValueError: Sonuç sıralarından biri 1'den küçükse
+        """
+        if any(k < 1 for k in result_ranks):
+            raise ValueError(f"Sonuç sıraları 1 veya daha büyük olmalı: {list(result_ranks)}")
+        
         self.engines = []
         self.results = {}
+        self.batch_summary = {}
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.force_live = force_live
+        self.warmup_runs = warmup_runs
+        self.outlier_threshold = outlier_threshold
+        self.confidence = confidence
+        self.bootstrap_resamples = bootstrap_resamples
+        self.timeout = timeout
+        self.engine_timeouts = engine_timeouts or {}
+        self.circuit_breakers = circuit_breakers
+        self.result_ranks = tuple(sorted(set(result_ranks)))
+        # Motor bazında tüm sorgular üzerindeki gecikme dağılımı
+        self.latency_histograms = {}
+        self._histogram_lock = threading.Lock()
+        # Motor bazında istek aşaması (DNS, bağlantı, TLS, TTFB, indirme, ayrıştırma) süreleri
+        self.phase_stats = {}
         
     def register_engine(self, engine: SearchEngine) -> None:
         """
@@ -37,6 +107,208 @@ class SearchEngineEvaluator:
         for engine in engines:
             self.register_engine(engine)
         
+    @contextmanager
+    def _throttle(self, engine: SearchEngine):
+        """
+        Motorun hız sınırı için eşzamanlılık yuvası ve bir token alır. Blok
+        içinde motorun gönderdiği sonraki istekler (ör. sayfalar) aynı
+        sınırlayıcıdan token alır; ilk istek bu token ile gönderilir.
+        
+        Args:
+            engine: Arama motoru
+            
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        if self.rate_limiter is None:
+            yield 0.0
+            return
+        with self.rate_limiter.limiter_for(engine).throttle() as wait_time, pacing(self.rate_limiter, prepaid=engine):
+            yield wait_time
+    
+    @asynccontextmanager
+    async def _async_throttle(self, engine: SearchEngine):
+        """
+        _throttle metodunun asenkron karşılığı.
+        
+        Args:
+            engine: Arama motoru
+            
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        if self.rate_limiter is None:
+            yield 0.0
+            return
+        async with self.rate_limiter.limiter_for(engine).async_throttle() as wait_time:
+            with pacing(self.rate_limiter, prepaid=engine):
+                yield wait_time
+    
+    def _guard(self, engine: SearchEngine, query: str, num_results: int):
+        """
+        Devre kesici varsa aramayı onun üzerinden çalıştıran bağlam yöneticisi döndürür.
+        
+        Args:
+            engine: Arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            
+        Returns:
+            CircuitCall veren bağlam yöneticisi (devre açıksa girişte CircuitOpenError fırlatır)
+        """
+        if self.circuit_breakers is None:
+            return nullcontext(CircuitCall())
+        return self.circuit_breakers.guard(engine, query, num_results)
+    
+    def _live(self, engine: SearchEngine):
+        """
+        force_live açıksa motorun önbelleğini atlayan bağlam yöneticisi döndürür.
+        
+        Args:
+            engine: Arama motoru
+            
+        Returns:
+            Bağlam yöneticisi
+        """
+        if self.force_live and hasattr(engine, "bypass_cache"):
+            return engine.bypass_cache()
+        return nullcontext()
+    
+    def _measure(self, 
+                 engine: SearchEngine, 
+                 query: str, 
+                 num_results: int,
+                 phase_stats: Optional[PhaseStats] = None,
+                 record: bool = True) -> Tuple[List[SearchResult], float, float, List[float]]:
+        """
+        Hız sınırı ve önbellek ayarlarını uygulayarak tek bir arama ölçümü yapar.
+        Arama search_iter üzerinden yapılır; böylece toplam sürenin yanında her
+        sonucun hazır olduğu an da ölçülür.
+        
+        Yanıt kalıcı önbellekten dönerse ölçülen süre yerine yanıtın ilk
+        alındığı andaki süre kullanılır; böylece önbellekten yeniden üretilen
+        raporlar canlı çalıştırmanın sürelerini korur.
+        
+        Args:
+            engine: Arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            phase_stats: Canlı isteğin aşama sürelerinin ayrıca ekleneceği sorgu bazında toplayıcı
+            record: Aşama sürelerinin motorun genel toplayıcısına eklenip eklenmeyeceği
+                (ısınma çalıştırmalarında False)
+            
+        Returns:
+            (sonuçlar, süre, kuyruk_bekleme_süresi, sonuç_varış_süreleri) biçiminde tuple
+            
+        Raises:
+            CircuitOpenError: Motorun devresi açıksa (istek gönderilmez)
+        """
+        with self._guard(engine, query, num_results) as call:
+            with self._throttle(engine) as wait_time, self._live(engine), trace_cache_hits() as trace, record_phases() as phases:
+                with deadline(self._engine_timeout(engine)) as budget:
+                    results, elapsed_time, arrival_times = engine.measure_search_iter(query, num_results)
+                    # Süre sınırını kendisi uygulamayan motorlar için de aşım zaman aşımı sayılır
+                    if budget is not None:
+                        budget.check(engine.name)
+            call.elapsed_time = elapsed_time
+        if trace.recorded_time is not None:
+            logger.debug(f"{engine.name} yanıtı kalıcı önbellekten döndü: '{query}'")
+            elapsed_time = trace.recorded_time
+            # Önbellekteki yanıt tek seferde alınmıştı; tüm sonuçlar o anda hazırdı
+            arrival_times = [elapsed_time] * len(results)
+        elif record:
+            self._record_phases(engine.name, phases, phase_stats)
+        return results, elapsed_time, wait_time, arrival_times
+    
+    async def _async_measure(self, 
+                             engine: SearchEngine, 
+                             query: str, 
+                             num_results: int, 
+                             session: Any,
+                             phase_stats: Optional[PhaseStats] = None,
+                             record: bool = True) -> Tuple[List[SearchResult], float, float, List[float]]:
+        """
+        _measure metodunun asenkron karşılığı.
+        
+        Args:
+            engine: Arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+            phase_stats: Canlı isteğin aşama sürelerinin ayrıca ekleneceği sorgu bazında toplayıcı
+            record: Aşama sürelerinin motorun genel toplayıcısına eklenip eklenmeyeceği
+                (ısınma çalıştırmalarında False)
+            
+        Returns:
+            (sonuçlar, süre, kuyruk_bekleme_süresi, sonuç_varış_süreleri) biçiminde tuple
+        """
+        with self._guard(engine, query, num_results) as call:
+            async with self._async_throttle(engine) as wait_time:
+                with self._live(engine), trace_cache_hits() as trace, record_phases() as phases:
+                    with deadline(self._engine_timeout(engine)) as budget:
+                        try:
+                            results, elapsed_time, arrival_times = await asyncio.wait_for(
+                                engine.async_measure_search_iter(query, num_results, session=session),
+                                timeout=budget.remaining() if budget is not None else None
+                            )
+                        except asyncio.TimeoutError as e:
+                            raise SearchTimeoutError(f"{engine.name} süre sınırını aştı") from e
+            call.elapsed_time = elapsed_time
+        if trace.recorded_time is not None:
+            elapsed_time = trace.recorded_time
+            arrival_times = [elapsed_time] * len(results)
+        elif record:
+            self._record_phases(engine.name, phases, phase_stats)
+        return results, elapsed_time, wait_time, arrival_times
+    
+    def _engine_timeout(self, engine: SearchEngine) -> Optional[float]:
+        """
+        Motorun arama süre bütçesini döndürür: engine_timeouts içinde motor adı
+        veya sınıf adıyla tanımlıysa o, değilse genel timeout.
+        
+        Args:
+            engine: Arama motoru
+            
+        Returns:
+            Süre bütçesi (saniye) veya None
+        """
+        for key in (engine.name, engine.__class__.__name__):
+            if key in self.engine_timeouts:
+                return self.engine_timeouts[key]
+        return self.timeout
+    
+    def _record_phases(self, engine_name: str, phases, phase_stats: Optional[PhaseStats] = None) -> None:
+        """
+        Ölçümün aşama sürelerini motorun genel toplayıcısına (ve verildiyse
+        sorgu bazındaki toplayıcıya) ekler.
+        
+        Args:
+            engine_name: Motor adı
+            phases: record_phases ile toplanan RequestPhases nesnesi
+            phase_stats: Sorgu bazındaki toplayıcı
+        """
+        with self._histogram_lock:
+            if engine_name not in self.phase_stats:
+                self.phase_stats[engine_name] = PhaseStats()
+            engine_stats = self.phase_stats[engine_name]
+        engine_stats.add(phases)
+        if phase_stats is not None:
+            phase_stats.add(phases)
+    
+    def get_phase_breakdown(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Motor bazında istek başına ortalama aşama sürelerini döndürür.
+        
+        "network" toplamı sağlayıcı ve ağ kaynaklı süreyi, "parse" ise
+        yanıtın bizim tarafımızda ayrıştırılma süresini gösterir.
+        
+        Returns:
+            Motor adı -> PhaseStats özeti
+        """
+        with self._histogram_lock:
+            phase_stats = dict(self.phase_stats)
+        return {engine_name: stats.to_dict() for engine_name, stats in phase_stats.items()}
+    
     def _run_single_engine_test(self, 
                                engine: SearchEngine, 
                                query: str, 
@@ -59,13 +331,37 @@ class SearchEngineEvaluator:
         
         # Birden fazla ölçüm alınarak ortalama hesaplanacak
         times = []
+        wait_times = []
+        arrival_runs = []
+        cold_time = None
         found_results = None
+        phase_stats = PhaseStats()
+        timeouts = 0
+        skipped = 0
+        
+        # İlk çalıştırmanın soğuk bağlantı ile başlaması için havuzu boşalt
+        if hasattr(engine, "reset_session"):
+            engine.reset_session()
+        
+        # Isınma çalıştırmaları soğuk bağlantıyı öder ve istatistiklere dahil edilmez
+        for i in range(self.warmup_runs):
+            try:
+                logger.info(f"Isınma çalıştırması {i+1}/{self.warmup_runs}...")
+                _, elapsed_time, _, _ = self._measure(engine, query, num_results, record=False)
+                if i == 0:
+                    cold_time = elapsed_time
+            except Exception as e:
+                logger.error(f"Isınma hatası: {e}")
         
         for i in range(runs):
             try:
                 logger.info(f"Çalıştırma {i+1}/{runs}...")
-                results, elapsed_time = engine.measure_search_time(query, num_results)
+                results, elapsed_time, wait_time, arrival_times = self._measure(engine, query, num_results, phase_stats)
                 times.append(elapsed_time)
+                wait_times.append(wait_time)
+                arrival_runs.append(arrival_times)
+                if i == 0 and not self.warmup_runs:
+                    cold_time = elapsed_time
                 
                 # İlk geçerli sonuçları sakla
                 if found_results is None and results:
@@ -73,11 +369,155 @@ class SearchEngineEvaluator:
                     
                 logger.info(f"Sorgu tamamlandı: {len(results)} sonuç, {elapsed_time:.2f} saniye")
                 
+            except TimeoutError as e:  # SearchTimeoutError ve diğer zaman aşımları
+                timeouts += 1
+                logger.warning(f"Zaman aşımı: {e}")
+            except CircuitOpenError as e:
+                skipped += 1
+                logger.info(f"Atlandı: {e}")
             except Exception as e:
                 logger.error(f"Hata: {e}")
         
+        return self._summarize_engine_test(engine, query, num_results, times, found_results, cold_time, wait_times,
+                                           phase_stats, timeouts, skipped, arrival_runs)
+    
+    async def _async_run_single_engine_test(self, 
+                                            engine: SearchEngine, 
+                                            query: str, 
+                                            num_results: int, 
+                                            runs: int,
+                                            session: Any) -> Dict[str, Any]:
+        """
+        Tek bir arama motoru için testi asenkron olarak çalıştırır.
+        
+        Args:
+            engine: Test edilecek arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            runs: Test tekrar sayısı
+            session: Tüm motorların paylaştığı aiohttp.ClientSession
+            
+        Returns:
+            Test sonuçlarını içeren sözlük
+        """
+        engine_name = engine.name
+        logger.info(f"{engine_name} test ediliyor (asenkron)...")
+        
+        times = []
+        wait_times = []
+        arrival_runs = []
+        cold_time = None
+        found_results = None
+        phase_stats = PhaseStats()
+        timeouts = 0
+        skipped = 0
+        
+        for i in range(self.warmup_runs):
+            try:
+                _, elapsed_time, _, _ = await self._async_measure(engine, query, num_results, session, record=False)
+                if i == 0:
+                    cold_time = elapsed_time
+            except Exception as e:
+                logger.error(f"Isınma hatası: {e}")
+        
+        for i in range(runs):
+            try:
+                results, elapsed_time, wait_time, arrival_times = await self._async_measure(engine, query, num_results, session, phase_stats)
+                times.append(elapsed_time)
+                wait_times.append(wait_time)
+                arrival_runs.append(arrival_times)
+                if i == 0 and not self.warmup_runs:
+                    cold_time = elapsed_time
+                
+                # İlk geçerli sonuçları sakla
+                if found_results is None and results:
+                    found_results = results
+                    
+                logger.info(f"{engine_name} çalıştırma {i+1}/{runs}: {len(results)} sonuç, {elapsed_time:.2f} saniye")
+                
+            except TimeoutError as e:  # SearchTimeoutError ve diğer zaman aşımları
+                timeouts += 1
+                logger.warning(f"Zaman aşımı: {e}")
+            except CircuitOpenError as e:
+                skipped += 1
+                logger.info(f"Atlandı: {e}")
+            except Exception as e:
+                logger.error(f"Hata: {e}")
+        
+        return self._summarize_engine_test(engine, query, num_results, times, found_results, cold_time, wait_times,
+                                           phase_stats, timeouts, skipped, arrival_runs)
+    
+    def _engine_histogram(self, engine_name: str) -> LatencyHistogram:
+        """
+        Motorun tüm sorgular üzerindeki gecikme histogramını döndürür.
+        
+        Args:
+            engine_name: Motor adı
+            
+        Returns:
+            LatencyHistogram nesnesi
+        """
+        with self._histogram_lock:
+            if engine_name not in self.latency_histograms:
+                self.latency_histograms[engine_name] = LatencyHistogram()
+            return self.latency_histograms[engine_name]
+    
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Motor bazında tüm ölçümler üzerindeki gecikme yüzdeliklerini döndürür.
+        
+        Returns:
+            Motor adı -> histogram özeti (count, min, max, mean, p50, p90, p95, p99, p99.9)
+        """
+        with self._histogram_lock:
+            histograms = dict(self.latency_histograms)
+        return {engine_name: histogram.to_dict() for engine_name, histogram in histograms.items()}
+    
+    def _summarize_engine_test(self, 
+                               engine: SearchEngine, 
+                               query: str, 
+                               num_results: int, 
+                               times: List[float], 
+                               found_results: Optional[List[SearchResult]],
+                               cold_time: Optional[float] = None,
+                               wait_times: Optional[List[float]] = None,
+                               phase_stats: Optional[PhaseStats] = None,
+                               timeouts: int = 0,
+                               skipped: int = 0,
+                               arrival_runs: Optional[List[List[float]]] = None) -> Dict[str, Any]:
+        """
+        Ölçülen sürelerden motorun test sonucu sözlüğünü oluşturur.
+        
+        Args:
+            engine: Test edilen arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            times: Başarılı çalıştırmaların süreleri (saniye)
+            found_results: İlk geçerli sonuç listesi
+            cold_time: Soğuk bağlantı ile yapılan ilk çalıştırmanın süresi (başarısızsa None)
+            wait_times: Hız sınırı kuyruğunda beklenen süreler (yanıt sürelerine dahil değildir)
+            phase_stats: Canlı isteklerin aşama süreleri
+            timeouts: Süre sınırını aşan (times içinde olmayan) çalıştırma sayısı
+            skipped: Devre kesici tarafından istek gönderilmeden atlanan çalıştırma sayısı
+            arrival_runs: Başarılı her çalıştırmada sonuçların sırayla hazır olduğu anlar
+            
+        Returns:
+            Test sonuçlarını içeren sözlük
+        """
         # Test sonuçlarını hazırla
         if times:
+            # İlk çalıştırma dışındakiler havuzdaki açık bağlantıyı kullanır; ısınma
+            # yapıldıysa soğuk çalıştırma zaten times içinde değildir
+            warm_times = times[1:] if cold_time is not None and not self.warmup_runs else times
+            
+            # Sorgu bazındaki dağılım motorun genel histogramına eklenir
+            histogram = LatencyHistogram.from_seconds(times)
+            self._engine_histogram(engine.name).merge(histogram)
+            
+            # Ajan akışı ilk sonuçlarla hemen çalışmaya başladığından ilk sonuç ve ilk k sonuç süreleri ayrıca raporlanır
+            arrival_runs = arrival_runs or []
+            first_result_times = [arrivals[0] for arrivals in arrival_runs if arrivals]
+            
             return {
                 "engine_info": engine.get_engine_info(),
                 "query": query,
@@ -85,6 +525,17 @@ class SearchEngineEvaluator:
                 "avg_response_time": statistics.mean(times),
                 "min_response_time": min(times),
                 "max_response_time": max(times),
+                "cold_response_time": cold_time,
+                "warm_avg_response_time": statistics.mean(warm_times) if warm_times else None,
+                "avg_queue_wait_time": statistics.mean(wait_times) if wait_times else 0.0,
+                "avg_first_result_time": statistics.mean(first_result_times) if first_result_times else None,
+                "time_to_k": time_to_k(arrival_runs, self.result_ranks),
+                "latency_percentiles": histogram.to_dict(),
+                "warmup_runs": self.warmup_runs,
+                "robust_stats": self._robust_summary(times),
+                "phase_breakdown": phase_stats.to_dict() if phase_stats is not None else None,
+                "timeouts": timeouts,
+                "skipped": skipped,
                 "results_count": len(found_results) if found_results else 0,
                 "results": [
                     result.to_dict() for result in (found_results or [])
@@ -95,10 +546,64 @@ class SearchEngineEvaluator:
                 "engine_info": engine.get_engine_info(),
                 "query": query,
                 "num_results": num_results,
-                "error": "Test başarısız oldu"
+                "error": "Zaman aşımı" if timeouts else "Devre açık, atlandı" if skipped else "Test başarısız oldu",
+                "timeouts": timeouts,
+                "skipped": skipped
             }
         
-    def run_test(self, query: str, num_results: int = 10, runs: int = 3) -> Dict[str, Any]:
+    def _robust_summary(self, times: List[float]) -> Dict[str, Any]:
+        """
+        Süreler için evaluator ayarlarıyla sağlam istatistik özeti oluşturur.
+        
+        Args:
+            times: Ölçülen süreler (saniye)
+            
+        Returns:
+            src.stats.robust_summary çıktısı
+        """
+        return robust_summary(times,
+                              outlier_threshold=self.outlier_threshold,
+                              confidence=self.confidence,
+                              resamples=self.bootstrap_resamples)
+    
+    def compare_engines(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Sorgu sonuçlarındaki motorları medyan gecikmeye göre sıralar ve her
+        motoru en hızlı motorla karşılaştırır. Güven aralıkları örtüşen
+        farklar istatistiksel olarak anlamlı sayılmaz.
+        
+        Args:
+            query: Sonuçları karşılaştırılacak sorgu
+            
+        Returns:
+            Motor adı, medyan, güven aralığı ve significant alanlarını içeren
+            sözlüklerin listesi (en hızlıdan en yavaşa)
+        """
+        ranked = []
+        for engine_name, data in self.results.get(query, {}).items():
+            robust = data.get("robust_stats") or {}
+            if robust.get("median") is not None:
+                ranked.append((robust["median"], engine_name, robust.get("confidence_interval")))
+        ranked.sort()
+        
+        comparison = []
+        for median, engine_name, interval in ranked:
+            fastest_interval = ranked[0][2]
+            comparison.append({
+                "engine": engine_name,
+                "median": median,
+                "confidence_interval": interval,
+                # En hızlı motorun kendisi için karşılaştırma yapılmaz
+                "significant": None if engine_name == ranked[0][1] else not intervals_overlap(interval, fastest_interval)
+            })
+        return comparison
+    
+    def run_test(self, 
+                 query: str, 
+                 num_results: int = 10, 
+                 runs: int = 3, 
+                 parallel: bool = False,
+                 max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Kayıtlı tüm arama motorlarında belirtilen sorguyu çalıştırır ve performans verilerini toplar.
         
@@ -106,6 +611,8 @@ class SearchEngineEvaluator:
             query: Test edilecek arama sorgusu
             num_results: Her motordan istenecek sonuç sayısı
             runs: Güvenilir hız ölçümü için kaç kez çalıştırılacağı
+            parallel: True ise sorgu tüm motorlara aynı anda gönderilir
+            max_workers: Paralel modda iş parçacığı sayısı (None ise self.max_workers kullanılır)
             
         Returns:
             Test sonuçlarını içeren sözlük
@@ -117,17 +624,273 @@ class SearchEngineEvaluator:
         
         print(f"Test çalıştırılıyor: '{query}' sorgusu, {len(self.engines)} arama motoru ile...")
         
-        # Her arama motoru için tek tek test çalıştır
-        for engine in self.engines:
-            engine_name = engine.name
-            print(f"\n{engine_name} test ediliyor...")
+        if parallel:
+            # Her motor kendi iş parçacığında çalışır; süreler motor bazında ayrı ölçülür
+            workers = max_workers or self.max_workers or len(self.engines)
+            print(f"Paralel mod: {workers} iş parçacığı")
             
-            result = self._run_single_engine_test(engine, query, num_results, runs)
-            test_results[engine_name] = result
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (engine, executor.submit(self._run_single_engine_test, engine, query, num_results, runs))
+                    for engine in self.engines
+                ]
+                
+                # Sonuçları kayıt sırasına göre topla
+                for engine, future in futures:
+                    test_results[engine.name] = future.result()
+        else:
+            # Her arama motoru için tek tek test çalıştır
+            for engine in self.engines:
+                engine_name = engine.name
+                print(f"\n{engine_name} test ediliyor...")
+                
+                result = self._run_single_engine_test(engine, query, num_results, runs)
+                test_results[engine_name] = result
                 
         self.results[query] = test_results
         return test_results
     
+    def _timed_search(self, 
+                      engine: SearchEngine, 
+                      query: str, 
+                      num_results: int,
+                      record: bool = True) -> Tuple[Optional[List[SearchResult]], Optional[float], float,
+                                                    Optional[List[float]], str]:
+        """
+        Toplu çalıştırmada tek bir sorgu × motor × tekrar görevini yürütür.
+        
+        Args:
+            engine: Arama motoru
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            record: Aşama sürelerinin kaydedilip kaydedilmeyeceği (ısınma çalıştırmalarında False)
+            
+        Returns:
+            (sonuçlar, süre, kuyruk_bekleme_süresi, sonuç_varış_süreleri, durum) biçiminde tuple;
+            durum "ok", "timeout", "skipped" (devre açık) veya "error" olur, başarısızsa
+            sonuçlar, süre ve varış süreleri None
+        """
+        try:
+            results, elapsed_time, wait_time, arrival_times = self._measure(engine, query, num_results, record=record)
+            return results, elapsed_time, wait_time, arrival_times, "ok"
+        except TimeoutError as e:  # SearchTimeoutError ve diğer zaman aşımları
+            logger.warning(f"{engine.name} - '{query}' zaman aşımı: {e}")
+            return None, None, 0.0, None, "timeout"
+        except CircuitOpenError as e:
+            logger.debug(f"{engine.name} - '{query}' atlandı: {e}")
+            return None, None, 0.0, None, "skipped"
+        except Exception as e:
+            logger.error(f"{engine.name} - '{query}' hatası: {e}")
+            return None, None, 0.0, None, "error"
+    
+    def _engine_workers(self, engine: SearchEngine, workers: int) -> int:
+        """
+        Motora ayrılacak iş parçacığı sayısını döndürür; hız sınırlayıcı varsa
+        motorun eşzamanlılık sınırını aşmaz.
+        
+        Args:
+            engine: Arama motoru
+            workers: İstenen iş parçacığı sayısı
+            
+        Returns:
+            İş parçacığı sayısı
+        """
+        if self.rate_limiter is not None:
+            max_concurrency = self.rate_limiter.get_spec(engine).max_concurrency
+            if max_concurrency:
+                return min(workers, max_concurrency)
+        return workers
+    
+    def run_batch(self, 
+                  queries: List[str], 
+                  num_results: int = 10, 
+                  runs: int = 1,
+                  max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Bir sorgu kümesini kayıtlı tüm motorlarda çalıştırır.
+        
+        Her sorgu × motor × tekrar bir görev olarak motorun kendi iş parçacığı
+        havuzuna verilir; böylece yavaş ya da sıkı sınırlı bir motor diğerlerini
+        bekletmez. Sorgu bazındaki sonuçlar run_test ile aynı yapıda
+        self.results içine yazılır; motor bazında tüm küme üzerindeki
+        gecikme özeti self.batch_summary içinde tutulur.
+        
+        Args:
+            queries: Test edilecek sorgular
+            num_results: Her motordan istenecek sonuç sayısı
+            runs: Her sorgu için tekrar sayısı
+            max_workers: Motor başına iş parçacığı sayısı (None ise self.max_workers veya motor sayısı)
+            
+        Returns:
+            Motor bazında toplu gecikme özetini içeren sözlük
+        """
+        if not self.engines:
+            raise ValueError("Test yapılacak arama motoru kaydedilmemiş")
+        if not queries:
+            raise ValueError("Toplu test için en az bir sorgu gerekli")
+            
+        workers = max_workers or self.max_workers or len(self.engines)
+        total_tasks = len(queries) * len(self.engines) * runs
+        print(f"Toplu test: {len(queries)} sorgu, {len(self.engines)} motor, {runs} tekrar "
+              f"({total_tasks} görev, {workers} iş parçacığı)")
+        
+        # (sorgu, motor indeksi) -> ölçülen süreler, sonuç varış süreleri ve ilk geçerli sonuçlar
+        times = {}
+        arrivals = {}
+        wait_times = {}
+        found = {}
+        failures = {}
+        timeouts = {}
+        skipped = {}
+        # Motor indeksi -> soğuk bağlantı ile yapılan ilk çalıştırmanın süresi
+        cold_times = {}
+        
+        def collect(key, outcome_tuple):
+            """Tamamlanan görevin sonucunu sorgu × motor toplayıcılarına ekler."""
+            results, elapsed_time, wait_time, arrival_times, outcome = outcome_tuple
+            wait_times.setdefault(key, []).append(wait_time)
+            
+            if outcome == "timeout":
+                timeouts[key] = timeouts.get(key, 0) + 1
+            elif outcome == "skipped":
+                skipped[key] = skipped.get(key, 0) + 1
+            elif outcome == "error":
+                failures[key] = failures.get(key, 0) + 1
+            else:
+                times.setdefault(key, []).append(elapsed_time)
+                arrivals.setdefault(key, []).append(arrival_times)
+                if key not in found and results:
+                    found[key] = results
+        
+        # run_test'te olduğu gibi ilk çalıştırma soğuk bağlantı ile başlar: ısınma yapılıyorsa
+        # ilk ısınma, yapılmıyorsa ilk sorgunun ilk çalıştırması (havuza dağıtılmadan önce,
+        # tek başına) soğuk süre olarak kaydedilir
+        for index, engine in enumerate(self.engines):
+            if hasattr(engine, "reset_session"):
+                engine.reset_session()
+            for i in range(self.warmup_runs):
+                _, elapsed_time, _, _, _ = self._timed_search(engine, queries[0], num_results, record=False)
+                if i == 0:
+                    cold_times[index] = elapsed_time
+            if not self.warmup_runs and runs:
+                outcome = self._timed_search(engine, queries[0], num_results)
+                collect((queries[0], index), outcome)
+                cold_times[index] = outcome[1]
+        
+        # Her motorun kendi havuzu olur
+        executors = [
+            ThreadPoolExecutor(max_workers=self._engine_workers(engine, workers)) for engine in self.engines
+        ]
+        try:
+            futures = {}
+            for query in queries:
+                for index, engine in enumerate(self.engines):
+                    # Soğuk çalıştırma olarak önceden yapılan görev tekrar gönderilmez
+                    query_runs = runs - 1 if query == queries[0] and not self.warmup_runs else runs
+                    for _ in range(max(query_runs, 0)):
+                        future = executors[index].submit(self._timed_search, engine, query, num_results)
+                        futures[future] = (query, index)
+            
+            for completed, future in enumerate(as_completed(futures), 1):
+                collect(futures[future], future.result())
+                if completed % 100 == 0:
+                    logger.info(f"{completed}/{total_tasks} görev tamamlandı")
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True)
+        
+        # Sorgu bazındaki sonuçları run_test ile aynı biçimde sakla
+        for query in queries:
+            self.results[query] = {
+                engine.name: self._summarize_engine_test(
+                    engine, query, num_results, times.get((query, index), []), found.get((query, index)),
+                    cold_time=cold_times.get(index) if query == queries[0] else None,
+                    wait_times=wait_times.get((query, index)), timeouts=timeouts.get((query, index), 0),
+                    skipped=skipped.get((query, index), 0), arrival_runs=arrivals.get((query, index))
+                )
+                for index, engine in enumerate(self.engines)
+            }
+        
+        # Motor bazında tüm küme üzerindeki gecikmeyi topla
+        summary = {}
+        for index, engine in enumerate(self.engines):
+            engine_times = [t for query in queries for t in times.get((query, index), [])]
+            engine_waits = [t for query in queries for t in wait_times.get((query, index), [])]
+            engine_arrivals = [run for query in queries for run in arrivals.get((query, index), [])]
+            failed_runs = sum(failures.get((query, index), 0) for query in queries)
+            timeout_runs = sum(timeouts.get((query, index), 0) for query in queries)
+            skipped_runs = sum(skipped.get((query, index), 0) for query in queries)
+            answered = sum(1 for query in queries if (query, index) in found)
+            # Isınma yapılmadıysa soğuk çalıştırma ilk sorgunun ilk ölçümüdür
+            cold_time = cold_times.get(index)
+            warm_times = engine_times[1:] if cold_time is not None and not self.warmup_runs else engine_times
+            
+            summary[engine.name] = {
+                "queries": len(queries),
+                "answered_queries": answered,
+                "successful_runs": len(engine_times),
+                "failed_runs": failed_runs,
+                "timeout_runs": timeout_runs,
+                "skipped_runs": skipped_runs,
+                "avg_response_time": statistics.mean(engine_times) if engine_times else None,
+                "median_response_time": statistics.median(engine_times) if engine_times else None,
+                "min_response_time": min(engine_times) if engine_times else None,
+                "max_response_time": max(engine_times) if engine_times else None,
+                "cold_response_time": cold_time,
+                "warm_avg_response_time": statistics.mean(warm_times) if warm_times else None,
+                "avg_queue_wait_time": statistics.mean(engine_waits) if engine_waits else 0.0,
+                "max_queue_wait_time": max(engine_waits) if engine_waits else 0.0,
+                "time_to_k": time_to_k(engine_arrivals, self.result_ranks),
+                "latency_percentiles": LatencyHistogram.from_seconds(engine_times).to_dict(),
+                "robust_stats": self._robust_summary(engine_times),
+                "circuit_breaker": self.circuit_breakers.breaker_for(engine).get_stats() if self.circuit_breakers else None
+            }
+        
+        self.batch_summary = summary
+        return summary
+    
+    async def async_run_test(self, 
+                             query: str, 
+                             num_results: int = 10, 
+                             runs: int = 3,
+                             connection_limit: int = 100) -> Dict[str, Any]:
+        """
+        run_test metodunun asenkron karşılığı.
+        
+        Sorgu tek bir paylaşılan aiohttp oturumu üzerinden tüm motorlara aynı
+        anda gönderilir; istek başına iş parçacığı açılmaz. Sonuç sözlüğü
+        run_test ile aynı yapıdadır.
+        
+        Örnek:
+            asyncio.run(evaluator.async_run_test("python programming"))
+        
+        Args:
+            query: Test edilecek arama sorgusu
+            num_results: Her motordan istenecek sonuç sayısı
+            runs: Güvenilir hız ölçümü için kaç kez çalıştırılacağı
+            connection_limit: Paylaşılan oturumda eşzamanlı açık bağlantı sınırı
+            
+        Returns:
+            Test sonuçlarını içeren sözlük
+        """
+        if not self.engines:
+            raise ValueError("Test yapılacak arama motoru kaydedilmemiş")
+            
+        print(f"Asenkron test çalıştırılıyor: '{query}' sorgusu, {len(self.engines)} arama motoru ile...")
+        
+        async with create_async_session(connection_limit=connection_limit) as session:
+            engine_results = await asyncio.gather(*[
+                self._async_run_single_engine_test(engine, query, num_results, runs, session)
+                for engine in self.engines
+            ])
+        
+        test_results = {
+            engine.name: result for engine, result in zip(self.engines, engine_results)
+        }
+        
+        self.results[query] = test_results
+        return test_results
+    
     def generate_report(self, output_dir: str = ".") -> str:
         """
         Test sonuçlarına dayalı karşılaştırmalı bir rapor oluşturur.
@@ -189,13 +952,114 @@ class SearchEngineEvaluator:
             f.write(f"## Test Parametreleri\n\n")
             f.write(f"* Sorgu: `{first_query}`\n")
             f.write(f"* İstenen sonuç sayısı: {self.results[first_query][list(self.results[first_query].keys())[0]].get('num_results', 0)}\n")
-            f.write(f"* Test edilen motor sayısı: {len(self.engines)}\n\n")
+            f.write(f"* Test edilen motor sayısı: {len(self.engines)}\n")
+            f.write(f"* Isınma çalıştırması: {self.warmup_runs} (istatistiklere dahil değil)\n\n")
             
             f.write(f"## Karşılaştırma Tablosu\n\n")
             headers = ["Motor", "Kaynak", "Lisans", "Limit", "Ücretlendirme", "Ort. Yanıt Süresi", "Sonuç Sayısı", "Dönen Sonuç"]
             f.write(tabulate(table_data, headers=headers, tablefmt="github"))
             f.write("\n\n")
             
+            # Motor bazında tüm ölçümler üzerindeki gecikme yüzdelikleri
+            latency_percentiles = self.get_latency_percentiles()
+            if latency_percentiles:
+                f.write(f"## Gecikme Yüzdelikleri\n\n")
+                percentile_rows = [
+                    [engine_name, summary["count"], format_latency(summary["mean"])] + format_percentiles(summary)
+                    for engine_name, summary in latency_percentiles.items()
+                ]
+                percentile_headers = ["Motor", "Ölçüm", "Ort."] + [percentile_key(p) for p in DEFAULT_PERCENTILES]
+                f.write(tabulate(percentile_rows, headers=percentile_headers, tablefmt="github"))
+                f.write("\n\n")
+            
+            # Medyan gecikmelerin güven aralıklarıyla karşılaştırılması
+            comparison = self.compare_engines(first_query)
+            if comparison:
+                f.write(f"## İstatistiksel Karşılaştırma\n\n")
+                f.write(f"Aykırı değerler ayıklandıktan sonraki medyan gecikme ve %{self.confidence * 100:g} "
+                        f"bootstrap güven aralığı. Aralığı en hızlı motorunkiyle örtüşen farklar anlamlı değildir.\n\n")
+                comparison_rows = []
+                for entry in comparison:
+                    robust = self.results[first_query][entry["engine"]]["robust_stats"]
+                    interval = entry["confidence_interval"]
+                    if entry["significant"] is None:
+                        significance = "En hızlı"
+                    else:
+                        significance = "Anlamlı" if entry["significant"] else "Anlamlı değil (aralıklar örtüşüyor)"
+                    comparison_rows.append([
+                        entry["engine"],
+                        format_latency(entry["median"]),
+                        format_latency(robust["trimmed_mean"]),
+                        f"[{format_latency(interval[0])}, {format_latency(interval[1])}]" if interval else "N/A",
+                        len(robust["outliers"]),
+                        significance
+                    ])
+                comparison_headers = ["Motor", "Medyan", "Kırpılmış Ort.", "Güven Aralığı", "Aykırı", "Fark"]
+                f.write(tabulate(comparison_rows, headers=comparison_headers, tablefmt="github"))
+                f.write("\n\n")
+            
+            # İlk sonuca ve ilk k sonuca kadar geçen süreler (toplam süreden önce hazır olabilir)
+            ranked_engines = {name: data for name, data in self.results[first_query].items() if data.get("time_to_k")}
+            if ranked_engines:
+                f.write(f"## Sonuç Hazır Olma Süreleri\n\n")
+                f.write(f"İlk sonuca ve ilk k sonuca kadar geçen ortalama süre; k sonuca ulaşmayan çalıştırmalar dahil değildir.\n\n")
+                rank_rows = [
+                    [engine_name, format_latency(data["avg_response_time"])]
+                    + [format_latency(data["time_to_k"].get(k)) for k in self.result_ranks]
+                    for engine_name, data in ranked_engines.items()
+                ]
+                rank_headers = ["Motor", "Ort. Toplam"] + [rank_label(k) for k in self.result_ranks]
+                f.write(tabulate(rank_rows, headers=rank_headers, tablefmt="github"))
+                f.write("\n\n")
+            
+            # Sağlayıcı/ağ süresi ile ayrıştırma süresinin ayrımı
+            phase_breakdown = {name: phases for name, phases in self.get_phase_breakdown().items() if phases["requests"]}
+            if phase_breakdown:
+                f.write(f"## İstek Aşamaları (istek başına ortalama)\n\n")
+                phase_rows = [
+                    [engine_name, phases["requests"]] + [format_latency(phases[phase]) for phase in PHASES] + [format_latency(phases["network"])]
+                    for engine_name, phases in phase_breakdown.items()
+                ]
+                phase_headers = ["Motor", "İstek"] + [PHASE_LABELS[phase] for phase in PHASES] + ["Ağ Toplamı"]
+                f.write(tabulate(phase_rows, headers=phase_headers, tablefmt="github"))
+                f.write("\n\n")
+            
+            # Toplu test yapıldıysa tüm sorgu kümesinin özetini ekle
+            if self.batch_summary:
+                f.write(f"## Toplu Test Özeti ({len(queries)} sorgu)\n\n")
+                batch_rows = []
+                for engine_name, summary in self.batch_summary.items():
+                    batch_rows.append([
+                        engine_name,
+                        f"{summary['answered_queries']}/{summary['queries']}",
+                        summary["successful_runs"],
+                        summary["failed_runs"],
+                        summary.get("timeout_runs", 0),
+                        summary.get("skipped_runs", 0),
+                        f"{summary['avg_response_time']:.2f}s" if summary["avg_response_time"] is not None else "N/A",
+                        f"{summary['median_response_time']:.2f}s" if summary["median_response_time"] is not None else "N/A",
+                        f"{summary['max_response_time']:.2f}s" if summary["max_response_time"] is not None else "N/A",
+                        f"{summary.get('avg_queue_wait_time', 0):.2f}s"
+                    ] + [format_latency(summary.get("time_to_k", {}).get(k)) for k in self.result_ranks])
+                batch_headers = (["Motor", "Yanıtlanan Sorgu", "Başarılı", "Hatalı", "Zaman Aşımı", "Atlanan", "Ort.", "Medyan",
+                                  "Maks.", "Ort. Kuyruk Bekleme"] + [rank_label(k) for k in self.result_ranks])
+                f.write(tabulate(batch_rows, headers=batch_headers, tablefmt="github"))
+                f.write("\n\n")
+            
+            # Devre kesici açıldıysa veya istek reddettiyse durumunu göster
+            breaker_stats = self.circuit_breakers.get_stats() if self.circuit_breakers else {}
+            if any(stats["trips"] or stats["rejected"] for stats in breaker_stats.values()):
+                f.write(f"## Devre Kesici\n\n")
+                f.write(f"Negatif önbellekten reddedilen istek: {self.circuit_breakers.negative_cache.hits}\n\n")
+                breaker_rows = [
+                    [engine_name, STATE_LABELS[stats["state"]], stats["trips"], stats["rejected"],
+                     f"%{stats['failure_rate'] * 100:.0f}", f"%{stats['slow_call_rate'] * 100:.0f}"]
+                    for engine_name, stats in breaker_stats.items()
+                ]
+                breaker_headers = ["Motor", "Durum", "Açılma", "Reddedilen", "Hata Oranı", "Yavaş Çağrı Oranı"]
+                f.write(tabulate(breaker_rows, headers=breaker_headers, tablefmt="github"))
+                f.write("\n\n")
+            
             # Her motor için ayrıntılı sonuçları ekle
             f.write(f"## Ayrıntılı Sonuçlar\n\n")
             for engine_name, data in self.results[first_query].items():
@@ -204,10 +1068,51 @@ class SearchEngineEvaluator:
                 if "error" in data:
                     f.write(f"**Hata**: {data.get('error')}\n\n")
                     continue
+                if data.get("timeouts"):
+                    f.write(f"* Zaman Aşımı: {data['timeouts']} çalıştırma süre sınırını aştı\n")
+                if data.get("skipped"):
+                    f.write(f"* Atlanan: {data['skipped']} çalıştırma devre açık olduğu için gönderilmedi\n")
                     
                 f.write(f"* Ortalama Yanıt Süresi: {data.get('avg_response_time', 0):.2f}s\n")
                 f.write(f"* Minimum Yanıt Süresi: {data.get('min_response_time', 0):.2f}s\n")
                 f.write(f"* Maksimum Yanıt Süresi: {data.get('max_response_time', 0):.2f}s\n")
+                if data.get("cold_response_time") is not None:
+                    f.write(f"* Soğuk Bağlantı Yanıt Süresi: {data['cold_response_time']:.2f}s\n")
+                if data.get("warm_avg_response_time") is not None:
+                    f.write(f"* Sıcak Bağlantı Ort. Yanıt Süresi: {data['warm_avg_response_time']:.2f}s\n")
+                if data.get("avg_first_result_time") is not None and 1 not in data.get("time_to_k", {}):
+                    f.write(f"* Ort. İlk Sonuç Süresi: {data['avg_first_result_time']:.2f}s\n")
+                if data.get("time_to_k"):
+                    ranks = ", ".join(f"{rank_label(k)}: {format_latency(value)}" for k, value in data["time_to_k"].items())
+                    f.write(f"* Sonuç Hazır Olma Süreleri: {ranks}\n")
+                if data.get("latency_percentiles"):
+                    percentiles = ", ".join(
+                        f"{percentile_key(p)} {value}"
+                        for p, value in zip(DEFAULT_PERCENTILES, format_percentiles(data["latency_percentiles"]))
+                    )
+                    f.write(f"* Yüzdelikler: {percentiles}\n")
+                robust = data.get("robust_stats") or {}
+                if robust.get("median") is not None:
+                    interval = robust["confidence_interval"]
+                    f.write(f"* Medyan: {format_latency(robust['median'])} "
+                            f"(güven aralığı [{format_latency(interval[0])}, {format_latency(interval[1])}], "
+                            f"{len(robust['outliers'])} aykırı ölçüm ayıklandı)\n")
+                if data.get("phase_breakdown") and data["phase_breakdown"]["requests"]:
+                    phases = data["phase_breakdown"]
+                    f.write(f"* Aşamalar: ağ {format_latency(phases['network'])} "
+                            f"(TTFB {format_latency(phases['ttfb'])}), ayrıştırma {format_latency(phases['parse'])}\n")
+                if data.get("engine_info", {}).get("wins"):
+                    wins = ", ".join(f"{name} {count}" for name, count in data["engine_info"]["wins"].items())
+                    f.write(f"* Yarış Kazananları: {wins}\n")
+                if data.get("engine_info", {}).get("hedging"):
+                    hedging = data["engine_info"]["hedging"]
+                    f.write(f"* Yedek İstek: {hedging['hedged_requests']}/{hedging['requests']} istek yedeklendi, "
+                            f"yedek {hedging['backup_wins']} kez kazandı (bekleme {format_latency(hedging['hedge_delay'])})\n")
+                if data.get("engine_info", {}).get("missed_deadline"):
+                    missed = ", ".join(f"{name} {count}" for name, count in data["engine_info"]["missed_deadline"].items())
+                    f.write(f"* Süre Sınırını Kaçıran Motorlar: {missed}\n")
+                if data.get("avg_queue_wait_time"):
+                    f.write(f"* Ort. Hız Sınırı Kuyruk Bekleme: {data['avg_queue_wait_time']:.2f}s (yanıt süresine dahil değil)\n")
                 f.write(f"* Sonuç Sayısı: {data.get('results_count', 0)}\n\n")
                 
                 if "results" in data and data["results"]:
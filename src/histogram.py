@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yüksek çözünürlüklü gecikme ölçümü ve yüzdelik istatistikleri modülü.
+
+Bu modül, monoton nanosaniye saatini ve HDR (High Dynamic Range) histogram
+yaklaşımıyla çalışan, sınırlı bellekli akışkan bir gecikme histogramını
+sağlar. Histogram değerleri logaritmik kovalar içinde doğrusal alt kovalara
+yerleştirir; bellek kullanımı ölçüm sayısından bağımsızdır ve yüzdelikler
+belirtilen anlamlı basamak hassasiyetinde hesaplanır.
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# Monoton, yüksek çözünürlüklü saat (nanosaniye)
+monotonic_ns = time.perf_counter_ns
+
+NS_PER_SECOND = 1_000_000_000
+
+# Raporlarda gösterilen yüzdelikler
+DEFAULT_PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+def percentile_key(percentile: float) -> str:
+    """
+    Yüzdeliğin sözlük anahtarını döndürür (ör. 50 -> "p50", 99.9 -> "p99.9").
+    
+    Args:
+        percentile: Yüzdelik (0-100)
+    
+    Returns:
+        Anahtar
+    """
+    return f"p{percentile:g}"
+
+
+class LatencyHistogram:
+    """
+    HDR tarzı, sınırlı bellekli akışkan gecikme histogramı.
+    
+    Değerler nanosaniye cinsinden kaydedilir. Her kova bir önceki kovanın
+    iki katı genişliktedir ve kendi içinde significant_figures basamak
+    hassasiyet sağlayacak kadar doğrusal alt kovaya bölünür. Yalnızca dolu
+    kovalar saklanır.
+    """
+    
+    def __init__(self,
+                 lowest_ns: int = 1_000,
+                 highest_ns: int = 3600 * NS_PER_SECOND,
+                 significant_figures: int = 3):
+        """
+        LatencyHistogram sınıfını başlatır.
+        
+        Args:
+            lowest_ns: Ayırt edilebilen en küçük değer (nanosaniye, varsayılan 1 µs)
+            highest_ns: İzlenen en büyük değer (nanosaniye, büyük değerler buna kırpılır)
+            significant_figures: Yüzdelik hassasiyeti (anlamlı basamak sayısı, 1-5)
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures 1 ile 5 arasında olmalı")
+        
+        self.lowest_ns = max(1, lowest_ns)
+        self.highest_ns = max(highest_ns, 2 * self.lowest_ns)
+        self.significant_figures = significant_figures
+        
+        self._unit_magnitude = int(math.floor(math.log2(self.lowest_ns)))
+        self._sub_bucket_bits = int(math.ceil(math.log2(2 * 10 ** significant_figures)))
+        self._sub_bucket_half_bits = self._sub_bucket_bits - 1
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._sub_bucket_half = 1 << self._sub_bucket_half_bits
+        self._sub_bucket_mask = (self._sub_bucket_count - 1) << self._unit_magnitude
+        
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+    
+    def _index_of(self, value_ns: int) -> int:
+        """Değerin sayaç indeksini döndürür."""
+        bucket = max(0, (value_ns | self._sub_bucket_mask).bit_length() - self._unit_magnitude - self._sub_bucket_bits)
+        sub_bucket = value_ns >> (bucket + self._unit_magnitude)
+        return ((bucket + 1) << self._sub_bucket_half_bits) + (sub_bucket - self._sub_bucket_half)
+    
+    def _range_of(self, index: int) -> Tuple[int, int]:
+        """Sayaç indeksinin kapsadığı [en küçük, en büyük] değer aralığını döndürür."""
+        bucket = (index >> self._sub_bucket_half_bits) - 1
+        sub_bucket = (index & (self._sub_bucket_half - 1)) + self._sub_bucket_half
+        if bucket < 0:
+            sub_bucket -= self._sub_bucket_half
+            bucket = 0
+        shift = bucket + self._unit_magnitude
+        lowest = sub_bucket << shift
+        return lowest, lowest + (1 << shift) - 1
+    
+    def record(self, value_ns: int, count: int = 1) -> None:
+        """
+        Bir gecikme değerini kaydeder.
+        
+        Args:
+            value_ns: Gecikme (nanosaniye)
+            count: Değerin kaç kez kaydedileceği
+        """
+        value_ns = min(max(0, int(value_ns)), self.highest_ns)
+        index = self._index_of(value_ns)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + count
+            self.count += count
+            self.total_ns += value_ns * count
+            self.min_ns = value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+            self.max_ns = value_ns if self.max_ns is None else max(self.max_ns, value_ns)
+    
+    def record_seconds(self, seconds: float) -> None:
+        """
+        Saniye cinsinden bir gecikme değerini kaydeder.
+        
+        Args:
+            seconds: Gecikme (saniye)
+        """
+        self.record(round(seconds * NS_PER_SECOND))
+    
+    @classmethod
+    def from_seconds(cls, values: Iterable[float], **kwargs) -> "LatencyHistogram":
+        """
+        Saniye cinsinden değerlerden histogram oluşturur.
+        
+        Args:
+            values: Gecikme değerleri (saniye)
+            **kwargs: LatencyHistogram parametreleri
+        
+        Returns:
+            LatencyHistogram nesnesi
+        """
+        histogram = cls(**kwargs)
+        for value in values:
+            histogram.record_seconds(value)
+        return histogram
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Aynı ayarlarla oluşturulmuş başka bir histogramı bu histograma ekler.
+        
+        Args:
+            other: Eklenecek histogram
+        """
+        if (other.lowest_ns, other.significant_figures) != (self.lowest_ns, self.significant_figures):
+            raise ValueError("Yalnızca aynı ayarlara sahip histogramlar birleştirilebilir")
+        
+        with other._lock:
+            counts = dict(other._counts)
+            count, total_ns, min_ns, max_ns = other.count, other.total_ns, other.min_ns, other.max_ns
+        if not count:
+            return
+        
+        with self._lock:
+            for index, value in counts.items():
+                self._counts[index] = self._counts.get(index, 0) + value
+            self.count += count
+            self.total_ns += total_ns
+            self.min_ns = min_ns if self.min_ns is None else min(self.min_ns, min_ns)
+            self.max_ns = max_ns if self.max_ns is None else max(self.max_ns, max_ns)
+    
+    def value_at_percentile(self, percentile: float) -> Optional[int]:
+        """
+        Yüzdeliğe karşılık gelen değeri döndürür.
+        
+        Args:
+            percentile: Yüzdelik (0-100)
+        
+        Returns:
+            Değer (nanosaniye) veya histogram boşsa None
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            if percentile <= 0:
+                return self.min_ns
+            target = max(1, math.ceil(min(100.0, max(0.0, percentile)) / 100.0 * self.count))
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    # Kovanın en büyük eşdeğer değeri, gerçek uç değerlerle sınırlanır
+                    return min(max(self._range_of(index)[1], self.min_ns), self.max_ns)
+            return self.max_ns
+    
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """
+        Yüzdelikleri saniye cinsinden döndürür.
+        
+        Args:
+            percentiles: Hesaplanacak yüzdelikler
+        
+        Returns:
+            "p50" -> saniye biçiminde sözlük
+        """
+        result = {}
+        for percentile in percentiles:
+            value = self.value_at_percentile(percentile)
+            result[percentile_key(percentile)] = value / NS_PER_SECOND if value is not None else None
+        return result
+    
+    def to_dict(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """
+        Histogram özetini saniye cinsinden döndürür.
+        
+        Returns:
+            count, min, max, mean ve yüzdelikleri içeren sözlük
+        """
+        summary = {
+            "count": self.count,
+            "min": self.min_ns / NS_PER_SECOND if self.min_ns is not None else None,
+            "max": self.max_ns / NS_PER_SECOND if self.max_ns is not None else None,
+            "mean": self.total_ns / self.count / NS_PER_SECOND if self.count else None
+        }
+        summary.update(self.percentiles(percentiles))
+        return summary
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class RollingLatencyHistogram:
+    """
+    Son ölçümleri izleyen kayan pencereli gecikme histogramı.
+    
+    İki LatencyHistogram dönüşümlü kullanılır: etkin histogram window
+    ölçüme ulaşınca bir önceki histogramın yerini alır ve yeni bir etkin
+    histogram açılır. Yüzdelikler ikisinin birleşiminden hesaplanır; böylece
+    her zaman son window ile 2*window arasındaki ölçümler dikkate alınır.
+    """
+    
+    def __init__(self, window: int = 500, **kwargs):
+        """
+        RollingLatencyHistogram sınıfını başlatır.
+        
+        Args:
+            window: Bir histogramın dönmeden önce tuttuğu ölçüm sayısı
+            **kwargs: LatencyHistogram parametreleri
+        """
+        if window < 1:
+            raise ValueError("window en az 1 olmalı")
+        
+        self.window = window
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._current = LatencyHistogram(**kwargs)
+        self._previous = LatencyHistogram(**kwargs)
+    
+    def record_seconds(self, seconds: float) -> None:
+        """
+        Saniye cinsinden bir gecikme değerini kaydeder.
+        
+        Args:
+            seconds: Gecikme (saniye)
+        """
+        with self._lock:
+            if self._current.count >= self.window:
+                self._previous = self._current
+                self._current = LatencyHistogram(**self._kwargs)
+            current = self._current
+        current.record_seconds(seconds)
+    
+    def snapshot(self) -> LatencyHistogram:
+        """
+        Penceredeki ölçümleri içeren histogramı döndürür.
+        
+        Returns:
+            LatencyHistogram nesnesi
+        """
+        with self._lock:
+            current, previous = self._current, self._previous
+        merged = LatencyHistogram(**self._kwargs)
+        merged.merge(previous)
+        merged.merge(current)
+        return merged
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Penceredeki ölçümlerin yüzdeliğini saniye cinsinden döndürür.
+        
+        Args:
+            percentile: Yüzdelik (0-100)
+        
+        Returns:
+            Değer (saniye) veya ölçüm yoksa None
+        """
+        value = self.snapshot().value_at_percentile(percentile)
+        return value / NS_PER_SECOND if value is not None else None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._current.count + self._previous.count
+
+
+def format_latency(seconds: Optional[float]) -> str:
+    """
+    Gecikmeyi rapor için biçimlendirir (1 saniyenin altı milisaniye olarak).
+    
+    Args:
+        seconds: Gecikme (saniye) veya None
+    
+    Returns:
+        Biçimlendirilmiş metin
+    """
+    if seconds is None:
+        return "N/A"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_percentiles(summary: Optional[Dict[str, Any]],
+                       percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> list:
+    """
+    Histogram özetindeki yüzdelikleri rapor tablosu satırı olarak biçimlendirir.
+    
+    Args:
+        summary: LatencyHistogram.to_dict çıktısı (None ise tüm değerler "N/A")
+        percentiles: Gösterilecek yüzdelikler
+    
+    Returns:
+        Biçimlendirilmiş değerlerin listesi
+    """
+    summary = summary or {}
+    return [format_latency(summary.get(percentile_key(percentile))) for percentile in percentiles]
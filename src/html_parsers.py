@@ -0,0 +1,373 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+DuckDuckGo HTML sonuç sayfası ayrıştırıcıları.
+
+Sonuç sayfasının tamamını BeautifulSoup ile ağaç olarak kurmak ve her sonuç
+için CSS seçicileri çalıştırmak saf Python'da ağ gecikmesi kadar sürebilir.
+Bu modül aynı sonuçları üreten değiştirilebilir ayrıştırıcılar sağlar:
+    
+    lxml:   C tabanlı ayrıştırıcı ve XPath (lxml kuruluysa)
+    stream: Standart kütüphanenin HTMLParser'ı ile akışkan ayrıştırma;
+            num_results sonuç bloğu tamamlanınca sayfanın kalanını okumaz
+    bs4:    BeautifulSoup ile önceki implementasyon (yedek)
+
+Örnek:
+    python -m src.html_parsers --cassette cassettes/duck.jsonl.gz --repeat 50
+    python -m src.html_parsers sayfa1.html sayfa2.html
+"""
+
+import argparse
+import gzip
+import json
+import time
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from src.core import SearchResult, logger
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml isteğe bağlı; yoksa akışkan ayrıştırıcı kullanılır
+    lxml_html = None
+
+# Ayrıştırıcı: (HTML metni, istenen sonuç sayısı) -> sonuçlar
+ResultParser = Callable[[str, int], List[SearchResult]]
+
+# Ayrıştırıcı belirtilmediğinde kullanılabilir olan ilki seçilir
+DEFAULT_PARSER_ORDER = ("lxml", "stream", "bs4")
+
+DEFAULT_BENCHMARK_REPEAT = 20
+
+
+def _resolve_link(url_text: str, href: str) -> str:
+    """
+    Sonucun bağlantısını döndürür: başlıktaki DuckDuckGo yönlendirme
+    bağlantısından (uddg parametresi) çıkarılan adres, yoksa görünen URL.
+    
+    Args:
+        url_text: .result__url öğesinin metni
+        href: Başlıktaki ilk bağlantının href değeri
+    
+    Returns:
+        Bağlantı
+    """
+    if href.startswith("/") and "uddg=" in href:
+        return unquote(href.split("uddg=")[1].split("&")[0])
+    return url_text
+
+
+def parse_bs4(data: str, num_results: int) -> List[SearchResult]:
+    """
+    BeautifulSoup ile ayrıştırır (sayfanın tamamı ağaç olarak kurulur).
+    
+    Args:
+        data: HTML yanıt metni
+        num_results: İstenen sonuç sayısı
+    
+    Returns:
+        SearchResult nesnelerinin listesi
+    """
+    from bs4 import BeautifulSoup
+    
+    results = []
+    soup = BeautifulSoup(data, "html.parser")
+    for element in soup.select(".result")[:num_results]:
+        title_element = element.select_one(".result__title")
+        link_element = element.select_one(".result__url")
+        snippet_element = element.select_one(".result__snippet")
+        
+        anchor = title_element.find("a") if title_element else None
+        results.append(SearchResult(
+            title=title_element.text.strip() if title_element else "",
+            link=_resolve_link(link_element.text.strip() if link_element else "",
+                               anchor.get("href", "") if anchor else ""),
+            snippet=snippet_element.text.strip() if snippet_element else ""
+        ))
+    return results
+
+
+def _class_xpath(class_name: str) -> str:
+    """Sınıf listesinde class_name bulunan öğeler için XPath koşulu (CSS .sınıf karşılığı)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+_LXML_RESULT_XPATH = f"//*[{_class_xpath('result')}]"
+_LXML_TITLE_XPATH = f".//*[{_class_xpath('result__title')}]"
+_LXML_URL_XPATH = f".//*[{_class_xpath('result__url')}]"
+_LXML_SNIPPET_XPATH = f".//*[{_class_xpath('result__snippet')}]"
+
+
+def parse_lxml(data: str, num_results: int) -> List[SearchResult]:
+    """
+    lxml ile ayrıştırır.
+    
+    Args:
+        data: HTML yanıt metni
+        num_results: İstenen sonuç sayısı
+    
+    Returns:
+        SearchResult nesnelerinin listesi
+    
+    Raises:
+        ImportError: lxml kurulu değilse
+    """
+    if lxml_html is None:
+        raise ImportError("lxml ayrıştırıcısı için lxml paketi gerekli")
+    
+    results = []
+    for element in lxml_html.fromstring(data).xpath(_LXML_RESULT_XPATH)[:num_results]:
+        titles = element.xpath(_LXML_TITLE_XPATH)
+        urls = element.xpath(_LXML_URL_XPATH)
+        snippets = element.xpath(_LXML_SNIPPET_XPATH)
+        
+        anchors = titles[0].xpath(".//a") if titles else []
+        results.append(SearchResult(
+            title=titles[0].text_content().strip() if titles else "",
+            link=_resolve_link(urls[0].text_content().strip() if urls else "",
+                               anchors[0].get("href", "") if anchors else ""),
+            snippet=snippets[0].text_content().strip() if snippets else ""
+        ))
+    return results
+
+
+class _StopParsing(Exception):
+    """İstenen sayıda sonuç bloğu tamamlandığında ayrıştırmayı durdurur."""
+
+
+class _ResultStreamParser(HTMLParser):
+    """
+    .result bloklarını akışkan olarak okuyan ayrıştırıcı. Blok içindeki ilk
+    .result__title, .result__url ve .result__snippet öğelerinin metnini ve
+    başlıktaki ilk bağlantıyı toplar.
+    """
+    
+    _FIELDS = ("result__title", "result__url", "result__snippet")
+    
+    def __init__(self, num_results: int):
+        super().__init__(convert_charrefs=True)
+        self.num_results = num_results
+        self.results = []
+        self._block = None          # Açık sonuç bloğunun alanları
+        self._block_tag = None
+        self._block_depth = 0       # Blok öğesiyle aynı addaki açık etiket sayısı
+        self._field = None          # Metni toplanan alan
+        self._field_tag = None
+        self._field_depth = 0       # Alan öğesiyle aynı addaki açık etiket sayısı
+    
+    def handle_starttag(self, tag, attrs):
+        classes = ()
+        for name, value in attrs:
+            if name == "class" and value:
+                classes = value.split()
+                break
+        
+        if self._block is None:
+            if "result" in classes:
+                self._block = {"texts": {}, "href": None}
+                self._block_tag, self._block_depth = tag, 1
+            return
+        
+        if tag == self._block_tag:
+            self._block_depth += 1
+        
+        if self._field is not None:
+            if tag == self._field_tag:
+                self._field_depth += 1
+            if self._field == "result__title" and tag == "a" and self._block["href"] is None:
+                self._block["href"] = dict(attrs).get("href") or ""
+            return
+        
+        for field in self._FIELDS:
+            if field in classes and field not in self._block["texts"]:
+                self._field, self._field_tag, self._field_depth = field, tag, 1
+                self._block["texts"][field] = []
+                break
+    
+    def handle_endtag(self, tag):
+        if self._block is None:
+            return
+        
+        if self._field is not None and tag == self._field_tag:
+            self._field_depth -= 1
+            if self._field_depth == 0:
+                self._field = None
+        
+        if tag == self._block_tag:
+            self._block_depth -= 1
+            if self._block_depth == 0:
+                self._finish_block()
+    
+    def handle_data(self, data):
+        if self._field is not None:
+            self._block["texts"][self._field].append(data)
+    
+    def _finish_block(self):
+        """Tamamlanan bloğu sonuca çevirir; yeterli sonuç toplandıysa durur."""
+        texts = {field: "".join(parts).strip() for field, parts in self._block["texts"].items()}
+        self.results.append(SearchResult(
+            title=texts.get("result__title", ""),
+            link=_resolve_link(texts.get("result__url", ""), self._block["href"] or ""),
+            snippet=texts.get("result__snippet", "")
+        ))
+        self._block = None
+        self._field = None
+        if len(self.results) >= self.num_results:
+            raise _StopParsing()
+
+
+def parse_streaming(data: str, num_results: int) -> List[SearchResult]:
+    """
+    Standart kütüphane ile akışkan ayrıştırır; num_results sonuç bloğu
+    tamamlandığında sayfanın kalanı okunmaz.
+    
+    Args:
+        data: HTML yanıt metni
+        num_results: İstenen sonuç sayısı
+    
+    Returns:
+        SearchResult nesnelerinin listesi
+    """
+    if num_results <= 0:
+        return []
+    
+    parser = _ResultStreamParser(num_results)
+    try:
+        parser.feed(data)
+        parser.close()
+    except _StopParsing:
+        pass
+    return parser.results
+
+
+# Kayıtlı ayrıştırıcılar (Key: Ad, Value: Ayrıştırıcı)
+HTML_PARSERS: Dict[str, ResultParser] = {
+    "lxml": parse_lxml,
+    "stream": parse_streaming,
+    "bs4": parse_bs4,
+}
+
+
+def available_parsers() -> List[str]:
+    """
+    Bu ortamda kullanılabilen ayrıştırıcıların adlarını döndürür.
+    
+    Returns:
+        Ayrıştırıcı adları
+    """
+    return [name for name in HTML_PARSERS if name != "lxml" or lxml_html is not None]
+
+
+def get_parser(name: Optional[str] = None) -> Tuple[str, ResultParser]:
+    """
+    Ayrıştırıcıyı döndürür.
+    
+    Args:
+        name: Ayrıştırıcı adı (None ise DEFAULT_PARSER_ORDER içinde kullanılabilir olan ilki)
+    
+    Returns:
+        (ad, ayrıştırıcı) biçiminde tuple
+    
+    Raises:
+        ValueError: Ayrıştırıcı bilinmiyorsa veya bu ortamda kullanılamıyorsa
+    """
+    available = available_parsers()
+    if name is None:
+        name = next(parser for parser in DEFAULT_PARSER_ORDER if parser in available)
+    if name not in available:
+        raise ValueError(f"Kullanılamayan HTML ayrıştırıcısı: {name}. Seçenekler: {', '.join(available)}")
+    return name, HTML_PARSERS[name]
+
+
+def load_recorded_pages(cassette_path: Optional[str] = None, html_paths: Sequence[str] = ()) -> List[str]:
+    """
+    Karşılaştırma için kaydedilmiş DuckDuckGo sayfalarını yükler.
+    
+    Args:
+        cassette_path: Kaset dosyası (yalnızca duckduckgo adreslerine ait yanıtlar alınır)
+        html_paths: HTML dosyaları
+    
+    Returns:
+        HTML metinleri
+    """
+    pages = []
+    if cassette_path:
+        opener = gzip.open if cassette_path.endswith(".gz") else open
+        with opener(cassette_path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "duckduckgo" in entry["request"]["url"] and entry["response"]["status"] == 200:
+                    pages.append(entry["response"]["body"])
+    for path in html_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append(f.read())
+    return pages
+
+
+def benchmark_parsers(pages: Sequence[str],
+                      num_results: int = 10,
+                      repeat: int = DEFAULT_BENCHMARK_REPEAT,
+                      parsers: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Ayrıştırıcıları aynı sayfalar üzerinde karşılaştırır ve sonuçlarının
+    bs4 ile aynı olup olmadığını denetler.
+    
+    Args:
+        pages: HTML sayfaları
+        num_results: Sayfa başına istenen sonuç sayısı
+        repeat: Her sayfanın ayrıştırılma sayısı
+        parsers: Karşılaştırılacak ayrıştırıcılar (None ise kullanılabilir olanların tümü)
+    
+    Returns:
+        Ayrıştırıcı adı -> {"per_page": sayfa başına süre (saniye), "speedup": bs4'e göre hız,
+        "matches": bs4 ile aynı sonuç veren sayfa oranı}
+    """
+    names = list(parsers or available_parsers())
+    expected = [parse_bs4(page, num_results) for page in pages]
+    
+    stats = {}
+    for name in names:
+        parser = HTML_PARSERS[name]
+        matches = sum(1 for page, reference in zip(pages, expected) if parser(page, num_results) == reference)
+        
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for page in pages:
+                parser(page, num_results)
+        per_page = (time.perf_counter() - start) / (repeat * len(pages))
+        stats[name] = {"per_page": per_page, "matches": matches / len(pages)}
+    
+    baseline = stats.get("bs4", {}).get("per_page")
+    for entry in stats.values():
+        entry["speedup"] = baseline / entry["per_page"] if baseline and entry["per_page"] else None
+    return stats
+
+
+def main():
+    """Ayrıştırıcı karşılaştırmasını komut satırından çalıştırır; sonuçlar logger ile yazılır."""
+    parser = argparse.ArgumentParser(description="DuckDuckGo HTML ayrıştırıcı karşılaştırması")
+    parser.add_argument("pages", nargs="*", help="Kaydedilmiş HTML sayfaları")
+    parser.add_argument("--cassette", type=str, default=None, help="DuckDuckGo yanıtları içeren kaset dosyası")
+    parser.add_argument("--num", "-n", type=int, default=10, help="Sayfa başına istenen sonuç sayısı")
+    parser.add_argument("--repeat", "-r", type=int, default=DEFAULT_BENCHMARK_REPEAT,
+                        help="Her sayfanın ayrıştırılma sayısı")
+    args = parser.parse_args()
+    
+    pages = load_recorded_pages(args.cassette, args.pages)
+    if not pages:
+        logger.warning("Karşılaştırma için kaydedilmiş DuckDuckGo sayfası bulunamadı")
+        return
+    
+    logger.info(f"{len(pages)} sayfa, sayfa başına {args.num} sonuç, {args.repeat} tekrar")
+    for name, entry in benchmark_parsers(pages, args.num, args.repeat).items():
+        speedup = f", bs4'ten {entry['speedup']:.1f} kat hızlı" if entry["speedup"] and name != "bs4" else ""
+        logger.info(f"{name}: {entry['per_page'] * 1000:.2f}ms/sayfa{speedup}, "
+                    f"bs4 ile aynı sonuç: %{entry['matches'] * 100:.0f}")
+
+
+if __name__ == "__main__":
+    main()
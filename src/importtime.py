@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Başlangıç (içe aktarma) süresi ölçüm modülü.
+
+Her senaryo ayrı bir `python -X importtime -c ...` sürecinde çalıştırılır ve
+yorumlayıcının standart hataya yazdığı modül bazındaki süreler ayrıştırılır.
+Senaryolarda yüklenmemesi gereken modüller (ör. yalnızca Serper kullanılırken
+BeautifulSoup) ve toplam süre bütçesi denetlenir; sonuçlar bir JSON dosyasına
+kaydedilip sonraki ölçümlerle karşılaştırılarak gerilemeler yakalanır.
+
+Örnek:
+    python -m src.importtime --save startup.json
+    python -m src.importtime --compare startup.json --tolerance 0.25
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+# Ölçülen başlangıç senaryoları (Key: Senaryo adı, Value: Çalıştırılan kod)
+STARTUP_SCENARIOS: Dict[str, str] = {
+    "engines": "import src.engines",
+    "serper": "from src.engines import get_engine_class; get_engine_class('serper')",
+    "utils": "from src.utils import quick_search",
+}
+
+_ENGINE_MODULES = tuple(f"src.engines.{key}" for key in (
+    "bing", "google", "duck", "brave", "searchapi", "serper", "jina", "firecrawl", "tavily"))
+
+# Senaryolarda yüklenmemesi gereken modüller; aiohttp ve sqlite3 yalnızca
+# asenkron arama ve yanıt önbelleği yollarında yüklenir
+_LAZY_MODULES = ("aiohttp", "sqlite3")
+
+FORBIDDEN_MODULES: Dict[str, tuple] = {
+    "engines": ("bs4", "matplotlib", "reportlab") + _LAZY_MODULES + _ENGINE_MODULES,
+    "serper": ("bs4", "matplotlib", "reportlab", "src.engines.duck", "src.engines.google", "src.engines.bing")
+              + _LAZY_MODULES,
+    "utils": ("matplotlib", "reportlab", "src.utils.pdf_report") + _LAZY_MODULES,
+}
+
+DEFAULT_RUNS = 3
+
+# Karşılaştırmada gerileme sayılmadan kabul edilen göreli artış
+DEFAULT_TOLERANCE = 0.25
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@dataclass
+class ImportTiming:
+    """Tek bir modülün içe aktarma süresi (mikrosaniye)."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class ImportProfile:
+    """Bir senaryonun `-X importtime` ölçümü."""
+    
+    def __init__(self, statement: str, timings: Dict[str, ImportTiming]):
+        """
+        ImportProfile sınıfını başlatır.
+        
+        Args:
+            statement: Ölçülen kod
+            timings: Modül adı -> ImportTiming
+        """
+        self.statement = statement
+        self.timings = timings
+    
+    @property
+    def total_us(self) -> int:
+        """En üst düzeydeki içe aktarmaların toplam süresi (mikrosaniye)."""
+        return sum(timing.cumulative_us for timing in self.timings.values() if timing.depth == 0)
+    
+    def loaded(self, module: str) -> bool:
+        """
+        Modülün (veya alt modüllerinden birinin) yüklenip yüklenmediğini döndürür.
+        
+        Args:
+            module: Modül adı
+        
+        Returns:
+            Yüklendiyse True
+        """
+        prefix = module + "."
+        return any(name == module or name.startswith(prefix) for name in self.timings)
+    
+    def slowest(self, count: int = 10) -> List[ImportTiming]:
+        """
+        Kendi süresi en uzun modülleri döndürür.
+        
+        Args:
+            count: Döndürülecek modül sayısı
+        
+        Returns:
+            Süreye göre azalan sırada ImportTiming listesi
+        """
+        return sorted(self.timings.values(), key=lambda timing: timing.self_us, reverse=True)[:count]
+
+
+def parse_importtime(output: str) -> Dict[str, ImportTiming]:
+    """
+    `python -X importtime` çıktısını ayrıştırır.
+    
+    Satırlar "import time: <self> | <cumulative> | <girintili modül adı>"
+    biçimindedir; girinti iç içe içe aktarma derinliğini gösterir.
+    
+    Args:
+        output: Yorumlayıcının standart hata çıktısı
+    
+    Returns:
+        Modül adı -> ImportTiming
+    """
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Başlık satırı ("self [us] | cumulative | imported package")
+            continue
+        name = fields[2].rstrip()
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings[module] = ImportTiming(module, int(fields[0]), int(fields[1]), max(depth, 0))
+    return timings
+
+
+def measure_import_time(statement: str, runs: int = DEFAULT_RUNS,
+                        python: Optional[str] = None, cwd: Optional[str] = None) -> ImportProfile:
+    """
+    Kodu her seferinde yeni bir yorumlayıcıda `-X importtime` ile çalıştırır
+    ve en hızlı ölçümü döndürür (önbellek ve gürültü etkisini azaltmak için).
+    
+    Args:
+        statement: Çalıştırılacak kod
+        runs: Ölçüm sayısı
+        python: Yorumlayıcı (varsayılan: geçerli yorumlayıcı)
+        cwd: Çalışma dizini (varsayılan: proje kök dizini)
+    
+    Returns:
+        En hızlı ölçümün ImportProfile nesnesi
+    
+    Raises:
+        RuntimeError: Kod hata ile sonlanırsa
+    """
+    best = None
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [python or sys.executable, "-X", "importtime", "-c", statement],
+            cwd=cwd or _PROJECT_ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"'{statement}' çalıştırılamadı:\n{completed.stderr[-2000:]}")
+        
+        profile = ImportProfile(statement, parse_importtime(completed.stderr))
+        if best is None or profile.total_us < best.total_us:
+            best = profile
+    return best
+
+
+def check_startup(profile: ImportProfile, forbidden: Iterable[str] = (),
+                  budget_ms: Optional[float] = None) -> List[str]:
+    """
+    Ölçümü yasaklı modüllere ve süre bütçesine göre denetler.
+    
+    Args:
+        profile: Senaryo ölçümü
+        forbidden: Yüklenmemesi gereken modüller
+        budget_ms: Toplam süre bütçesi (milisaniye, None ise denetlenmez)
+    
+    Returns:
+        Bulunan sorunların açıklamaları (sorun yoksa boş liste)
+    """
+    problems = [f"{module} yüklenmemeliydi" for module in forbidden if profile.loaded(module)]
+    if budget_ms is not None and profile.total_us / 1000 > budget_ms:
+        problems.append(f"başlangıç süresi {profile.total_us / 1000:.1f}ms, bütçe {budget_ms:.1f}ms")
+    return problems
+
+
+def compare_to_baseline(results: Dict[str, float], baseline: Dict[str, float],
+                        tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    Senaryo sürelerini kayıtlı temel ölçümle karşılaştırır.
+    
+    Args:
+        results: Senaryo adı -> süre (milisaniye)
+        baseline: Senaryo adı -> temel süre (milisaniye)
+        tolerance: Kabul edilen göreli artış (0.25 = %25)
+    
+    Returns:
+        Gerileme açıklamaları (gerileme yoksa boş liste)
+    """
+    regressions = []
+    for name, elapsed_ms in results.items():
+        previous = baseline.get(name)
+        if previous and elapsed_ms > previous * (1 + tolerance):
+            regressions.append(f"{name}: {previous:.1f}ms -> {elapsed_ms:.1f}ms (+{(elapsed_ms / previous - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    """Başlangıç süresi ölçümünü komut satırından çalıştırır."""
+    parser = argparse.ArgumentParser(description="İçe aktarma (başlangıç) süresi ölçümü")
+    parser.add_argument("scenarios", nargs="*", default=list(STARTUP_SCENARIOS),
+                        help=f"Ölçülecek senaryolar. Seçenekler: {', '.join(STARTUP_SCENARIOS)}")
+    parser.add_argument("--runs", "-r", type=int, default=DEFAULT_RUNS, help="Senaryo başına ölçüm sayısı")
+    parser.add_argument("--top", type=int, default=5, help="Gösterilecek en yavaş modül sayısı")
+    parser.add_argument("--budget", type=float, default=None, help="Senaryo başına süre bütçesi (milisaniye)")
+    parser.add_argument("--save", type=str, default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", type=str, default=None, help="Karşılaştırılacak temel ölçüm JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Gerileme sayılmayan göreli artış (varsayılan: 0.25)")
+    args = parser.parse_args()
+    
+    problems = []
+    results = {}
+    for name in args.scenarios:
+        profile = measure_import_time(STARTUP_SCENARIOS[name], runs=args.runs)
+        results[name] = profile.total_us / 1000
+        print(f"{name}: {results[name]:.1f}ms ({len(profile.timings)} modül)")
+        for timing in profile.slowest(args.top):
+            print(f"  {timing.module}: {timing.self_us / 1000:.1f}ms")
+        problems += [f"{name}: {problem}" for problem in
+                     check_startup(profile, FORBIDDEN_MODULES.get(name, ()), args.budget)]
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            problems += compare_to_baseline(results, json.load(f), args.tolerance)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    
+    for problem in problems:
+        print(f"GERİLEME: {problem}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,14 @@ import time
 import argparse
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-from dotenv import load_dotenv
 
 # Projenin kök dizinini Python yoluna ekle
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Arama motorlarını içe aktar
-from src.engines import get_engine_class, get_all_engine_classes, AVAILABLE_ENGINES
+# Arama motorlarını içe aktar; motor modülleri ve yalnızca toplu test, kaset ve
+# yarış modlarında kullanılan modüller başlangıç süresini kısaltmak için ilk kullanımda yüklenir
+from src.engines import get_engine_class, get_available_engines
+from src.deadline import SearchTimeoutError, deadline
 from search_interface import SearchResult, logger
 
 def parse_arguments():
@@ -27,9 +28,33 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description="Çoklu arama motoru test uygulaması")
     parser.add_argument("query", nargs="?", default="", help="Arama sorgusu")
     parser.add_argument("--engine", "-e", type=str, default="all", 
-                       help=f"Kullanılacak arama motoru. Seçenekler: {', '.join(list(AVAILABLE_ENGINES.keys()) + ['all'])}")
+                       help=f"Kullanılacak arama motoru. Seçenekler: {', '.join(get_available_engines() + ['all'])}")
     parser.add_argument("--num", "-n", type=int, default=5, help="Gösterilecek sonuç sayısı (varsayılan: 5)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Detaylı çıktı")
+    parser.add_argument("--query-file", "-f", type=str, default=None,
+                       help="Toplu test için sorgu dosyası (.jsonl veya satır başına bir sorgu içeren metin)")
+    parser.add_argument("--field", type=str, default="query", help="JSONL dosyasında sorgu alanı (varsayılan: query)")
+    parser.add_argument("--runs", "-r", type=int, default=1, help="Toplu testte sorgu başına tekrar sayısı (varsayılan: 1)")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Toplu testte iş parçacığı sayısı")
+    parser.add_argument("--timeout", type=float, default=None,
+                       help="Arama başına süre bütçesi (saniye); aşan çalıştırmalar zaman aşımı olarak sayılır")
+    parser.add_argument("--warmup", type=int, default=0,
+                       help="Toplu testte motor başına istatistiklere dahil edilmeyen ısınma çalıştırması sayısı")
+    parser.add_argument("--report", type=str, default=None, help="Toplu test raporunun yazılacağı dizin")
+    parser.add_argument("--rate-limit", action="store_true",
+                       help="Toplu testte ENGINE_SETTINGS içindeki motor hız sınırlarını uygula")
+    parser.add_argument("--circuit-breaker", action="store_true",
+                       help="Toplu testte sürekli hata veren motorları devre kesiciyle geçici olarak atla")
+    parser.add_argument("--cassette", type=str, default=None,
+                       help="HTTP isteklerini bu kaset dosyasından oynat (ağ bağlantısı gerekmez)")
+    parser.add_argument("--record", action="store_true",
+                       help="--cassette ile birlikte: canlı istek yapıp kasete kaydet")
+    parser.add_argument("--replay-latency", action="store_true",
+                       help="Kasetten oynatırken kaydedilen yanıt sürelerini bekle")
+    parser.add_argument("--processes", "-p", type=int, default=None,
+                       help="Toplu testte aramaları bu sayıda işçi sürece dağıt (motorlar süreç başına bir kez oluşturulur)")
+    parser.add_argument("--race", action="store_true",
+                       help="Seçili motorları yarıştır; ilk sonuç döndüren motorun sonuçlarını kullan")
     
     return parser.parse_args()
 
@@ -44,45 +69,190 @@ def print_results(engine_name: str, results: List[SearchResult], elapsed_time: f
         return
     
     for i, result in enumerate(results, 1):
-        print(f"{i}. {result.title}")
-        print(f"   URL: {result.link}")
-        print(f"   Özet: {result.snippet[:150]}..." if len(result.snippet) > 150 else f"   Özet: {result.snippet}")
-        print()
+        print_result(i, result)
+
+def print_result(index: int, result: SearchResult):
+    """Tek bir arama sonucunu ekrana yazdırır."""
+    print(f"{index}. {result.title}")
+    print(f"   URL: {result.link}")
+    print(f"   Özet: {result.snippet[:150]}..." if len(result.snippet) > 150 else f"   Özet: {result.snippet}")
+    print()
+
+def stream_results(engine: Any, query: str, num_results: int) -> Tuple[int, float, Optional[float]]:
+    """
+    Sonuçları motorun search_iter metodu ile hazır oldukça ekrana yazdırır.
+    
+    Args:
+        engine: Arama motoru
+        query: Arama sorgusu
+        num_results: İstenen sonuç sayısı
+        
+    Returns:
+        (sonuç sayısı, toplam süre, ilk sonuca kadar geçen süre) biçiminde tuple
+    """
+    print(f"{'-'*80}")
+    start_time = time.perf_counter()
+    first_result_time = None
+    count = 0
+    for count, result in enumerate(engine.search_iter(query, num_results), 1):
+        if first_result_time is None:
+            first_result_time = time.perf_counter() - start_time
+        print_result(count, result)
+    return count, time.perf_counter() - start_time, first_result_time
+
+def create_engines(engine_ids: List[str]) -> List[Any]:
+    """
+    Motor anahtarlarından arama motoru örnekleri oluşturur; oluşturulamayan motorlar atlanır.
+    
+    Args:
+        engine_ids: Motor anahtarlarının listesi
+        
+    Returns:
+        Oluşturulan SearchEngine örneklerinin listesi
+    """
+    engines = []
+    for engine_id in engine_ids:
+        try:
+            engine_class = get_engine_class(engine_id)
+            engines.append(engine_class())
+        except Exception as e:
+            logger.error(f"{engine_id} motoru oluşturulamadı: {e}")
+    return engines
+
+def run_batch_benchmark(args, engine_ids: List[str]):
+    """
+    Sorgu dosyasındaki tüm sorguları seçili motorlarda çalıştırır ve özeti yazdırır.
+    
+    Args:
+        args: Komut satırı argümanları
+        engine_ids: Test edilecek motor anahtarları
+    """
+    from src.evaluator import SearchEngineEvaluator
+    from src.rate_limiter import RateLimitScheduler
+    from src.circuit_breaker import CircuitBreakerRegistry
+    from src.meta import RaceSearch
+    from src.utils import load_queries
+    
+    queries = load_queries(args.query_file, field=args.field)
+    if not queries:
+        print(f"{args.query_file} dosyasında sorgu bulunamadı.")
+        return
+    
+    pool = None
+    if args.processes:
+        from src.worker_pool import WorkerPool, EngineSpec
+        
+        # Motorlar her işçi süreçte bir kez oluşturulur; ana süreçte yalnızca vekiller kullanılır
+        engine_ids = [engine_id for engine_id in engine_ids if get_engine_class(engine_id) is not None]
+        pool = WorkerPool([EngineSpec(engine_id) for engine_id in engine_ids], processes=args.processes) if engine_ids else None
+        engines = pool.engines if pool else []
+    else:
+        engines = create_engines(engine_ids)
+    if not engines:
+        print("Kullanılabilir arama motoru bulunamadı.")
+        return
+    
+    # Yarış modunda motorlar tek bir meta motor olarak ölçülür
+    if args.race:
+        engines = [RaceSearch(engines)]
+    
+    rate_limiter = RateLimitScheduler.from_settings() if args.rate_limit else None
+    circuit_breakers = CircuitBreakerRegistry() if args.circuit_breaker else None
+    evaluator = SearchEngineEvaluator(max_workers=args.workers, rate_limiter=rate_limiter,
+                                      warmup_runs=args.warmup, timeout=args.timeout,
+                                      circuit_breakers=circuit_breakers)
+    evaluator.register_engines(engines)
+    try:
+        summary = evaluator.run_batch(queries, num_results=args.num, runs=args.runs)
+    finally:
+        if pool is not None:
+            pool.close()
+    
+    print(f"\n{'-'*80}")
+    print(f"Toplu test özeti | {len(queries)} sorgu")
+    print(f"{'-'*80}")
+    for engine_name, data in summary.items():
+        avg_time = f"{data['avg_response_time']:.2f}s" if data["avg_response_time"] is not None else "N/A"
+        median_time = f"{data['median_response_time']:.2f}s" if data["median_response_time"] is not None else "N/A"
+        print(f"{engine_name}: ort. {avg_time}, medyan {median_time}, "
+              f"{data['successful_runs']} başarılı / {data['failed_runs']} hatalı / "
+              f"{data['timeout_runs']} zaman aşımı / {data['skipped_runs']} atlanan çalıştırma, "
+              f"ort. kuyruk bekleme {data['avg_queue_wait_time']:.2f}s")
+        if data["circuit_breaker"] and data["circuit_breaker"]["trips"]:
+            print(f"  devre {data['circuit_breaker']['trips']} kez açıldı, {data['circuit_breaker']['rejected']} istek reddedildi")
+    if args.race:
+        print(f"Kazanan dağılımı: {engines[0].get_engine_info()['wins']}")
+    
+    if args.report:
+        evaluator.generate_report(args.report)
 
 def main():
     """Ana fonksiyon."""
     args = parse_arguments()
     
-    # .env dosyasını yükle
-    load_dotenv()
-    
     # Detaylı çıktı istenirse, log seviyesini DEBUG'a ayarla
     if args.verbose:
         logger.setLevel(logging.DEBUG)
     
-    # Arama sorgusu komut satırından alınmamışsa, kullanıcıdan iste
-    query = args.query
-    if not query:
-        query = input("Arama sorgunuzu girin: ")
-    
-    if not query:
-        print("Geçerli bir sorgu girmeniz gerekiyor.")
-        return
+    # Kaset verilmişse tüm HTTP istekleri kaset üzerinden geçer
+    if args.cassette:
+        from src.cassette import Cassette, RECORD, REPLAY
+        
+        mode = RECORD if args.record else REPLAY
+        cassette = Cassette(args.cassette, mode=mode, replay_latency=args.replay_latency)
+        with cassette.use():
+            run(args)
+    else:
+        run(args)
+
+def run(args):
+    """
+    Seçili motorlarda aramayı veya toplu testi çalıştırır.
     
+    Args:
+        args: Komut satırı argümanları
+    """
     engines_to_test = []
     
     # Hangi motorları test edeceğimizi belirle
     if args.engine.lower() == "all":
         # Tüm motorları al
-        engines_to_test = list(AVAILABLE_ENGINES.keys())
+        engines_to_test = get_available_engines()
     else:
         # Belirtilen motoru al
         engine_id = args.engine.lower()
-        if engine_id not in AVAILABLE_ENGINES:
-            print(f"Belirtilen motor '{engine_id}' bulunamadı. Seçenekler: {', '.join(AVAILABLE_ENGINES.keys())}")
+        if engine_id not in get_available_engines():
+            print(f"Belirtilen motor '{engine_id}' bulunamadı. Seçenekler: {', '.join(get_available_engines())}")
             return
         engines_to_test = [engine_id]
     
+    # Sorgu dosyası verilmişse toplu test çalıştır
+    if args.query_file:
+        run_batch_benchmark(args, engines_to_test)
+        return
+    
+    # Arama sorgusu komut satırından alınmamışsa, kullanıcıdan iste
+    query = args.query
+    if not query:
+        query = input("Arama sorgunuzu girin: ")
+    
+    if not query:
+        print("Geçerli bir sorgu girmeniz gerekiyor.")
+        return
+    
+    if args.race:
+        from src.meta import RaceSearch
+        
+        engines = create_engines(engines_to_test)
+        if not engines:
+            print("Kullanılabilir arama motoru bulunamadı.")
+            return
+        race = RaceSearch(engines, timeout=args.timeout)
+        results, elapsed_time = race.measure_search_time(query, args.num)
+        print_results(f"{race.name} (kazanan: {race.last_winner or 'yok'})", results, elapsed_time)
+        race.close()
+        return
+    
     # Her motor için arama yap
     for engine_id in engines_to_test:
         try:
@@ -92,14 +262,17 @@ def main():
             
             print(f"\n{engine.name} ile arama yapılıyor...")
             
-            # Aramayı yap ve süreyi ölç
-            start_time = time.time()
-            results = engine.search(query, args.num)
-            elapsed_time = time.time() - start_time
+            # Sonuçları geldikçe göster ve süreyi ölç
+            with deadline(args.timeout):
+                count, elapsed_time, first_result_time = stream_results(engine, query, args.num)
             
-            # Sonuçları göster
-            print_results(engine.name, results, elapsed_time)
+            if not count:
+                print("Sonuç bulunamadı.")
+            first_result = f", ilk sonuç {first_result_time:.2f} saniye" if first_result_time is not None else ""
+            print(f"{engine.name} | {count} sonuç | {elapsed_time:.2f} saniye{first_result}")
             
+        except SearchTimeoutError as e:
+            print(f"ZAMAN AŞIMI: {engine_id} {args.timeout} saniye içinde yanıt vermedi ({e})")
         except Exception as e:
             logger.error(f"{engine_id} ile arama yapılırken hata oluştu: {e}")
             print(f"HATA: {engine_id} ile arama yapılırken bir sorun oluştu.")
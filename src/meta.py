@@ -0,0 +1,629 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Meta arama motorları modülü.
+
+Bu modüldeki motorlar mevcut SearchEngine sınıflarını bir araya getirir ve
+kendileri de SearchEngine olduğundan SearchEngineEvaluator'a diğer motorlar
+gibi kaydedilebilir.
+
+Örnek:
+    race = RaceSearch([SerperSearch(), BraveSearch(), TavilySearch()])
+    results = race.search("python programming")
+    print(race.last_winner)
+    
+    hedged = HedgedSearch(SerperSearch(), fallback=BraveSearch())
+    results = hedged.search("python programming")
+    
+    federated = FederatedSearch([SerperSearch(), BraveSearch(), BingSearch()], deadline=2.0)
+    results = federated.search("python programming")
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
+from contextlib import contextmanager, ExitStack
+from typing import Dict, List, Any, Optional, Tuple
+
+from src.core import SearchEngine, SearchResult, logger
+from src.histogram import RollingLatencyHistogram, monotonic_ns, NS_PER_SECOND
+from src.utils import canonicalize_url
+from src.deadline import deadline, SearchTimeoutError
+
+
+class _MultiEngineSearch(SearchEngine):
+    """Birden fazla motoru yöneten meta motorların ortak temel sınıfı."""
+    
+    def __init__(self, engines: List[SearchEngine], name: str, license_type: str = "Meta"):
+        """
+        Args:
+            engines: Sorgunun gönderileceği arama motorları
+            name: Meta motorun adı
+            license_type: Lisans türü
+        """
+        if not engines:
+            raise ValueError(f"{name} için en az bir arama motoru gerekli")
+        
+        super().__init__(name, ", ".join(engine.source_url for engine in engines), license_type)
+        self.engines = list(engines)
+        self.rate_limit_info = "Alt motorların limitleri geçerlidir"
+        self.pricing_info = "Alt motorların ücretlendirmesi geçerlidir"
+    
+    def reset_session(self) -> None:
+        """Tüm alt motorların bağlantı havuzlarını kapatır."""
+        for engine in self.engines:
+            if hasattr(engine, "reset_session"):
+                engine.reset_session()
+    
+    def _submit(self, fn, *args):
+        """
+        Fonksiyonu iş parçacığı havuzunda çalıştırır. Bağlam değişkenleri
+        (süre sınırı, aşama ölçümü, önbellek izleme) iş parçacığına kopyalanır.
+        """
+        return self._executor.submit(contextvars.copy_context().run, fn, *args)
+    
+    @contextmanager
+    def bypass_cache(self):
+        """Blok içinde tüm alt motorların önbelleklerini atlar."""
+        with ExitStack() as stack:
+            for engine in self.engines:
+                if hasattr(engine, "bypass_cache"):
+                    stack.enter_context(engine.bypass_cache())
+            yield
+
+
+class RaceSearch(_MultiEngineSearch):
+    """
+    Sorguyu tüm motorlara aynı anda gönderen ve boş olmayan ilk sonuç
+    listesini döndüren meta motor. Geride kalan istekler senkron yolda
+    yok sayılır, asenkron yolda iptal edilir.
+    """
+    
+    def __init__(self,
+                 engines: List[SearchEngine],
+                 name: str = "Yarış",
+                 timeout: Optional[float] = None,
+                 max_workers: Optional[int] = None):
+        """
+        RaceSearch sınıfını başlatır.
+        
+        Args:
+            engines: Yarışacak arama motorları
+            name: Meta motorun adı
+            timeout: Kazanan beklenecek en uzun süre (saniye, None ise sınırsız)
+            max_workers: Senkron yolda iş parçacığı sayısı (None ise motor sayısının
+                dört katı; geride kalan istekler sonraki yarışları bekletmez)
+        """
+        super().__init__(engines, name)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or 4 * len(self.engines),
+                                            thread_name_prefix="race")
+        self._lock = threading.Lock()
+        self.wins = {engine.name: 0 for engine in self.engines}
+        self.last_winner = None
+    
+    def _record_winner(self, engine: Optional[SearchEngine], query: str) -> None:
+        """Yarışın kazananını kaydeder."""
+        with self._lock:
+            self.last_winner = engine.name if engine is not None else None
+            if engine is not None:
+                self.wins[engine.name] += 1
+        if engine is None:
+            logger.warning(f"{self.name}: hiçbir motor '{query}' için sonuç döndürmedi")
+        else:
+            logger.debug(f"{self.name}: '{query}' yarışını {engine.name} kazandı")
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Sorguyu tüm motorlara aynı anda gönderir ve ilk gelen boş olmayan sonucu döndürür.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            Kazanan motorun SearchResult listesi (hiçbiri sonuç döndürmezse boş liste)
+        """
+        # Tek bir bitiş anı: her bekleme yalnızca kalan süre kadar sürer
+        with deadline(self.timeout) as limit:
+            pending = {self._submit(engine.search, query, num_results): engine for engine in self.engines}
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=limit.remaining() if limit else None, return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.warning(f"{self.name}: {limit.timeout} saniye içinde sonuç gelmedi")
+                    break
+                for future in done:
+                    engine = pending.pop(future)
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        logger.error(f"{self.name}: {engine.name} hatası: {e}")
+                        continue
+                    if results:
+                        self._record_winner(engine, query)
+                        return results
+        finally:
+            # Henüz başlamamış istekler iptal edilir, çalışanlar arka planda biter
+            for future in pending:
+                future.cancel()
+        
+        self._record_winner(None, query)
+        return []
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """
+        search metodunun asenkron karşılığı; kazanan belli olunca diğer istekler iptal edilir.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+        
+        Returns:
+            Kazanan motorun SearchResult listesi (hiçbiri sonuç döndürmezse boş liste)
+        """
+        with deadline(self.timeout) as limit:
+            pending = {
+                asyncio.ensure_future(engine.async_search(query, num_results, session=session)): engine
+                for engine in self.engines
+            }
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=limit.remaining() if limit else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.warning(f"{self.name}: {limit.timeout} saniye içinde sonuç gelmedi")
+                    break
+                for task in done:
+                    engine = pending.pop(task)
+                    try:
+                        results = task.result()
+                    except Exception as e:
+                        logger.error(f"{self.name}: {engine.name} hatası: {e}")
+                        continue
+                    if results:
+                        self._record_winner(engine, query)
+                        return results
+        finally:
+            # İptal edilen isteklerin bağlantılarını kapatıp bitmeleri beklenir
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        self._record_winner(None, query)
+        return []
+    
+    def close(self) -> None:
+        """Senkron yolun iş parçacığı havuzunu kapatır."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Meta motorun bilgilerini motor bazında kazanma sayılarıyla birlikte döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        info = super().get_engine_info()
+        with self._lock:
+            info["wins"] = dict(self.wins)
+        return info
+
+
+class HedgedSearch(_MultiEngineSearch):
+    """
+    Birincil motor kendi gözlenen p95 gecikmesi içinde yanıt vermezse yedek
+    bir istek (aynı motora veya yedek motora) gönderen sarmalayıcı.
+    
+    Bekleme süresi birincil motorun son ölçümlerinden oluşan kayan
+    histogramdan hesaplanır; böylece isteklerin yalnızca yaklaşık %5'i
+    yedeklenir ve kuyruk gecikmesi, tüm motorları yarıştırmanın maliyetinin
+    küçük bir kısmıyla kısalır.
+    """
+    
+    def __init__(self,
+                 engine: SearchEngine,
+                 fallback: Optional[SearchEngine] = None,
+                 name: Optional[str] = None,
+                 hedge_percentile: float = 95,
+                 initial_delay: float = 1.0,
+                 min_delay: float = 0.0,
+                 max_delay: Optional[float] = None,
+                 min_samples: int = 20,
+                 window: int = 500,
+                 max_workers: Optional[int] = None):
+        """
+        HedgedSearch sınıfını başlatır.
+        
+        Args:
+            engine: Birincil arama motoru
+            fallback: Yedek isteğin gönderileceği motor (None ise aynı motor)
+            name: Meta motorun adı (None ise "<motor adı> (yedekli)")
+            hedge_percentile: Yedek isteğin gönderileceği gecikme yüzdeliği
+            initial_delay: Yeterli ölçüm birikene kadar kullanılan bekleme süresi (saniye)
+            min_delay: Bekleme süresinin alt sınırı (saniye)
+            max_delay: Bekleme süresinin üst sınırı (saniye, None ise sınırsız)
+            min_samples: Uyarlanabilir beklemeye geçmek için gereken ölçüm sayısı
+            window: Kayan histogramın pencere büyüklüğü
+            max_workers: Senkron yolda iş parçacığı sayısı
+        """
+        super().__init__([engine] + ([fallback] if fallback is not None else []),
+                         name or f"{engine.name} (yedekli)")
+        self.engine = engine
+        self.fallback = fallback if fallback is not None else engine
+        self.source_url = engine.source_url
+        self.license_type = engine.license_type
+        self.rate_limit_info = engine.rate_limit_info
+        self.pricing_info = engine.pricing_info
+        self.hedge_percentile = hedge_percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.latencies = RollingLatencyHistogram(window=window)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or 8, thread_name_prefix="hedge")
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged_requests = 0
+        self.backup_wins = 0
+    
+    @property
+    def settings_key(self) -> str:
+        """Hız sınırı ve devre kesici tanımları birincil motorun sınıf adıyla aranır."""
+        return self.engine.settings_key
+    
+    def hedge_delay(self) -> float:
+        """
+        Yedek istek gönderilmeden önce beklenecek süreyi döndürür.
+        
+        Returns:
+            Bekleme süresi (saniye)
+        """
+        delay = self.initial_delay
+        if len(self.latencies) >= self.min_samples:
+            delay = self.latencies.percentile(self.hedge_percentile)
+        delay = max(self.min_delay, delay)
+        return min(delay, self.max_delay) if self.max_delay is not None else delay
+    
+    def _record_latency(self, engine: SearchEngine, start_ns: int, results: Optional[List[SearchResult]]) -> None:
+        """Birincil motorun başarılı isteklerinin gecikmesini kayan histograma ekler."""
+        if engine is self.engine and results:
+            self.latencies.record_seconds((monotonic_ns() - start_ns) / NS_PER_SECOND)
+    
+    def _timed_search(self, engine: SearchEngine, query: str, num_results: int) -> List[SearchResult]:
+        """Aramayı yapar ve birincil motorun gecikmesini kaydeder."""
+        start_ns = monotonic_ns()
+        results = engine.search(query, num_results)
+        self._record_latency(engine, start_ns, results)
+        return results
+    
+    async def _async_timed_search(self,
+                                  engine: SearchEngine,
+                                  query: str,
+                                  num_results: int,
+                                  session: Optional[Any]) -> List[SearchResult]:
+        """_timed_search metodunun asenkron karşılığı."""
+        start_ns = monotonic_ns()
+        results = await engine.async_search(query, num_results, session=session)
+        self._record_latency(engine, start_ns, results)
+        return results
+    
+    def _record_outcome(self, hedged: bool, backup_won: bool) -> None:
+        """İstek, yedekleme ve yedek isteğin kazanma sayılarını günceller."""
+        with self._lock:
+            self.requests += 1
+            if hedged:
+                self.hedged_requests += 1
+            if backup_won:
+                self.backup_wins += 1
+    
+    def _first_result(self, future: Any, engine: SearchEngine) -> Optional[List[SearchResult]]:
+        """Tamamlanan isteğin sonucunu döndürür; hata olursa kaydedip None döndürür."""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"{self.name}: {engine.name} hatası: {e}")
+            return None
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Birincil motoru sorgular; bekleme süresi içinde yanıt gelmezse ya da
+        birincil motor boş sonuç veya hata döndürürse yedek isteği gönderir ve
+        boş olmayan ilk sonucu döndürür.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        pending = {self._submit(self._timed_search, self.engine, query, num_results): self.engine}
+        backup = None
+        timeout = self.hedge_delay()
+        
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    engine = pending.pop(future)
+                    results = self._first_result(future, engine)
+                    if results:
+                        self._record_outcome(backup is not None, future is backup)
+                        return results
+                if backup is None:
+                    # Bekleme süresi doldu ya da birincil motor boş/hatalı yanıt verdi
+                    logger.debug(f"{self.name}: '{query}' için yedek istek gönderiliyor")
+                    backup = self._submit(self._timed_search, self.fallback, query, num_results)
+                    pending[backup] = self.fallback
+                    timeout = None
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        self._record_outcome(backup is not None, False)
+        return []
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """
+        search metodunun asenkron karşılığı; kazanan belli olunca diğer istek iptal edilir.
+        
+        İptal edilen birincil isteğin o ana kadar geçen süresi de histograma
+        eklenir; aksi halde yalnızca hızlı yanıtlar kaydedilir ve bekleme
+        süresi giderek kısalır.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        start_ns = monotonic_ns()
+        primary = asyncio.ensure_future(self._async_timed_search(self.engine, query, num_results, session))
+        pending = {primary: self.engine}
+        backup = None
+        timeout = self.hedge_delay()
+        
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    engine = pending.pop(task)
+                    results = self._first_result(task, engine)
+                    if results:
+                        self._record_outcome(backup is not None, task is backup)
+                        return results
+                if backup is None:
+                    # Bekleme süresi doldu ya da birincil motor boş/hatalı yanıt verdi
+                    logger.debug(f"{self.name}: '{query}' için yedek istek gönderiliyor")
+                    backup = asyncio.ensure_future(self._async_timed_search(self.fallback, query, num_results, session))
+                    pending[backup] = self.fallback
+                    timeout = None
+        finally:
+            if primary in pending:
+                self.latencies.record_seconds((monotonic_ns() - start_ns) / NS_PER_SECOND)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        self._record_outcome(backup is not None, False)
+        return []
+    
+    def close(self) -> None:
+        """Senkron yolun iş parçacığı havuzunu kapatır."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Birincil motorun bilgilerini yedekleme istatistikleriyle birlikte döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        info = super().get_engine_info()
+        with self._lock:
+            info["hedging"] = {
+                "fallback": self.fallback.name,
+                "requests": self.requests,
+                "hedged_requests": self.hedged_requests,
+                "backup_wins": self.backup_wins,
+                "hedge_delay": self.hedge_delay()
+            }
+        return info
+
+
+# Reciprocal-rank fusion sabiti (Cormack vd., 2009); büyük değerler alt sıraların ağırlığını artırır
+DEFAULT_RRF_K = 60
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, List[SearchResult]],
+                           k: int = DEFAULT_RRF_K,
+                           weights: Optional[Dict[str, float]] = None) -> List[SearchResult]:
+    """
+    Motorların sıralı sonuç listelerini reciprocal-rank fusion ile birleştirir.
+    
+    Her bağlantı, göründüğü her listede ağırlık / (k + sıra) puanı alır.
+    Bağlantılar canonicalize_url ile karşılaştırılır; aynı listede tekrar
+    eden bağlantının yalnızca ilk görünümü sayılır. Eşit puanlarda en iyi
+    sırası daha yüksek olan önce gelir. Her bağlantı için en iyi sırada
+    görünen sonuç (başlık ve snippet ile) kullanılır.
+    
+    Args:
+        rankings: Motor adı -> sıralı SearchResult listesi
+        k: RRF sabiti
+        weights: Motor adı -> ağırlık (verilmeyen motorlar için 1.0)
+    
+    Returns:
+        Puana göre sıralı, tekilleştirilmiş SearchResult listesi
+    """
+    weights = weights or {}
+    scores = {}
+    best = {}
+    
+    for engine_name, results in rankings.items():
+        weight = weights.get(engine_name, 1.0)
+        seen = set()
+        for rank, result in enumerate(results, 1):
+            key = canonicalize_url(result.link)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+            if key not in best or rank < best[key][0]:
+                best[key] = (rank, result)
+    
+    ordered = sorted(scores, key=lambda key: (-scores[key], best[key][0]))
+    return [best[key][1] for key in ordered]
+
+
+class FederatedSearch(_MultiEngineSearch):
+    """
+    Sorguyu birden fazla motora paralel gönderen, bağlantıları kanonik hale
+    getirip tekilleştiren ve sıralamaları reciprocal-rank fusion ile tek bir
+    listede birleştiren meta motor. Genel süre sınırını kaçıran motorlar
+    birleştirmeye dahil edilmez.
+    """
+    
+    def __init__(self,
+                 engines: List[SearchEngine],
+                 name: str = "Federe",
+                 deadline: Optional[float] = None,
+                 rrf_k: int = DEFAULT_RRF_K,
+                 weights: Optional[Dict[str, float]] = None,
+                 max_workers: Optional[int] = None):
+        """
+        FederatedSearch sınıfını başlatır.
+        
+        Args:
+            engines: Sorgulanacak arama motorları
+            name: Meta motorun adı
+            deadline: Tüm motorlar için genel süre sınırı (saniye, None ise hepsi beklenir)
+            rrf_k: Reciprocal-rank fusion sabiti
+            weights: Motor adı -> birleştirme ağırlığı
+            max_workers: Senkron yolda iş parçacığı sayısı (None ise motor sayısının iki katı)
+        """
+        super().__init__(engines, name)
+        self.deadline = deadline
+        self.rrf_k = rrf_k
+        self.weights = weights or {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or 2 * len(self.engines),
+                                            thread_name_prefix="federated")
+        self._lock = threading.Lock()
+        self.missed_deadline = {engine.name: 0 for engine in self.engines}
+        self.last_contributors = []
+    
+    def _fuse(self,
+              query: str,
+              num_results: int,
+              rankings: Dict[str, List[SearchResult]],
+              late: List[str]) -> List[SearchResult]:
+        """Zamanında yanıt veren motorların sonuçlarını birleştirir ve istatistikleri günceller."""
+        with self._lock:
+            self.last_contributors = [name for name, results in rankings.items() if results]
+            for engine_name in late:
+                self.missed_deadline[engine_name] += 1
+        if late:
+            logger.warning(f"{self.name}: {', '.join(late)} süre sınırını kaçırdı ('{query}')")
+        
+        return reciprocal_rank_fusion(rankings, k=self.rrf_k, weights=self.weights)[:num_results]
+    
+    def _collect(self, completed: Dict[Any, SearchEngine]) -> Tuple[Dict[str, List[SearchResult]], List[str]]:
+        """
+        Tamamlanan isteklerin sonuçlarını motor sırasıyla toplar; hata veren
+        motorlar atlanır. Alt motorlar süre sınırını kendileri de uyguladığından
+        SearchTimeoutError ile biten motorlar hata değil, geç kalan sayılır.
+        
+        Args:
+            completed: Tamamlanmış future/görev -> motor eşlemesi
+        
+        Returns:
+            (motor adı -> sonuçlar, süre sınırını kaçıran motor adları)
+        """
+        rankings = {}
+        timed_out = set()
+        for future, engine in completed.items():
+            try:
+                rankings[engine.name] = future.result() or []
+            except SearchTimeoutError:
+                timed_out.add(engine.name)
+            except Exception as e:
+                logger.error(f"{self.name}: {engine.name} hatası: {e}")
+        ordered = {engine.name: rankings[engine.name] for engine in self.engines if engine.name in rankings}
+        return ordered, [engine.name for engine in self.engines if engine.name in timed_out]
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Sorguyu tüm motorlara paralel gönderir ve süre sınırı içinde gelen
+        sonuçları birleştirir.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı (her motordan da bu kadar istenir)
+        
+        Returns:
+            Birleştirilmiş SearchResult listesi
+        """
+        # Süre sınırı alt motorlara da iletilir; geciken istekler kendi içinde zaman aşımına uğrar
+        with deadline(self.deadline):
+            futures = {self._submit(engine.search, query, num_results): engine for engine in self.engines}
+        done, pending = wait(futures, timeout=self.deadline, return_when=ALL_COMPLETED)
+        for future in pending:
+            future.cancel()
+        
+        rankings, timed_out = self._collect({future: futures[future] for future in done})
+        return self._fuse(query, num_results, rankings, timed_out + [futures[future].name for future in pending])
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """
+        search metodunun asenkron karşılığı; süre sınırını kaçıran istekler iptal edilir.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Paylaşılan aiohttp.ClientSession
+        
+        Returns:
+            Birleştirilmiş SearchResult listesi
+        """
+        with deadline(self.deadline):
+            tasks = {
+                asyncio.ensure_future(engine.async_search(query, num_results, session=session)): engine
+                for engine in self.engines
+            }
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        rankings, timed_out = self._collect({task: tasks[task] for task in done})
+        return self._fuse(query, num_results, rankings, timed_out + [tasks[task].name for task in pending])
+    
+    def close(self) -> None:
+        """Senkron yolun iş parçacığı havuzunu kapatır."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Meta motorun bilgilerini süre sınırını kaçırma sayılarıyla birlikte döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        info = super().get_engine_info()
+        with self._lock:
+            info["missed_deadline"] = dict(self.missed_deadline)
+        return info
@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yerel sahte arama API sunucusu.
+
+Bu modül, gerçek motor sınıflarının istek oluşturma ve ayrıştırma kodunu
+ağa çıkmadan çalıştırmak için asyncio (aiohttp) tabanlı bir HTTP sunucusu
+sağlar. Sunucu Serper, Brave, Tavily, Jina, Firecrawl, SearchAPI, Google
+CSE, Bing ve DuckDuckGo HTML biçiminde yanıtlar üretir. Motor bazında
+gecikme dağılımı, hata oranı ve 429 (hız sınırı) oranı ayarlanabilir.
+
+Örnek:
+    server = MockSearchServer({"serper": MockEngineConfig(latency=LatencyDistribution.lognormal(0.2, 0.5))})
+    with server.running():
+        engine = server.point(SerperSearch(api_key="test"))
+        evaluator.register_engine(engine)
+        evaluator.run_batch(queries)
+
+Komut satırından ayrı bir süreç olarak da çalıştırılabilir:
+    python -m src.mock_server --port 8080 --latency 0.1 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import random
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import quote
+
+from src.core import SearchEngine, logger
+
+try:
+    from aiohttp import web
+except ImportError:  # aiohttp yalnızca sahte sunucu ve asenkron arama yolu için gerekli
+    web = None
+
+DEFAULT_MOCK_RESULTS = 10  # İstekte sonuç sayısı yoksa döndürülecek sonuç sayısı
+
+# Motor anahtarı -> (HTTP metodu, yol)
+ENGINE_ROUTES = {
+    "serper": ("POST", "/serper/search"),
+    "brave": ("GET", "/brave/res/v1/web/search"),
+    "tavily": ("POST", "/tavily/search"),
+    "jina": ("POST", "/jina/v1/search"),
+    "firecrawl": ("POST", "/firecrawl/v1/search"),
+    "searchapi": ("GET", "/searchapi/api/v1/search"),
+    "google": ("GET", "/google/customsearch/v1"),
+    "bing": ("GET", "/bing/v7.0/search"),
+    "duckduckgo": ("POST", "/duckduckgo/html/"),
+}
+
+# Motor sınıf adı -> motor anahtarı
+ENGINE_CLASS_KEYS = {
+    "SerperSearch": "serper",
+    "BraveSearch": "brave",
+    "TavilySearch": "tavily",
+    "JinaSearch": "jina",
+    "FirecrawlSearch": "firecrawl",
+    "SearchApiSearch": "searchapi",
+    "GoogleSearch": "google",
+    "BingSearch": "bing",
+    "DuckDuckGoSearch": "duckduckgo",
+}
+
+# Motor anahtarı -> istekte sonuç sayısını taşıyan parametre
+_COUNT_FIELDS = {
+    "serper": "num",
+    "brave": "count",
+    "tavily": "max_results",
+    "jina": "top_k",
+    "firecrawl": "limit",
+    "searchapi": "num",
+    "google": "num",
+    "bing": "count",
+}
+
+# Motor anahtarı -> (istekte sayfa başlangıcını taşıyan parametre, ilk sonucun indeksi)
+_OFFSET_FIELDS = {
+    "google": ("start", 1),
+    "bing": ("offset", 0),
+}
+
+
+@dataclass
+class LatencyDistribution:
+    """Sahte yanıt gecikmesinin dağılımı (saniye)."""
+    kind: str = "constant"  # constant, uniform, normal, lognormal veya exponential
+    a: float = 0.0
+    b: float = 0.0
+    
+    @classmethod
+    def constant(cls, seconds: float) -> "LatencyDistribution":
+        """Sabit gecikme."""
+        return cls("constant", seconds)
+    
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "LatencyDistribution":
+        """[low, high] aralığında düzgün dağılımlı gecikme."""
+        return cls("uniform", low, high)
+    
+    @classmethod
+    def normal(cls, mean: float, stddev: float) -> "LatencyDistribution":
+        """Normal dağılımlı gecikme (negatif değerler sıfıra yuvarlanır)."""
+        return cls("normal", mean, stddev)
+    
+    @classmethod
+    def lognormal(cls, median: float, sigma: float) -> "LatencyDistribution":
+        """Log-normal dağılımlı gecikme; gerçek API'lerdeki uzun kuyruğu taklit eder."""
+        return cls("lognormal", median, sigma)
+    
+    @classmethod
+    def exponential(cls, mean: float) -> "LatencyDistribution":
+        """Üstel dağılımlı gecikme."""
+        return cls("exponential", mean)
+    
+    def sample(self, rng: random.Random) -> float:
+        """
+        Dağılımdan bir gecikme örneği çeker.
+        
+        Args:
+            rng: Kullanılacak rastgele sayı üreteci
+        
+        Returns:
+            Gecikme (saniye)
+        """
+        if self.kind == "uniform":
+            value = rng.uniform(self.a, self.b)
+        elif self.kind == "normal":
+            value = rng.gauss(self.a, self.b)
+        elif self.kind == "lognormal":
+            value = self.a * rng.lognormvariate(0.0, self.b) if self.a > 0 else 0.0
+        elif self.kind == "exponential":
+            value = rng.expovariate(1.0 / self.a) if self.a > 0 else 0.0
+        else:
+            value = self.a
+        return max(0.0, value)
+
+
+@dataclass
+class MockEngineConfig:
+    """Bir motor uç noktasının sahte davranışı."""
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    error_rate: float = 0.0  # 500 döndürülen isteklerin oranı
+    rate_limit_rate: float = 0.0  # 429 döndürülen isteklerin oranı
+    retry_after: int = 1  # 429 yanıtındaki Retry-After değeri (saniye)
+    total_results: Optional[int] = None  # sorgu başına toplam sonuç (None ise sınırsız; sayfalama testleri için)
+
+
+def _mock_items(query: str, count: int, first: int = 1) -> List[Tuple[str, str, str]]:
+    """Sorgudan belirlenimci (başlık, link, özet) üçlüleri üretir; numaralandırma first'ten başlar."""
+    slug = quote(query.replace(" ", "-"))
+    return [
+        (f"{query} - Sonuç {i}", f"https://example.com/{slug}/{i}", f"{query} ile ilgili örnek içerik {i}.")
+        for i in range(first, first + count)
+    ]
+
+
+def _render_response(engine_key: str, query: str, count: int, first: int = 1) -> Any:
+    """
+    Motorun yanıt biçiminde sahte gövde oluşturur.
+    
+    Args:
+        engine_key: Motor anahtarı
+        query: Arama sorgusu
+        count: Sonuç sayısı
+        first: İlk sonucun sıra numarası (sayfalama için)
+    
+    Returns:
+        JSON sözlüğü veya DuckDuckGo için HTML metni
+    """
+    items = _mock_items(query, count, first)
+    
+    if engine_key in ("serper", "searchapi", "google"):
+        items_key = {"serper": "organic", "searchapi": "organic_results", "google": "items"}[engine_key]
+        return {items_key: [{"title": t, "link": l, "snippet": s} for t, l, s in items]}
+    if engine_key == "brave":
+        return {"web": {"results": [{"title": t, "url": l, "description": s} for t, l, s in items]}}
+    if engine_key == "tavily":
+        return {"query": query, "results": [{"title": t, "url": l, "content": s} for t, l, s in items]}
+    if engine_key == "jina":
+        return {"results": [{"metadata": {"title": t, "url": l, "description": s}} for t, l, s in items]}
+    if engine_key == "firecrawl":
+        return {"success": True, "data": [{"title": t, "url": l, "description": s} for t, l, s in items]}
+    if engine_key == "bing":
+        return {"webPages": {"value": [{"name": t, "url": l, "snippet": s} for t, l, s in items]}}
+    
+    # DuckDuckGo HTML
+    blocks = "".join(
+        f'<div class="result results_links web-result">'
+        f'<h2 class="result__title"><a class="result__a" href="//duckduckgo.com/l/?uddg={quote(l, safe="")}&amp;rut=0">{t}</a></h2>'
+        f'<a class="result__url" href="{l}">{l}</a>'
+        f'<a class="result__snippet" href="{l}">{s}</a>'
+        f'</div>'
+        for t, l, s in items
+    )
+    return f"<html><body><div class=\"results\">{blocks}</div></body></html>"
+
+
+class MockSearchServer:
+    """Gerçek motor sınıflarına sahte yanıtlar veren yerel HTTP sunucusu."""
+    
+    def __init__(self,
+                 configs: Optional[Dict[str, MockEngineConfig]] = None,
+                 default_config: Optional[MockEngineConfig] = None,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 seed: Optional[int] = None):
+        """
+        MockSearchServer sınıfını başlatır.
+        
+        Args:
+            configs: Motor anahtarı (ör. "serper") -> davranış ayarları
+            default_config: Ayarı verilmeyen motorlar için davranış
+            host: Dinlenecek adres
+            port: Dinlenecek port (0 ise boş bir port seçilir)
+            seed: Gecikme ve hata üretimi için rastgele sayı tohumu
+        """
+        if web is None:
+            raise ImportError("Sahte sunucu için aiohttp paketi gerekli: pip install aiohttp")
+        
+        self.configs = configs or {}
+        self.default_config = default_config or MockEngineConfig()
+        self.host = host
+        self.port = port
+        self.rng = random.Random(seed)
+        self.stats = {key: {"requests": 0, "errors": 0, "rate_limited": 0} for key in ENGINE_ROUTES}
+        self._runner = None
+        self._loop = None
+        self._thread = None
+    
+    def get_config(self, engine_key: str) -> MockEngineConfig:
+        """Motorun davranış ayarlarını döndürür."""
+        return self.configs.get(engine_key, self.default_config)
+    
+    @property
+    def base_url(self) -> str:
+        """Sunucunun kök adresi."""
+        return f"http://{self.host}:{self.port}"
+    
+    def url_for(self, engine_key: str) -> str:
+        """
+        Motorun sahte uç noktasının adresini döndürür.
+        
+        Args:
+            engine_key: Motor anahtarı (ör. "serper", "google")
+        
+        Returns:
+            Tam URL
+        """
+        return self.base_url + ENGINE_ROUTES[engine_key][1]
+    
+    def point(self, engine: SearchEngine) -> SearchEngine:
+        """
+        Motorun base_url değerini bu sunucuya yönlendirir.
+        
+        Args:
+            engine: Yönlendirilecek motor (sınıfı ENGINE_CLASS_KEYS içinde olmalı)
+        
+        Returns:
+            Aynı motor
+        
+        Raises:
+            ValueError: Motor türü desteklenmiyorsa
+        """
+        engine_key = ENGINE_CLASS_KEYS.get(engine.__class__.__name__)
+        if engine_key is None:
+            raise ValueError(f"Sahte sunucu {engine.__class__.__name__} motorunu desteklemiyor")
+        engine.base_url = self.url_for(engine_key)
+        return engine
+    
+    def _make_handler(self, engine_key: str):
+        """Motor uç noktası için aiohttp istek işleyicisi oluşturur."""
+        count_field = _COUNT_FIELDS.get(engine_key)
+        offset_field, first_index = _OFFSET_FIELDS.get(engine_key, (None, 0))
+        
+        async def handler(request: "web.Request") -> "web.Response":
+            config = self.get_config(engine_key)
+            stats = self.stats[engine_key]
+            stats["requests"] += 1
+            
+            # Parametreleri sorgu dizgisinden, JSON veya form gövdesinden oku
+            values = dict(request.query)
+            if request.method == "POST":
+                if request.content_type == "application/json":
+                    values.update(await request.json())
+                else:
+                    values.update(await request.post())
+            
+            await asyncio.sleep(config.latency.sample(self.rng))
+            
+            roll = self.rng.random()
+            if roll < config.rate_limit_rate:
+                stats["rate_limited"] += 1
+                return web.json_response({"error": "Too Many Requests"}, status=429,
+                                         headers={"Retry-After": str(config.retry_after)})
+            if roll < config.rate_limit_rate + config.error_rate:
+                stats["errors"] += 1
+                return web.json_response({"error": "Internal Server Error"}, status=500)
+            
+            query = str(values.get("q") or values.get("query") or "")
+            try:
+                count = int(values.get(count_field, DEFAULT_MOCK_RESULTS)) if count_field else DEFAULT_MOCK_RESULTS
+            except (TypeError, ValueError):
+                count = DEFAULT_MOCK_RESULTS
+            try:
+                offset = int(values.get(offset_field, first_index)) - first_index if offset_field else 0
+            except (TypeError, ValueError):
+                offset = 0
+            if config.total_results is not None:
+                count = max(0, min(count, config.total_results - offset))
+            
+            body = _render_response(engine_key, query, count, offset + 1)
+            if isinstance(body, str):
+                return web.Response(text=body, content_type="text/html")
+            return web.json_response(body)
+        
+        return handler
+    
+    def create_app(self) -> "web.Application":
+        """
+        Tüm motor uç noktalarını içeren aiohttp uygulamasını oluşturur.
+        
+        Returns:
+            aiohttp.web.Application nesnesi
+        """
+        app = web.Application()
+        for engine_key, (method, path) in ENGINE_ROUTES.items():
+            app.router.add_route(method, path, self._make_handler(engine_key))
+        return app
+    
+    async def start(self) -> None:
+        """Sunucuyu çalışan olay döngüsünde başlatır."""
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port, backlog=1024)
+        await site.start()
+        # port 0 verildiyse işletim sisteminin seçtiği portu al
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Sahte arama sunucusu başlatıldı: {self.base_url}")
+    
+    async def stop(self) -> None:
+        """Sunucuyu durdurur."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def __aenter__(self) -> "MockSearchServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+    
+    @contextmanager
+    def running(self):
+        """
+        Sunucuyu arka plandaki bir iş parçacığında kendi olay döngüsüyle
+        çalıştırır; senkron motorlar ve değerlendirici ile kullanım içindir.
+        """
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        
+        def serve():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop())
+            self._loop.close()
+        
+        self._thread = threading.Thread(target=serve, name="mock-search-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        try:
+            yield self
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+            self._loop = None
+
+
+def main():
+    """Sahte sunucuyu komut satırından çalıştırır."""
+    parser = argparse.ArgumentParser(description="Yerel sahte arama API sunucusu")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Dinlenecek adres")
+    parser.add_argument("--port", type=int, default=8080, help="Dinlenecek port (varsayılan: 8080)")
+    parser.add_argument("--latency", type=float, default=0.1, help="Medyan gecikme (saniye, varsayılan: 0.1)")
+    parser.add_argument("--sigma", type=float, default=0.0,
+                        help="Log-normal gecikme dağılımının sigma değeri (0 ise sabit gecikme)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 döndürülen isteklerin oranı")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 döndürülen isteklerin oranı")
+    parser.add_argument("--seed", type=int, default=None, help="Rastgele sayı tohumu")
+    args = parser.parse_args()
+    
+    latency = (LatencyDistribution.lognormal(args.latency, args.sigma) if args.sigma
+               else LatencyDistribution.constant(args.latency))
+    server = MockSearchServer(
+        default_config=MockEngineConfig(latency=latency, error_rate=args.error_rate,
+                                        rate_limit_rate=args.rate_limit_rate),
+        host=args.host,
+        port=args.port,
+        seed=args.seed
+    )
+    
+    for engine_key in ENGINE_ROUTES:
+        print(f"{engine_key}: {server.url_for(engine_key)}")
+    
+    with server.running():
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+İstek aşaması zamanlama modülü.
+
+Bu modül, tek bir arama isteğinin süresini aşamalarına ayırır: DNS
+çözümleme, TCP bağlantısı, TLS el sıkışması, ilk bayta kadar geçen süre
+(TTFB), gövde indirme ve yanıtın ayrıştırılması. Böylece "sağlayıcı yavaş"
+ile "ayrıştırıcımız yavaş" durumları birbirinden ayrılabilir.
+
+requests yolu için urllib3 bağlantılarını ölçen bir HTTPAdapter, aiohttp
+yolu için bir TraceConfig sağlar. Ölçüm yalnızca record_phases() bloğu
+içinde yapılır; blok dışında ek maliyet yoktur.
+
+Örnek:
+    with record_phases() as phases:
+        engine.search("python")
+    print(phases.to_dict())
+"""
+
+import socket
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from src.histogram import monotonic_ns, NS_PER_SECOND
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# Ölçülen aşamalar (istek sırasına göre)
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "parse")
+
+# Raporlarda kullanılan aşama adları
+PHASE_LABELS = {
+    "dns": "DNS",
+    "connect": "Bağlantı",
+    "tls": "TLS",
+    "ttfb": "TTFB",
+    "download": "İndirme",
+    "parse": "Ayrıştırma",
+}
+
+# Sağlayıcı ve ağ kaynaklı aşamalar (ayrıştırma dışındakiler)
+NETWORK_PHASES = ("dns", "connect", "tls", "ttfb", "download")
+
+
+class RequestPhases:
+    """Tek bir ölçümün aşama sürelerini (saniye) tutar."""
+    
+    def __init__(self):
+        self.durations = {}
+    
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Aşamaya süre ekler (aynı aşama birden fazla kez ölçülürse toplanır,
+        ör. sayfalama yapan motorlarda).
+        
+        Args:
+            phase: Aşama adı (PHASES içinden)
+            seconds: Süre (saniye)
+        """
+        self.durations[phase] = self.durations.get(phase, 0.0) + max(0.0, seconds)
+    
+    def add_ns(self, phase: str, nanoseconds: int) -> None:
+        """Aşamaya nanosaniye cinsinden süre ekler."""
+        self.add(phase, nanoseconds / NS_PER_SECOND)
+    
+    def get(self, phase: str) -> float:
+        """Aşamanın süresini döndürür (ölçülmediyse 0)."""
+        return self.durations.get(phase, 0.0)
+    
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Tüm aşamaların sürelerini döndürür.
+        
+        Returns:
+            Aşama adı -> saniye biçiminde sözlük
+        """
+        return {phase: self.get(phase) for phase in PHASES}
+
+
+class PhaseStats:
+    """Bir motorun birden fazla ölçümdeki aşama sürelerini toplar."""
+    
+    def __init__(self):
+        self.requests = 0
+        self.totals = {phase: 0.0 for phase in PHASES}
+        self._lock = threading.Lock()
+    
+    def add(self, phases: RequestPhases) -> None:
+        """
+        Bir ölçümün aşama sürelerini ekler.
+        
+        Args:
+            phases: Ölçümün aşama süreleri
+        """
+        with self._lock:
+            self.requests += 1
+            for phase in PHASES:
+                self.totals[phase] += phases.get(phase)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        İstek başına ortalama aşama sürelerini döndürür. Açık bağlantının
+        yeniden kullanıldığı isteklerde DNS, bağlantı ve TLS süreleri 0
+        sayılır; böylece ortalamalar gecikmeye ortalama katkıyı gösterir.
+        
+        Returns:
+            requests, aşama ortalamaları, network ve parse toplamlarını içeren sözlük
+        """
+        with self._lock:
+            if not self.requests:
+                return {"requests": 0}
+            averages = {phase: total / self.requests for phase, total in self.totals.items()}
+            requests = self.requests
+        
+        averages["requests"] = requests
+        averages["network"] = sum(averages[phase] for phase in NETWORK_PHASES)
+        return averages
+
+
+_current_phases = ContextVar("request_phases", default=None)
+
+
+@contextmanager
+def record_phases():
+    """
+    Blok içindeki (aynı iş parçacığı veya asyncio görevi) isteklerin
+    aşama sürelerini kaydeder.
+    
+    Yields:
+        RequestPhases nesnesi
+    """
+    phases = RequestPhases()
+    token = _current_phases.set(phases)
+    try:
+        yield phases
+    finally:
+        _current_phases.reset(token)
+
+
+def current_phases() -> Optional[RequestPhases]:
+    """Etkin ölçümün RequestPhases nesnesini döndürür (yoksa None)."""
+    return _current_phases.get()
+
+
+@contextmanager
+def phase_timer(phase: str):
+    """
+    Blok süresini etkin ölçümün ilgili aşamasına ekler; etkin ölçüm yoksa
+    hiçbir şey yapmaz.
+    
+    Args:
+        phase: Aşama adı
+    """
+    phases = _current_phases.get()
+    if phases is None:
+        yield
+        return
+    
+    start_ns = monotonic_ns()
+    try:
+        yield
+    finally:
+        phases.add_ns(phase, monotonic_ns() - start_ns)
+
+
+class _TimedConnectionMixin:
+    """urllib3 bağlantısının DNS, bağlantı, TLS ve TTFB aşamalarını ölçer."""
+    
+    def _new_conn(self):
+        phases = _current_phases.get()
+        if phases is None:
+            return super()._new_conn()
+        
+        host = self._dns_host
+        start_ns = monotonic_ns()
+        try:
+            addresses = [info[4][0] for info in socket.getaddrinfo(host, self.port, type=socket.SOCK_STREAM)]
+        except (socket.gaierror, UnicodeError):
+            # Çözümleme hatasını urllib3'ün kendi hata türüyle bildirmesi için
+            addresses = []
+        dns_end_ns = monotonic_ns()
+        phases.add_ns("dns", dns_end_ns - start_ns)
+        
+        # Çözümlenen adresler sırayla denenir; TLS doğrulaması self.host ile yapılır
+        try:
+            last_error = None
+            for address in addresses or [host]:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except Exception as e:
+                    last_error = e
+            raise last_error
+        finally:
+            self._dns_host = host
+            self._new_conn_ns = monotonic_ns() - start_ns
+            phases.add_ns("connect", monotonic_ns() - dns_end_ns)
+    
+    def connect(self):
+        phases = _current_phases.get()
+        if phases is None:
+            return super().connect()
+        
+        self._new_conn_ns = 0
+        start_ns = monotonic_ns()
+        super().connect()
+        self._connect_ns = monotonic_ns() - start_ns
+        # connect() = soket bağlantısı (_new_conn) + TLS el sıkışması
+        if isinstance(self, HTTPSConnection):
+            phases.add_ns("tls", self._connect_ns - self._new_conn_ns)
+    
+    def request(self, *args, **kwargs):
+        self._request_start_ns = monotonic_ns()
+        self._connect_ns = 0
+        return super().request(*args, **kwargs)
+    
+    def getresponse(self, *args, **kwargs):
+        response = super().getresponse(*args, **kwargs)
+        phases = _current_phases.get()
+        start_ns = getattr(self, "_request_start_ns", None)
+        if phases is not None and start_ns is not None:
+            # Düz HTTP'de bağlantı istek gönderilirken kurulur; o süre TTFB'ye dahil edilmez
+            phases.add_ns("ttfb", monotonic_ns() - start_ns - getattr(self, "_connect_ns", 0))
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """Aşama süreleri ölçülen HTTP bağlantısı."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """Aşama süreleri ölçülen HTTPS bağlantısı."""
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    Bağlantı aşamalarını ölçen ve gövde indirme süresini ayrıca kaydeden
+    HTTPAdapter. Etkin ölçüm yoksa standart HTTPAdapter gibi davranır.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+    
+    def send(self, request, stream=False, **kwargs):
+        response = super().send(request, stream=stream, **kwargs)
+        if not stream and _current_phases.get() is not None:
+            # Gövde burada okunur; requests aynı içeriği tekrar okumaz
+            with phase_timer("download"):
+                response.content
+        return response
+
+
+def create_trace_config() -> "aiohttp.TraceConfig":
+    """
+    aiohttp istekleri için aşama ölçümü yapan TraceConfig oluşturur.
+    
+    aiohttp TCP ve TLS kurulumunu tek adımda bildirdiğinden TLS süresi
+    "connect" aşamasına dahildir. İndirme ve ayrıştırma süreleri arama
+    kodunda ölçülür.
+    
+    Returns:
+        aiohttp.TraceConfig nesnesi
+    
+    Raises:
+        ImportError: aiohttp kurulu değilse
+    """
+    try:
+        import aiohttp  # yalnızca asenkron yolda yüklenir; senkron CLI başlangıcını yavaşlatmaz
+    except ImportError:
+        raise ImportError("Asenkron arama için aiohttp paketi gereklidir: pip install aiohttp") from None
+    
+    async def on_request_start(session, context, params):
+        context.start_ns = monotonic_ns()
+        context.setup_ns = 0
+    
+    async def on_connection_queued_start(session, context, params):
+        context.queued_start_ns = monotonic_ns()
+    
+    async def on_connection_queued_end(session, context, params):
+        context.setup_ns += monotonic_ns() - context.queued_start_ns
+    
+    async def on_dns_resolvehost_start(session, context, params):
+        context.dns_start_ns = monotonic_ns()
+    
+    async def on_dns_resolvehost_end(session, context, params):
+        context.dns_ns = monotonic_ns() - context.dns_start_ns
+        phases = _current_phases.get()
+        if phases is not None:
+            phases.add_ns("dns", context.dns_ns)
+    
+    async def on_connection_create_start(session, context, params):
+        context.create_start_ns = monotonic_ns()
+        context.dns_ns = 0
+    
+    async def on_connection_create_end(session, context, params):
+        create_ns = monotonic_ns() - context.create_start_ns
+        context.setup_ns += create_ns
+        phases = _current_phases.get()
+        if phases is not None:
+            phases.add_ns("connect", create_ns - context.dns_ns)
+    
+    async def on_request_end(session, context, params):
+        phases = _current_phases.get()
+        if phases is not None:
+            phases.add_ns("ttfb", monotonic_ns() - context.start_ns - context.setup_ns)
+    
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(on_connection_queued_end)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
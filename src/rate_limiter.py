@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Motor bazında hız sınırlama modülü.
+
+Bu modül, ENGINE_SETTINGS içindeki makine tarafından okunabilir hız sınırı
+tanımlarını (saniyedeki istek, patlama kapasitesi, eşzamanlılık) uygulayan
+token bucket tabanlı bir zamanlayıcı sağlar. Her motor kendi kovası ve
+semaforu ile bağımsız olarak kısıtlanır; kuyrukta beklenen süre ayrıca
+kaydedilir.
+
+Değerlendirici bir arama için motorun sınırlayıcısından eşzamanlılık yuvası
+ve bir token alır. Aramanın gönderdiği sonraki HTTP istekleri (ör. sayfalar)
+aynı sınırlayıcıdan yalnızca token alır (pace_request); böylece sayfalar
+kovadaki token kadar eşzamanlı gönderilir ve kota istek başına uygulanır.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from src.core import SearchEngine, logger
+from src.config.settings import ENGINE_SETTINGS
+
+
+@dataclass
+class RateLimitSpec:
+    """Bir motorun hız sınırı tanımı."""
+    requests_per_second: Optional[float] = None  # None ise sınırsız
+    burst: int = 1
+    max_concurrency: Optional[int] = None  # None ise sınırsız
+    
+    @classmethod
+    def from_settings(cls, engine_settings: Dict[str, Any]) -> "RateLimitSpec":
+        """
+        ENGINE_SETTINGS girdisinden hız sınırı tanımı oluşturur.
+        
+        "rate_limit" anahtarı yoksa sınırsız tanım döner. max_concurrency
+        belirtilmemişse ve concurrent_requests False ise eşzamanlılık 1'dir.
+        
+        Args:
+            engine_settings: Motorun ENGINE_SETTINGS girdisi
+        
+        Returns:
+            RateLimitSpec nesnesi
+        """
+        rate_limit = engine_settings.get("rate_limit", {})
+        max_concurrency = rate_limit.get("max_concurrency")
+        if max_concurrency is None and engine_settings.get("concurrent_requests") is False:
+            max_concurrency = 1
+        
+        return cls(
+            requests_per_second=rate_limit.get("requests_per_second"),
+            burst=rate_limit.get("burst", 1),
+            max_concurrency=max_concurrency
+        )
+
+
+class TokenBucket:
+    """İş parçacığı güvenli token bucket."""
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        TokenBucket sınıfını başlatır.
+        
+        Args:
+            rate: Saniyede eklenen token sayısı
+            capacity: Kovanın alabileceği en fazla token (patlama kapasitesi)
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Bir token ayırır ve token kullanılabilir olana kadar beklenmesi gereken
+        süreyi döndürür. Token yoksa kova borçlanır; böylece bekleyenler geliş
+        sırasına göre hizmet alır.
+        
+        Returns:
+            Beklenmesi gereken süre (saniye), hemen kullanılabiliyorsa 0
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class EngineRateLimiter:
+    """Tek bir motorun hız ve eşzamanlılık sınırını uygular."""
+    
+    def __init__(self, spec: RateLimitSpec):
+        """
+        EngineRateLimiter sınıfını başlatır.
+        
+        Args:
+            spec: Uygulanacak hız sınırı tanımı
+        """
+        self.spec = spec
+        self._bucket = TokenBucket(spec.requests_per_second, spec.burst) if spec.requests_per_second else None
+        self._semaphore = threading.BoundedSemaphore(spec.max_concurrency) if spec.max_concurrency else None
+        self._async_semaphores = {}
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+    
+    def _record_wait(self, wait_time: float) -> None:
+        """Kuyrukta beklenen süreyi istatistiklere ekler."""
+        with self._stats_lock:
+            self.requests += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+    
+    @contextmanager
+    def throttle(self):
+        """
+        İstek için eşzamanlılık yuvası ve token alır.
+        
+        Örnek:
+            with limiter.throttle() as wait_time:
+                engine.search(query)
+        
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        start_time = time.perf_counter()
+        if self._semaphore:
+            self._semaphore.acquire()
+        try:
+            if self._bucket:
+                delay = self._bucket.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+            wait_time = time.perf_counter() - start_time
+            self._record_wait(wait_time)
+            yield wait_time
+        finally:
+            if self._semaphore:
+                self._semaphore.release()
+    
+    @contextmanager
+    def pace(self):
+        """
+        İstek için yalnızca token alır; eşzamanlılık yuvası almaz. Yuvasını
+        throttle ile almış bir aramanın sonraki istekleri için kullanılır;
+        aynı arama ikinci bir yuva beklerse max_concurrency 1 olan motorlarda
+        kilitlenirdi.
+        
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        start_time = time.perf_counter()
+        if self._bucket:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        wait_time = time.perf_counter() - start_time
+        self._record_wait(wait_time)
+        yield wait_time
+    
+    @asynccontextmanager
+    async def async_pace(self):
+        """
+        pace metodunun olay döngüsünü bloklamayan karşılığı.
+        
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        start_time = time.perf_counter()
+        if self._bucket:
+            delay = self._bucket.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        wait_time = time.perf_counter() - start_time
+        self._record_wait(wait_time)
+        yield wait_time
+    
+    def _get_async_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Çalışan olay döngüsüne ait asyncio semaforunu döndürür."""
+        if not self.spec.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop not in self._async_semaphores:
+            self._async_semaphores[loop] = asyncio.Semaphore(self.spec.max_concurrency)
+        return self._async_semaphores[loop]
+    
+    @asynccontextmanager
+    async def async_throttle(self):
+        """
+        throttle metodunun olay döngüsünü bloklamayan karşılığı.
+        
+        Yields:
+            Kuyrukta beklenen süre (saniye)
+        """
+        start_time = time.perf_counter()
+        semaphore = self._get_async_semaphore()
+        if semaphore:
+            await semaphore.acquire()
+        try:
+            if self._bucket:
+                delay = self._bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            wait_time = time.perf_counter() - start_time
+            self._record_wait(wait_time)
+            yield wait_time
+        finally:
+            if semaphore:
+                semaphore.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Kuyruk bekleme istatistiklerini döndürür.
+        
+        Returns:
+            İstatistikleri içeren sözlük
+        """
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "total_wait_time": self.total_wait_time,
+                "avg_wait_time": self.total_wait_time / self.requests if self.requests else 0.0,
+                "max_wait_time": self.max_wait_time
+            }
+
+
+class RateLimitScheduler:
+    """Her motoru kendi sınırıyla bağımsız olarak kısıtlayan zamanlayıcı."""
+    
+    def __init__(self,
+                 specs: Optional[Dict[str, RateLimitSpec]] = None,
+                 default_spec: Optional[RateLimitSpec] = None):
+        """
+        RateLimitScheduler sınıfını başlatır.
+        
+        Args:
+            specs: Motor sınıf adı (veya motor adı) -> hız sınırı tanımı
+            default_spec: Tanımı olmayan motorlar için kullanılacak sınır (None ise sınırsız)
+        """
+        self.specs = specs or {}
+        self.default_spec = default_spec or RateLimitSpec()
+        self._limiters = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls, default_spec: Optional[RateLimitSpec] = None) -> "RateLimitScheduler":
+        """
+        ENGINE_SETTINGS içindeki tanımlardan zamanlayıcı oluşturur.
+        
+        Args:
+            default_spec: Ayarlarda bulunmayan motorlar için kullanılacak sınır
+        
+        Returns:
+            RateLimitScheduler nesnesi
+        """
+        specs = {
+            engine_name: RateLimitSpec.from_settings(engine_settings)
+            for engine_name, engine_settings in ENGINE_SETTINGS.items()
+        }
+        return cls(specs, default_spec)
+    
+    def _engine_key(self, engine: SearchEngine) -> str:
+        """
+        Motorun hız sınırı anahtarını döndürür: tanım sınıf adıyla verilmişse
+        sınıf adı, motor adıyla verilmişse motor adı.
+        """
+        class_name = engine.settings_key
+        if class_name not in self.specs and engine.name in self.specs:
+            return engine.name
+        return class_name
+    
+    def get_spec(self, engine: SearchEngine) -> RateLimitSpec:
+        """
+        Motora uygulanacak hız sınırı tanımını döndürür.
+        
+        Args:
+            engine: Arama motoru
+        
+        Returns:
+            RateLimitSpec nesnesi
+        """
+        return self.specs.get(self._engine_key(engine), self.default_spec)
+    
+    def limiter_for(self, engine: SearchEngine) -> EngineRateLimiter:
+        """
+        Motorun sınırlayıcısını döndürür; aynı anahtara sahip motorlar aynı kotayı paylaşır.
+        
+        Args:
+            engine: Arama motoru
+        
+        Returns:
+            EngineRateLimiter nesnesi
+        """
+        key = self._engine_key(engine)
+        with self._lock:
+            if key not in self._limiters:
+                spec = self.get_spec(engine)
+                logger.debug(f"{key} hız sınırı: {spec}")
+                self._limiters[key] = EngineRateLimiter(spec)
+            return self._limiters[key]
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Tüm motorların kuyruk bekleme istatistiklerini döndürür.
+        
+        Returns:
+            Motor anahtarı -> istatistik sözlüğü
+        """
+        with self._lock:
+            return {key: limiter.get_stats() for key, limiter in self._limiters.items()}
+
+
+class RequestPacer:
+    """
+    Bir aramanın HTTP isteklerini zamanlayıcıdaki motor sınırlayıcısından
+    geçirir. Aramayı başlatan taraf motor için throttle ile bir token aldıysa
+    o motorun ilk isteği bu token ile gönderilir; böylece tek sayfalı aramalar
+    iki kez sayılmaz.
+    """
+    
+    def __init__(self, scheduler: RateLimitScheduler, prepaid: Optional[SearchEngine] = None):
+        """
+        RequestPacer sınıfını başlatır.
+        
+        Args:
+            scheduler: İsteklerin geçeceği zamanlayıcı
+            prepaid: İlk isteğinin token'ı önceden alınmış motor
+        """
+        self.scheduler = scheduler
+        self._prepaid = {scheduler._engine_key(prepaid)} if prepaid is not None else set()
+        self._lock = threading.Lock()
+    
+    def _use_prepaid(self, engine: SearchEngine) -> bool:
+        """Motorun önceden alınmış token'ı varsa onu harcar ve True döndürür."""
+        key = self.scheduler._engine_key(engine)
+        with self._lock:
+            if key in self._prepaid:
+                self._prepaid.discard(key)
+                return True
+            return False
+    
+    def pace(self, engine: SearchEngine):
+        """
+        İsteği motorun sınırlayıcısından geçiren bağlam yöneticisi döndürür.
+        
+        Args:
+            engine: İsteği gönderen motor
+        
+        Returns:
+            Kuyrukta beklenen süreyi veren bağlam yöneticisi
+        """
+        if self._use_prepaid(engine):
+            return nullcontext(0.0)
+        return self.scheduler.limiter_for(engine).pace()
+    
+    def async_pace(self, engine: SearchEngine):
+        """
+        pace metodunun asenkron karşılığı.
+        
+        Args:
+            engine: İsteği gönderen motor
+        
+        Returns:
+            Kuyrukta beklenen süreyi veren asenkron bağlam yöneticisi
+        """
+        if self._use_prepaid(engine):
+            return nullcontext(0.0)
+        return self.scheduler.limiter_for(engine).async_pace()
+
+
+_current_pacer = ContextVar("request_pacer", default=None)
+
+
+@contextmanager
+def pacing(scheduler: RateLimitScheduler, prepaid: Optional[SearchEngine] = None):
+    """
+    Blok içindeki HTTP isteklerinin zamanlayıcıdan geçmesini sağlar. Bağlam
+    değişkeni olduğundan sayfa iş parçacıklarına ve görevlere de taşınır.
+    
+    Args:
+        scheduler: İsteklerin geçeceği zamanlayıcı
+        prepaid: İlk isteğinin token'ı önceden alınmış motor
+    
+    Yields:
+        RequestPacer nesnesi
+    """
+    token = _current_pacer.set(RequestPacer(scheduler, prepaid))
+    try:
+        yield _current_pacer.get()
+    finally:
+        _current_pacer.reset(token)
+
+
+def pace_request(engine: SearchEngine):
+    """
+    Geçerli bağlamda hız sınırlama etkinse isteği motorun sınırlayıcısından
+    geçiren, değilse hiçbir şey yapmayan bağlam yöneticisi döndürür.
+    
+    Args:
+        engine: İsteği gönderen motor
+    
+    Returns:
+        Kuyrukta beklenen süreyi veren bağlam yöneticisi
+    """
+    pacer = _current_pacer.get()
+    if pacer is None:
+        return nullcontext(0.0)
+    return pacer.pace(engine)
+
+
+def async_pace_request(engine: SearchEngine):
+    """
+    pace_request fonksiyonunun asenkron karşılığı.
+    
+    Args:
+        engine: İsteği gönderen motor
+    
+    Returns:
+        Kuyrukta beklenen süreyi veren asenkron bağlam yöneticisi
+    """
+    pacer = _current_pacer.get()
+    if pacer is None:
+        return nullcontext(0.0)
+    return pacer.async_pace(engine)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Gecikme ölçümleri için sağlam istatistik modülü.
+
+Ağ gecikmeleri sağa çarpık dağılır ve ara sıra çok yavaş ölçümler içerir;
+bu nedenle ortalama yerine medyan ve kırpılmış ortalama, aykırı değerler
+için MAD (median absolute deviation) tabanlı değiştirilmiş z-skoru ve
+motorların karşılaştırılması için bootstrap güven aralıkları kullanılır.
+"""
+
+import random
+import statistics
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+
+# Iglewicz ve Hoaglin'in önerdiği değiştirilmiş z-skoru eşiği
+DEFAULT_OUTLIER_THRESHOLD = 3.5
+
+# Kırpılmış ortalamada her iki uçtan atılan oran
+DEFAULT_TRIM_PROPORTION = 0.1
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_BOOTSTRAP_RESAMPLES = 2000
+
+# Hazır olma süresi ölçülen sonuç sıraları (ilk sonuç, ilk 5, ilk 10)
+DEFAULT_RESULT_RANKS = (1, 5, 10)
+
+# Normal dağılımda MAD'i standart sapmaya çeviren katsayının tersi (0.6745 ≈ Φ⁻¹(0.75))
+_MAD_Z_FACTOR = 0.6745
+
+
+def trimmed_mean(values: Sequence[float], proportion: float = DEFAULT_TRIM_PROPORTION) -> float:
+    """
+    Her iki uçtan belirtilen oranda değer atılarak hesaplanan ortalamayı döndürür.
+    
+    Args:
+        values: Değerler
+        proportion: Her uçtan atılacak oran (0-0.5)
+    
+    Returns:
+        Kırpılmış ortalama
+    
+    Raises:
+        ValueError: Değer listesi boşsa veya oran geçersizse
+    """
+    if not values:
+        raise ValueError("Kırpılmış ortalama için en az bir değer gerekli")
+    if not 0 <= proportion < 0.5:
+        raise ValueError("Kırpma oranı 0 ile 0.5 arasında olmalı")
+    
+    ordered = sorted(values)
+    cut = int(len(ordered) * proportion)
+    return statistics.mean(ordered[cut:len(ordered) - cut])
+
+
+def median_absolute_deviation(values: Sequence[float]) -> float:
+    """
+    Medyandan mutlak sapmaların medyanını (MAD) döndürür.
+    
+    Args:
+        values: Değerler
+    
+    Returns:
+        MAD değeri
+    """
+    center = statistics.median(values)
+    return statistics.median(abs(value - center) for value in values)
+
+
+def reject_outliers(values: Sequence[float],
+                    threshold: float = DEFAULT_OUTLIER_THRESHOLD) -> Tuple[List[float], List[float]]:
+    """
+    Değiştirilmiş z-skoru (0.6745 * |x - medyan| / MAD) eşiği aşan değerleri ayırır.
+    
+    Üçten az değer varsa veya MAD sıfırsa (değerlerin yarısından fazlası
+    aynıysa) hiçbir değer aykırı sayılmaz.
+    
+    Args:
+        values: Değerler
+        threshold: Aykırı sayılma eşiği
+    
+    Returns:
+        (kalan değerler, aykırı değerler) biçiminde tuple; sıra korunur
+    """
+    if len(values) < 3:
+        return list(values), []
+    
+    center = statistics.median(values)
+    mad = median_absolute_deviation(values)
+    if mad == 0:
+        return list(values), []
+    
+    kept, outliers = [], []
+    for value in values:
+        score = _MAD_Z_FACTOR * abs(value - center) / mad
+        (outliers if score > threshold else kept).append(value)
+    return kept, outliers
+
+
+def bootstrap_ci(values: Sequence[float],
+                 statistic: Callable[[Sequence[float]], float] = statistics.median,
+                 confidence: float = DEFAULT_CONFIDENCE,
+                 resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+                 seed: Optional[int] = None) -> Optional[Tuple[float, float]]:
+    """
+    İstatistiğin yüzdelik yöntemiyle bootstrap güven aralığını hesaplar.
+    
+    Args:
+        values: Değerler
+        statistic: Aralığı hesaplanacak istatistik (varsayılan medyan)
+        confidence: Güven düzeyi (0-1)
+        resamples: Yeniden örnekleme sayısı
+        seed: Tekrarlanabilir sonuçlar için rastgele sayı tohumu
+    
+    Returns:
+        (alt sınır, üst sınır) veya değer yoksa None
+    """
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0], values[0]
+    
+    rng = random.Random(seed)
+    size = len(values)
+    estimates = sorted(statistic(rng.choices(values, k=size)) for _ in range(resamples))
+    
+    alpha = (1 - confidence) / 2
+    low = estimates[int(alpha * (resamples - 1))]
+    high = estimates[int(round((1 - alpha) * (resamples - 1)))]
+    return low, high
+
+
+def intervals_overlap(first: Optional[Sequence[float]], second: Optional[Sequence[float]]) -> bool:
+    """
+    İki güven aralığının örtüşüp örtüşmediğini döndürür.
+    
+    Args:
+        first: (alt, üst) aralığı
+        second: (alt, üst) aralığı
+    
+    Returns:
+        Aralıklar örtüşüyorsa (veya biri bilinmiyorsa) True
+    """
+    if not first or not second:
+        return True
+    return first[0] <= second[1] and second[0] <= first[1]
+
+
+def robust_summary(values: Sequence[float],
+                   outlier_threshold: Optional[float] = DEFAULT_OUTLIER_THRESHOLD,
+                   confidence: float = DEFAULT_CONFIDENCE,
+                   resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+                   seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Gecikme ölçümlerinin sağlam özetini oluşturur. Aykırı değerler ayıklandıktan
+    sonra medyan, kırpılmış ortalama ve medyanın güven aralığı hesaplanır.
+    
+    Args:
+        values: Gecikme ölçümleri (saniye)
+        outlier_threshold: Aykırı değer eşiği (None ise ayıklama yapılmaz)
+        confidence: Güven düzeyi
+        resamples: Bootstrap yeniden örnekleme sayısı
+        seed: Rastgele sayı tohumu
+    
+    Returns:
+        median, trimmed_mean, mad, outliers, confidence ve confidence_interval içeren sözlük
+    """
+    if outlier_threshold is None:
+        kept, outliers = list(values), []
+    else:
+        kept, outliers = reject_outliers(values, outlier_threshold)
+    
+    if not kept:
+        return {"median": None, "trimmed_mean": None, "mad": None, "outliers": outliers,
+                "confidence": confidence, "confidence_interval": None}
+    
+    interval = bootstrap_ci(kept, confidence=confidence, resamples=resamples, seed=seed)
+    return {
+        "median": statistics.median(kept),
+        "trimmed_mean": trimmed_mean(kept),
+        "mad": median_absolute_deviation(kept),
+        "outliers": outliers,
+        "confidence": confidence,
+        "confidence_interval": list(interval) if interval else None
+    }
+
+
+def rank_label(k: int) -> str:
+    """
+    Sonuç sırası için rapor etiketini döndürür.
+    
+    Args:
+        k: Sonuç sırası (1 tabanlı)
+    
+    Returns:
+        "İlk Sonuç" veya "İlk k"
+    """
+    return "İlk Sonuç" if k == 1 else f"İlk {k}"
+
+
+def time_to_k(arrival_runs: Sequence[Sequence[float]],
+              ranks: Sequence[int] = DEFAULT_RESULT_RANKS) -> Dict[int, Optional[float]]:
+    """
+    Her k için k'inci sonucun hazır olduğu ortalama süreyi hesaplar. k sonuca
+    ulaşmayan çalıştırmalar o k'nin ortalamasına dahil edilmez.
+    
+    Args:
+        arrival_runs: Her çalıştırma için sonuçların sırayla hazır olduğu anlar (saniye)
+        ranks: Süresi hesaplanacak sonuç sıraları (1 tabanlı)
+    
+    Returns:
+        k -> ortalama süre (hiçbir çalıştırma k sonuca ulaşmadıysa None)
+    
+    Raises:
+        ValueError: Sonuç sırası 1'den küçükse
+    """
+    invalid = [k for k in ranks if k < 1]
+    if invalid:
+        raise ValueError(f"Sonuç sıraları 1 veya daha büyük olmalı: {invalid}")
+    
+    summary = {}
+    for k in ranks:
+        values = [arrivals[k - 1] for arrivals in arrival_runs if len(arrivals) >= k]
+        summary[k] = statistics.mean(values) if values else None
+    return summary
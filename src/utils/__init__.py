@@ -5,13 +5,442 @@
 Yardımcı araçlar paketi.
 
 Bu paket, proje genelinde kullanılabilecek yardımcı fonksiyonları
+(HTTP oturumları, JSON yolları, sonuç eşlemeleri, URL normalleştirme)
 ve arama ile ilgili yardımcı araçları içerir.
+
+PdfReportGenerator ilk erişimde yüklenir; böylece yalnızca quick_search
+kullanan kod matplotlib ve reportlab'ı yüklemez.
 """
 
+import importlib
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, TYPE_CHECKING
+import requests
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+from src.core import SearchResult
+from src.phases import TimedHTTPAdapter, create_trace_config
+from src.deadline import SearchTimeoutError, request_timeout
 from src.utils.quick_search import quick_search, QuickSearch
-from src.utils.pdf_report import PdfReportGenerator
+
+if TYPE_CHECKING:
+    import aiohttp
+    from src.utils.pdf_report import PdfReportGenerator
+
+# Sabitler
+DEFAULT_USER_AGENT = "SearchEvaluator/1.0"
+DEFAULT_TIMEOUT = 10  # saniye
+DEFAULT_ASYNC_CONNECTION_LIMIT = 100  # eşzamanlı açık bağlantı sayısı
+DEFAULT_POOL_SIZE = 10  # host başına havuzda tutulan bağlantı sayısı
+
+# Aynı sayfayı farklı bağlantılarla gösteren izleme parametreleri (canonicalize_url bunları atar)
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid", "ref", "ref_src", "srsltid"}
+
+# Derlenmiş JSON yolu: veriyi alıp yoldaki değeri (bulunamazsa None) döndürür
+JSONAccessor = Callable[[Any], Any]
+
+@lru_cache(maxsize=None)
+def compile_json_path(path: str) -> JSONAccessor:
+    """
+    Nokta notasyonlu yolu bir kez ayrıştırıp önbellekteki erişim fonksiyonuna
+    çevirir; fonksiyon her çağrıda yolu yeniden bölmez ve parçaları yeniden
+    sınıflandırmaz. Sayısal parçalar liste indeksi (veya sayısal sözlük
+    anahtarı), diğerleri sözlük anahtarı olarak kullanılır.
+    
+    Args:
+        path: Nokta notasyonlu yol (örn: "items.0.title", boş ise verinin kendisi)
+    
+    Returns:
+        Yoldaki değeri veya bulunamazsa None döndüren fonksiyon
+    """
+    if not path:
+        return lambda data: data
+    
+    steps = tuple(int(part) if part.isdigit() else part for part in path.split('.'))
+    
+    if len(steps) == 1 and isinstance(steps[0], str):
+        # En sık durum: tek bir sözlük anahtarı (örn: "title")
+        key = steps[0]
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+    
+    def accessor(data: Any) -> Any:
+        current = data
+        for step in steps:
+            if isinstance(step, int) and isinstance(current, (list, tuple)):
+                if 0 <= step < len(current):
+                    current = current[step]
+                else:
+                    return None
+            elif isinstance(current, dict) and step in current:
+                current = current[step]
+            else:
+                return None
+        return current
+    
+    return accessor
+
+def extract_data_from_json(data: Dict[str, Any], path: str) -> Any:
+    """
+    Nokta notasyonu ile JSON verisinden değer çıkarır.
+    
+    Args:
+        data: JSON verisi
+        path: Nokta notasyonlu yol (örn: "items.0.title")
+        
+    Returns:
+        Bulunan değer veya None
+    """
+    return compile_json_path(path)(data)
+
+def safe_request(
+    url: str, 
+    method: str = "GET", 
+    headers: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None
+) -> requests.Response:
+    """
+    Hata yönetimi ile güvenli HTTP istekleri yapar.
+    
+    Args:
+        url: İstek URL'si
+        method: HTTP metodu ('GET', 'POST', vs.)
+        headers: İstek başlıkları
+        params: URL parametreleri
+        json_data: JSON olarak gönderilecek veri
+        timeout: Zaman aşımı süresi (saniye); geçerli arama süre sınırında daha
+            az süre kaldıysa kalan süre kullanılır
+        session: Bağlantıları yeniden kullanmak için requests.Session (None ise her
+            istek yeni bağlantı açar)
+        
+    Returns:
+        Response nesnesi
+        
+    Raises:
+        SearchTimeoutError: İstek zaman aşımına uğrarsa veya süre sınırı dolduysa
+        ValueError: İstek başka bir nedenle başarısız olursa
+    """
+    default_headers = {
+        "User-Agent": DEFAULT_USER_AGENT
+    }
+    
+    if headers:
+        default_headers.update(headers)
+    
+    # Oturum verilmemişse istek için geçici bir oturum açılır (requests.request ile aynı davranış)
+    own_session = None
+    if session is None:
+        session = own_session = create_http_session(pool_size=1)
+    
+    try:
+        response = session.request(
+            method=method,
+            url=url,
+            headers=default_headers,
+            params=params,
+            json=json_data,
+            # Geçerli arama süre sınırında daha az süre kaldıysa o kullanılır
+            timeout=request_timeout(timeout)
+        )
+        response.raise_for_status()
+        return response
+    except requests.exceptions.Timeout as e:
+        raise SearchTimeoutError(f"HTTP isteği zaman aşımına uğradı: {str(e)}") from e
+    except requests.exceptions.RequestException as e:
+        raise ValueError(f"HTTP isteği başarısız: {str(e)}")
+    finally:
+        if own_session is not None:
+            own_session.close()
+
+def create_http_session(
+    pool_size: int = DEFAULT_POOL_SIZE,
+    keep_alive: bool = True
+) -> requests.Session:
+    """
+    Bağlantı havuzlu bir requests oturumu oluşturur.
+    
+    Aynı oturum üzerinden yapılan istekler TCP+TLS bağlantısını yeniden
+    kullanır; böylece ölçülen süre her seferinde el sıkışmayı içermez.
+    
+    Args:
+        pool_size: Host başına havuzda tutulacak en fazla bağlantı sayısı
+        keep_alive: False ise her istekten sonra bağlantı kapatılır
+        
+    Returns:
+        requests.Session nesnesi
+    """
+    session = requests.Session()
+    # Aşama ölçümü (src.phases) etkin değilken standart HTTPAdapter gibi davranır
+    adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    
+    return session
+
+def create_async_session(
+    connection_limit: int = DEFAULT_ASYNC_CONNECTION_LIMIT,
+    headers: Optional[Dict[str, str]] = None
+) -> "aiohttp.ClientSession":
+    """
+    Motorlar arasında paylaşılacak bir aiohttp oturumu oluşturur.
+    
+    Oturum çalışan olay döngüsü içinde oluşturulmalı ve işi bitince
+    kapatılmalıdır (``async with create_async_session() as session``).
+    
+    Args:
+        connection_limit: Aynı anda açık tutulabilecek en fazla bağlantı sayısı
+        headers: Tüm isteklere eklenecek varsayılan başlıklar
+        
+    Returns:
+        aiohttp.ClientSession nesnesi
+        
+    Raises:
+        ImportError: aiohttp kurulu değilse
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("Asenkron arama için aiohttp paketi gereklidir: pip install aiohttp") from None
+    
+    connector = aiohttp.TCPConnector(limit=connection_limit)
+    return aiohttp.ClientSession(connector=connector, headers=headers, trace_configs=[create_trace_config()])
+
+def load_queries(path: str, field: str = "query") -> List[str]:
+    """
+    Dosyadan sorgu kümesi okur.
+    
+    ``.jsonl`` uzantılı dosyalarda her satır bir JSON nesnesi (veya düz JSON
+    dizgesi) olarak okunur ve sorgu ``field`` alanından alınır; alan yoksa
+    sırasıyla "query", "q" ve "title" alanlarına bakılır. Diğer dosyalarda
+    her boş olmayan satır bir sorgudur, ``#`` ile başlayan satırlar atlanır.
+    
+    Args:
+        path: Sorgu dosyasının yolu
+        field: JSONL kayıtlarında sorguyu içeren alan adı
+        
+    Returns:
+        Sorgu listesi
+        
+    Raises:
+        ValueError: JSONL satırı ayrıştırılamazsa veya sorgu alanı bulunamazsa
+    """
+    queries = []
+    is_jsonl = path.lower().endswith(".jsonl")
+    
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or (not is_jsonl and line.startswith("#")):
+                continue
+            
+            if not is_jsonl:
+                queries.append(line)
+                continue
+            
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no} JSON olarak ayrıştırılamadı: {e}")
+            
+            if isinstance(record, str):
+                queries.append(record)
+                continue
+            
+            for key in (field, "query", "q", "title"):
+                if isinstance(record, dict) and record.get(key):
+                    queries.append(str(record[key]))
+                    break
+            else:
+                raise ValueError(f"{path}:{line_no} satırında '{field}' alanı bulunamadı")
+    
+    return queries
+
+def canonicalize_url(url: str) -> str:
+    """
+    Farklı motorların aynı sayfa için döndürdüğü bağlantıları karşılaştırılabilir
+    hale getirir: şema https'e, host küçük harfe çevrilir, "www." öneki,
+    varsayılan port, parça (#...), izleme parametreleri (utm_*, gclid vb.) ve
+    sondaki "/" atılır; kalan sorgu parametreleri sıralanır. DuckDuckGo
+    yönlendirme bağlantıları (uddg=) hedef adrese çözülür.
+    
+    Args:
+        url: Bağlantı
+    
+    Returns:
+        Kanonik bağlantı (boş bağlantı için boş metin)
+    """
+    url = url.strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "https://" + url.lstrip("/")
+    
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    
+    # DuckDuckGo yönlendirmesi: //duckduckgo.com/l/?uddg=<hedef>
+    redirect = dict(params).get("uddg")
+    if redirect and parts.netloc.endswith("duckduckgo.com"):
+        return canonicalize_url(unquote(redirect))
+    
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    
+    query = urlencode(sorted(
+        (name, value) for name, value in params
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https", host, path, query, ""))
+
+def format_timestamp(timestamp=None):
+    """
+    Zaman damgası oluşturur.
+    
+    Args:
+        timestamp: Zaman damgası (None ise şu anki zaman kullanılır)
+    
+    Returns:
+        Biçimlendirilmiş zaman damgası
+    """
+    if timestamp is None:
+        timestamp = datetime.now()
+    return timestamp.strftime("%Y%m%d_%H%M%S")
+
+@dataclass(frozen=True)
+class ResultMapping:
+    """
+    Bir motorun JSON yanıtındaki sonuç listesinin ve alanlarının yolları.
+    
+    Örnek:
+        ResultMapping("webPages.value", title_field="name", link_field="url")
+    """
+    items_path: str
+    title_field: str = "title"
+    link_field: str = "link"
+    snippet_field: str = "snippet"
+    
+    def extract(self, data: Dict[str, Any], max_results: int = 10) -> List[SearchResult]:
+        """
+        Yanıttan SearchResult nesneleri oluşturur (bkz. compile_result_mapping).
+        
+        Args:
+            data: API yanıt verisi
+            max_results: Maksimum sonuç sayısı
+        
+        Returns:
+            SearchResult nesnelerinin listesi
+        """
+        return compile_result_mapping(self)(data, max_results)
+
+# Derlenmiş eşleme: (yanıt, maksimum sonuç sayısı) -> sonuçlar
+ResultExtractor = Callable[[Dict[str, Any], int], List[SearchResult]]
+
+@lru_cache(maxsize=None)
+def compile_result_mapping(mapping: ResultMapping) -> ResultExtractor:
+    """
+    Eşlemedeki yolları bir kez derleyip sonuç çıkarma fonksiyonu oluşturur.
+    Aynı eşleme için her zaman aynı fonksiyon döndürülür; öğeler tek bir
+    geçişte, öğe başına metin işlemi yapılmadan dönüştürülür.
+    
+    Args:
+        mapping: Sonuç eşlemesi
+    
+    Returns:
+        (yanıt, maksimum sonuç sayısı) alıp SearchResult listesi döndüren fonksiyon
+    """
+    get_items = compile_json_path(mapping.items_path)
+    get_title = compile_json_path(mapping.title_field)
+    get_link = compile_json_path(mapping.link_field)
+    get_snippet = compile_json_path(mapping.snippet_field)
+    
+    def extract(data: Dict[str, Any], max_results: int = 10) -> List[SearchResult]:
+        items = get_items(data)
+        if not items or not isinstance(items, list):
+            return []
+        return [
+            SearchResult(title=get_title(item) or "", link=get_link(item) or "", snippet=get_snippet(item) or "")
+            for item in items[:max_results]
+        ]
+    
+    return extract
+
+def extract_search_results(
+    data: Dict[str, Any], 
+    items_path: str, 
+    title_field: str, 
+    link_field: str, 
+    snippet_field: str,
+    max_results: int = 10
+) -> List[SearchResult]:
+    """
+    API yanıtından SearchResult nesneleri oluşturur. Yollar ilk çağrıda
+    derlenir ve sonraki çağrılarda önbellekten kullanılır.
+    
+    Args:
+        data: API yanıt verisi
+        items_path: Sonuç öğelerinin JSON yolu (örn: "items" veya "webPages.value")
+        title_field: Başlık alanının adı
+        link_field: Bağlantı alanının adı
+        snippet_field: Snippet alanının adı
+        max_results: Maksimum sonuç sayısı
+        
+    Returns:
+        SearchResult nesnelerinin listesi
+    """
+    mapping = ResultMapping(items_path, title_field, link_field, snippet_field)
+    return compile_result_mapping(mapping)(data, max_results)
+
+
+# İlk erişimde yüklenen isimler (Key: İsim, Value: Alt modül)
+_LAZY_ATTRIBUTES = {
+    'PdfReportGenerator': 'src.utils.pdf_report'
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Ağır bağımlılıkları olan isimleri ilk erişimde ilgili alt modülden yükler.
+    
+    Raises:
+        AttributeError: İsim paket tarafından dışa açılmıyorsa
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 __all__ = [
+    'DEFAULT_USER_AGENT',
+    'DEFAULT_TIMEOUT',
+    'DEFAULT_ASYNC_CONNECTION_LIMIT',
+    'DEFAULT_POOL_SIZE',
+    'TRACKING_PARAMS',
+    'compile_json_path',
+    'extract_data_from_json',
+    'safe_request',
+    'create_http_session',
+    'create_async_session',
+    'load_queries',
+    'canonicalize_url',
+    'format_timestamp',
+    'ResultMapping',
+    'compile_result_mapping',
+    'extract_search_results',
     'quick_search',
     'QuickSearch',
     'PdfReportGenerator'
@@ -23,6 +23,8 @@ from io import BytesIO
 import datetime
 import numpy as np
 from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER, TA_RIGHT
+from src.histogram import DEFAULT_PERCENTILES, percentile_key, format_percentiles, format_latency
+from src.stats import rank_label
 
 # Türkçe karakterler için font ayarları
 try:
@@ -52,7 +54,7 @@ matplotlib.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial', 'Helvetica']
 class PdfReportGenerator:
     """PDF formatında arama motoru karşılaştırma raporu oluşturan sınıf."""
     
-    def __init__(self, search_results, engines, output_dir="."):
+    def __init__(self, search_results, engines, output_dir=".", latency_percentiles=None):
         """
         PdfReportGenerator sınıfını başlatır.
         
@@ -60,10 +62,13 @@ class PdfReportGenerator:
             search_results: Arama motorlarının sonuçlarını içeren sözlük
             engines: Arama motorları listesi
             output_dir: Çıktı dizini
+            latency_percentiles: Motor adı -> tüm ölçümler üzerindeki gecikme yüzdelikleri
+                (None ise ilk sorgunun yüzdelikleri kullanılır)
         """
         self.search_results = search_results
         self.engines = engines
         self.output_dir = output_dir
+        self.latency_percentiles = latency_percentiles
         self.styles = getSampleStyleSheet()
         
         # Fontu kontrol et - eğer DejaVu Sans varsa onu kullan
@@ -213,7 +218,7 @@ class PdfReportGenerator:
         # Türkçe karakter desteği için matplotlib ayarlarını ayarla
         plt.rcParams['font.family'] = 'sans-serif'
         plt.rcParams['font.sans-serif'] = ['DejaVu Sans', 'Arial', 'Helvetica']
-
+        
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         pdf_filename = os.path.join(self.output_dir, f"search_comparison_report_{timestamp}.pdf")
         
@@ -339,6 +344,68 @@ class PdfReportGenerator:
         content.append(table)
         content.append(Spacer(1, 0.5 * inch))
         
+        # Gecikme yüzdelikleri tablosu
+        latency_percentiles = self.latency_percentiles or {
+            engine_name: data["latency_percentiles"]
+            for engine_name, data in self.search_results[query].items()
+            if data.get("latency_percentiles")
+        }
+        if latency_percentiles:
+            content.append(Paragraph("Gecikme Yüzdelikleri", self.styles['TurkishHeading2']))
+            content.append(Spacer(1, 0.25 * inch))
+            
+            percentile_data = [["Arama Motoru", "Ölçüm", "Ort."] + [percentile_key(p) for p in DEFAULT_PERCENTILES]]
+            for engine_name, summary in latency_percentiles.items():
+                percentile_data.append(
+                    [engine_name, str(summary["count"]), format_latency(summary["mean"])] + format_percentiles(summary)
+                )
+            
+            percentile_table = Table(percentile_data, repeatRows=1)
+            percentile_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.blue),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), bold_font_name),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ]))
+            content.append(percentile_table)
+            content.append(Spacer(1, 0.5 * inch))
+        
+        # İlk sonuç ve ilk k sonuç süreleri tablosu
+        ranked_engines = {
+            engine_name: data
+            for engine_name, data in self.search_results[query].items()
+            if data.get("time_to_k")
+        }
+        if ranked_engines:
+            content.append(Paragraph("Sonuç Hazır Olma Süreleri", self.styles['TurkishHeading2']))
+            content.append(Spacer(1, 0.25 * inch))
+            
+            ranks = list(next(iter(ranked_engines.values()))["time_to_k"])
+            rank_data = [["Arama Motoru", "Ort. Toplam"] + [rank_label(k) for k in ranks]]
+            for engine_name, data in ranked_engines.items():
+                rank_data.append(
+                    [engine_name, format_latency(data["avg_response_time"])]
+                    + [format_latency(data["time_to_k"].get(k)) for k in ranks]
+                )
+            
+            rank_table = Table(rank_data, repeatRows=1)
+            rank_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.blue),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), bold_font_name),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ]))
+            content.append(rank_table)
+            content.append(Spacer(1, 0.5 * inch))
+        
         # Sonuç ve değerlendirme
         conclusion_text = """
         Değerlendirme ve Sonuç:
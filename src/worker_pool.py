@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Süreç havuzu ile arama yürütme modülü.
+
+Toplu çalıştırmalar birden fazla sürece dağıtıldığında her görevde motorun
+yeniden oluşturulması; modüllerin içe aktarılması, kimlik bilgilerinin
+yüklenmesi ve bağlantı kurulması maliyetlerini tekrarlar. WorkerPool her
+işçi süreçte motorları EngineSpec tanımlarından yalnızca bir kez oluşturur;
+motorlar ve HTTP oturumları işçi süreç yaşadıkça sıcak kalır. Görevlere
+motor nesnesi değil yalnızca motorun indeksi, sorgu ve sonuç sayısı
+gönderilir; işçi süreçten sonuçlar, süreler ve aşama ölçümleri döner.
+
+pool.engines içindeki RemoteEngine vekilleri birer SearchEngine olduğundan
+SearchEngineEvaluator'a (veya meta motorlara) diğer motorlar gibi
+kaydedilebilir; hız sınırı, devre kesici ve süre sınırı ana süreçte
+uygulanır, arama işçi süreçte yapılır.
+
+Örnek:
+    with WorkerPool([EngineSpec("serper"), EngineSpec("brave")], processes=4) as pool:
+        evaluator = SearchEngineEvaluator(max_workers=4)
+        evaluator.register_engines(pool.engines)
+        evaluator.run_batch(queries)
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.settings import get_engine_settings
+from src.core import SearchEngine, SearchResult, logger
+from src.core.utils import dynamic_import
+from src.phases import record_phases, current_phases
+from src.deadline import SearchTimeoutError, current_deadline, deadline
+from src.circuit_breaker import trace_errors, report_error
+
+
+@dataclass
+class EngineSpec:
+    """
+    İşçi süreçte motoru oluşturmak için gereken, pickle edilebilir tanım.
+    
+    Attributes:
+        engine: Motor anahtarı (ör. "serper"), ENGINE_SETTINGS'teki motor adı
+            (ör. "GoogleSearch") veya "modül:Sınıf" biçiminde sınıf yolu
+        kwargs: Motor sınıfının yapıcısına verilecek argümanlar
+        attributes: Oluşturulduktan sonra motora atanacak nitelikler (ör. base_url)
+    """
+    engine: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    
+    def build(self) -> SearchEngine:
+        """
+        Tanımdaki motoru oluşturur.
+        
+        Returns:
+            SearchEngine nesnesi
+        
+        Raises:
+            ImportError: Sınıf yolu içe aktarılamazsa
+            ValueError: Motor bulunamazsa
+        """
+        engine_settings = get_engine_settings(self.engine)
+        if ":" in self.engine:
+            module_name, _, class_name = self.engine.partition(":")
+            engine_class = dynamic_import(module_name, class_name)
+        elif engine_settings:
+            engine_class = dynamic_import(engine_settings["module_path"], engine_settings["class_name"])
+        else:
+            # Eklentilerle kaydedilenler dahil src.engines anahtarları
+            from src.engines import get_engine_class
+            engine_class = get_engine_class(self.engine)
+        if engine_class is None:
+            raise ValueError(f"Arama motoru bulunamadı: {self.engine}")
+        
+        engine = engine_class(**self.kwargs)
+        for name, value in self.attributes.items():
+            setattr(engine, name, value)
+        return engine
+
+
+# İşçi süreçte bir kez oluşturulan motorlar (EngineSpec sırasıyla)
+_worker_engines: Optional[List[SearchEngine]] = None
+
+
+def _init_worker(specs: Sequence[EngineSpec]) -> None:
+    """İşçi süreç başlarken motorları oluşturur."""
+    global _worker_engines
+    _worker_engines = [spec.build() for spec in specs]
+
+
+def _ping() -> bool:
+    """İşçi sürecin başlatılmasını (ve motorların oluşturulmasını) bekletmek için boş görev."""
+    return True
+
+
+def _run_search(index: int, query: str, num_results: int,
+                timeout: Optional[float]) -> Tuple[List[SearchResult], float, List[float], Dict[str, float], int, Optional[str]]:
+    """
+    İşçi süreçte tek bir arama görevini yürütür.
+    
+    Args:
+        index: Motorun EngineSpec listesindeki indeksi
+        query: Arama sorgusu
+        num_results: İstenen sonuç sayısı
+        timeout: Ana süreçteki süre sınırından kalan süre (saniye)
+    
+    Returns:
+        (sonuçlar, süre, sonuç_varış_süreleri, aşama_süreleri, gizlenen_hata_sayısı,
+        son_gizlenen_hata) biçiminde tuple
+    
+    Raises:
+        SearchTimeoutError: Süre sınırı aşılırsa
+        RuntimeError: Arama hata verirse (özgün istisna pickle edilemeyebileceği için mesajıyla)
+    """
+    engine = _worker_engines[index]
+    try:
+        with trace_errors() as errors, record_phases() as phases, deadline(timeout):
+            results, elapsed_time, arrival_times = engine.measure_search_iter(query, num_results)
+    except TimeoutError as e:
+        raise SearchTimeoutError(str(e)) from None
+    except Exception as e:
+        raise RuntimeError(f"{type(e).__name__}: {e}") from None
+    
+    last_error = f"{type(errors.last_error).__name__}: {errors.last_error}" if errors.last_error else None
+    return results, elapsed_time, arrival_times, dict(phases.durations), errors.errors, last_error
+
+
+class WorkerPool:
+    """Motorları her işçi süreçte bir kez oluşturan süreç havuzu."""
+    
+    def __init__(self,
+                 specs: Sequence[EngineSpec],
+                 processes: Optional[int] = None,
+                 start_method: Optional[str] = None):
+        """
+        WorkerPool sınıfını başlatır. İşçi süreçler start() veya ilk görevde başlatılır.
+        
+        Args:
+            specs: Motor tanımları
+            processes: İşçi süreç sayısı (None ise işlemci sayısı)
+            start_method: multiprocessing başlatma yöntemi ("fork", "spawn", "forkserver";
+                None ise platform varsayılanı)
+        """
+        if not specs:
+            raise ValueError("Süreç havuzu için en az bir motor tanımı gerekli")
+        
+        self.specs = list(specs)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.start_method = start_method
+        self._executor = None
+        self._lock = threading.Lock()
+        
+        # Ana süreçteki vekiller; ad ve bilgi için motorlar burada da oluşturulur (oturum açılmaz)
+        self.engines = [RemoteEngine(self, index, spec.build()) for index, spec in enumerate(self.specs)]
+    
+    def start(self) -> "WorkerPool":
+        """
+        İşçi süreçleri başlatır ve motorlarının oluşturulmasını bekler; böylece
+        oluşturma maliyeti ilk ölçüme eklenmez.
+        
+        Returns:
+            Aynı havuz
+        """
+        with self._lock:
+            if self._executor is not None:
+                return self
+            context = multiprocessing.get_context(self.start_method) if self.start_method else None
+            self._executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=context,
+                                                 initializer=_init_worker, initargs=(self.specs,))
+            wait([self._executor.submit(_ping) for _ in range(self.processes)])
+            logger.info(f"Süreç havuzu başlatıldı: {self.processes} işçi, {len(self.specs)} motor")
+        return self
+    
+    def submit(self, index: int, query: str, num_results: int, timeout: Optional[float] = None) -> Future:
+        """
+        Arama görevini bir işçi sürece gönderir.
+        
+        Args:
+            index: Motorun indeksi
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            timeout: İşçi süreçte uygulanacak süre sınırı (saniye)
+        
+        Returns:
+            _run_search sonucunu taşıyan Future
+        """
+        self.start()
+        return self._executor.submit(_run_search, index, query, num_results, timeout)
+    
+    def close(self) -> None:
+        """İşçi süreçleri kapatır."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+    
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class RemoteEngine(SearchEngine):
+    """Aramayı WorkerPool işçi süreçlerinde yapan motor vekili."""
+    
+    def __init__(self, pool: WorkerPool, index: int, engine: SearchEngine):
+        """
+        RemoteEngine sınıfını başlatır.
+        
+        Args:
+            pool: Aramaların gönderileceği süreç havuzu
+            index: Motorun havuzdaki indeksi
+            engine: Ad ve bilgi için ana süreçte oluşturulan motor
+        """
+        super().__init__(engine.name, engine.source_url, engine.license_type)
+        self.pool = pool
+        self.index = index
+        self.engine = engine
+        self.rate_limit_info = engine.rate_limit_info
+        self.pricing_info = engine.pricing_info
+    
+    @property
+    def settings_key(self) -> str:
+        """Hız sınırı ve devre kesici tanımları asıl motorun sınıf adıyla aranır."""
+        return self.engine.settings_key
+    
+    def _deliver(self, outcome: Tuple) -> Tuple[List[SearchResult], float, List[float]]:
+        """
+        İşçi süreçteki ölçümü ana süreçteki etkin aşama ve hata izlemelerine aktarır.
+        
+        Args:
+            outcome: _run_search sonucu
+        
+        Returns:
+            (sonuçlar, süre, sonuç_varış_süreleri) biçiminde tuple
+        """
+        results, elapsed_time, arrival_times, durations, errors, last_error = outcome
+        phases = current_phases()
+        if phases is not None:
+            for phase, seconds in durations.items():
+                phases.add(phase, seconds)
+        for _ in range(errors):
+            report_error(RuntimeError(last_error))
+        return results, elapsed_time, arrival_times
+    
+    def _submit(self, query: str, num_results: int) -> Tuple[Future, Optional[float]]:
+        """Görevi geçerli süre sınırından kalan süreyle gönderir."""
+        budget = current_deadline()
+        timeout = budget.remaining() if budget is not None else None
+        return self.pool.submit(self.index, query, num_results, timeout), timeout
+    
+    def measure_search_iter(self, query: str, num_results: int = 10) -> Tuple[List[SearchResult], float, List[float]]:
+        """
+        Aramayı işçi süreçte yapar; süre ve varış süreleri işçi süreçte ölçülür
+        (süreçler arası aktarım ve havuz kuyruğu ölçüme dahil edilmez).
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye, sonuç_başına_varış_süreleri) biçiminde tuple
+        
+        Raises:
+            SearchTimeoutError: Süre sınırı aşılırsa
+        """
+        future, timeout = self._submit(query, num_results)
+        try:
+            outcome = future.result(timeout=timeout)
+        except TimeoutError as e:
+            future.cancel()
+            raise SearchTimeoutError(f"{self.name} süre sınırını aştı") from e
+        return self._deliver(outcome)
+    
+    async def async_measure_search_iter(self,
+                                        query: str,
+                                        num_results: int = 10,
+                                        session: Optional[Any] = None) -> Tuple[List[SearchResult], float, List[float]]:
+        """
+        measure_search_iter metodunun olay döngüsünü bloklamayan karşılığı.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+            session: Kullanılmaz (işçi süreçler kendi oturumlarını kullanır)
+        
+        Returns:
+            (arama_sonuçları, geçen_süre_saniye, sonuç_başına_varış_süreleri) biçiminde tuple
+        """
+        future, timeout = self._submit(query, num_results)
+        try:
+            outcome = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError as e:
+            raise SearchTimeoutError(f"{self.name} süre sınırını aştı") from e
+        return self._deliver(outcome)
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        """
+        Aramayı işçi süreçte yapar.
+        
+        Args:
+            query: Arama sorgusu
+            num_results: İstenen sonuç sayısı
+        
+        Returns:
+            Liste olarak SearchResult nesneleri
+        """
+        return self.measure_search_iter(query, num_results)[0]
+    
+    def search_iter(self, query: str, num_results: int = 10) -> Iterator[SearchResult]:
+        """Sonuçlar işçi süreçten tek seferde döner."""
+        yield from self.search(query, num_results)
+    
+    async def async_search(self,
+                           query: str,
+                           num_results: int = 10,
+                           session: Optional[Any] = None) -> List[SearchResult]:
+        """search metodunun olay döngüsünü bloklamayan karşılığı."""
+        return (await self.async_measure_search_iter(query, num_results))[0]
+    
+    def get_engine_info(self) -> Dict[str, Any]:
+        """
+        Asıl motorun bilgilerini havuz bilgisiyle birlikte döndürür.
+        
+        Returns:
+            Arama motoru bilgilerini içeren sözlük
+        """
+        info = self.engine.get_engine_info()
+        info["processes"] = self.pool.processes
+        return info
@@ -10,9 +10,8 @@ bir SearchEngine implementasyonunu içerir.
 
 import requests
 from typing import List, Dict, Any
-import os
-from dotenv import load_dotenv
-from search_interface import SearchEngine, SearchResult
+from search_interface import SearchEngine, SearchResult, DEFAULT_TIMEOUT
+from src.credentials import get_credentials
 
 class TavilySearch(SearchEngine):
     """Tavily API kullanarak arama yapan sınıf."""
@@ -30,10 +29,7 @@ class TavilySearch(SearchEngine):
             license_type="Kapalı, Ücretli (Freemium)"
         )
         
-        # .env dosyasını yükle (eğer daha önce yüklenmemişse)
-        load_dotenv()
-        
-        self.api_key = api_key or os.getenv("TAVILY_API_KEY")
+        self.api_key = api_key or get_credentials().get("TAVILY_API_KEY")
         self.base_url = "https://api.tavily.com/search"
         self.rate_limit_info = "Ücretsiz plan: 1000 sorgu/ay"
         self.pricing_info = "Ücretsiz: 1000 sorgu/ay, Growth: $29/ay, Pro: $99/ay"
@@ -64,7 +60,7 @@ class TavilySearch(SearchEngine):
         results = []
         
         try:
-            response = requests.get(self.base_url, params=params)
+            response = requests.get(self.base_url, params=params, timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
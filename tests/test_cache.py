@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Önbellek katmanı için test modülü.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, Dict, List
+
+from src.core import SearchEngine, SearchResult
+from src.cache import ResultCache, CachedSearch, ResponseCache
+from src.engines.base import BaseAPISearch
+from src.evaluator import SearchEngineEvaluator
+
+
+class CountingSearch(SearchEngine):
+    """Kaç kez çağrıldığını sayan sahte motor."""
+    
+    def __init__(self):
+        super().__init__(name="Sayaç", source_url="https://example.com", license_type="Test")
+        self.calls = 0
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        self.calls += 1
+        return [SearchResult(title=query, link="https://example.com", snippet="")][:num_results]
+
+
+class TestResultCache(unittest.TestCase):
+    """ResultCache davranışını test eder."""
+    
+    def test_lru_eviction(self):
+        """Kapasite aşılınca en az kullanılan kayıt çıkarılmalı."""
+        cache = ResultCache(max_size=2)
+        cache.put(("e", "a", 1), [])
+        cache.put(("e", "b", 1), [])
+        cache.get(("e", "a", 1))
+        cache.put(("e", "c", 1), [])
+        
+        self.assertIsNotNone(cache.get(("e", "a", 1)))
+        self.assertIsNone(cache.get(("e", "b", 1)))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+    
+    def test_per_engine_ttl(self):
+        """Motor bazındaki TTL süresi dolan kayıtlar geçersiz olmalı."""
+        cache = ResultCache(default_ttl=60, engine_ttls={"kısa": 0.05})
+        cache.put(("kısa", "q", 1), [])
+        cache.put(("uzun", "q", 1), [])
+        time.sleep(0.1)
+        
+        self.assertIsNone(cache.get(("kısa", "q", 1)))
+        self.assertIsNotNone(cache.get(("uzun", "q", 1)))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+
+class TestCachedSearch(unittest.TestCase):
+    """CachedSearch sarmalayıcısını test eder."""
+    
+    def setUp(self):
+        self.engine = CountingSearch()
+        self.cached = CachedSearch(self.engine)
+    
+    def test_hit_skips_engine(self):
+        """Normalleştirilmiş aynı sorgu ikinci kez motora gitmemeli."""
+        first = self.cached.search("Python  Programlama", 5)
+        second = self.cached.search("python programlama", 5)
+        
+        self.assertEqual(self.engine.calls, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(self.cached.cache.get_stats()["hits"], 1)
+    
+    def test_bypass_forces_live_request(self):
+        """bypass_cache bloğu içinde her arama canlı yapılmalı."""
+        self.cached.search("python", 5)
+        with self.cached.bypass_cache():
+            self.cached.search("python", 5)
+        
+        self.assertEqual(self.engine.calls, 2)
+    
+    def test_settings_key_follows_engine(self):
+        """Hız sınırı tanımları sarmalayıcının değil, sarılan motorun adıyla aranmalı."""
+        self.assertEqual(self.cached.settings_key, "CountingSearch")
+    
+    def test_bypass_is_scoped_to_context(self):
+        """Atlama yalnızca bloğu açan eşyordamı etkilemeli ve iş parçacığı havuzuna taşınmalı."""
+        cache = ResponseCache(path=os.path.join(tempfile.mkdtemp(), "cache.sqlite"))
+        self.addCleanup(cache.close)
+        seen = {}
+        
+        class ProbeSearch(CountingSearch):
+            def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+                time.sleep(0.05)
+                seen[query] = cache.is_bypassed
+                return super().search(query, num_results)
+        
+        async def bypassed():
+            with cache.bypass_cache():
+                await asyncio.sleep(0.01)
+                await ProbeSearch().async_search("atla", 1)
+        
+        async def run():
+            await asyncio.gather(bypassed(), ProbeSearch().async_search("oku", 1))
+        
+        asyncio.run(run())
+        self.assertEqual(seen, {"atla": True, "oku": False})
+        self.assertFalse(cache.is_bypassed)
+
+
+class FakeResponse:
+    """requests.Response yerine kullanılan basit yanıt."""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+    
+    def json(self) -> Dict[str, Any]:
+        return self.data
+
+
+class FakeAPISearch(BaseAPISearch):
+    """Ağa çıkmadan sabit JSON döndüren sahte API motoru."""
+    
+    cache_key_params = ("gl", "hl")
+    
+    def __init__(self, delay: float = 0.05):
+        super().__init__(name="Sahte API", source_url="https://example.com", license_type="Test", api_key="x")
+        self.delay = delay
+        self.calls = 0
+        self.gl = "tr"
+    
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
+        return {"method": "POST", "url": "https://example.com", "json": {"q": query, "gl": self.gl, "hl": "tr"}}
+    
+    def _send_request(self, request: Dict[str, Any]) -> FakeResponse:
+        self.calls += 1
+        time.sleep(self.delay)
+        return FakeResponse({"organic": [{"title": request["json"]["q"], "link": "https://example.com"}]})
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        return [SearchResult(title=item["title"], link=item["link"], snippet="") for item in data["organic"]]
+
+
+class TestResponseCache(unittest.TestCase):
+    """SQLite tabanlı kalıcı yanıt önbelleğini test eder."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "responses.sqlite3")
+        self.engine = FakeAPISearch()
+        self.engine.response_cache = ResponseCache(self.path)
+    
+    def tearDown(self):
+        self.engine.response_cache.close()
+        self.directory.cleanup()
+    
+    def test_shared_across_instances(self):
+        """Aynı dosyayı açan başka bir önbellek kaydı ham yanıtıyla birlikte görmeli."""
+        self.engine.search("Python", 5)
+        
+        other = FakeAPISearch()
+        other.response_cache = ResponseCache(self.path)
+        results = other.search("python", 5)
+        
+        self.assertEqual(other.calls, 0)
+        self.assertEqual(results[0].title, "Python")
+        key = other.response_cache.make_key(other.name, "python", 5, {"gl": "tr", "hl": "tr"})
+        self.assertEqual(other.response_cache.get_raw(key)["organic"][0]["title"], "Python")
+        other.response_cache.close()
+    
+    def test_locale_params_are_part_of_key(self):
+        """Farklı yerel ayarla yapılan arama önbellekten dönmemeli."""
+        self.engine.search("python", 5)
+        self.engine.gl = "us"
+        self.engine.search("python", 5)
+        
+        self.assertEqual(self.engine.calls, 2)
+    
+    def test_evaluator_keeps_recorded_time(self):
+        """Önbellekten dönen ölçümler canlı isteğin süresini korumalı."""
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engine(self.engine)
+        results = evaluator.run_test("python", num_results=1, runs=3)
+        
+        self.assertEqual(self.engine.calls, 1)
+        self.assertGreaterEqual(results["Sahte API"]["min_response_time"], 0.05)
+        
+        live = SearchEngineEvaluator(force_live=True)
+        live.register_engine(self.engine)
+        live.run_test("python", num_results=1, runs=2)
+        self.assertEqual(self.engine.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+HTTP kaset (kayıt/oynatma) modülü için test modülü.
+
+Kayıt, yerel bir HTTP sunucusuna yapılan gerçek isteklerle yapılır;
+oynatma sunucu kapatıldıktan sonra test edilir.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+from src.core import SearchResult
+from src.cassette import Cassette, RECORD, REPLAY
+from src.engines.base import BaseAPISearch
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """Sorguyu başlık olarak geri döndüren basit sunucu."""
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(0.05)
+        payload = json.dumps({"organic": [{"title": body["q"], "link": "https://example.com"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSearch(BaseAPISearch):
+    """Yerel sunucuya istek yapan motor."""
+    
+    def __init__(self, base_url: str):
+        super().__init__(name="Yerel", source_url=base_url, license_type="Test", api_key="gizli")
+        self.base_url = base_url
+    
+    def _build_request(self, query: str, num_results: int) -> Dict[str, Any]:
+        return {"method": "POST", "url": self.base_url, "headers": {"X-API-KEY": self.api_key},
+                "json": {"q": query, "num": num_results}}
+    
+    def _parse_response(self, data: Dict[str, Any], num_results: int) -> List[SearchResult]:
+        return [SearchResult(title=item["title"], link=item["link"], snippet="") for item in data["organic"]]
+
+
+class TestCassette(unittest.TestCase):
+    """Kayıt ve oynatma akışını test eder."""
+    
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "kaset.jsonl.gz")
+        
+        server = ThreadingHTTPServer(("127.0.0.1", 0), JSONHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.engine = LocalSearch(f"http://127.0.0.1:{server.server_address[1]}/search")
+        
+        with Cassette(self.path, mode=RECORD).use():
+            self.assertEqual(self.engine.search("python", 3)[0].title, "python")
+        
+        server.shutdown()
+        server.server_close()
+        self.engine.reset_session()
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_replay_without_network(self):
+        """Sunucu kapalıyken aynı istek kasetten yanıtlanmalı."""
+        with Cassette(self.path, mode=REPLAY).use():
+            results = self.engine.search("python", 3)
+            missing = self.engine.search("java", 3)
+        
+        self.assertEqual(results[0].title, "python")
+        self.assertEqual(missing, [])
+    
+    def test_secrets_are_not_recorded(self):
+        """API anahtarı kasete yazılmamalı."""
+        cassette = Cassette(self.path, mode=REPLAY)
+        
+        self.assertEqual(len(cassette), 1)
+        self.assertNotIn("gizli", json.dumps(cassette.entries))
+    
+    def test_replay_latency(self):
+        """replay_latency açıkken kaydedilen süre kadar beklenmeli."""
+        cassette = Cassette(self.path, mode=REPLAY, replay_latency=True)
+        with cassette.use():
+            _, elapsed_time = self.engine.measure_search_time("python", 3)
+        
+        self.assertGreaterEqual(elapsed_time, cassette.entries[0]["elapsed_time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
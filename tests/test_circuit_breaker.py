@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Devre kesici ve negatif önbellek için test modülü.
+"""
+
+import tempfile
+import time
+import unittest
+
+from src.engines import SerperSearch
+from src.mock_server import MockSearchServer, MockEngineConfig
+from src.circuit_breaker import (CircuitBreaker, CircuitBreakerSpec, CircuitBreakerRegistry, CircuitOpenError,
+                                 NegativeCache, CLOSED, OPEN, HALF_OPEN)
+from src.evaluator import SearchEngineEvaluator
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Durum geçişlerini, negatif önbelleği ve değerlendirici entegrasyonunu test eder."""
+    
+    def test_state_transitions(self):
+        """Hata oranı eşiği aşılınca devre açılmalı, bekleme sonrası deneme isteğiyle kapanmalı."""
+        breaker = CircuitBreaker(CircuitBreakerSpec(minimum_calls=4, open_duration=0.05))
+        for _ in range(2):
+            breaker.record_success(0.1)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow_request())
+        
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        # Yarı açık durumda yalnızca bir deneme isteğine izin verilir
+        self.assertFalse(breaker.allow_request())
+        breaker.record_success(0.1)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.get_stats()["trips"], 1)
+        self.assertEqual(breaker.get_stats()["rejected"], 2)
+    
+    def test_slow_calls_trip(self):
+        """Yavaş çağrı oranı eşiği aşılınca devre açılmalı; başarısız deneme devreyi yeniden açmalı."""
+        spec = CircuitBreakerSpec(slow_call_threshold=1.0, slow_call_rate_threshold=0.5, minimum_calls=2,
+                                  open_duration=0.0)
+        breaker = CircuitBreaker(spec)
+        breaker.record_success(2.0)
+        breaker.record_success(2.5)
+        self.assertEqual(breaker.trips, 1)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.trips, 2)
+    
+    def test_negative_cache(self):
+        """Negatif önbellek kayıtları süre dolunca silinmeli."""
+        cache = NegativeCache(ttl=0.05)
+        key = cache.make_key("Motor", "  Python  Programming", 5)
+        cache.put(key, "500 Server Error")
+        self.assertEqual(cache.get(cache.make_key("Motor", "python programming", 5)), "500 Server Error")
+        time.sleep(0.06)
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(cache.hits, 1)
+    
+    def test_batch_skips_failing_engine(self):
+        """Toplu testte hata veren motor devre açıldıktan sonra istek gönderilmeden atlanmalı."""
+        server = MockSearchServer({"serper": MockEngineConfig(error_rate=1.0)})
+        engine = SerperSearch(api_key="test")
+        registry = CircuitBreakerRegistry(default_spec=CircuitBreakerSpec(minimum_calls=3), negative_cache_ttl=0)
+        evaluator = SearchEngineEvaluator(max_workers=1, circuit_breakers=registry)
+        evaluator.register_engine(engine)
+        queries = [f"sorgu {i}" for i in range(10)]
+        
+        with server.running():
+            server.point(engine)
+            summary = evaluator.run_batch(queries, num_results=3)[engine.name]
+        
+        self.assertEqual(summary["failed_runs"], 0)  # hatalar boş sonuçla döner
+        self.assertEqual(summary["skipped_runs"], 7)
+        self.assertEqual(summary["circuit_breaker"]["state"], OPEN)
+        self.assertEqual(summary["circuit_breaker"]["trips"], 1)
+        self.assertEqual(evaluator.results["sorgu 9"][engine.name]["error"], "Devre açık, atlandı")
+        
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(evaluator.generate_report(output_dir), encoding="utf-8") as f:
+                report = f.read()
+        self.assertIn("## Devre Kesici", report)
+    
+    def test_negative_cache_in_single_test(self):
+        """Başarısız motor × sorgu çifti aynı testin sonraki çalıştırmalarında yeniden denenmemeli."""
+        server = MockSearchServer({"serper": MockEngineConfig(error_rate=1.0)})
+        engine = SerperSearch(api_key="test")
+        registry = CircuitBreakerRegistry()
+        evaluator = SearchEngineEvaluator(circuit_breakers=registry)
+        evaluator.register_engine(engine)
+        
+        with server.running():
+            server.point(engine)
+            data = evaluator.run_test("python", num_results=3, runs=3)[engine.name]
+        
+        self.assertEqual(data["skipped"], 2)
+        self.assertEqual(registry.negative_cache.hits, 2)
+        with self.assertRaises(CircuitOpenError):
+            with registry.guard(engine, "Python", 3):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Merkezi kimlik bilgisi sağlayıcısı için test modülü.
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.config.settings import get_api_keys
+from src.credentials import CredentialProvider, get_credentials, set_credentials
+from src.engines import SerperSearch, GoogleSearch
+
+
+class TestCredentialProvider(unittest.TestCase):
+    """Tek seferlik yüklemeyi, öncelik sırasını, yeniden yüklemeyi ve enjeksiyonu test eder."""
+    
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".env")
+        os.close(handle)
+        self._write("TEST_CRED_KEY=ilk\nTEST_CRED_OTHER=dosya\n", mtime=1_000_000)
+    
+    def tearDown(self):
+        os.remove(self.path)
+        os.environ.pop("TEST_CRED_OTHER", None)
+    
+    def _write(self, content, mtime):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.utime(self.path, (mtime, mtime))
+    
+    def test_loads_once_and_precedence(self):
+        """Dosya bir kez okunmalı; doğrudan değerler ve çevre değişkenleri önce gelmeli."""
+        credentials = CredentialProvider(self.path, values={"TEST_CRED_KEY": "doğrudan"})
+        os.environ["TEST_CRED_OTHER"] = "ortam"
+        for _ in range(3):
+            self.assertEqual(credentials.get("TEST_CRED_KEY"), "doğrudan")
+            self.assertEqual(credentials.get("TEST_CRED_OTHER"), "ortam")
+            self.assertIsNone(credentials.get("TEST_CRED_MISSING"))
+        self.assertEqual(credentials.loads, 1)
+        self.assertEqual(CredentialProvider(self.path, use_environ=False).get("TEST_CRED_OTHER"), "dosya")
+    
+    def test_reload_on_change(self):
+        """Dosya değiştiğinde değerler yeniden yüklenmeli; değişmediyse yüklenmemeli."""
+        credentials = CredentialProvider(self.path, check_interval=0)
+        self.assertEqual(credentials.get("TEST_CRED_KEY"), "ilk")
+        self.assertEqual(credentials.get("TEST_CRED_KEY"), "ilk")
+        self.assertEqual(credentials.loads, 1)
+        
+        self._write("TEST_CRED_KEY=yeni\n", mtime=2_000_000)
+        self.assertEqual(credentials.get("TEST_CRED_KEY"), "yeni")
+        self.assertEqual(credentials.loads, 2)
+        
+        frozen = CredentialProvider(self.path, check_interval=None)
+        frozen.get("TEST_CRED_KEY")
+        self._write("TEST_CRED_KEY=son\n", mtime=3_000_000)
+        self.assertEqual(frozen.get("TEST_CRED_KEY"), "yeni")
+        frozen.reload()
+        self.assertEqual(frozen.get("TEST_CRED_KEY"), "son")
+    
+    def test_engine_injection(self):
+        """Motorlar verilen sağlayıcıdan, verilmezse varsayılan sağlayıcıdan okumalı."""
+        credentials = CredentialProvider("", values={"SERPER_API_KEY": "serper", "GOOGLE_API_KEY": "g",
+                                                     "GOOGLE_CX": "cx"})
+        self.assertEqual(SerperSearch(credentials=credentials).api_key, "serper")
+        google = GoogleSearch(credentials=credentials)
+        self.assertEqual((google.api_key, google.cx), ("g", "cx"))
+        self.assertEqual(SerperSearch(api_key="açık", credentials=credentials).api_key, "açık")
+        
+        previous = get_credentials()
+        set_credentials(credentials)
+        try:
+            self.assertIs(SerperSearch().credentials, credentials)
+            self.assertEqual(SerperSearch().api_key, "serper")
+        finally:
+            set_credentials(previous)
+    
+    def test_api_keys_read_at_use_time(self):
+        """get_api_keys içe aktarma anındaki değil, o anki sağlayıcının değerlerini döndürmeli."""
+        previous = get_credentials()
+        set_credentials(CredentialProvider("", values={"GOOGLE_API_KEY": "g", "GOOGLE_CX": "cx"}, use_environ=False))
+        try:
+            self.assertEqual(get_api_keys("google"), {"api_key": "g", "cx": "cx"})
+            self.assertEqual(get_api_keys("bing"), {"api_key": None})
+            self.assertEqual(get_api_keys("bilinmeyen"), {})
+        finally:
+            set_credentials(previous)
+
+
+if __name__ == "__main__":
+    unittest.main()
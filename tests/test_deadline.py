@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Arama süre sınırı (deadline) için test modülü.
+"""
+
+import asyncio
+import time
+import unittest
+
+from src.engines import SerperSearch
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+from src.deadline import SearchTimeoutError, deadline, request_timeout, check_deadline
+from src.evaluator import SearchEngineEvaluator
+
+
+class TestDeadline(unittest.TestCase):
+    """Süre sınırının HTTP isteklerine iletilmesini ve değerlendiricide sayılmasını test eder."""
+    
+    def setUp(self):
+        self.server = MockSearchServer({
+            "serper": MockEngineConfig(latency=LatencyDistribution.constant(0.5))
+        })
+        self.engine = SerperSearch(api_key="test")
+    
+    def test_nested_deadlines(self):
+        """İç içe süre sınırlarında daha erken biten geçerli olmalı."""
+        self.assertEqual(request_timeout(10), 10)
+        with deadline(0.2):
+            with deadline(5.0):
+                self.assertLessEqual(request_timeout(10), 0.2)
+            time.sleep(0.25)
+            with self.assertRaises(SearchTimeoutError):
+                check_deadline()
+    
+    def test_search_timeout_raises(self):
+        """Süre bütçesini aşan arama boş liste yerine SearchTimeoutError fırlatmalı."""
+        with self.server.running():
+            self.server.point(self.engine)
+            start_time = time.monotonic()
+            with self.assertRaises(SearchTimeoutError):
+                self.engine.search("python", 3, timeout=0.1)
+            self.assertLess(time.monotonic() - start_time, 0.4)
+            
+            with self.assertRaises(SearchTimeoutError):
+                asyncio.run(self.engine.async_search("python", 3, timeout=0.1))
+            
+            self.assertEqual(len(self.engine.search("python", 3, timeout=2.0)), 3)
+    
+    def test_evaluator_counts_timeouts(self):
+        """Değerlendirici zaman aşımlarını genel hatalardan ayrı kaydetmeli."""
+        evaluator = SearchEngineEvaluator(engine_timeouts={"SerperSearch": 0.1})
+        evaluator.register_engine(self.engine)
+        with self.server.running():
+            self.server.point(self.engine)
+            data = evaluator.run_test("python", num_results=3, runs=2)[self.engine.name]
+            summary = evaluator.run_batch(["python", "java"], num_results=3)
+        
+        self.assertEqual(data["error"], "Zaman aşımı")
+        self.assertEqual(data["timeouts"], 2)
+        self.assertEqual(summary[self.engine.name]["timeout_runs"], 2)
+        self.assertEqual(summary[self.engine.name]["failed_runs"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
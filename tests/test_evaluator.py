@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+SearchEngineEvaluator için test modülü.
+
+Bu modül, ağ bağlantısı gerektirmeyen sahte motorlarla
+değerlendiricinin davranışını test eder.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from typing import List
+
+from src.core import SearchEngine, SearchResult
+from src.evaluator import SearchEngineEvaluator
+
+
+class SleepySearch(SearchEngine):
+    """Belirli bir süre bekleyip sabit sonuç döndüren sahte motor."""
+    
+    def __init__(self, name: str, delay: float):
+        super().__init__(name=name, source_url="https://example.com", license_type="Test")
+        self.delay = delay
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        time.sleep(self.delay)
+        return [
+            SearchResult(title=f"{self.name} {i}", link=f"https://example.com/{i}", snippet=query)
+            for i in range(num_results)
+        ]
+
+
+class TestParallelRunTest(unittest.TestCase):
+    """run_test paralel modunu test eder."""
+    
+    def setUp(self):
+        self.evaluator = SearchEngineEvaluator()
+        self.evaluator.register_engines([
+            SleepySearch("Motor A", 0.2),
+            SleepySearch("Motor B", 0.2),
+            SleepySearch("Motor C", 0.2),
+        ])
+    
+    def test_parallel_is_faster_than_sum(self):
+        """Paralel modda toplam süre, motor sürelerinin toplamından kısa olmalı."""
+        start_time = time.time()
+        self.evaluator.run_test("python", num_results=2, runs=1, parallel=True)
+        elapsed_time = time.time() - start_time
+        
+        self.assertLess(elapsed_time, 0.5)
+    
+    def test_parallel_result_shape(self):
+        """Paralel mod sıralı mod ile aynı sonuç yapısını döndürmeli."""
+        parallel_results = self.evaluator.run_test("python", num_results=2, runs=1, parallel=True)
+        serial_results = self.evaluator.run_test("java", num_results=2, runs=1)
+        
+        self.assertEqual(list(parallel_results.keys()), ["Motor A", "Motor B", "Motor C"])
+        for engine_name, data in parallel_results.items():
+            self.assertEqual(set(data.keys()), set(serial_results[engine_name].keys()))
+            self.assertGreaterEqual(data["avg_response_time"], 0.2)
+            self.assertEqual(data["results_count"], 2)
+    
+    
+    def test_latency_percentiles(self):
+        """Sonuç sözlüğü ve rapor gecikme yüzdeliklerini içermeli."""
+        results = self.evaluator.run_test("python", num_results=2, runs=4, parallel=True)
+        percentiles = results["Motor A"]["latency_percentiles"]
+        
+        self.assertEqual(percentiles["count"], 4)
+        self.assertGreaterEqual(percentiles["p50"], 0.2)
+        self.assertLessEqual(percentiles["p50"], percentiles["p99.9"])
+        self.assertEqual(self.evaluator.get_latency_percentiles()["Motor B"]["count"], 4)
+        
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(self.evaluator.generate_report(output_dir), encoding="utf-8") as f:
+                report = f.read()
+        self.assertIn("## Gecikme Yüzdelikleri", report)
+        self.assertIn("p99.9", report)
+
+
+class FirstSlowSearch(SleepySearch):
+    """İlk çağrısı yavaş olan (soğuk bağlantıyı taklit eden) sahte motor."""
+    
+    def __init__(self, name: str, delay: float, first_delay: float):
+        super().__init__(name, delay)
+        self.first_delay = first_delay
+        self.calls = 0
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        self.calls += 1
+        if self.calls == 1:
+            time.sleep(self.first_delay)
+        return super().search(query, num_results)
+
+
+class TestRobustStatistics(unittest.TestCase):
+    """Isınma çalıştırmalarını ve güven aralığı karşılaştırmasını test eder."""
+    
+    def test_warmup_runs_are_excluded(self):
+        """Isınma çalıştırması istatistiklere girmemeli, soğuk süre olarak raporlanmalı."""
+        evaluator = SearchEngineEvaluator(warmup_runs=1)
+        engine = FirstSlowSearch("Motor A", 0.01, first_delay=0.2)
+        evaluator.register_engine(engine)
+        
+        data = evaluator.run_test("python", num_results=2, runs=3)["Motor A"]
+        
+        self.assertEqual(engine.calls, 4)
+        self.assertEqual(data["latency_percentiles"]["count"], 3)
+        self.assertLess(data["max_response_time"], 0.2)
+        self.assertGreaterEqual(data["cold_response_time"], 0.2)
+        self.assertLess(data["robust_stats"]["median"], 0.2)
+    
+    def test_batch_reports_cold_run(self):
+        """Toplu çalıştırmada her motorun ilk çalıştırması soğuk sayılmalı, sıcak ortalamaya girmemeli."""
+        engine = FirstSlowSearch("Motor A", 0.01, first_delay=0.2)
+        evaluator = SearchEngineEvaluator(max_workers=4)
+        evaluator.register_engine(engine)
+        
+        summary = evaluator.run_batch(["python", "java"], num_results=2, runs=3)["Motor A"]
+        first_query = evaluator.results["python"]["Motor A"]
+        
+        self.assertEqual(summary["successful_runs"], 6)
+        self.assertGreaterEqual(summary["cold_response_time"], 0.2)
+        self.assertLess(summary["warm_avg_response_time"], 0.2)
+        self.assertEqual(first_query["cold_response_time"], summary["cold_response_time"])
+        self.assertLess(first_query["warm_avg_response_time"], 0.2)
+        self.assertIsNone(evaluator.results["java"]["Motor A"]["cold_response_time"])
+    
+    def test_overlapping_intervals_are_not_significant(self):
+        """Güven aralıkları örtüşen motorlar anlamlı farklı sayılmamalı."""
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engines([
+            SleepySearch("Motor A", 0.01),
+            SleepySearch("Motor B", 0.01),
+            SleepySearch("Motor C", 0.1),
+        ])
+        evaluator.run_test("python", num_results=1, runs=5)
+        
+        comparison = {entry["engine"]: entry for entry in evaluator.compare_engines("python")}
+        fastest = evaluator.compare_engines("python")[0]["engine"]
+        
+        self.assertIn(fastest, ("Motor A", "Motor B"))
+        self.assertIsNone(comparison[fastest]["significant"])
+        self.assertTrue(comparison["Motor C"]["significant"])
+        
+        with tempfile.TemporaryDirectory() as output_dir:
+            with open(evaluator.generate_report(output_dir), encoding="utf-8") as f:
+                report = f.read()
+        self.assertIn("## İstatistiksel Karşılaştırma", report)
+
+
+class TestAsyncRunTest(unittest.TestCase):
+    """async_run_test asenkron yolunu test eder."""
+    
+    def test_async_run_test_matches_shape(self):
+        """Asenkron yol motorları aynı anda çalıştırmalı ve aynı yapıyı döndürmeli."""
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engines([SleepySearch("Motor A", 0.2), SleepySearch("Motor B", 0.2)])
+        
+        start_time = time.time()
+        results = asyncio.run(evaluator.async_run_test("python", num_results=3, runs=1))
+        elapsed_time = time.time() - start_time
+        
+        self.assertLess(elapsed_time, 0.4)
+        self.assertEqual(list(results.keys()), ["Motor A", "Motor B"])
+        self.assertEqual(results["Motor A"]["results_count"], 3)
+        self.assertIn("python", evaluator.results)
+
+
+class TestRunBatch(unittest.TestCase):
+    """run_batch toplu çalıştırıcısını test eder."""
+    
+    def test_run_batch_aggregates_per_engine(self):
+        """Her sorgu için sonuç saklanmalı ve motor bazında özet üretilmeli."""
+        evaluator = SearchEngineEvaluator(max_workers=8)
+        evaluator.register_engines([SleepySearch("Motor A", 0.05), SleepySearch("Motor B", 0.05)])
+        
+        queries = ["python", "java", "rust", "go"]
+        summary = evaluator.run_batch(queries, num_results=2, runs=2)
+        
+        self.assertEqual(set(evaluator.results.keys()), set(queries))
+        self.assertEqual(set(evaluator.results["rust"].keys()), {"Motor A", "Motor B"})
+        self.assertEqual(summary["Motor A"]["successful_runs"], 8)
+        self.assertEqual(summary["Motor A"]["answered_queries"], 4)
+        self.assertEqual(summary["Motor B"]["failed_runs"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Gecikme histogramı için test modülü.
+"""
+
+import math
+import random
+import unittest
+
+from src.histogram import LatencyHistogram, RollingLatencyHistogram, NS_PER_SECOND
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """LatencyHistogram yüzdelik hassasiyetini ve bellek sınırını test eder."""
+    
+    def setUp(self):
+        rng = random.Random(42)
+        self.values = [int(rng.lognormvariate(math.log(0.2 * NS_PER_SECOND), 1.0)) for _ in range(50000)]
+        self.histogram = LatencyHistogram()
+        for value in self.values:
+            self.histogram.record(value)
+    
+    def test_percentiles_within_precision(self):
+        """Yüzdelikler gerçek değerlerden en fazla 3 anlamlı basamak kadar sapmalı."""
+        values = sorted(self.values)
+        for percentile in (50, 90, 95, 99, 99.9):
+            exact = values[math.ceil(percentile / 100 * len(values)) - 1]
+            self.assertAlmostEqual(self.histogram.value_at_percentile(percentile) / exact, 1.0, delta=0.001)
+        
+        self.assertEqual(self.histogram.value_at_percentile(100), max(self.values))
+    
+    def test_bounded_memory(self):
+        """Saklanan kova sayısı ölçüm sayısından çok küçük olmalı."""
+        self.assertLess(len(self.histogram._counts), len(self.values) / 4)
+    
+    def test_merge(self):
+        """Birleştirilen histogram tüm ölçümleri içermeli."""
+        other = LatencyHistogram.from_seconds([0.001, 5.0])
+        other.merge(self.histogram)
+        summary = other.to_dict()
+        
+        self.assertEqual(summary["count"], len(self.values) + 2)
+        self.assertAlmostEqual(summary["min"], 0.001)
+        self.assertIn("p99.9", summary)
+
+
+class TestRollingLatencyHistogram(unittest.TestCase):
+    """Kayan pencereli histogramı test eder."""
+    
+    def test_old_values_roll_out(self):
+        """Pencereden çıkan eski ölçümler yüzdelikleri etkilememeli."""
+        histogram = RollingLatencyHistogram(window=10)
+        for _ in range(10):
+            histogram.record_seconds(5.0)
+        self.assertAlmostEqual(histogram.percentile(95), 5.0, delta=0.01)
+        
+        for _ in range(20):
+            histogram.record_seconds(0.1)
+        self.assertEqual(len(histogram), 20)
+        self.assertAlmostEqual(histogram.percentile(95), 0.1, delta=0.001)
+        self.assertIsNone(RollingLatencyHistogram().percentile(95))
+
+
+if __name__ == "__main__":
+    unittest.main()
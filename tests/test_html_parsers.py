@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+DuckDuckGo HTML ayrıştırıcıları için test modülü.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from src.engines.duck import DuckDuckGoSearch
+from src.html_parsers import (HTML_PARSERS, available_parsers, benchmark_parsers, get_parser,
+                              load_recorded_pages, parse_bs4, parse_streaming)
+from src.mock_server import _render_response
+
+# İç içe etiketler, karakter referansları ve eksik alanlar içeren sayfa
+TRICKY_PAGE = """<html><body><div class="results">
+<div class="result result--ad"><h2 class="result__title"><a href="https://ads.example.com">Reklam</a></h2></div>
+<div class="result results_links">
+  <div class="links_main"><h2 class="result__title"><a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fa%3Fx%3D1&amp;rut=abc"><b>Python</b> &amp; Veri</a></h2>
+  <a class="result__url" href="https://example.com/a">example.com/a</a>
+  <a class="result__snippet" href="https://example.com/a">Kısa <b>özet</b><br>ikinci satır</a></div>
+</div>
+<div class="result"><h2 class="result__title"><a href="https://example.org">Doğrudan</a></h2>
+  <div class="result__url">example.org</div></div>
+<div class="result"><div class="result__snippet">Başlıksız</div></div>
+</div></body></html>"""
+
+
+class TestHtmlParsers(unittest.TestCase):
+    """Ayrıştırıcıların bs4 ile aynı sonuçları üretmesini ve karşılaştırmayı test eder."""
+    
+    def test_parsers_match_bs4(self):
+        """Kullanılabilir tüm ayrıştırıcılar bs4 ile aynı sonuçları döndürmeli."""
+        pages = [TRICKY_PAGE, _render_response("duckduckgo", "python", 10)]
+        for name in available_parsers():
+            for page in pages:
+                for num_results in (1, 3, 10, 20):
+                    with self.subTest(parser=name, num_results=num_results):
+                        self.assertEqual(HTML_PARSERS[name](page, num_results), parse_bs4(page, num_results))
+    
+    def test_link_resolution(self):
+        """uddg yönlendirme bağlantısı çözülmeli, yoksa görünen URL kullanılmalı."""
+        results = parse_streaming(TRICKY_PAGE, 10)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[1].title, "Python & Veri")
+        self.assertEqual(results[1].link, "https://example.com/a?x=1")
+        self.assertEqual(results[2].link, "example.org")
+        self.assertEqual(results[3].snippet, "Başlıksız")
+    
+    def test_streaming_stops_early(self):
+        """Akışkan ayrıştırıcı istenen sayıda bloktan sonra sayfanın kalanını okumamalı."""
+        page = _render_response("duckduckgo", "python", 5) + "<div class='result'><h2 class='result__title'>"
+        self.assertEqual(len(parse_streaming(page, 2)), 2)
+        self.assertEqual(parse_streaming(page, 0), [])
+    
+    def test_get_parser(self):
+        """Varsayılan ayrıştırıcı kullanılabilir olmalı, bilinmeyen ad reddedilmeli."""
+        name, parser = get_parser()
+        self.assertIn(name, available_parsers())
+        self.assertIs(parser, HTML_PARSERS[name])
+        with self.assertRaises(ValueError):
+            get_parser("yok")
+    
+    def test_engine_falls_back_to_bs4(self):
+        """Seçilen ayrıştırıcı hata verirse motor bs4 ile yeniden denemeli."""
+        engine = DuckDuckGoSearch(parser="stream")
+        engine._html_parser = lambda data, num_results: 1 / 0
+        page = _render_response("duckduckgo", "python", 3)
+        self.assertEqual(engine._parse_response(page, 3), parse_bs4(page, 3))
+    
+    def test_benchmark_on_recorded_pages(self):
+        """Kasetteki DuckDuckGo yanıtları yüklenip karşılaştırılmalı."""
+        entries = [
+            {"request": {"method": "POST", "url": "https://html.duckduckgo.com/html/"},
+             "response": {"status": 200, "body": _render_response("duckduckgo", "python", 8)}},
+            {"request": {"method": "POST", "url": "https://google.serper.dev/search"},
+             "response": {"status": 200, "body": "{}"}},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "duck.jsonl.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                f.write("".join(json.dumps(entry) + "\n" for entry in entries))
+            pages = load_recorded_pages(path)
+        
+        self.assertEqual(len(pages), 1)
+        stats = benchmark_parsers(pages, num_results=5, repeat=2)
+        self.assertEqual(set(stats), set(available_parsers()))
+        for entry in stats.values():
+            self.assertEqual(entry["matches"], 1.0)
+            self.assertGreater(entry["per_page"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tembel motor kaydı ve başlangıç süresi ölçümü için test modülü.
+"""
+
+import sys
+import types
+import unittest
+
+import src.engines as engines
+from src.importtime import (parse_importtime, measure_import_time, check_startup,
+                            compare_to_baseline, STARTUP_SCENARIOS, FORBIDDEN_MODULES)
+
+SAMPLE_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | src.engines
+import time:       250 |        600 |   src.engines.serper
+import time:       350 |        350 |     src.engines.base
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """-X importtime ayrıştırmasını, denetimleri ve tembel yüklemeyi test eder."""
+    
+    def test_parse_importtime(self):
+        """Modül süreleri ve iç içe derinlik doğru ayrıştırılmalı."""
+        timings = parse_importtime(SAMPLE_OUTPUT)
+        self.assertEqual(timings["src.engines"].cumulative_us, 900)
+        self.assertEqual(timings["src.engines"].depth, 0)
+        self.assertEqual(timings["src.engines.base"].depth, 2)
+        self.assertEqual(timings["src.engines.serper"].self_us, 250)
+    
+    def test_checks(self):
+        """Yasaklı modül, bütçe ve temel ölçüm karşılaştırması sorunları raporlamalı."""
+        from src.importtime import ImportProfile
+        profile = ImportProfile("import src.engines", parse_importtime(SAMPLE_OUTPUT))
+        self.assertEqual(check_startup(profile, ["bs4"], budget_ms=5), [])
+        self.assertEqual(len(check_startup(profile, ["src.engines.serper", "src"], budget_ms=0.5)), 3)
+        self.assertEqual(compare_to_baseline({"serper": 110}, {"serper": 100}, tolerance=0.25), [])
+        self.assertEqual(len(compare_to_baseline({"serper": 130}, {"serper": 100}, tolerance=0.25)), 1)
+    
+    def test_startup_scenarios(self):
+        """Yalnızca kullanılan motorun modülü yüklenmeli; pdf ve HTML ayrıştırıcı yüklenmemeli."""
+        for name in ("engines", "serper"):
+            profile = measure_import_time(STARTUP_SCENARIOS[name], runs=1)
+            self.assertEqual(check_startup(profile, FORBIDDEN_MODULES[name]), [], name)
+        self.assertTrue(profile.loaded("src.engines.base"))
+    
+    def test_lazy_attribute_and_plugin_registration(self):
+        """Motor sınıfları ilk erişimde yüklenmeli; modül yolu verilen motorlar kayıt edilebilmeli."""
+        from src.engines.serper import SerperSearch
+        self.assertIs(engines.SerperSearch, SerperSearch)
+        self.assertIn("TavilySearch", dir(engines))
+        with self.assertRaises(AttributeError):
+            engines.MissingSearch
+        
+        plugin = types.ModuleType("test_plugin_engine")
+        plugin.PluginSearch = SerperSearch
+        sys.modules["test_plugin_engine"] = plugin
+        try:
+            engines.register_engine("plugin", "PluginSearch", "test_plugin_engine")
+            self.assertIs(engines.get_engine_class("plugin"), SerperSearch)
+            self.assertIn("plugin", engines.get_available_engines())
+        finally:
+            engines.AVAILABLE_ENGINES.pop("plugin", None)
+            engines._ENGINE_MODULES.pop("plugin", None)
+            del sys.modules["test_plugin_engine"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Meta arama motorları için test modülü.
+"""
+
+import asyncio
+import time
+import unittest
+from typing import List
+
+from src.core import SearchEngine, SearchResult
+from src.deadline import check_deadline
+from src.evaluator import SearchEngineEvaluator
+from src.meta import RaceSearch, HedgedSearch, FederatedSearch, reciprocal_rank_fusion
+from src.utils import canonicalize_url
+
+
+class FakeSearch(SearchEngine):
+    """Belirli bir süre bekleyip verilen bağlantıları döndüren sahte motor."""
+    
+    def __init__(self, name: str, delay: float, links: List[str]):
+        super().__init__(name=name, source_url=f"https://{name.lower()}.example.com", license_type="Test")
+        self.delay = delay
+        self.links = links
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        time.sleep(self.delay)
+        return [SearchResult(title=link, link=link, snippet=query) for link in self.links[:num_results]]
+    
+    async def async_search(self, query, num_results=10, session=None):
+        await asyncio.sleep(self.delay)
+        return [SearchResult(title=link, link=link, snippet=query) for link in self.links[:num_results]]
+
+
+class DeadlineAwareSearch(FakeSearch):
+    """Beklerken geçerli süre sınırını kontrol eden, sınır dolunca SearchTimeoutError fırlatan sahte motor."""
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        end = time.monotonic() + self.delay
+        while time.monotonic() < end:
+            check_deadline()
+            time.sleep(0.01)
+        return super().search(query, num_results)
+    
+    async def async_search(self, query, num_results=10, session=None):
+        end = time.monotonic() + self.delay
+        while time.monotonic() < end:
+            check_deadline()
+            await asyncio.sleep(0.01)
+        return await super().async_search(query, num_results, session=session)
+
+
+class TestRaceSearch(unittest.TestCase):
+    """RaceSearch meta motorunu test eder."""
+    
+    def setUp(self):
+        self.race = RaceSearch([
+            FakeSearch("Yavaş", 0.3, ["https://slow.example.com"]),
+            FakeSearch("Boş", 0.0, []),
+            FakeSearch("Hızlı", 0.05, ["https://fast.example.com"]),
+        ])
+        self.addCleanup(self.race.close)
+    
+    def test_first_non_empty_result_wins(self):
+        """Boş sonuç döndüren motor yarışı kazanamamalı; yavaş motor beklenmemeli."""
+        results, elapsed_time = self.race.measure_search_time("python", 3)
+        
+        self.assertEqual(results[0].link, "https://fast.example.com")
+        self.assertEqual(self.race.last_winner, "Hızlı")
+        self.assertLess(elapsed_time, 0.25)
+    
+    def test_async_race_cancels_stragglers(self):
+        """Asenkron yolda kazanan belli olunca diğer istekler iptal edilmeli."""
+        results = asyncio.run(self.race.async_search("python", 3))
+        
+        self.assertEqual(results[0].link, "https://fast.example.com")
+        self.assertEqual(self.race.get_engine_info()["wins"]["Hızlı"], 1)
+    
+    def test_timeout_is_a_single_deadline(self):
+        """Boş sonuçlar bekleme süresini yeniden başlatmamalı; iptal edilen istekler beklenmeli."""
+        finished = []
+        
+        class TrackedSearch(FakeSearch):
+            async def async_search(self, query, num_results=10, session=None):
+                try:
+                    return await super().async_search(query, num_results, session)
+                finally:
+                    finished.append(self.name)
+        
+        race = RaceSearch([TrackedSearch(f"Boş{i}", 0.1 * i, []) for i in (1, 2, 3)]
+                          + [TrackedSearch("Yavaş", 1.0, ["https://slow.example.com"])], timeout=0.25)
+        self.addCleanup(race.close)
+        
+        results, elapsed_time = race.measure_search_time("python", 1)
+        self.assertEqual(results, [])
+        self.assertLess(elapsed_time, 0.4)
+        
+        async def run():
+            start = time.perf_counter()
+            results = await race.async_search("python", 1)
+            return results, time.perf_counter() - start, sorted(finished)
+        
+        results, elapsed_time, done = asyncio.run(run())
+        self.assertEqual(results, [])
+        self.assertLess(elapsed_time, 0.4)
+        self.assertEqual(done, ["Boş1", "Boş2", "Boş3", "Yavaş"])
+    
+    def test_plugs_into_evaluator(self):
+        """RaceSearch değerlendiriciye diğer motorlar gibi kaydedilebilmeli."""
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engine(self.race)
+        data = evaluator.run_test("python", num_results=1, runs=2)["Yarış"]
+        
+        self.assertEqual(data["results_count"], 1)
+        self.assertEqual(data["engine_info"]["wins"], {"Yavaş": 0, "Boş": 0, "Hızlı": 2})
+
+
+class FlakySearch(FakeSearch):
+    """Belirli çağrılarda yavaşlayan sahte motor."""
+    
+    def __init__(self, name: str, delay: float, links: List[str], slow_calls: set, slow_delay: float):
+        super().__init__(name, delay, links)
+        self.slow_calls = slow_calls
+        self.slow_delay = slow_delay
+        self.calls = 0
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        self.calls += 1
+        if self.calls in self.slow_calls:
+            time.sleep(self.slow_delay)
+        return super().search(query, num_results)
+
+
+class TestHedgedSearch(unittest.TestCase):
+    """HedgedSearch sarmalayıcısını test eder."""
+    
+    def test_hedge_delay_adapts_to_p95(self):
+        """Yeterli ölçümden sonra bekleme süresi birincil motorun p95 gecikmesine uymalı."""
+        hedged = HedgedSearch(FakeSearch("Motor", 0.02, ["https://a.example.com"]), initial_delay=5.0, min_samples=5)
+        self.addCleanup(hedged.close)
+        
+        self.assertEqual(hedged.settings_key, "FakeSearch")
+        self.assertEqual(hedged.hedge_delay(), 5.0)
+        for _ in range(5):
+            hedged.search("python", 1)
+        
+        self.assertGreaterEqual(hedged.hedge_delay(), 0.02)
+        self.assertLess(hedged.hedge_delay(), 0.2)
+        self.assertEqual(hedged.hedged_requests, 0)
+    
+    def test_slow_primary_is_hedged(self):
+        """Birincil motor bekleme süresini aşarsa yedek motorun sonucu dönmeli."""
+        primary = FlakySearch("Birincil", 0.01, ["https://primary.example.com"], slow_calls={2}, slow_delay=0.5)
+        fallback = FakeSearch("Yedek", 0.01, ["https://fallback.example.com"])
+        hedged = HedgedSearch(primary, fallback=fallback, initial_delay=0.05)
+        self.addCleanup(hedged.close)
+        
+        self.assertEqual(hedged.search("python", 1)[0].link, "https://primary.example.com")
+        results, elapsed_time = hedged.measure_search_time("python", 1)
+        
+        self.assertEqual(results[0].link, "https://fallback.example.com")
+        self.assertLess(elapsed_time, 0.3)
+        info = hedged.get_engine_info()["hedging"]
+        self.assertEqual((info["requests"], info["hedged_requests"], info["backup_wins"]), (2, 1, 1))
+    
+    def test_async_hedging(self):
+        """Asenkron yolda da yavaş birincil istek yedeklenmeli."""
+        hedged = HedgedSearch(FakeSearch("Birincil", 0.5, ["https://primary.example.com"]),
+                              fallback=FakeSearch("Yedek", 0.01, ["https://fallback.example.com"]),
+                              initial_delay=0.05)
+        self.addCleanup(hedged.close)
+        
+        results = asyncio.run(hedged.async_search("python", 1))
+        self.assertEqual(results[0].link, "https://fallback.example.com")
+        self.assertEqual(hedged.backup_wins, 1)
+        # İptal edilen birincil isteğin geçen süresi de kaydedilmeli
+        self.assertEqual(len(hedged.latencies), 1)
+        self.assertGreaterEqual(hedged.latencies.percentile(100), 0.05)
+    
+    def test_empty_or_failed_primary_is_hedged(self):
+        """Birincil motor hızlıca boş sonuç veya hata döndürürse yedek istek hemen gönderilmeli."""
+        class FailingSearch(FakeSearch):
+            def search(self, query, num_results=10):
+                raise RuntimeError("kota aşıldı")
+            
+            async def async_search(self, query, num_results=10, session=None):
+                raise RuntimeError("kota aşıldı")
+        
+        fallback = FakeSearch("Yedek", 0.01, ["https://fallback.example.com"])
+        for primary in (FakeSearch("Boş", 0.0, []), FailingSearch("Hatalı", 0.0, [])):
+            hedged = HedgedSearch(primary, fallback=fallback, initial_delay=5.0)
+            self.addCleanup(hedged.close)
+            with self.subTest(primary=primary.name):
+                results, elapsed_time = hedged.measure_search_time("python", 1)
+                self.assertEqual(results[0].link, "https://fallback.example.com")
+                self.assertLess(elapsed_time, 1.0)
+                results = asyncio.run(hedged.async_search("python", 1))
+                self.assertEqual(results[0].link, "https://fallback.example.com")
+                self.assertEqual((hedged.hedged_requests, hedged.backup_wins), (2, 2))
+
+
+class TestFederatedSearch(unittest.TestCase):
+    """FederatedSearch ve reciprocal-rank fusion birleştirmesini test eder."""
+    
+    def test_canonicalize_url(self):
+        """Aynı sayfanın farklı yazımları aynı kanonik bağlantıya dönüşmeli."""
+        canonical = "https://example.com/python?a=1&b=2"
+        for url in ("http://www.Example.com/python/?b=2&a=1#giris",
+                    "https://example.com:443/python?a=1&utm_source=x&b=2&gclid=y",
+                    "example.com/python?a=1&b=2",
+                    "//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fpython%3Fa%3D1%26b%3D2&rut=abc"):
+            self.assertEqual(canonicalize_url(url), canonical, url)
+    
+    def test_reciprocal_rank_fusion(self):
+        """Birden fazla motorda üst sıralarda çıkan bağlantı öne geçmeli."""
+        def results(*links):
+            return [SearchResult(title=link, link=link, snippet="") for link in links]
+        
+        fused = reciprocal_rank_fusion({
+            "A": results("https://a.com", "https://shared.com", "https://a.com/"),
+            "B": results("https://b.com", "http://www.shared.com"),
+        })
+        
+        self.assertEqual([result.link for result in fused], ["https://shared.com", "https://a.com", "https://b.com"])
+    
+    def test_deadline_drops_slow_engines(self):
+        """Süre sınırını kaçıran motor birleştirmeye dahil edilmemeli."""
+        federated = FederatedSearch([
+            FakeSearch("A", 0.01, ["https://a.com", "https://shared.com"]),
+            FakeSearch("B", 0.02, ["https://shared.com/", "https://b.com"]),
+            FakeSearch("Yavaş", 0.5, ["https://slow.com"]),
+        ], deadline=0.2)
+        self.addCleanup(federated.close)
+        
+        results, elapsed_time = federated.measure_search_time("python", 10)
+        
+        self.assertLess(elapsed_time, 0.4)
+        # Birleştirilen bağlantı için en iyi sıradaki (B'nin ilk) sonuç kullanılır
+        self.assertEqual([result.link for result in results], ["https://shared.com/", "https://a.com", "https://b.com"])
+        self.assertEqual(federated.last_contributors, ["A", "B"])
+        self.assertEqual(federated.get_engine_info()["missed_deadline"]["Yavaş"], 1)
+        
+        async_results = asyncio.run(federated.async_search("python", 2))
+        self.assertEqual([result.link for result in async_results], ["https://shared.com/", "https://a.com"])
+    
+    def test_sub_engine_timeout_counts_as_missed_deadline(self):
+        """Süre sınırını kendisi uygulayıp zaman aşımına uğrayan alt motor geç kalan sayılmalı."""
+        federated = FederatedSearch([
+            FakeSearch("A", 0.01, ["https://a.com"]),
+            DeadlineAwareSearch("Yavaş", 0.5, ["https://slow.com"]),
+        ], deadline=0.1)
+        self.addCleanup(federated.close)
+        
+        with self.assertLogs("search_evaluator", level="WARNING") as logs:
+            results = federated.search("python", 10)
+            async_results = asyncio.run(federated.async_search("python", 10))
+        
+        self.assertEqual([result.link for result in results], ["https://a.com"])
+        self.assertEqual([result.link for result in async_results], ["https://a.com"])
+        self.assertEqual(federated.last_contributors, ["A"])
+        self.assertEqual(federated.get_engine_info()["missed_deadline"]["Yavaş"], 2)
+        self.assertFalse([line for line in logs.output if line.startswith("ERROR")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Yerel sahte arama sunucusu için test modülü.
+
+Gerçek motor sınıfları sahte sunucuya yönlendirilerek istek oluşturma ve
+ayrıştırma kodu ağa çıkmadan test edilir.
+"""
+
+import unittest
+
+from src.engines import SerperSearch, GoogleSearch, BingSearch, DuckDuckGoSearch, TavilySearch
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+
+
+class TestMockSearchServer(unittest.TestCase):
+    """Sahte sunucunun motor yanıt biçimlerini ve hata enjeksiyonunu test eder."""
+    
+    def test_real_engines_parse_mock_responses(self):
+        """Her motor kendi biçimindeki sahte yanıtı ayrıştırabilmeli."""
+        engines = [
+            SerperSearch(api_key="test"),
+            GoogleSearch(api_key="test", cx="test"),
+            BingSearch(api_key="test"),
+            TavilySearch(api_key="test"),
+            DuckDuckGoSearch(),
+        ]
+        
+        server = MockSearchServer()
+        with server.running():
+            for engine in engines:
+                server.point(engine)
+                results = engine.search("python programlama", 3)
+                
+                self.assertEqual(len(results), 3, engine.name)
+                self.assertEqual(results[0].title, "python programlama - Sonuç 1", engine.name)
+                self.assertEqual(results[0].link, "https://example.com/python-programlama/1", engine.name)
+    
+    def test_rate_limit_injection(self):
+        """429 oranı 1 olan uç nokta her istekte hata döndürmeli."""
+        server = MockSearchServer({
+            "serper": MockEngineConfig(latency=LatencyDistribution.constant(0.0), rate_limit_rate=1.0)
+        })
+        engine = SerperSearch(api_key="test")
+        
+        with server.running():
+            server.point(engine)
+            results = engine.search("python", 3)
+        
+        self.assertEqual(results, [])
+        self.assertEqual(server.stats["serper"]["rate_limited"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sayfalı motorlarda eşzamanlı sayfa istekleri için test modülü.
+"""
+
+import asyncio
+import time
+import unittest
+
+from src.engines import GoogleSearch, BingSearch
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+from src.rate_limiter import RateLimitScheduler, RateLimitSpec, pacing
+from src.evaluator import SearchEngineEvaluator
+
+
+class TestParallelPagination(unittest.TestCase):
+    """Sayfaların eşzamanlı istenmesini, sıralı birleştirilmesini ve erken durmayı test eder."""
+    
+    def setUp(self):
+        self.server = MockSearchServer({
+            "google": MockEngineConfig(latency=LatencyDistribution.constant(0.2)),
+            "bing": MockEngineConfig(total_results=60)
+        })
+        self.google = GoogleSearch(api_key="test", cx="test")
+    
+    def test_pages_fetched_concurrently_in_order(self):
+        """30 sonuç üç sayfalık gecikme yerine yaklaşık tek sayfalık sürede ve sırayla dönmeli."""
+        with self.server.running():
+            self.server.point(self.google)
+            start_time = time.monotonic()
+            results = self.google.search("python", 30)
+            elapsed_time = time.monotonic() - start_time
+        
+        self.assertEqual(len(results), 30)
+        self.assertEqual([r.link.rsplit("/", 1)[1] for r in results], [str(i) for i in range(1, 31)])
+        self.assertEqual(self.server.stats["google"]["requests"], 3)
+        self.assertLess(elapsed_time, 0.5)
+    
+    def test_pages_share_the_engine_rate_limit(self):
+        """Sayfalar kovadaki token kadar eşzamanlı, sonrası saniyedeki istek sınırıyla gönderilmeli."""
+        scheduler = RateLimitScheduler({"GoogleSearch": RateLimitSpec(requests_per_second=10, burst=3, max_concurrency=1)})
+        limiter = scheduler.limiter_for(self.google)
+        with self.server.running():
+            self.server.point(self.google)
+            start_time = time.monotonic()
+            # Değerlendiricinin yaptığı gibi: arama bir yuva ve token alır, ilk sayfa bu token'ı kullanır
+            with limiter.throttle(), pacing(scheduler, prepaid=self.google):
+                results = self.google.search("python", 50)
+            elapsed_time = time.monotonic() - start_time
+        
+        # İlk üç sayfa birlikte (~1 RTT), dördüncüsü token için 0.1 saniye bekler
+        self.assertEqual(len(results), 50)
+        self.assertEqual(limiter.get_stats()["requests"], 5)
+        self.assertGreaterEqual(limiter.get_stats()["max_wait_time"], 0.05)
+        self.assertLess(elapsed_time, 0.6)
+    
+    def test_single_page_search_counts_once(self):
+        """Değerlendiricide tek sayfalı arama sınırlayıcıdan bir kez, sayfalı arama sayfa başına bir kez geçmeli."""
+        scheduler = RateLimitScheduler.from_settings()
+        evaluator = SearchEngineEvaluator(rate_limiter=scheduler)
+        evaluator.register_engine(self.google)
+        with self.server.running():
+            self.server.point(self.google)
+            evaluator._measure(self.google, "python", 10)
+            self.assertEqual(scheduler.limiter_for(self.google).get_stats()["requests"], 1)
+            results, _, _, _ = evaluator._measure(self.google, "python", 30)
+        
+        self.assertEqual(len(results), 30)
+        self.assertEqual(scheduler.limiter_for(self.google).get_stats()["requests"], 4)
+    
+    def test_short_page_stops_early(self):
+        """Eksik dönen sayfadan sonraki sayfaların sonuçları kullanılmamalı."""
+        self.server.configs["google"] = MockEngineConfig(total_results=25)
+        with self.server.running():
+            self.server.point(self.google)
+            results = self.google.search("python", 100)
+            async_results = asyncio.run(self.google.async_search("python", 50))
+        
+        self.assertEqual(len(results), 25)
+        self.assertEqual(len(async_results), 25)
+        self.assertEqual(results[-1].link, "https://example.com/python/25")
+    
+    def test_google_cap_and_bing_offset(self):
+        """Google 100 sonuçla sınırlanmalı; Bing 50'lik sayfaları offset ile istemeli."""
+        self.assertEqual(len(self.google._page_offsets(250)), 10)
+        self.assertEqual(self.google._page_offsets(10), [(0, 10)])
+        
+        bing = BingSearch(api_key="test")
+        with self.server.running():
+            self.server.point(bing)
+            results = bing.search("python", 80)
+        
+        self.assertEqual(len(results), 60)
+        self.assertEqual(results[50].link, "https://example.com/python/51")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+İstek aşaması zamanlama modülü için test modülü.
+"""
+
+import asyncio
+import unittest
+
+from src.engines import SerperSearch
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+from src.phases import RequestPhases, PhaseStats, record_phases, phase_timer
+from src.evaluator import SearchEngineEvaluator
+from src.utils import create_async_session
+
+
+class TestRequestPhases(unittest.TestCase):
+    """Aşama ölçümünü ve motor bazında toplanmasını test eder."""
+    
+    def setUp(self):
+        self.server = MockSearchServer({
+            "serper": MockEngineConfig(latency=LatencyDistribution.constant(0.02))
+        })
+        self.engine = SerperSearch(api_key="test")
+    
+    def test_cold_and_warm_connection(self):
+        """Bağlantı aşaması yalnızca soğuk bağlantıda ölçülmeli; TTFB sunucu gecikmesini içermeli."""
+        with self.server.running():
+            self.server.point(self.engine)
+            with record_phases() as cold:
+                self.assertEqual(len(self.engine.search("python", 3)), 3)
+            with record_phases() as warm:
+                self.engine.search("python", 3)
+        
+        self.assertGreater(cold.get("connect"), 0)
+        self.assertEqual(warm.get("connect"), 0)
+        self.assertEqual(warm.get("dns"), 0)
+        for phases in (cold, warm):
+            self.assertGreaterEqual(phases.get("ttfb"), 0.02)
+            self.assertGreater(phases.get("parse"), 0)
+            self.assertGreater(phases.get("download"), 0)
+    
+    def test_async_phases(self):
+        """aiohttp yolunda TTFB ve ayrıştırma süreleri ölçülmeli."""
+        async def measure():
+            async with create_async_session() as session:
+                with record_phases() as phases:
+                    await self.engine.async_search("python", 3, session=session)
+            return phases
+        
+        with self.server.running():
+            self.server.point(self.engine)
+            phases = asyncio.run(measure())
+        
+        self.assertGreater(phases.get("connect"), 0)
+        self.assertGreaterEqual(phases.get("ttfb"), 0.02)
+        self.assertGreater(phases.get("parse"), 0)
+    
+    def test_evaluator_phase_breakdown(self):
+        """Değerlendirici aşama sürelerini sorgu ve motor bazında raporlamalı."""
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engine(self.engine)
+        with self.server.running():
+            self.server.point(self.engine)
+            results = evaluator.run_test("python", num_results=3, runs=2)
+        
+        breakdown = results[self.engine.name]["phase_breakdown"]
+        self.assertEqual(breakdown["requests"], 2)
+        self.assertAlmostEqual(breakdown["network"], sum(breakdown[p] for p in ("dns", "connect", "tls", "ttfb", "download")))
+        self.assertEqual(evaluator.get_phase_breakdown()[self.engine.name]["requests"], 2)
+    
+    def test_warmup_phases_are_excluded(self):
+        """Isınma çalıştırmalarının soğuk bağlantı aşamaları motorun aşama özetine girmemeli."""
+        evaluator = SearchEngineEvaluator(warmup_runs=2)
+        evaluator.register_engine(self.engine)
+        with self.server.running():
+            self.server.point(self.engine)
+            evaluator.run_test("python", num_results=3, runs=2)
+            evaluator.run_batch(["java"], num_results=3, runs=1)
+        
+        breakdown = evaluator.get_phase_breakdown()[self.engine.name]
+        self.assertEqual(breakdown["requests"], 3)
+        self.assertEqual(breakdown["connect"], 0)
+    
+    def test_phase_timer_without_recording(self):
+        """Etkin ölçüm yokken phase_timer hiçbir şey kaydetmemeli."""
+        with phase_timer("parse"):
+            pass
+        stats = PhaseStats()
+        self.assertEqual(stats.to_dict(), {"requests": 0})
+        phases = RequestPhases()
+        phases.add("parse", 0.5)
+        phases.add("parse", 0.25)
+        self.assertEqual(phases.get("parse"), 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Hız sınırlayıcı için test modülü.
+"""
+
+import threading
+import time
+import unittest
+
+from src.rate_limiter import TokenBucket, RateLimitSpec, EngineRateLimiter, RateLimitScheduler
+
+
+class TestTokenBucket(unittest.TestCase):
+    """TokenBucket davranışını test eder."""
+    
+    def test_burst_then_wait(self):
+        """Patlama kapasitesi kadar istek beklemeden geçmeli, sonrası beklemeli."""
+        bucket = TokenBucket(rate=10, capacity=3)
+        
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.02)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.02)
+
+
+class TestEngineRateLimiter(unittest.TestCase):
+    """EngineRateLimiter davranışını test eder."""
+    
+    def test_queue_wait_is_reported(self):
+        """Token beklenen süre kuyruk bekleme süresi olarak raporlanmalı."""
+        limiter = EngineRateLimiter(RateLimitSpec(requests_per_second=20, burst=1))
+        
+        waits = []
+        for _ in range(3):
+            with limiter.throttle() as wait_time:
+                waits.append(wait_time)
+        
+        self.assertLess(waits[0], 0.01)
+        self.assertGreater(waits[2], 0.04)
+        self.assertEqual(limiter.get_stats()["requests"], 3)
+    
+    def test_max_concurrency(self):
+        """Aynı anda en fazla max_concurrency istek çalışmalı."""
+        limiter = EngineRateLimiter(RateLimitSpec(max_concurrency=2))
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def worker():
+            with limiter.throttle():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.pop()
+        
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(max(peak), 2)
+
+
+class TestRateLimitScheduler(unittest.TestCase):
+    """RateLimitScheduler ayar okumayı test eder."""
+    
+    def test_from_settings(self):
+        """ENGINE_SETTINGS içindeki tanımlar okunmalı."""
+        spec = RateLimitSpec.from_settings({
+            "concurrent_requests": False,
+            "rate_limit": {"requests_per_second": 3, "burst": 3}
+        })
+        
+        self.assertEqual(spec.requests_per_second, 3)
+        self.assertEqual(spec.max_concurrency, 1)
+        self.assertIn("SerperSearch", RateLimitScheduler.from_settings().specs)
+
+
+if __name__ == "__main__":
+    unittest.main()
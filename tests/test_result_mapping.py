@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Derlenmiş JSON yolları ve motor sonuç eşlemeleri için test modülü.
+"""
+
+import unittest
+
+from src.core import SearchResult
+from src.engines.bing import BingSearch
+from src.engines.google import GoogleSearch
+from src.engines.searchapi import SearchApiSearch
+from src.credentials import CredentialProvider
+from src.mock_server import _render_response
+from src.utils import (ResultMapping, compile_json_path, compile_result_mapping,
+                       extract_data_from_json, extract_search_results)
+
+
+class TestResultMapping(unittest.TestCase):
+    """Yol derleyicisini ve Google, Bing, SearchAPI eşlemelerini test eder."""
+    
+    def test_compile_json_path(self):
+        """Derlenmiş yollar önceki nokta notasyonu davranışını korumalı ve önbellekte tutulmalı."""
+        data = {"items": [{"title": "a", "tags": ["x", "y"]}], "meta": {"0": "sözlük"}, "n": None}
+        self.assertEqual(compile_json_path("items.0.title")(data), "a")
+        self.assertEqual(compile_json_path("items.0.tags.1")(data), "y")
+        self.assertIsNone(compile_json_path("items.5.title")(data))
+        self.assertIsNone(compile_json_path("items.title")(data))
+        self.assertIsNone(compile_json_path("meta.0")(data))
+        self.assertIsNone(compile_json_path("title")(["liste"]))
+        self.assertIs(compile_json_path("")(data), data)
+        self.assertIs(compile_json_path("items.0.title"), compile_json_path("items.0.title"))
+        self.assertEqual(extract_data_from_json(data, "items.0.tags.0"), "x")
+    
+    def test_mapping_extracts_results(self):
+        """Eşleme eksik veya None alanları boş metne çevirmeli ve sonuç sayısını sınırlamalı."""
+        mapping = ResultMapping("data.hits", title_field="name", link_field="meta.url")
+        data = {"data": {"hits": [{"name": "A", "meta": {"url": "https://a"}, "snippet": None}, {"name": "B"}, {}]}}
+        self.assertEqual(mapping.extract(data, 2), [SearchResult("A", "https://a", ""), SearchResult("B", "", "")])
+        self.assertEqual(mapping.extract({"data": {"hits": {}}}), [])
+        self.assertIs(compile_result_mapping(mapping), compile_result_mapping(ResultMapping("data.hits", "name", "meta.url")))
+        self.assertEqual(extract_search_results(data, "data.hits", "name", "meta.url", "snippet", 1),
+                         [SearchResult("A", "https://a", "")])
+    
+    def test_engine_mappings(self):
+        """Google, Bing ve SearchAPI kendi yanıt biçimlerinden aynı sonuçları çıkarmalı."""
+        credentials = CredentialProvider(env_file="", use_environ=False,
+                                         values={"GOOGLE_CX": "cx", "GOOGLE_API_KEY": "k"})
+        engines = {
+            "google": GoogleSearch(api_key="k", credentials=credentials),
+            "bing": BingSearch(api_key="k", credentials=credentials),
+            "searchapi": SearchApiSearch(api_key="k", credentials=credentials),
+        }
+        expected = None
+        for key, engine in engines.items():
+            with self.subTest(engine=key):
+                results = engine._parse_response(_render_response(key, "python", 8), 5)
+                self.assertEqual(len(results), 5)
+                expected = expected or results
+                self.assertEqual(results, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
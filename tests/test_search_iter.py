@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sonuçları hazır oldukça üreten search_iter API'si için test modülü.
+"""
+
+import asyncio
+import unittest
+
+from src.engines import GoogleSearch, SerperSearch
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+from src.cache import CachedSearch
+from src.evaluator import SearchEngineEvaluator
+
+
+class TestSearchIter(unittest.TestCase):
+    """Sıralı üretimi, erken durmayı ve ilk sonuç süresi ölçümünü test eder."""
+    
+    def setUp(self):
+        self.server = MockSearchServer({
+            "google": MockEngineConfig(latency=LatencyDistribution.constant(0.05)),
+            "serper": MockEngineConfig(latency=LatencyDistribution.constant(0.02))
+        })
+        self.google = GoogleSearch(api_key="test", cx="test")
+    
+    def test_iter_matches_search(self):
+        """search_iter ve async_search_iter search ile aynı sonuçları aynı sırayla üretmeli."""
+        async def collect():
+            return [result async for result in self.google.async_search_iter("python", 25)]
+        
+        with self.server.running():
+            self.server.point(self.google)
+            streamed = list(self.google.search_iter("python", 25))
+            async_streamed = asyncio.run(collect())
+            listed = self.google.search("python", 25)
+        
+        self.assertEqual(len(streamed), 25)
+        self.assertEqual(streamed, listed)
+        self.assertEqual(async_streamed, listed)
+    
+    def test_early_stop_and_cache(self):
+        """Erken durulan arama önbelleğe yazılmamalı; tamamlanan arama yazılmalı."""
+        cached = CachedSearch(self.google)
+        with self.server.running():
+            self.server.point(self.google)
+            iterator = cached.search_iter("python", 30)
+            first = next(iterator)
+            iterator.close()
+            self.assertEqual(first.link, "https://example.com/python/1")
+            self.assertEqual(len(cached.cache), 0)
+            
+            self.assertEqual(len(list(cached.search_iter("python", 30))), 30)
+        self.assertEqual(len(cached.cache), 1)
+    
+    def test_measure_first_result_time(self):
+        """Değerlendirici ilk sonuca kadar geçen süreyi toplam süreden ayrı kaydetmeli."""
+        engine = SerperSearch(api_key="test")
+        evaluator = SearchEngineEvaluator()
+        evaluator.register_engine(engine)
+        with self.server.running():
+            self.server.point(engine)
+            results, elapsed_time, arrival_times = engine.measure_search_iter("python", 3)
+            data = evaluator.run_test("python", num_results=3, runs=2)[engine.name]
+        
+        self.assertEqual(len(arrival_times), 3)
+        self.assertLessEqual(arrival_times[-1], elapsed_time)
+        self.assertGreaterEqual(arrival_times[0], 0.02)
+        self.assertLessEqual(data["avg_first_result_time"], data["avg_response_time"])
+    
+    def test_time_to_k(self):
+        """İlk k sonuç süreleri sıralı olmalı; ulaşılamayan k için None raporlanmalı."""
+        evaluator = SearchEngineEvaluator(result_ranks=(10, 1, 5, 50))
+        evaluator.register_engine(self.google)
+        with self.server.running():
+            self.server.point(self.google)
+            data = evaluator.run_test("python", num_results=25, runs=2)[self.google.name]
+        
+        ranks = data["time_to_k"]
+        self.assertEqual(list(ranks), [1, 5, 10, 50])
+        self.assertEqual(ranks[1], data["avg_first_result_time"])
+        self.assertLessEqual(ranks[1], ranks[5])
+        self.assertLessEqual(ranks[5], ranks[10])
+        self.assertLessEqual(ranks[10], data["avg_response_time"])
+        self.assertIsNone(ranks[50])
+    
+    def test_batch_time_to_k(self):
+        """Toplu çalıştırma varış sürelerini sorgu ve motor özetlerine taşımalı."""
+        evaluator = SearchEngineEvaluator(result_ranks=(1, 10))
+        evaluator.register_engine(self.google)
+        with self.server.running():
+            self.server.point(self.google)
+            summary = evaluator.run_batch(["python", "java"], num_results=10, runs=2)[self.google.name]
+        
+        per_query = evaluator.results["java"][self.google.name]["time_to_k"]
+        self.assertIsNotNone(per_query[1])
+        self.assertLessEqual(per_query[1], per_query[10])
+        self.assertLessEqual(summary["time_to_k"][1], summary["time_to_k"][10])
+        self.assertLessEqual(summary["time_to_k"][10], summary["max_response_time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Sağlam istatistik modülü için test modülü.
+"""
+
+import unittest
+
+from src.stats import (trimmed_mean, median_absolute_deviation, reject_outliers, bootstrap_ci, intervals_overlap,
+                       robust_summary, time_to_k)
+
+
+class TestRobustStatistics(unittest.TestCase):
+    """Sağlam tahmin edicileri ve güven aralıklarını test eder."""
+    
+    def test_trimmed_mean(self):
+        """Kırpılmış ortalama uç değerlerden etkilenmemeli."""
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 100]
+        self.assertEqual(trimmed_mean(values, 0.1), 5.5)
+        self.assertEqual(trimmed_mean([2.0]), 2.0)
+        with self.assertRaises(ValueError):
+            trimmed_mean([])
+    
+    def test_reject_outliers(self):
+        """MAD tabanlı z-skoru yalnızca gerçek aykırı değeri ayıklamalı."""
+        values = [0.10, 0.11, 0.12, 0.10, 0.11, 0.90]
+        kept, outliers = reject_outliers(values)
+        self.assertEqual(outliers, [0.90])
+        self.assertEqual(kept, [0.10, 0.11, 0.12, 0.10, 0.11])
+        self.assertAlmostEqual(median_absolute_deviation([1, 2, 3, 4, 100]), 1)
+        # MAD sıfırsa hiçbir değer aykırı sayılmaz
+        self.assertEqual(reject_outliers([1, 1, 1, 5])[1], [])
+    
+    def test_bootstrap_ci(self):
+        """Güven aralığı medyanı kapsamalı ve aynı tohumla tekrarlanabilir olmalı."""
+        values = [0.1 + 0.01 * i for i in range(20)]
+        low, high = bootstrap_ci(values, seed=1)
+        self.assertLessEqual(low, 0.195)
+        self.assertGreaterEqual(high, 0.195)
+        self.assertEqual(bootstrap_ci(values, seed=1), (low, high))
+        self.assertIsNone(bootstrap_ci([]))
+    
+    def test_intervals_overlap(self):
+        """Örtüşen ve ayrık aralıklar ayırt edilmeli."""
+        self.assertTrue(intervals_overlap((1, 3), (2, 4)))
+        self.assertFalse(intervals_overlap((1, 2), (3, 4)))
+        self.assertTrue(intervals_overlap(None, (3, 4)))
+    
+    def test_robust_summary(self):
+        """Özet aykırı değerleri ayıklanmış ölçümlerden hesaplanmalı."""
+        summary = robust_summary([0.2, 0.21, 0.19, 0.2, 3.0], seed=0)
+        self.assertEqual(summary["outliers"], [3.0])
+        self.assertAlmostEqual(summary["median"], 0.2)
+        self.assertLess(summary["confidence_interval"][1], 3.0)
+        self.assertIsNone(robust_summary([])["median"])
+    
+    def test_time_to_k(self):
+        """k'inci sonucun süresi yalnızca k sonuca ulaşan çalıştırmalardan hesaplanmalı; k < 1 reddedilmeli."""
+        runs = [[0.1, 0.2, 0.3], [0.3, 0.4]]
+        self.assertEqual(time_to_k(runs, (1, 3, 5)), {1: 0.2, 3: 0.3, 5: None})
+        with self.assertRaises(ValueError):
+            time_to_k(runs, (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Süreç havuzu yürütme modülü için test modülü.
+"""
+
+import itertools
+import os
+import time
+import unittest
+from typing import List
+
+from src.core import SearchEngine, SearchResult
+from src.evaluator import SearchEngineEvaluator
+from src.mock_server import MockSearchServer, MockEngineConfig, LatencyDistribution
+from src.worker_pool import WorkerPool, EngineSpec
+
+_instance_ids = itertools.count(1)
+
+
+class ProcessTaggedSearch(SearchEngine):
+    """Sonuçlarına süreç ve örnek kimliğini yazan sahte motor."""
+    
+    def __init__(self, delay: float = 0.0):
+        super().__init__(name="Süreç Motoru", source_url="https://example.com", license_type="Test")
+        self.delay = delay
+        self.instance_id = next(_instance_ids)
+    
+    def search(self, query: str, num_results: int = 10) -> List[SearchResult]:
+        time.sleep(self.delay if query != "yavaş" else 1.0)
+        return [
+            SearchResult(title=query, link=f"https://example.com/{i}", snippet=f"{os.getpid()}:{self.instance_id}")
+            for i in range(num_results)
+        ]
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Motorların işçi başına bir kez oluşturulmasını ve değerlendiriciyle kullanımı test eder."""
+    
+    def test_engines_built_once_per_worker(self):
+        """Tüm görevler işçi başına tek bir motor örneğiyle yürütülmeli."""
+        spec = EngineSpec("tests.test_worker_pool:ProcessTaggedSearch", kwargs={"delay": 0.01})
+        with WorkerPool([spec], processes=2) as pool:
+            evaluator = SearchEngineEvaluator(max_workers=4)
+            evaluator.register_engines(pool.engines)
+            summary = evaluator.run_batch(["python", "java", "rust"], num_results=2, runs=4)
+            
+            instances = {
+                pool.engines[0].search(query, 1)[0].snippet for query in ["go"] * 8
+            }
+        
+        self.assertEqual(summary["Süreç Motoru"]["successful_runs"], 12)
+        self.assertLessEqual(len(instances), 2)
+        self.assertNotIn(str(os.getpid()), {tag.split(":")[0] for tag in instances})
+    
+    def test_spec_resolution(self):
+        """Motor anahtarı, ENGINE_SETTINGS adı ve sınıf yolu aynı şekilde çözülmeli."""
+        from src.engines.serper import SerperSearch
+        for name in ("serper", "SerperSearch", "src.engines.serper:SerperSearch"):
+            with self.subTest(engine=name):
+                self.assertIsInstance(EngineSpec(name, kwargs={"api_key": "test"}).build(), SerperSearch)
+        with self.assertRaises(ValueError):
+            EngineSpec("yok").build()
+    
+    def test_timeout_is_reported(self):
+        """Ana süreçteki süre sınırı işçi süreçteki aramaya uygulanmalı."""
+        with WorkerPool([EngineSpec("tests.test_worker_pool:ProcessTaggedSearch")], processes=1) as pool:
+            evaluator = SearchEngineEvaluator(timeout=0.2)
+            evaluator.register_engines(pool.engines)
+            data = evaluator.run_test("yavaş", num_results=1, runs=1)["Süreç Motoru"]
+        self.assertEqual(data["timeouts"], 1)
+    
+    def test_mock_engine_phases(self):
+        """İşçi süreçte ölçülen aşama süreleri ana süreçteki rapora aktarılmalı."""
+        server = MockSearchServer({"serper": MockEngineConfig(latency=LatencyDistribution.constant(0.02))})
+        with server.running():
+            spec = EngineSpec("serper", kwargs={"api_key": "test"}, attributes={"base_url": server.url_for("serper")})
+            with WorkerPool([spec], processes=1) as pool:
+                evaluator = SearchEngineEvaluator()
+                evaluator.register_engines(pool.engines)
+                data = evaluator.run_test("python", num_results=3, runs=3)[pool.engines[0].name]
+        
+        self.assertEqual(data["results_count"], 3)
+        self.assertGreaterEqual(data["phase_breakdown"]["ttfb"], 0.02)
+        self.assertEqual(pool.engines[0].settings_key, "SerperSearch")
+
+
+if __name__ == "__main__":
+    unittest.main()